@@ -13,6 +13,7 @@ try:
     from ..services.aiohttp_compat import import_aiohttp_web
     from ..services.approvals.models import ApprovalStatus
     from ..services.approvals.service import get_approval_service
+    from ..services.approvals.storage import ApprovalConflictError
     from ..services.audit import emit_audit_event
     from ..services.management_query import bounded_scan_collect, normalize_limit_offset
     from ..services.tenant_context import TenantBoundaryError, request_tenant_scope
@@ -23,6 +24,7 @@ except ImportError:
     from services.aiohttp_compat import import_aiohttp_web
     from services.approvals.models import ApprovalStatus
     from services.approvals.service import get_approval_service
+    from services.approvals.storage import ApprovalConflictError
     from services.audit import emit_audit_event  # type: ignore
     from services.management_query import (  # type: ignore
         bounded_scan_collect,
@@ -353,15 +355,17 @@ class ApprovalHandlers:
                 status=403,
             )
         except ValueError as e:
+            # A concurrent decision or expiry won the compare-and-set.
+            status = 409 if isinstance(e, ApprovalConflictError) else 400
             self._audit(
                 request=request,
                 action="approvals.approve",
                 target=approval_id,
                 outcome="error",
-                status_code=400,
+                status_code=status,
                 details={"error": str(e), "actor": actor},
             )
-            return web.json_response({"error": str(e)}, status=400)
+            return web.json_response({"error": str(e)}, status=status)
 
     async def reject_request(self, request: web.Request) -> web.Response:
         """POST /moltbot/approvals/{approval_id}/reject - Reject a request."""
@@ -432,15 +436,17 @@ class ApprovalHandlers:
                 status=403,
             )
         except ValueError as e:
+            # A concurrent decision or expiry won the compare-and-set.
+            status = 409 if isinstance(e, ApprovalConflictError) else 400
             self._audit(
                 request=request,
                 action="approvals.reject",
                 target=approval_id,
                 outcome="error",
-                status_code=400,
+                status_code=status,
                 details={"error": str(e), "actor": actor},
             )
-            return web.json_response({"error": str(e)}, status=400)
+            return web.json_response({"error": str(e)}, status=status)
 
 
 def register_approval_routes(
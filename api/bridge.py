@@ -80,6 +80,10 @@ MAX_INPUTS_SIZE = 64 * 1024  # 64KB JSON
 MAX_TEXT_LENGTH = 8000  # 8K chars
 MAX_FILES_COUNT = 10
 
+# Worker long-poll hold (?wait=) bounds
+WORKER_POLL_MAX_WAIT_SEC = 30.0
+WORKER_POLL_RECHECK_SEC = 1.0
+
 # Track startup time for uptime
 _startup_time = time.time()
 
@@ -88,6 +92,11 @@ def _bridge_sensitive_tag(value: Optional[str], *, label: str) -> str:
     return stable_redaction_tag(value, label=label)
 
 
+def _release_poll_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class BridgeHandlers:
     """Handlers for bridge API endpoints."""
 
@@ -105,6 +114,8 @@ class BridgeHandlers:
 
         # F46: Worker job queue (in-memory stub, production would use persistent store)
         self._worker_job_queue: list = []
+        # Long-poll waiters parked on an empty queue
+        self._worker_poll_waiters: list = []
         # F46: Worker result store
         self._worker_results: dict = {}
         # F46: Worker heartbeats
@@ -339,7 +350,7 @@ class BridgeHandlers:
 
         # Idempotency check (S50 Durable)
         store_key = f"bridge:{idempotency_key}"
-        is_dup, existing_pid = self._idempotency_store.check_and_record(
+        is_dup, existing_pid = await self._idempotency_store.acheck_and_record(
             store_key, ttl=86400
         )
 
@@ -401,7 +412,7 @@ class BridgeHandlers:
 
             # Update durable store with prompt_id
             if prompt_id:
-                self._idempotency_store.update_prompt_id(store_key, prompt_id)
+                await self._idempotency_store.aupdate_prompt_id(store_key, prompt_id)
 
             self._audit(
                 request=request,
@@ -647,7 +658,8 @@ class BridgeHandlers:
     async def worker_poll_handler(self, request: web.Request) -> web.Response:
         """
         GET /bridge/worker/poll
-        Worker polls for pending jobs. Returns available jobs or 204 if none.
+        Worker polls for pending jobs. Returns available jobs or 204 if none
+        arrived within the optional long-poll hold (?wait=seconds).
         """
         is_valid, error_resp, device_id = require_bridge_auth(
             request, BridgeScope.JOB_STATUS
@@ -655,24 +667,74 @@ class BridgeHandlers:
         if not is_valid:
             return error_resp
 
-        # Return pending jobs (FIFO, up to 5 per poll)
+        # Return pending jobs (FIFO, up to 5 per poll); ?wait=N holds an empty
+        # poll open for up to N seconds until a job is enqueued.
         try:
             batch_size = max(1, min(int(request.query.get("batch", "1")), 5))
         except (ValueError, TypeError):
             return web.json_response(
                 {"error": "batch must be an integer (1-5)"}, status=400
             )
+        try:
+            wait_sec = max(
+                0.0,
+                min(float(request.query.get("wait", "0")), WORKER_POLL_MAX_WAIT_SEC),
+            )
+        except (ValueError, TypeError):
+            return web.json_response(
+                {"error": f"wait must be a number (0-{WORKER_POLL_MAX_WAIT_SEC:g})"},
+                status=400,
+            )
+        jobs = self._take_worker_jobs(batch_size)
+        if not jobs and wait_sec > 0:
+            jobs = await self._hold_worker_poll(batch_size, wait_sec)
+
+        if not jobs:
+            return web.Response(status=204)
+
+        return web.json_response({"jobs": jobs})
+
+    def enqueue_worker_job(self, job: dict[str, Any]) -> None:
+        """Queue a job for workers and release one held long-poll."""
+        self._worker_job_queue.append(job)
+        while self._worker_poll_waiters:
+            waiter = self._worker_poll_waiters.pop(0)
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_release_poll_waiter, waiter)
+                break
+
+    def _take_worker_jobs(self, batch_size: int) -> list:
+        # FIFO, up to batch_size jobs
         jobs = []
         for _ in range(batch_size):
             if self._worker_job_queue:
                 jobs.append(self._worker_job_queue.pop(0))
             else:
                 break
-
-        if not jobs:
-            return web.Response(status=204)
-
-        return web.json_response({"jobs": jobs})
+        return jobs
+
+    async def _hold_worker_poll(self, batch_size: int, wait_sec: float) -> list:
+        """Park the poll until a job is enqueued or wait_sec elapses."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_sec
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return []
+            waiter = loop.create_future()
+            self._worker_poll_waiters.append(waiter)
+            try:
+                # Recheck periodically too: jobs appended to the queue directly
+                # do not release waiters.
+                await asyncio.wait_for(waiter, min(remaining, WORKER_POLL_RECHECK_SEC))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in self._worker_poll_waiters:
+                    self._worker_poll_waiters.remove(waiter)
+            jobs = self._take_worker_jobs(batch_size)
+            if jobs:
+                return jobs
 
     @endpoint_metadata(
         auth=AuthTier.BRIDGE,
@@ -720,7 +782,9 @@ class BridgeHandlers:
         idempotency_key = request.headers.get("X-Idempotency-Key", "")
         if idempotency_key:
             store_key = f"wr:{idempotency_key}"
-            is_dup, _ = self._idempotency_store.check_and_record(store_key, ttl=86400)
+            is_dup, _ = await self._idempotency_store.acheck_and_record(
+                store_key, ttl=86400
+            )
             if is_dup:
                 logger.info(
                     "Duplicate worker result suppressed for %s",
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import Any
 
 from .config_projection_handlers import ConfigHandlerDependencies
 
 
+async def _complete_off_thread(client: Any, run_in_thread: Any, **kwargs: Any) -> Any:
+    """Prefer the event-loop native client path; fall back to a worker thread."""
+    # IMPORTANT: injected/legacy clients may only expose sync complete().
+    if inspect.iscoroutinefunction(getattr(client, "acomplete", None)):
+        return await client.acomplete(**kwargs)
+    return await run_in_thread(client.complete, **kwargs)
+
+
 async def llm_test_response(request: Any, deps: ConfigHandlerDependencies) -> Any:
     """Run the existing tenant-scoped, audited LLM connection test."""
 
@@ -98,8 +107,9 @@ async def llm_test_response(request: Any, deps: ConfigHandlerDependencies) -> An
                 timeout=timeout_sec,
                 max_retries=max_retries,
             )
-            result = await run_in_thread(
-                client.complete,
+            result = await _complete_off_thread(
+                client,
+                run_in_thread,
                 system="You are a test assistant.",
                 user_message="Respond with exactly: OK",
                 max_tokens=10,
@@ -243,16 +253,14 @@ async def llm_chat_response(request: Any, deps: ConfigHandlerDependencies) -> An
             request=request, token_info=token_info, allow_default_when_missing=True
         ) as tenant:
             client = deps.llm_client()
-
-            def _run():
-                return client.complete(
-                    system=system,
-                    user_message=user_message,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-            result = await run_in_thread(_run)
+            result = await _complete_off_thread(
+                client,
+                run_in_thread,
+                system=system,
+                user_message=user_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
             text = result.get("text") or "" if isinstance(result, dict) else ""
             return deps.web.json_response(
                 {"ok": True, "tenant_id": tenant.tenant_id, "text": text}
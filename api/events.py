@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from inspect import signature
 from typing import Any, Dict
 
@@ -58,6 +59,8 @@ logger = logging.getLogger("ComfyUI-OpenClaw.api.events")
 SSE_KEEPALIVE_SEC = 15
 # Maximum SSE connection duration (seconds) — prevents zombie connections
 SSE_MAX_DURATION_SEC = 300  # 5 minutes
+# Events per ring-buffer read while replaying Last-Event-ID / lag catch-up
+SSE_REPLAY_BATCH = 100
 
 
 def _call_event_serializer(
@@ -77,6 +80,40 @@ def _call_event_serializer(
     return serializer()
 
 
+def _event_sse_bytes(event: Any, include_reasoning: bool) -> bytes:
+    """Shared pre-encoded SSE frame when available (one encode per event)."""
+    to_sse_bytes = getattr(event, "to_sse_bytes", None)
+    if callable(to_sse_bytes):
+        frame = to_sse_bytes(include_reasoning=include_reasoning)
+        if isinstance(frame, bytes):
+            return frame
+    text: str = _call_event_serializer(
+        event, "to_sse", include_reasoning=include_reasoning
+    )
+    return text.encode("utf-8")
+
+
+async def _write_backlog(
+    response: Any,
+    store: Any,
+    last_seq: int,
+    prompt_id: str | None,
+    include_reasoning: bool,
+) -> int:
+    """Replay buffered events after last_seq; returns the new cursor."""
+    while True:
+        events = store.events_since(
+            last_seq=last_seq,
+            limit=SSE_REPLAY_BATCH,
+            prompt_id=prompt_id,
+        )
+        if not events:
+            return last_seq
+        for evt in events:
+            await response.write(_event_sse_bytes(evt, include_reasoning))
+            last_seq = evt.seq
+
+
 # R98: Endpoint Metadata
 if __package__ and "." in __package__:
     from ..services.endpoint_manifest import (
@@ -158,49 +195,48 @@ async def events_stream_handler(request: web.Request) -> web.StreamResponse:
     await response.prepare(request)
 
     metrics.inc("events_sse_connections")
+    metrics.add_gauge("events_sse_active", 1)
 
-    import time
-
-    start_time = time.time()
-
-    last_keepalive = time.time()
+    include_reasoning = reveal["allowed"]
+    deadline = time.monotonic() + SSE_MAX_DURATION_SEC
 
     try:
-        while True:
-            # Check max duration
-            if time.time() - start_time > SSE_MAX_DURATION_SEC:
-                break
-
-            events = get_job_event_store().events_since(
-                last_seq=last_seq,
-                limit=50,
-                prompt_id=prompt_id,
+        # Subscribe before replaying so nothing emitted during the replay is
+        # missed; the live loop skips anything the replay already sent.
+        with store.subscribe(prompt_id=prompt_id) as subscription:
+            last_seq = await _write_backlog(
+                response, store, last_seq, prompt_id, include_reasoning
             )
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
 
-            if events:
-                for evt in events:
-                    await response.write(
-                        _call_event_serializer(
-                            evt,
-                            "to_sse",
-                            include_reasoning=reveal["allowed"],
-                        ).encode("utf-8")
+                evt = await subscription.next_event(
+                    timeout=min(SSE_KEEPALIVE_SEC, remaining)
+                )
+                if subscription.lagged:
+                    # Slow client overflowed its live queue: re-sync from the
+                    # ring buffer instead of silently skipping events.
+                    subscription.reset_lag()
+                    last_seq = await _write_backlog(
+                        response, store, last_seq, prompt_id, include_reasoning
                     )
-                    last_seq = evt.seq
-            else:
-                # Send keep-alive header only if interval exceeded
-                now = time.time()
-                if now - last_keepalive > SSE_KEEPALIVE_SEC:
-                    await response.write(b": keepalive\n\n")
-                    last_keepalive = now
-
-            # Poll interval (1s latency is acceptable for job events)
-            await asyncio.sleep(1)
+                    continue
+                if evt is None:
+                    if time.monotonic() < deadline:
+                        await response.write(b": keepalive\n\n")
+                    continue
+                if evt.seq <= last_seq:
+                    continue
+                await response.write(_event_sse_bytes(evt, include_reasoning))
+                last_seq = evt.seq
 
     except (ConnectionError, asyncio.CancelledError):
         pass
     finally:
         metrics.inc("events_sse_disconnections")
+        metrics.add_gauge("events_sse_active", -1)
 
     return response
 
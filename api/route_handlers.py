@@ -163,6 +163,12 @@ async def health_response(request: Any, deps: RouteHandlerDependencies) -> Any:
     except Exception:
         pass
 
+    try:
+        from ..services.runtime_config import get_effective_config_generation
+    except ImportError:
+        from services.runtime_config import get_effective_config_generation
+    config_generation = get_effective_config_generation()
+
     control_plane_info = {}
     runtime_profile = "minimal"
     try:
@@ -196,6 +202,7 @@ async def health_response(request: Any, deps: RouteHandlerDependencies) -> Any:
                 "api_type": provider_info.get("api_type"),
                 "llm_key_configured": provider_info.get("key_configured", False),
                 "llm_key_required": key_required,
+                "generation": config_generation,
             },
             "stats": {
                 "errors_captured": metrics_snapshot["errors_captured"],
@@ -214,6 +221,45 @@ async def health_response(request: Any, deps: RouteHandlerDependencies) -> Any:
     )
 
 
+async def metrics_response(request: Any, deps: RouteHandlerDependencies) -> Any:
+    """Serve counters, gauges and latency histograms for scraping."""
+
+    if deps.web is None:
+        raise RuntimeError("aiohttp not available")
+    ok, init_error = deps.ensure_observability_deps_ready()
+    if not ok:
+        return deps.web.json_response({"ok": False, "error": init_error}, status=500)
+    if not deps.check_rate_limit(request, "logs"):
+        return deps.build_rate_limit_response(
+            request,
+            "logs",
+            web_module=deps.web,
+            error="Rate limit exceeded",
+            include_ok=True,
+        )
+    allowed, error = deps.require_observability_access(request)
+    if not allowed:
+        return deps.web.json_response({"ok": False, "error": error}, status=403)
+    if deps.metrics is None:
+        return deps.web.json_response(
+            {"ok": False, "error": "Metrics unavailable"}, status=503
+        )
+
+    if request.query.get("format", "prometheus").lower() == "json":
+        return deps.web.json_response(
+            {
+                "ok": True,
+                "counters": deps.metrics.get_all(),
+                "gauges": deps.metrics.get_gauges(),
+                "histograms": deps.metrics.get_histograms(),
+            }
+        )
+    return deps.web.Response(
+        body=deps.metrics.render_prometheus().encode("utf-8"),
+        headers={"Content-Type": deps.metrics.prometheus_content_type},
+    )
+
+
 async def logs_tail_response(request: Any, deps: RouteHandlerDependencies) -> Any:
     """Authorize, bound, filter, and redact the log-tail response."""
 
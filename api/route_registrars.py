@@ -40,6 +40,11 @@ def build_core_route_specs(
             f"{prefix}/webhook/submit",
             handlers["webhook_submit_handler"],
         ),
+        RouteSpec(
+            "POST",
+            f"{prefix}/webhook/submit/batch",
+            handlers["webhook_submit_batch_handler"],
+        ),
         RouteSpec(
             "POST",
             f"{prefix}/webhook/validate",
@@ -149,6 +154,7 @@ def build_core_route_specs(
             handlers["events_stream_handler"],
         ),
         RouteSpec("GET", f"{prefix}/events", handlers["events_poll_handler"]),
+        RouteSpec("GET", f"{prefix}/metrics", handlers["metrics_handler"]),
         RouteSpec(
             "DELETE",
             f"{prefix}/secrets/{{provider}}",
@@ -0,0 +1,104 @@
+"""
+Per-route latency middleware for the owned OpenClaw API surface.
+
+Times every request that lands on an OpenClaw-owned path and records it in
+the ``http_request_duration_ms`` histogram labelled by the matched route
+template (never the raw path, so ids in the URL cannot explode cardinality),
+HTTP method and status class.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+if __package__ and "." in __package__:
+    from ..services.metrics import metrics
+else:  # pragma: no cover
+    from services.metrics import metrics
+
+logger = logging.getLogger("ComfyUI-OpenClaw.api.route_timing")
+
+HTTP_LATENCY_METRIC = "http_request_duration_ms"
+# Both bare and /api-prefixed aliases are registered for every family.
+TIMED_PATH_PREFIXES = (
+    "/openclaw/",
+    "/moltbot/",
+    "/bridge/",
+    "/api/openclaw/",
+    "/api/moltbot/",
+    "/api/bridge/",
+)
+UNMATCHED_ROUTE = "unmatched"
+# nginx convention for "client closed the connection before the response".
+CLIENT_CLOSED_STATUS = 499
+
+
+def is_timed_path(path: str) -> bool:
+    return path.startswith(TIMED_PATH_PREFIXES)
+
+
+def route_template(request: Any) -> str:
+    """Return the matched route template, e.g. ``/openclaw/trace/{prompt_id}``."""
+    try:
+        resource = request.match_info.route.resource
+    except AttributeError:
+        return UNMATCHED_ROUTE
+    canonical = getattr(resource, "canonical", None)
+    return canonical if isinstance(canonical, str) and canonical else UNMATCHED_ROUTE
+
+
+def _status_class(status: int) -> str:
+    return f"{status // 100}xx"
+
+
+async def route_timing_middleware(request: Any, handler: Any) -> Any:
+    if not is_timed_path(request.path):
+        return await handler(request)
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await handler(request)
+        status = int(getattr(response, "status", 200))
+        return response
+    except asyncio.CancelledError:
+        status = CLIENT_CLOSED_STATUS
+        raise
+    except Exception as e:
+        # aiohttp HTTPException subclasses carry their own status.
+        status = int(getattr(e, "status", 500))
+        raise
+    finally:
+        metrics.observe(
+            HTTP_LATENCY_METRIC,
+            (time.perf_counter() - started) * 1000.0,
+            {
+                "route": route_template(request),
+                "method": request.method,
+                "status": _status_class(status),
+            },
+        )
+
+
+# New-style middleware marker (what aiohttp's @web.middleware sets), so this
+# module stays importable without aiohttp.
+route_timing_middleware.__middleware_version__ = 1  # type: ignore[attr-defined]
+
+
+def install_route_timing(server: Any) -> bool:
+    """Append the timing middleware to the PromptServer app once."""
+    app = getattr(server, "app", None)
+    middlewares = getattr(app, "middlewares", None)
+    if middlewares is None:
+        return False
+    if route_timing_middleware in middlewares:
+        return True
+    try:
+        middlewares.append(route_timing_middleware)
+    except RuntimeError as e:
+        # The app is already frozen (server started before pack import).
+        logger.warning(f"Route latency middleware not installed: {e}")
+        return False
+    return True
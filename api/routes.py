@@ -43,6 +43,7 @@ else:
     health_response,
     jobs_response,
     logs_tail_response,
+    metrics_response,
     owned_ensure_observability_deps_ready,
     trace_response,
 ) = import_attrs_dual(
@@ -55,6 +56,7 @@ else:
         "health_response",
         "jobs_response",
         "logs_tail_response",
+        "metrics_response",
         "ensure_observability_deps_ready",
         "trace_response",
     ),
@@ -77,6 +79,13 @@ else:
     ),
 )
 
+(install_route_timing,) = import_attrs_dual(
+    __package__,
+    "..api.route_timing",
+    "api.route_timing",
+    ("install_route_timing",),
+)
+
 # R98 / R64: Endpoint Metadata import via shared helper
 (
     AuthTier,
@@ -112,6 +121,7 @@ JobsHostContractUnsupported = JobsBackendUnavailable = read_jobs = None  # type:
 get_executor_diagnostics = None  # type: ignore
 webhook_handler = webhook_submit_handler = webhook_validate_handler = capabilities_handler = preflight_handler = None  # type: ignore
 pnginfo_handler = None  # type: ignore  # R168
+webhook_submit_batch_handler = None
 config_get_handler = config_put_handler = llm_test_handler = llm_models_handler = llm_chat_handler = None  # type: ignore
 remote_admin_page_handler = None  # type: ignore  # F61
 security_doctor_handler = None  # type: ignore  # S30
@@ -294,11 +304,11 @@ if web is not None:
         "api.webhook",
         ("webhook_handler",),
     )
-    (webhook_submit_handler,) = import_attrs_dual(
+    (webhook_submit_handler, webhook_submit_batch_handler) = import_attrs_dual(
         __package__,
         "..api.webhook_submit",
         "api.webhook_submit",
-        ("webhook_submit_handler",),
+        ("webhook_submit_handler", "webhook_submit_batch_handler"),
     )
     (webhook_validate_handler,) = import_attrs_dual(
         __package__,
@@ -500,6 +510,24 @@ async def health_handler(request: web.Request) -> web.Response:
     return await health_response(request, _handler_dependencies())
 
 
+@endpoint_metadata(
+    auth=AuthTier.OBSERVABILITY,
+    risk=RiskTier.LOW,
+    summary="Metrics",
+    description="Counters, gauges and latency histograms (Prometheus text or JSON).",
+    audit="metrics.get",
+    plane=RoutePlane.ADMIN,
+)
+async def metrics_handler(request: web.Request) -> web.Response:
+    """
+    GET /openclaw/metrics (legacy: /moltbot/metrics)
+    Prometheus text exposition by default; ?format=json for a JSON summary.
+    """
+    # CRITICAL: metrics_response performs require_observability_access before
+    # exposing any counter or latency series.
+    return await metrics_response(request, _handler_dependencies())
+
+
 @endpoint_metadata(
     auth=AuthTier.ADMIN,
     risk=RiskTier.MEDIUM,
@@ -674,6 +702,7 @@ def register_routes(server) -> None:
         "trace_handler": trace_handler,
         "webhook_handler": webhook_handler,
         "webhook_submit_handler": webhook_submit_handler,
+        "webhook_submit_batch_handler": webhook_submit_batch_handler,
         "webhook_validate_handler": webhook_validate_handler,
         "capabilities_handler": capabilities_handler,
         "config_get_handler": config_get_handler,
@@ -707,6 +736,7 @@ def register_routes(server) -> None:
         "secrets_put_handler": secrets_put_handler,
         "events_stream_handler": events_stream_handler,
         "events_poll_handler": events_poll_handler,
+        "metrics_handler": metrics_handler,
         "secrets_delete_handler": secrets_delete_handler,
         "security_doctor_handler": security_doctor_handler,
         "tools_list_handler": tools_list_handler,
@@ -743,3 +773,5 @@ def register_routes(server) -> None:
             run_mae_startup_gate=_run_mae_startup_gate,
         ),
     )
+    # Per-route latency histograms for every owned path registered above.
+    install_route_timing(server)
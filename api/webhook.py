@@ -58,11 +58,11 @@ else:
     "services.trace",
     ("get_effective_trace_id",),
 )
-(get_auth_summary, require_auth) = import_attrs_dual(
+(arequire_auth, get_auth_summary) = import_attrs_dual(
     __package__,
     "..services.webhook_auth",
     "services.webhook_auth",
-    ("get_auth_summary", "require_auth"),
+    ("arequire_auth", "get_auth_summary"),
 )
 (diagnostics,) = import_attrs_dual(
     __package__,
@@ -138,7 +138,7 @@ async def webhook_handler(request: web.Request) -> web.Response:
             )
 
         # Require auth
-        valid, error = require_auth(request, raw_body)
+        valid, error = await arequire_auth(request, raw_body)
         if not valid:
             # R46: Use debug log for details (safe redaction), warning for summary
             logger.debug(f"Webhook auth failed details", data={"error": error})
@@ -21,12 +21,17 @@ if __package__ and "." in __package__:
     from ..services.idempotency_store import IdempotencyStore
     from ..services.job_events import JobEventType, get_job_event_store
     from ..services.metrics import metrics
-    from ..services.queue_submit import submit_prompt
+    from ..services.queue_submit import (
+        QueueSubmitItem,
+        submit_prompt,
+        submit_prompt_batch,
+    )
     from ..services.rate_limit import build_rate_limit_response, check_rate_limit
+    from ..services.request_contracts import MAX_BATCH_BODY_SIZE, MAX_BATCH_JOBS
     from ..services.templates import get_template_service
     from ..services.trace import get_effective_trace_id
     from ..services.trace_store import trace_store
-    from ..services.webhook_auth import require_auth
+    from ..services.webhook_auth import arequire_auth
     from ..services.webhook_mapping import (  # F40/S59
         apply_mapping,
         resolve_profile,
@@ -40,15 +45,20 @@ else:  # pragma: no cover (test-only import mode)
     from services.idempotency_store import IdempotencyStore  # type: ignore
     from services.job_events import JobEventType, get_job_event_store  # type: ignore
     from services.metrics import metrics  # type: ignore
-    from services.queue_submit import submit_prompt  # type: ignore
+    from services.queue_submit import (
+        QueueSubmitItem,
+        submit_prompt,
+        submit_prompt_batch,
+    )
     from services.rate_limit import (  # type: ignore
         build_rate_limit_response,
         check_rate_limit,
     )
+    from services.request_contracts import MAX_BATCH_BODY_SIZE, MAX_BATCH_JOBS
     from services.templates import get_template_service  # type: ignore
     from services.trace import get_effective_trace_id  # type: ignore
     from services.trace_store import trace_store  # type: ignore
-    from services.webhook_auth import require_auth  # type: ignore
+    from services.webhook_auth import arequire_auth  # type: ignore
     from services.webhook_mapping import (  # F40  # type: ignore
         apply_mapping,
         resolve_profile,
@@ -82,6 +92,148 @@ def safe_error_response(status: int, error: str, detail: str = "") -> web.Respon
     return web.json_response(body, status=status)
 
 
+async def _read_json_body(request, max_bytes: int) -> tuple:
+    """S2: content-type gate and bounded body read; returns (raw_body, denial)."""
+    content_type = request.headers.get("Content-Type", "")
+    if not content_type.startswith("application/json"):
+        metrics.inc("webhook_denied")
+        return None, safe_error_response(415, "unsupported_media_type")
+
+    try:
+        raw_body = await request.content.read(max_bytes + 1)
+        if len(raw_body) > max_bytes:
+            metrics.inc("webhook_denied")
+            return None, safe_error_response(413, "payload_too_large")
+    except Exception:
+        metrics.inc("errors")
+        return None, safe_error_response(400, "read_error")
+    return raw_body, None
+
+
+def _auth_denied(error: str):
+    metrics.inc("webhook_denied")
+    # Map specific auth errors
+    if error in (
+        "auth_not_configured",
+        "bearer_not_configured",
+        "hmac_not_configured",
+    ):
+        return safe_error_response(403, error)
+    return safe_error_response(401, error)
+
+
+class _JobValidationError(Exception):
+    """A job payload failed normalization; maps to a 400 error body."""
+
+    def __init__(self, error: str, detail: str = ""):
+        super().__init__(detail or error)
+        self.error = error
+        self.detail = detail
+
+
+def _normalize_job(data: dict, headers, mapping_profile) -> tuple:
+    """
+    R8/F40/S59 normalization of one job payload.
+
+    Returns (trace_id, job_request, normalized); raises _JobValidationError.
+    """
+    # Unwrap common envelopes (R8)
+    if "payload" in data and isinstance(data["payload"], dict):
+        data = data["payload"]
+    elif "data" in data and isinstance(data["data"], dict):
+        data = data["data"]
+
+    # Common alias normalization (camelCase -> snake_case)
+    if "templateId" in data:
+        data["template_id"] = data.pop("templateId")
+    if "profileId" in data:
+        data["profile_id"] = data.pop("profileId")
+    if "jobId" in data:
+        data["job_id"] = data.pop("jobId")
+    if "traceId" in data:
+        data["trace_id"] = data.pop("traceId")
+
+    # R25: Trace context
+    trace_id = get_effective_trace_id(headers, data)
+    data["trace_id"] = trace_id
+
+    # F40: Apply mapping if profile found
+    if mapping_profile:
+        try:
+            # Log usage of mapping profile for observability
+            logger.info(
+                f"Applying mapping profile '{mapping_profile.id}' to request (trace: {trace_id})"
+            )
+            mapped_data, mapping_warnings = apply_mapping(mapping_profile, data)
+
+            # If trace_id was not in source but resolved from headers, re-inject it
+            if "trace_id" not in mapped_data:
+                mapped_data["trace_id"] = trace_id
+
+            data = mapped_data
+            for w in mapping_warnings:
+                logger.warning(f"Mapping warning (trace: {trace_id}): {w}")
+        except ValueError as e:
+            raise _JobValidationError("mapping_error", str(e))
+
+    # Validate against schema
+    # S59: enforce canonical post-map schema gate before typed parsing.
+    canonical_ok, canonical_errors = validate_canonical_schema(data)
+    if not canonical_ok:
+        raise _JobValidationError("validation_error", "; ".join(canonical_errors))
+
+    try:
+        job_request = WebhookJobRequest.from_dict(data)
+        normalized = job_request.to_normalized()
+    except ValueError as e:
+        raise _JobValidationError("validation_error", str(e))
+    return trace_id, job_request, normalized
+
+
+async def _record_queued(
+    store,
+    key: str,
+    result: dict,
+    trace_id: str,
+    job_id,
+    template_id: str,
+    callback_config,
+    event_data: dict | None = None,
+):
+    """Post-submit bookkeeping shared by single and batch submit; returns prompt_id."""
+    prompt_id = result.get("prompt_id")
+
+    # Update store with prompt_id for future dedupes
+    if prompt_id:
+        await store.aupdate_prompt_id(key, prompt_id)
+
+    # R25: Record trace mapping + queued event
+    if prompt_id:
+        trace_store.add_event(prompt_id, trace_id, "queued", {"source": "webhook"})
+
+    # F16: Schedule callback delivery if configured
+    if callback_config and prompt_id:
+        await start_callback_watch(prompt_id, callback_config, trace_id=trace_id)
+
+    # R71: Emit QUEUED event
+    if prompt_id:
+        try:
+            get_job_event_store().emit(
+                JobEventType.QUEUED,
+                prompt_id=prompt_id,
+                trace_id=trace_id,
+                data={
+                    "source": "webhook",
+                    "template_id": template_id,
+                    "job_id": job_id,
+                    **(event_data or {}),
+                },
+            )
+        except Exception:
+            pass
+    return prompt_id
+
+
 @endpoint_metadata(
     auth=AuthTier.WEBHOOK,
     risk=RiskTier.HIGH,
@@ -124,31 +276,13 @@ async def webhook_submit_handler(request: web.Request) -> web.Response:
 
     try:
         # --- 1. S2: Auth & Basic Validation ---
-        content_type = request.headers.get("Content-Type", "")
-        if not content_type.startswith("application/json"):
-            metrics.inc("webhook_denied")
-            return safe_error_response(415, "unsupported_media_type")
+        raw_body, denied = await _read_json_body(request, MAX_BODY_SIZE)
+        if denied is not None:
+            return denied
 
-        try:
-            raw_body = await request.content.read(MAX_BODY_SIZE + 1)
-            if len(raw_body) > MAX_BODY_SIZE:
-                metrics.inc("webhook_denied")
-                return safe_error_response(413, "payload_too_large")
-        except Exception:
-            metrics.inc("errors")
-            return safe_error_response(400, "read_error")
-
-        valid, error = require_auth(request, raw_body)
+        valid, error = await arequire_auth(request, raw_body)
         if not valid:
-            metrics.inc("webhook_denied")
-            # Map specific auth errors
-            if error in (
-                "auth_not_configured",
-                "bearer_not_configured",
-                "hmac_not_configured",
-            ):
-                return safe_error_response(403, error)
-            return safe_error_response(401, error)
+            return _auth_denied(error)
 
         # --- 2. R8: Normalization ---
         try:
@@ -157,67 +291,15 @@ async def webhook_submit_handler(request: web.Request) -> web.Response:
             metrics.inc("webhook_denied")
             return safe_error_response(400, "invalid_json")
 
-        # Unwrap common envelopes (R8)
-        if "payload" in data and isinstance(data["payload"], dict):
-            data = data["payload"]
-        elif "data" in data and isinstance(data["data"], dict):
-            data = data["data"]
-
-        # Common alias normalization (camelCase -> snake_case)
-        if "templateId" in data:
-            data["template_id"] = data.pop("templateId")
-        if "profileId" in data:
-            data["profile_id"] = data.pop("profileId")
-        if "jobId" in data:
-            data["job_id"] = data.pop("jobId")
-        if "traceId" in data:
-            data["trace_id"] = data.pop("traceId")
-
-        # R25: Trace context
-        trace_id = get_effective_trace_id(request.headers, data)
-        data["trace_id"] = trace_id
-
-        # F40: Payload Mapping Engine
-        # 1. Resolve profile
+        # F40: Payload Mapping Engine (profile resolved from headers)
         mapping_profile = resolve_profile(request.headers)
-
-        # 2. Apply mapping if profile found
-        if mapping_profile:
-            try:
-                # Log usage of mapping profile for observability
-                logger.info(
-                    f"Applying mapping profile '{mapping_profile.id}' to request (trace: {trace_id})"
-                )
-                mapped_data, mapping_warnings = apply_mapping(mapping_profile, data)
-
-                # If trace_id was not in source but resolved from headers, re-inject it
-                if "trace_id" not in mapped_data:
-                    mapped_data["trace_id"] = trace_id
-
-                data = mapped_data
-                for w in mapping_warnings:
-                    logger.warning(f"Mapping warning (trace: {trace_id}): {w}")
-            except ValueError as e:
-                metrics.inc("webhook_denied")
-                return safe_error_response(400, "mapping_error", str(e))
-
-        # Validate against schema
-        # S59: enforce canonical post-map schema gate before typed parsing.
-        canonical_ok, canonical_errors = validate_canonical_schema(data)
-        if not canonical_ok:
-            metrics.inc("webhook_denied")
-            return safe_error_response(
-                400,
-                "validation_error",
-                "; ".join(canonical_errors),
-            )
-
         try:
-            job_request = WebhookJobRequest.from_dict(data)
-            normalized = job_request.to_normalized()
-        except ValueError as e:
+            trace_id, job_request, normalized = _normalize_job(
+                data, request.headers, mapping_profile
+            )
+        except _JobValidationError as e:
             metrics.inc("webhook_denied")
-            return safe_error_response(400, "validation_error", str(e))
+            return safe_error_response(400, e.error, e.detail)
 
         # --- 3. R3: Idempotency ---
         job_id = normalized.get("job_id")
@@ -226,7 +308,7 @@ async def webhook_submit_handler(request: web.Request) -> web.Response:
         normalized_for_key.pop("trace_id", None)
         key = store.generate_key(job_id, normalized_for_key)
 
-        is_duplicate, existing_prompt_id = store.check_and_record(key)
+        is_duplicate, existing_prompt_id = await store.acheck_and_record(key)
 
         if is_duplicate:
             logger.info(f"Duplicate request suppressed. Key: {key}")
@@ -264,40 +346,10 @@ async def webhook_submit_handler(request: web.Request) -> web.Response:
                 source="webhook",
                 trace_id=trace_id,
             )
-            prompt_id = result.get("prompt_id")
-
-            # Update store with prompt_id for future dedupes
-            if prompt_id:
-                store.update_prompt_id(key, prompt_id)
-
-            # R25: Record trace mapping + queued event
-            if prompt_id:
-                trace_store.add_event(
-                    prompt_id, trace_id, "queued", {"source": "webhook"}
-                )
-
-            # F16: Schedule callback delivery if configured
+            prompt_id = await _record_queued(
+                store, key, result, trace_id, job_id, template_id, job_request.callback
+            )
             callback_config = job_request.callback
-            if callback_config and prompt_id:
-                await start_callback_watch(
-                    prompt_id, callback_config, trace_id=trace_id
-                )
-
-            # R71: Emit QUEUED event
-            if prompt_id:
-                try:
-                    get_job_event_store().emit(
-                        JobEventType.QUEUED,
-                        prompt_id=prompt_id,
-                        trace_id=trace_id,
-                        data={
-                            "source": "webhook",
-                            "template_id": template_id,
-                            "job_id": job_id,
-                        },
-                    )
-                except Exception:
-                    pass
 
             metrics.inc("webhook_requests_executed")
             return web.json_response(
@@ -338,3 +390,269 @@ async def webhook_submit_handler(request: web.Request) -> web.Response:
         logger.exception(f"Unexpected error in webhook submission: {e}")
         metrics.inc("errors")
         return safe_error_response(500, "internal_error")
+
+
+def _batch_item_error(
+    index: int, status: int, error: str, detail: str = "", trace_id=None
+) -> dict:
+    line = {"index": index, "ok": False, "status": status, "error": error}
+    if detail:
+        line["detail"] = detail
+    if trace_id:
+        line["trace_id"] = trace_id
+    return line
+
+
+def _batch_submit_error(index: int, trace_id: str, e: Exception) -> dict:
+    """Per-item twin of the single-submit exception responses."""
+    if isinstance(e, BudgetExceededError):
+        # R33: Execution budgets (concurrency caps / render size budgets)
+        logger.warning(f"Execution budget exceeded: {e}")
+        metrics.inc("webhook_denied")
+        status = 429
+        if getattr(e, "budget_type", "") in (
+            "rendered_workflow_size",
+            "workflow_serialization",
+        ):
+            status = 413
+        line = _batch_item_error(index, status, "budget_exceeded", str(e), trace_id)
+        line["retry_after"] = getattr(e, "retry_after", 1)
+        return line
+    logger.error(f"Queue submission failed: {e}")
+    metrics.inc("errors")
+    return _batch_item_error(index, 500, "execution_failed", trace_id=trace_id)
+
+
+@endpoint_metadata(
+    auth=AuthTier.WEBHOOK,
+    risk=RiskTier.HIGH,
+    summary="Webhook batch submit",
+    description="Authenticated endpoint submitting many external jobs from one signed payload.",
+    audit="webhook.submit_batch",
+    plane=RoutePlane.EXTERNAL,
+)
+async def webhook_submit_batch_handler(request):
+    """
+    POST /openclaw/webhook/submit/batch
+
+    Body: {"jobs": [<webhook submit payload>, ...]} (at most MAX_BATCH_JOBS).
+
+    Rate limit, auth and mapping-profile resolution run once for the batch;
+    idempotency is checked and recorded in one bulk pass, templates render in
+    one pass and execution budgets are acquired in bulk. Per-item outcomes
+    stream back as NDJSON lines tagged with the job's "index" (rejections and
+    dedupes first, then submissions in completion order), followed by a
+    summary line. Each job keeps its own trace_id, idempotency key, trace
+    events, callback and QUEUED event exactly as /webhook/submit would.
+    """
+    # S62: Block webhook execution in public+split mode
+    try:
+        # CRITICAL: package-relative import must stay first in ComfyUI runtime.
+        from ..services.surface_guard import check_surface
+    except ImportError:
+        from services.surface_guard import check_surface  # type: ignore
+    blocked = check_surface("webhook_execute", request)
+    if blocked:
+        return blocked
+
+    # S17: Rate Limit (one pass for the whole batch)
+    if not check_rate_limit(request, "webhook"):
+        metrics.inc("webhook_denied")
+        return build_rate_limit_response(
+            request,
+            "webhook",
+            web_module=web,
+            error="rate_limit_exceeded",
+            include_ok=True,
+        )
+
+    response = None
+    try:
+        raw_body, denied = await _read_json_body(request, MAX_BATCH_BODY_SIZE)
+        if denied is not None:
+            return denied
+
+        valid, error = await arequire_auth(request, raw_body)
+        if not valid:
+            return _auth_denied(error)
+
+        try:
+            data = json.loads(raw_body.decode("utf-8"))
+        except Exception:
+            metrics.inc("webhook_denied")
+            return safe_error_response(400, "invalid_json")
+
+        jobs = data.get("jobs") if isinstance(data, dict) else None
+        if not isinstance(jobs, list) or not jobs:
+            metrics.inc("webhook_denied")
+            return safe_error_response(
+                400, "validation_error", "jobs must be a non-empty list"
+            )
+        if len(jobs) > MAX_BATCH_JOBS:
+            metrics.inc("webhook_denied")
+            return safe_error_response(
+                413, "batch_too_large", f"at most {MAX_BATCH_JOBS} jobs per batch"
+            )
+
+        # R25: the batch trace groups items; every item keeps its own trace_id.
+        batch_trace_id = get_effective_trace_id(request.headers, {})
+        mapping_profile = resolve_profile(request.headers)
+        lines: dict = {}
+
+        # --- R8/F40/S59: Normalization ---
+        accepted = []
+        for index, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                metrics.inc("webhook_denied")
+                lines[index] = _batch_item_error(
+                    index, 400, "validation_error", "job must be a JSON object"
+                )
+                continue
+            try:
+                # Header trace ids label the batch, not each job.
+                accepted.append((index, *_normalize_job(job, {}, mapping_profile)))
+            except _JobValidationError as e:
+                metrics.inc("webhook_denied")
+                lines[index] = _batch_item_error(index, 400, e.error, e.detail)
+
+        # --- R3: Idempotency (one bulk check-and-record) ---
+        store = IdempotencyStore()
+        keys = []
+        for _index, _trace_id, _job_request, normalized in accepted:
+            normalized_for_key = dict(normalized)
+            normalized_for_key.pop("trace_id", None)
+            keys.append(
+                store.generate_key(normalized.get("job_id"), normalized_for_key)
+            )
+        fresh = []
+        for entry, key, (is_duplicate, existing_prompt_id) in zip(
+            accepted,
+            keys,
+            await store.acheck_and_record_many(keys) if keys else [],
+            strict=True,
+        ):
+            index, trace_id = entry[0], entry[1]
+            if is_duplicate:
+                logger.info(f"Duplicate request suppressed. Key: {key}")
+                metrics.inc("webhook_requests_deduped")
+                lines[index] = {
+                    "index": index,
+                    "ok": True,
+                    "deduped": True,
+                    "prompt_id": existing_prompt_id,
+                    "trace_id": trace_id,
+                    "message": "Request already processed",
+                }
+            else:
+                fresh.append((entry, key))
+
+        # --- F5: Render (each template loaded once per batch) ---
+        rendered = get_template_service().render_templates(
+            [(entry[3]["template_id"], entry[3]["inputs"]) for entry, _key in fresh]
+        )
+        to_submit = []
+        for (entry, key), workflow in zip(fresh, rendered, strict=True):
+            if isinstance(workflow, ValueError):
+                metrics.inc("webhook_denied")
+                lines[entry[0]] = _batch_item_error(
+                    entry[0], 400, "template_error", str(workflow), entry[1]
+                )
+            else:
+                to_submit.append((entry, key, workflow))
+
+        response = web.StreamResponse(
+            status=200,
+            headers={
+                "Content-Type": "application/x-ndjson",
+                "Cache-Control": "no-cache",
+            },
+        )
+        await response.prepare(request)
+        counts = {"submitted": 0, "deduped": 0, "failed": 0}
+
+        async def _write_line(line: dict) -> None:
+            if not line["ok"]:
+                counts["failed"] += 1
+            elif line.get("deduped"):
+                counts["deduped"] += 1
+            else:
+                counts["submitted"] += 1
+            await response.write(json.dumps(line).encode("utf-8") + b"\n")
+
+        for index in sorted(lines):
+            await _write_line(lines[index])
+
+        # --- F5/R33: Submit (bulk budget acquisition) ---
+        items = [
+            QueueSubmitItem(
+                workflow,
+                client_id="moltbot-webhook",
+                extra_data={
+                    "moltbot": {
+                        "trace_id": entry[1],
+                        "job_id": entry[3].get("job_id"),
+                        "batch_trace_id": batch_trace_id,
+                    }
+                },
+                trace_id=entry[1],
+            )
+            for entry, _key, workflow in to_submit
+        ]
+        async for position, result in submit_prompt_batch(
+            items, source="webhook", trace_id=batch_trace_id
+        ):
+            (index, trace_id, job_request, normalized), key, _workflow = to_submit[
+                position
+            ]
+            if isinstance(result, Exception):
+                await _write_line(_batch_submit_error(index, trace_id, result))
+                continue
+            try:
+                prompt_id = await _record_queued(
+                    store,
+                    key,
+                    result,
+                    trace_id,
+                    normalized.get("job_id"),
+                    normalized["template_id"],
+                    job_request.callback,
+                    {"batch_trace_id": batch_trace_id},
+                )
+            except Exception as e:
+                await _write_line(_batch_submit_error(index, trace_id, e))
+                continue
+            metrics.inc("webhook_requests_executed")
+            await _write_line(
+                {
+                    "index": index,
+                    "ok": True,
+                    "deduped": False,
+                    "prompt_id": prompt_id,
+                    "trace_id": trace_id,
+                    "mapped": bool(mapping_profile),  # F40
+                    "number": result.get("number"),
+                    "callback_scheduled": bool(job_request.callback),
+                }
+            )
+
+        await response.write(
+            json.dumps(
+                {
+                    "done": True,
+                    "batch_trace_id": batch_trace_id,
+                    "total": len(jobs),
+                    **counts,
+                }
+            ).encode("utf-8")
+            + b"\n"
+        )
+        await response.write_eof()
+        return response
+
+    except Exception as e:
+        logger.exception(f"Unexpected error in webhook batch submission: {e}")
+        metrics.inc("errors")
+        if response is not None and response.prepared:
+            # Headers are out; truncating the stream (no summary line) signals failure.
+            return response
+        return safe_error_response(500, "internal_error")
@@ -42,7 +42,7 @@ if __package__ and "." in __package__:
     from ..services.rate_limit import build_rate_limit_response, check_rate_limit
     from ..services.templates import get_template_service
     from ..services.trace import get_effective_trace_id
-    from ..services.webhook_auth import require_auth
+    from ..services.webhook_auth import arequire_auth
     from ..services.webhook_mapping import apply_mapping, resolve_profile  # F40
 else:  # pragma: no cover (test-only import mode)
     from models.schemas import MAX_BODY_SIZE, WebhookJobRequest
@@ -57,7 +57,7 @@ else:  # pragma: no cover (test-only import mode)
     )
     from services.templates import get_template_service  # type: ignore
     from services.trace import get_effective_trace_id  # type: ignore
-    from services.webhook_auth import require_auth  # type: ignore
+    from services.webhook_auth import arequire_auth  # type: ignore
     from services.webhook_mapping import (  # F40  # type: ignore
         apply_mapping,
         resolve_profile,
@@ -134,7 +134,7 @@ async def webhook_validate_handler(request: web.Request) -> web.Response:
         metrics.inc("errors")
         return _safe_error_response(400, "read_error")
 
-    valid, error = require_auth(request, raw_body)
+    valid, error = await arequire_auth(request, raw_body)
     if not valid:
         metrics.inc("webhook_denied")
         if error in (
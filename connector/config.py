@@ -186,6 +186,7 @@ class ConnectorConfig:
     delivery_max_images: int = DEFAULT_DELIVERY_MAX_IMAGES
     delivery_max_bytes: int = DEFAULT_DELIVERY_MAX_BYTES
     delivery_timeout_sec: int = DEFAULT_DELIVERY_TIMEOUT_SEC
+    delivery_ws_signals: bool = True  # Wake result sweeps from ComfyUI /ws
 
     # Telegram
     telegram_bot_token: Optional[str] = None
@@ -354,6 +355,9 @@ def load_config() -> ConnectorConfig:
         minimum=MIN_DELIVERY_TIMEOUT_SEC,
         maximum=MAX_DELIVERY_TIMEOUT_SEC,
     )
+    cfg.delivery_ws_signals = (
+        os.environ.get("OPENCLAW_CONNECTOR_DELIVERY_WS_SIGNALS", "1") != "0"
+    )
 
     # Telegram
     cfg.telegram_bot_token = os.environ.get("OPENCLAW_CONNECTOR_TELEGRAM_TOKEN")
@@ -6,8 +6,9 @@ Handles communication with the local ComfyUI instance.
 import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 from .config import ConnectorConfig
 
@@ -23,7 +24,7 @@ def _create_session():
     - Keep the import lazy so `python -m unittest discover ...` can run without aiohttp installed.
     """
     try:
-        import aiohttp  # type: ignore
+        import aiohttp
     except ModuleNotFoundError as e:
         raise RuntimeError(
             "aiohttp is required for the chat connector network client. "
@@ -143,6 +144,61 @@ class OpenClawClient:
     async def get_history(self, prompt_id: str) -> dict:
         return await self._request("GET", f"/history/{prompt_id}")
 
+    async def get_recent_history(self, max_items: int) -> dict:
+        """Most recent history entries in one request (completion watcher sweep)."""
+        query = urlencode({"max_items": max(1, int(max_items))})
+        return await self._request("GET", f"/history?{query}")
+
+    async def iter_execution_signals(self) -> AsyncIterator[str]:
+        """
+        Yield a prompt_id (or "" for a plain queue update) per ComfyUI /ws signal.
+
+        Execution events are addressed to the submitting client, so most
+        signals are the broadcast queue `status` updates; either kind is only
+        used to wake the completion sweep early.
+        """
+        import aiohttp
+
+        session = self.session
+        local_session = False
+        if not session:
+            session = _create_session()
+            local_session = True
+        ws_base = "ws" + self.base_url[len("http") :]
+        client_id = f"openclaw-connector-{uuid.uuid4().hex[:12]}"
+        try:
+            async with session.ws_connect(
+                f"{ws_base}/ws?{urlencode({'clientId': client_id})}",
+                headers=self.headers,
+                heartbeat=30,
+            ) as ws:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.ERROR:
+                        break
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue  # binary preview frames
+                    try:
+                        event = json.loads(msg.data)
+                    except (TypeError, ValueError):
+                        continue
+                    if not isinstance(event, dict):
+                        continue
+                    data = event.get("data")
+                    data = data if isinstance(data, dict) else {}
+                    if event.get("type") == "status":
+                        yield ""
+                    elif event.get("type") in (
+                        "execution_success",
+                        "execution_error",
+                        "execution_interrupted",
+                    ) or (
+                        event.get("type") == "executing" and data.get("node") is None
+                    ):
+                        yield str(data.get("prompt_id") or "")
+        finally:
+            if local_session:
+                await session.close()
+
     async def get_trace(self, prompt_id: str) -> dict:
         # F29 Phase 3 Introspection
         # Admin-only typically, gives detailed execution trace/logs for a job
@@ -8,12 +8,23 @@ from .contract import Platform
 from .openclaw_client import OpenClawClient
 from .reply_visibility import decide_reply_visibility
 
+try:
+    from services.completion_watcher import CompletionWatcher
+except ImportError as e:  # pragma: no cover - connector started outside the pack root
+    raise ImportError(
+        "connector.results_poller requires the pack's services package on sys.path"
+    ) from e
+
 logger = logging.getLogger(__name__)
 
 
 class ResultsPoller:
     """
-    Polls ComfyUI history for completed jobs and triggers delivery.
+    Watches ComfyUI history for completed jobs and triggers delivery.
+
+    Every tracked job waits on one shared CompletionWatcher, so the connector
+    issues a single batched history sweep per interval (woken early by /ws
+    queue signals) instead of one polling loop per job.
     """
 
     def __init__(
@@ -33,6 +44,14 @@ class ResultsPoller:
         )  # (approval_id, platform_name, channel_id, sender_id, delivery_context)
         self.active_polls = {}  # prompt_id -> task
         self.active_approval_polls = {}  # approval_id -> task
+        self.watcher = CompletionWatcher(
+            self._sweep_recent_history,
+            fetch_one=self._fetch_history_item,
+            signals=(
+                client.iter_execution_signals if config.delivery_ws_signals else None
+            ),
+            name="connector_results",
+        )
 
     async def start(self):
         """Start the main queue consumer."""
@@ -53,6 +72,7 @@ class ResultsPoller:
             await asyncio.gather(
                 *self.active_approval_polls.values(), return_exceptions=True
             )
+        await self.watcher.close()
         logger.info("ResultsPoller stopped.")
 
     def track_job(
@@ -119,7 +139,7 @@ class ResultsPoller:
             try:
                 prompt_id, platform_name, channel_id, sender_id, delivery_context = item
                 task = asyncio.create_task(
-                    self._poll_job(
+                    self._watch_job(
                         prompt_id,
                         platform_name,
                         channel_id,
@@ -220,7 +240,24 @@ class ResultsPoller:
             delivery_context=delivery_context,
         )
 
-    async def _poll_job(
+    async def _sweep_recent_history(self, max_items: int) -> dict | None:
+        res = await self.client.get_recent_history(max_items)
+        if not res.get("ok"):
+            return None
+        # ComfyUI /history?max_items=N -> { "prompt_id": { ... }, ... }
+        data = res.get("data")
+        return data if isinstance(data, dict) else None
+
+    async def _fetch_history_item(self, prompt_id: str) -> dict | None:
+        res = await self.client.get_history(prompt_id)
+        if not res.get("ok"):
+            return None
+        # ComfyUI /history/{prompt_id} -> { "prompt_id": { ... } }
+        data = res.get("data")
+        item = data.get(prompt_id) if isinstance(data, dict) else None
+        return item if isinstance(item, dict) else None
+
+    async def _watch_job(
         self,
         prompt_id: str,
         platform_name: str,
@@ -228,36 +265,19 @@ class ResultsPoller:
         sender_id: str,
         delivery_context: Optional[Dict[str, Any]] = None,
     ):
-        """Poll history with backoff until complete or timeout."""
-        start_time = time.time()
-        delay = 1.0
-
-        while (time.time() - start_time) < self.config.delivery_timeout_sec:
-            # Check history
-            try:
-                hist = await self.client.get_history(prompt_id)
-                if hist.get("ok"):
-                    # ComfyUI /history/{prompt_id} -> { "prompt_id": { ... } }
-                    data = hist.get("data", {})
-                    if prompt_id in data:
-                        job_data = data[prompt_id]
-                        await self._deliver_results(
-                            prompt_id,
-                            job_data,
-                            platform_name,
-                            channel_id,
-                            delivery_context=delivery_context,
-                        )
-                        return
-            except Exception as e:
-                logger.debug(f"Poll check failed for {prompt_id}: {e}")
-
-            # Backoff
-            try:
-                await asyncio.sleep(delay)
-            except asyncio.CancelledError:
-                raise
-            delay = min(delay * 2, 15)  # Cap at 15s
+        """Wait on the shared completion watcher until complete or timeout."""
+        job_data = await self.watcher.wait(
+            prompt_id, timeout=self.config.delivery_timeout_sec
+        )
+        if job_data is not None:
+            await self._deliver_results(
+                prompt_id,
+                job_data,
+                platform_name,
+                channel_id,
+                delivery_context=delivery_context,
+            )
+            return
 
         logger.warning(f"Job {prompt_id} timed out waiting for results.")
         await self._send_text(
@@ -0,0 +1,142 @@
+"""
+S50 durable idempotency throughput benchmark.
+
+Measures dedupe checks per second through SQLiteDurableBackend at several
+concurrent writer counts (default 1/16/64) and reports how many checks each
+group commit carried. Every key is checked twice, so half the checks are
+duplicates. Each run uses a fresh database in a temp dir.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_repo_on_path() -> None:
+    root = str(_repo_root())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+def _parse_writers(raw: str) -> list[int]:
+    return [int(part) for part in raw.split(",") if part.strip()]
+
+
+def run_benchmark(
+    writers: int, checks: int, *, group_window_ms: float, state_dir: str
+) -> dict[str, Any]:
+    from services.idempotency_store import SQLiteDurableBackend
+
+    db_path = str(Path(state_dir) / f"bench_{writers}.db")
+    backend = SQLiteDurableBackend(db_path, group_window_ms=group_window_ms)
+    per_writer = max(1, checks // writers)
+    duplicates = [0] * writers
+    barrier = threading.Barrier(writers + 1)
+
+    def _writer(index: int) -> None:
+        barrier.wait()
+        for n in range(per_writer):
+            key = f"bench:{(index * per_writer + n) // 2}"
+            is_dup, _ = backend.check_and_record(key, 3600)
+            if is_dup:
+                duplicates[index] += 1
+
+    threads = [
+        threading.Thread(target=_writer, args=(index,), daemon=True)
+        for index in range(writers)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        stats = backend.stats()
+    finally:
+        backend.close()
+
+    total = per_writer * writers
+    return {
+        "writers": writers,
+        "checks": total,
+        "duplicates": sum(duplicates),
+        "elapsed_sec": round(elapsed, 4),
+        "checks_per_sec": round(total / elapsed, 1) if elapsed > 0 else None,
+        "commits": stats["commits"],
+        "checks_per_commit": round(total / max(1, stats["commits"]), 2),
+        "max_group_ops": stats["max_group_ops"],
+        "journal_mode": stats["journal_mode"],
+    }
+
+
+def main() -> int:
+    _ensure_repo_on_path()
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark S50 durable idempotency dedupe checks per second."
+    )
+    parser.add_argument(
+        "--writers",
+        default="1,16,64",
+        help="Comma-separated concurrent writer counts (default: 1,16,64)",
+    )
+    parser.add_argument(
+        "--checks",
+        type=int,
+        default=4096,
+        help="Total checks per run, split across writers (default: 4096)",
+    )
+    parser.add_argument(
+        "--group-window-ms",
+        type=float,
+        default=None,
+        help="Group commit window (default: backend default)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output",
+    )
+    args = parser.parse_args()
+
+    from services.idempotency_store import DEFAULT_GROUP_COMMIT_WINDOW_MS
+
+    window = (
+        DEFAULT_GROUP_COMMIT_WINDOW_MS
+        if args.group_window_ms is None
+        else args.group_window_ms
+    )
+    with tempfile.TemporaryDirectory(prefix="openclaw-idem-bench-") as state_dir:
+        runs = [
+            run_benchmark(
+                writers,
+                args.checks,
+                group_window_ms=window,
+                state_dir=state_dir,
+            )
+            for writers in _parse_writers(args.writers)
+        ]
+    payload = {"group_window_ms": window, "runs": runs}
+
+    if args.pretty:
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+    else:
+        print(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
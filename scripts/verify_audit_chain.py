@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
 
 
@@ -20,6 +21,17 @@ def main() -> int:
         default="",
         help="Explicit audit log path. Defaults to the configured OpenClaw audit path.",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the verify checkpoint and re-hash every retained entry.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to verify rotated files in parallel.",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -32,7 +44,9 @@ def main() -> int:
     sys.path.insert(0, str(_repo_root()))
     from services.audit import verify_audit_chain
 
-    result = verify_audit_chain(args.path or None)
+    result = verify_audit_chain(
+        args.path or None, full=args.full, workers=max(1, args.workers)
+    )
     if args.json:
         print(json.dumps(result.to_dict(), indent=2))
     else:
@@ -167,6 +167,7 @@ class ApprovalService:
 
         Raises:
             ValueError: If request not found or not pending.
+            ApprovalConflictError: If it stopped being pending concurrently.
         """
         request = self._store.get(approval_id, tenant_id=tenant_id)
 
@@ -176,13 +177,13 @@ class ApprovalService:
         # Check expiration first
         if request.is_expired():
             request.expire()
-            self._store.update(request)
+            self._store.update(request, expected_status=ApprovalStatus.PENDING)
             raise ValueError(f"Approval request has expired: {approval_id}")
 
         # Approve
         request.approve(actor)
 
-        if not self._store.update(request):
+        if not self._store.update(request, expected_status=ApprovalStatus.PENDING):
             raise ValueError(f"Failed to update approval request: {approval_id}")
 
         logger.info(f"Approved request: {approval_id} (by={actor})")
@@ -206,6 +207,7 @@ class ApprovalService:
 
         Raises:
             ValueError: If request not found or not pending.
+            ApprovalConflictError: If it stopped being pending concurrently.
         """
         request = self._store.get(approval_id, tenant_id=tenant_id)
 
@@ -215,7 +217,7 @@ class ApprovalService:
         # Reject
         request.reject(actor)
 
-        if not self._store.update(request):
+        if not self._store.update(request, expected_status=ApprovalStatus.PENDING):
             raise ValueError(f"Failed to update approval request: {approval_id}")
 
         logger.info(f"Rejected request: {approval_id} (by={actor})")
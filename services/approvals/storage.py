@@ -1,16 +1,20 @@
 """
 Approval Storage (S7).
-Atomic JSON persistence for approval requests.
+Row-level persistence for approval requests in the shared state store.
 """
 
-import json
+from __future__ import annotations
+
 import logging
 import os
+import sqlite3
 import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any
 
+from ..integrity import IntegrityError, load_verified
 from ..state_dir import get_state_dir
+from ..state_store import StateRow, StateTable, get_state_store
 from ..tenant_context import (
     DEFAULT_TENANT_ID,
     is_multi_tenant_enabled,
@@ -24,247 +28,268 @@ logger = logging.getLogger("ComfyUI-OpenClaw.services.approvals")
 MAX_APPROVALS = 10000
 RETENTION_DAYS = 30
 
+APPROVALS_TABLE = "approvals"
+LEGACY_MIGRATION = "approvals/approvals.json"
+
+_TERMINAL_STATUSES = (
+    ApprovalStatus.APPROVED.value,
+    ApprovalStatus.REJECTED.value,
+    ApprovalStatus.EXPIRED.value,
+)
+
+
+class ApprovalConflictError(ValueError):
+    """The stored approval left the expected status before an update landed."""
+
 
 def _get_approvals_path() -> str:
-    """Get the path to the approvals JSON file."""
-    state_dir = get_state_dir()
-    approvals_dir = os.path.join(state_dir, "approvals")
-    os.makedirs(approvals_dir, exist_ok=True)
-    return os.path.join(approvals_dir, "approvals.json")
+    """Get the path to the legacy approvals JSON file."""
+    return os.path.join(get_state_dir(), "approvals", "approvals.json")
 
 
-def _atomic_write(path: str, data: Dict) -> None:
-    """Atomically write JSON data to a file."""
-    import tempfile
+def _requested_ts(approval: ApprovalRequest) -> float:
+    try:
+        return datetime.fromisoformat(
+            approval.requested_at.replace("Z", "+00:00")
+        ).timestamp()
+    except (ValueError, AttributeError):
+        return 0.0
+
+
+def _to_row(approval: ApprovalRequest) -> StateRow:
+    return StateRow(
+        key=approval.approval_id,
+        payload=approval.to_dict(),
+        tenant_id=approval.tenant_id,
+        status=approval.status.value,
+        category=approval.source.value,
+        updated_at=_requested_ts(approval),
+    )
 
-    dir_path = os.path.dirname(path)
-    os.makedirs(dir_path, exist_ok=True)
 
-    # Write to temp file first
-    fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=dir_path)
+def _from_payload(payload: dict[str, Any]) -> ApprovalRequest | None:
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        # Atomic rename
-        if os.name == "nt":
-            # Windows: need to remove existing file first
-            if os.path.exists(path):
-                os.replace(tmp_path, path)
-            else:
-                os.rename(tmp_path, path)
-        else:
-            os.rename(tmp_path, path)
-    except Exception:
-        # Clean up temp file on error
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
-        raise
-
-
-from ..integrity import IntegrityError, load_verified, save_verified
-
-
-def load_approvals() -> Dict[str, ApprovalRequest]:
-    """Load approvals from disk with integrity check."""
-    path = _get_approvals_path()
+        return ApprovalRequest.from_dict(payload)
+    except Exception as e:
+        logger.warning(f"Skipping invalid approval record: {e}")
+        return None
 
-    if not os.path.exists(path):
-        return {}
 
+def _import_legacy_approvals(table: StateTable) -> int:
+    """Copy approvals.json (integrity envelope) into the approvals table."""
+    path = _get_approvals_path()
+    if not os.path.exists(path):
+        return 0
     try:
         # R77: Load verification
         data = load_verified(path, expected_version=1, migrate=True)
-
-        result = {}
-        if isinstance(data, dict) and "approvals" in data:
-            for item in data["approvals"]:
-                try:
-                    approval = ApprovalRequest.from_dict(item)
-                    result[approval.approval_id] = approval
-                except Exception as e:
-                    logger.warning(f"Skipping invalid approval record: {e}")
-
-        logger.info(f"Loaded {len(result)} approval records")
-        return result
     except IntegrityError as e:
-        # R77: Fail-closed logic with escalation
+        # R77: Fail-closed, a tampered file contributes no approvals.
         logger.critical(
             f"R77: Integrity violation detected in approvals file {path}: {e}"
         )
-        # Return empty (deny all pending approvals) which is safe fail-state
-        return {}
-    except Exception as e:
-        logger.error(f"Failed to load approvals: {e}")
-        return {}
+        return 0
 
-
-def save_approvals(approvals: Dict[str, ApprovalRequest]) -> bool:
-    """Save approvals to disk with integrity envelope."""
-    path = _get_approvals_path()
-
-    try:
-        data = {
-            "version": 1,
-            "saved_at": datetime.now(timezone.utc).isoformat(),
-            "approvals": [a.to_dict() for a in approvals.values()],
-        }
-        # R77: Atomic verified save
-        save_verified(path, data, version=1)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to save approvals: {e}")
-        return False
+    rows = []
+    if isinstance(data, dict):
+        for item in data.get("approvals", []):
+            approval = _from_payload(item)
+            if approval is not None:
+                rows.append(_to_row(approval))
+    return table.put_many(rows)
 
 
 class ApprovalStore:
     """
-    In-memory approval store with persistent backing.
-    Thread-safe through locking.
+    Approval store backed by the ``approvals`` state table.
+    Lookups and status/tenant listings are index queries; each mutation
+    writes only the rows it touches.
     """
 
     def __init__(self):
         self._lock = threading.RLock()
-        self._approvals: Dict[str, ApprovalRequest] = {}
-        self._loaded = False
-
-    def _ensure_loaded(self) -> None:
-        """Lazy-load approvals from disk."""
-        if not self._loaded:
-            self._approvals = load_approvals()
-            self._loaded = True
+        self._table: StateTable | None = None
+
+    def _state(self) -> StateTable:
+        """Open the table, importing the legacy JSON file on first use."""
+        if self._table is None:
+            store = get_state_store()
+            table = store.table(APPROVALS_TABLE)
+            store.migrate_once(
+                LEGACY_MIGRATION, lambda: _import_legacy_approvals(table)
+            )
+            self._table = table
+        return self._table
 
-    def _match_tenant(
-        self, approval: ApprovalRequest, tenant_id: Optional[str]
-    ) -> bool:
+    def _tenant_filter(self, tenant_id: str | None) -> str | None:
         if not is_multi_tenant_enabled() or tenant_id is None:
-            return True
+            return None
         try:
-            expected = normalize_tenant_id(tenant_id)
+            return normalize_tenant_id(tenant_id)
         except Exception:
-            expected = DEFAULT_TENANT_ID
-        return approval.tenant_id == expected
+            return DEFAULT_TENANT_ID
+
+    def _load(self, payloads: list[dict[str, Any]]) -> list[ApprovalRequest]:
+        approvals = (_from_payload(payload) for payload in payloads)
+        return [approval for approval in approvals if approval is not None]
 
     def get(
-        self, approval_id: str, tenant_id: Optional[str] = None
-    ) -> Optional[ApprovalRequest]:
+        self, approval_id: str, tenant_id: str | None = None
+    ) -> ApprovalRequest | None:
         """Get an approval by ID."""
         with self._lock:
-            self._ensure_loaded()
-            approval = self._approvals.get(approval_id)
+            payload = self._state().get(approval_id)
+            if payload is None:
+                return None
+            approval = _from_payload(payload)
             if approval is None:
                 return None
-            if not self._match_tenant(approval, tenant_id):
+            expected = self._tenant_filter(tenant_id)
+            if expected is not None and approval.tenant_id != expected:
                 return None
             return approval
 
     def add(self, approval: ApprovalRequest) -> bool:
         """Add a new approval."""
         with self._lock:
-            self._ensure_loaded()
-
-            if approval.approval_id in self._approvals:
-                logger.warning(f"Approval already exists: {approval.approval_id}")
+            table = self._state()
+            try:
+                with table.store.transaction():
+                    if table.get(approval.approval_id) is not None:
+                        logger.warning(
+                            f"Approval already exists: {approval.approval_id}"
+                        )
+                        return False
+
+                    # Enforce limit
+                    if table.count() >= MAX_APPROVALS:
+                        # Remove oldest terminal approvals first
+                        self._cleanup_old_approvals()
+
+                        if table.count() >= MAX_APPROVALS:
+                            logger.error(f"Max approvals reached ({MAX_APPROVALS})")
+                            return False
+
+                    table.put_many([_to_row(approval)])
+                return True
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save approval {approval.approval_id}: {e}")
                 return False
 
-            # Enforce limit
-            if len(self._approvals) >= MAX_APPROVALS:
-                # Remove oldest terminal approvals first
-                self._cleanup_old_approvals()
-
-                if len(self._approvals) >= MAX_APPROVALS:
-                    logger.error(f"Max approvals reached ({MAX_APPROVALS})")
-                    return False
-
-            self._approvals[approval.approval_id] = approval
-            return save_approvals(self._approvals)
+    def update(
+        self,
+        approval: ApprovalRequest,
+        expected_status: ApprovalStatus | None = None,
+    ) -> bool:
+        """
+        Update an existing approval.
 
-    def update(self, approval: ApprovalRequest) -> bool:
-        """Update an existing approval."""
+        With expected_status the write is a compare-and-set on the stored
+        status, and ApprovalConflictError is raised when another writer (e.g.
+        expire_due) already moved the row out of it.
+        """
         with self._lock:
-            self._ensure_loaded()
-
-            if approval.approval_id not in self._approvals:
-                logger.warning(f"Approval not found: {approval.approval_id}")
+            table = self._state()
+            row = _to_row(approval)
+            try:
+                with table.store.transaction():
+                    if expected_status is not None:
+                        expected = ApprovalStatus(expected_status).value
+                        if table.replace_if_status(row, expected):
+                            return True
+                    current = table.get(approval.approval_id)
+                    if current is None:
+                        logger.warning(f"Approval not found: {approval.approval_id}")
+                        return False
+                    if expected_status is None:
+                        table.put_many([row])
+                        return True
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save approval {approval.approval_id}: {e}")
                 return False
-
-            self._approvals[approval.approval_id] = approval
-            return save_approvals(self._approvals)
+            raise ApprovalConflictError(
+                f"Approval request is no longer {expected}: "
+                f"{approval.approval_id} (status={current.get('status')})"
+            )
 
     def delete(self, approval_id: str) -> bool:
         """Delete an approval."""
         with self._lock:
-            self._ensure_loaded()
-
-            if approval_id not in self._approvals:
+            try:
+                return self._state().delete(approval_id)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to delete approval {approval_id}: {e}")
                 return False
 
-            del self._approvals[approval_id]
-            return save_approvals(self._approvals)
-
-    def list_all(self, tenant_id: Optional[str] = None) -> List[ApprovalRequest]:
+    def list_all(self, tenant_id: str | None = None) -> list[ApprovalRequest]:
         """List all approvals."""
         with self._lock:
-            self._ensure_loaded()
-            return [
-                a for a in self._approvals.values() if self._match_tenant(a, tenant_id)
-            ]
+            payloads = self._state().query(tenant_id=self._tenant_filter(tenant_id))
+            return self._load(payloads)
 
     def list_by_status(
-        self, status: ApprovalStatus, tenant_id: Optional[str] = None
-    ) -> List[ApprovalRequest]:
+        self, status: ApprovalStatus, tenant_id: str | None = None
+    ) -> list[ApprovalRequest]:
         """List approvals by status."""
         with self._lock:
-            self._ensure_loaded()
-            return [
-                a
-                for a in self._approvals.values()
-                if a.status == status and self._match_tenant(a, tenant_id)
-            ]
-
-    def count_pending(self, tenant_id: Optional[str] = None) -> int:
+            payloads = self._state().query(
+                status=ApprovalStatus(status).value,
+                tenant_id=self._tenant_filter(tenant_id),
+            )
+            return self._load(payloads)
+
+    def count_pending(self, tenant_id: str | None = None) -> int:
         """Count pending approvals."""
         with self._lock:
-            self._ensure_loaded()
-            return sum(
-                1
-                for a in self._approvals.values()
-                if a.status == ApprovalStatus.PENDING
-                and self._match_tenant(a, tenant_id)
+            return self._state().count(
+                status=ApprovalStatus.PENDING.value,
+                tenant_id=self._tenant_filter(tenant_id),
             )
 
     def expire_due(self) -> int:
         """Expire all due pending approvals. Returns count of expired."""
         with self._lock:
-            self._ensure_loaded()
-
+            table = self._state()
             now = datetime.now(timezone.utc)
-            expired_count = 0
+            expired = []
 
-            for approval in self._approvals.values():
-                if approval.status == ApprovalStatus.PENDING and approval.is_expired(
-                    now
-                ):
+            for approval in self._load(
+                table.query(status=ApprovalStatus.PENDING.value)
+            ):
+                if approval.is_expired(now):
                     approval.expire()
-                    expired_count += 1
+                    expired.append(_to_row(approval))
 
-            if expired_count > 0:
-                save_approvals(self._approvals)
-                logger.info(f"Expired {expired_count} approval requests")
+            count = 0
+            if expired:
+                pending = ApprovalStatus.PENDING.value
+                try:
+                    # Rows decided since the query above keep their decision.
+                    with table.store.transaction():
+                        for row in expired:
+                            count += table.replace_if_status(row, pending)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to persist expired approvals: {e}")
+                    return 0
+                logger.info(f"Expired {count} approval requests")
 
-            return expired_count
+            return count
 
     def _cleanup_old_approvals(self) -> None:
         """Remove old terminal approvals to make room."""
+        table = self._state()
         now = datetime.now(timezone.utc)
         cutoff_days = RETENTION_DAYS
+        total = table.count()
 
-        # Sort terminal approvals by age
-        terminal = [(aid, a) for aid, a in self._approvals.items() if a.is_terminal()]
+        # Terminal approvals, oldest first
+        terminal = self._load(
+            table.query(status=_TERMINAL_STATUSES, newest_first=False)
+        )
 
         # Remove oldest until under limit or no more terminal
-        to_remove = []
-        for aid, approval in terminal:
+        to_remove: list[str] = []
+        for approval in terminal:
             try:
                 created = datetime.fromisoformat(
                     approval.requested_at.replace("Z", "+00:00")
@@ -272,27 +297,25 @@ class ApprovalStore:
                 age_days = (now - created).days
                 if (
                     age_days > cutoff_days
-                    or len(self._approvals) - len(to_remove) >= MAX_APPROVALS - 100
+                    or total - len(to_remove) >= MAX_APPROVALS - 100
                 ):
-                    to_remove.append(aid)
+                    to_remove.append(approval.approval_id)
             except (ValueError, AttributeError):
                 continue
 
-        for aid in to_remove:
-            del self._approvals[aid]
-
         if to_remove:
+            table.delete_many(to_remove)
             logger.info(f"Cleaned up {len(to_remove)} old approval records")
 
     def reload(self) -> None:
-        """Force reload from disk."""
+        """Re-open the backing table (e.g. after the state dir changed)."""
         with self._lock:
-            self._approvals = load_approvals()
-            self._loaded = True
+            self._table = None
+            self._state()
 
 
 # Singleton instance
-_approval_store: Optional[ApprovalStore] = None
+_approval_store: ApprovalStore | None = None
 
 
 def get_approval_store() -> ApprovalStore:
@@ -11,7 +11,7 @@ import functools
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Iterable, Literal, TypeVar
 
 from .metrics import metrics
@@ -99,7 +99,9 @@ def _executor_for_lane(lane: ExecutorLane) -> ThreadPoolExecutor:
 
 def _record_lane_metrics(lane: ExecutorLane, *, submitted_at: float) -> None:
     metrics.increment(f"executor_{lane}_started")
-    wait_ms = int(max(0.0, (time.perf_counter() - submitted_at) * 1000))
+    wait_ms_exact = max(0.0, (time.perf_counter() - submitted_at) * 1000)
+    metrics.observe("executor_wait_ms", wait_ms_exact, {"lane": lane})
+    wait_ms = int(wait_ms_exact)
     metrics.increment(f"executor_{lane}_wait_ms_total", wait_ms)
     if wait_ms >= _WAIT_BUCKET_MS:
         metrics.increment(f"executor_{lane}_wait_over_{_WAIT_BUCKET_MS}ms")
@@ -110,6 +112,12 @@ def get_executor_diagnostics() -> Dict[str, Any]:
     Return lightweight runtime diagnostics for executor-lane saturation.
     """
     all_counters = metrics.get_all()
+    try:
+        from .plugins.async_bridge import get_plugin_loop_stats
+
+        plugin_loop = get_plugin_loop_stats()
+    except ImportError:
+        plugin_loop = {}
     return {
         "llm": {
             "workers": _LLM_WORKERS,
@@ -127,17 +135,13 @@ def get_executor_diagnostics() -> Dict[str, Any]:
             "wait_ms_total": all_counters.get("executor_io_wait_ms_total", 0),
             "wait_over_250ms": all_counters.get("executor_io_wait_over_250ms", 0),
         },
+        "plugin_loop": plugin_loop,
     }
 
 
-async def run_in_thread(
-    func: Callable[..., T], /, *args: Any, lane: ExecutorLane = "llm", **kwargs: Any
-) -> T:
-    """Run a sync callable in the lane-specific thread pool executor."""
-    loop = asyncio.get_running_loop()
-    # NOTE: We intentionally avoid asyncio's *default* executor here.
-    # In some environments, loop.run_in_executor(None, ...) can hang when args/kwargs are used.
-    pool = _executor_for_lane(lane)
+def _lane_call(
+    lane: ExecutorLane, func: Callable[..., T], args: Any, kwargs: Any
+) -> Callable[[], T]:
     submitted_at = time.perf_counter()
     metrics.increment(f"executor_{lane}_submitted")
     call = functools.partial(func, *args, **kwargs)
@@ -149,7 +153,26 @@ async def run_in_thread(
         finally:
             metrics.increment(f"executor_{lane}_completed")
 
-    return await loop.run_in_executor(pool, _wrapped_call)
+    return _wrapped_call
+
+
+async def run_in_thread(
+    func: Callable[..., T], /, *args: Any, lane: ExecutorLane = "llm", **kwargs: Any
+) -> T:
+    """Run a sync callable in the lane-specific thread pool executor."""
+    loop = asyncio.get_running_loop()
+    # NOTE: We intentionally avoid asyncio's *default* executor here.
+    # In some environments, loop.run_in_executor(None, ...) can hang when args/kwargs are used.
+    pool = _executor_for_lane(lane)
+    return await loop.run_in_executor(pool, _lane_call(lane, func, args, kwargs))
+
+
+def submit_io(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+    """
+    Schedule sync I/O in the IO lane from non-async code (timers, sweeps).
+    Returns the concurrent Future; callers need not wait on it.
+    """
+    return _IO_EXECUTOR.submit(_lane_call("io", func, args, kwargs))
 
 
 async def run_io_in_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
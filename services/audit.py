@@ -3,8 +3,9 @@ R99 Audit Service.
 Standardized, append-only audit events for sensitive operations.
 """
 
-import hmac
-import json
+import atexit
+import contextlib
+import functools
 import logging
 import os
 import secrets
@@ -14,11 +15,23 @@ import uuid
 from typing import Any, Dict, Optional, Tuple
 
 from .audit_pipeline import (
+    VERIFY_CHECKPOINT_SUFFIX,
     AuditVerificationResult,
+    BatchFileAuditSink,
     LocalFileAuditSink,
+    hmac_chain_hash,
     read_last_entry_hash_from_chain,
 )
 from .audit_pipeline import verify_audit_chain as verify_audit_chain_impl
+from .audit_writer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_DURABILITY,
+    DEFAULT_FLUSH_INTERVAL_SEC,
+    DEFAULT_QUEUE_CAPACITY,
+    DURABILITY_MODES,
+    QUEUE_FULL_POLICIES,
+    AuditBatchWriter,
+)
 from .redaction import redact_json, stable_redaction_tag
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.audit")
@@ -163,16 +176,7 @@ def _get_audit_chain_key() -> bytes:
 
 
 def _chain_hash(prev_hash: str, entry: Dict[str, Any]) -> str:
-    payload = json.dumps(
-        entry, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-    )
-    # IMPORTANT: keep the append-only chain keyed, but avoid direct hashlib password
-    # sinks here. CodeQL accepts the stdlib HMAC helper more reliably for audit data.
-    return hmac.digest(
-        _get_audit_chain_key(),
-        f"{prev_hash}|{payload}".encode("utf-8"),
-        "sha256",
-    ).hex()
+    return hmac_chain_hash(_get_audit_chain_key(), prev_hash, entry)
 
 
 def _build_audit_sink(path: str) -> LocalFileAuditSink:
@@ -198,20 +202,110 @@ def _read_last_entry_hash(path: str) -> str:
 
 _LAST_HASH: Optional[str] = None
 _AUDIT_WRITE_LOCK = threading.Lock()
+_AUDIT_SINK: BatchFileAuditSink | None = None
+_AUDIT_WRITER: AuditBatchWriter | None = None
+_AUDIT_WRITER_LOCK = threading.Lock()
+
+
+def _audit_writer_settings() -> dict[str, Any]:
+    mode = (os.environ.get("OPENCLAW_AUDIT_DURABILITY") or "").strip().lower()
+    if mode not in DURABILITY_MODES:
+        if mode:
+            logger.warning("Unknown OPENCLAW_AUDIT_DURABILITY=%r; using batched", mode)
+        mode = DEFAULT_DURABILITY
+    queue_full = (os.environ.get("OPENCLAW_AUDIT_QUEUE_FULL") or "").strip().lower()
+    if queue_full not in QUEUE_FULL_POLICIES:
+        queue_full = "block"
+    return {
+        "mode": mode,
+        "queue_full": queue_full,
+        "capacity": _env_int(
+            "OPENCLAW_AUDIT_QUEUE_CAPACITY", "", DEFAULT_QUEUE_CAPACITY
+        )
+        or DEFAULT_QUEUE_CAPACITY,
+        "batch_size": _env_int("OPENCLAW_AUDIT_BATCH_SIZE", "", DEFAULT_BATCH_SIZE),
+        "flush_interval_sec": _env_int(
+            "OPENCLAW_AUDIT_FLUSH_INTERVAL_MS",
+            "",
+            int(DEFAULT_FLUSH_INTERVAL_SEC * 1000),
+        )
+        / 1000.0,
+    }
 
 
-def _write_audit_entry(entry: Dict[str, Any]) -> None:
+def _get_audit_sink(path: str) -> BatchFileAuditSink:
+    global _AUDIT_SINK
+    max_bytes, backups = _audit_limits()
+    sink = _AUDIT_SINK
+    if sink is None or (sink.path, sink.max_bytes, sink.backups) != (
+        path,
+        max_bytes,
+        backups,
+    ):
+        if sink is not None:
+            sink.close()
+        sink = _AUDIT_SINK = BatchFileAuditSink(
+            path=path,
+            max_bytes=max_bytes,
+            backups=backups,
+            chain_hash=_chain_hash,
+        )
+    return sink
+
+
+def _flush_audit_batch(entries: list[dict[str, Any]]) -> None:
     global _LAST_HASH
-    sink = _build_audit_sink(AUDIT_LOG_PATH)
     # CRITICAL: keep tail-resolution -> rotate -> append -> cache update atomic so
     # restarts and file rotations cannot fork the retained audit chain.
     with _AUDIT_WRITE_LOCK:
+        sink = _get_audit_sink(AUDIT_LOG_PATH)
         try:
-            _LAST_HASH = sink.append_entry(entry, last_hash=_LAST_HASH)
+            _LAST_HASH = sink.append_batch(entries, last_hash=_LAST_HASH)
         except Exception as exc:
+            # Part of the batch may be on disk: re-read the tail next time.
+            _LAST_HASH = None
+            sink.close()
             logger.error("Failed to write audit entry: %s", exc)
 
 
+def _get_audit_writer() -> AuditBatchWriter:
+    global _AUDIT_WRITER
+    with _AUDIT_WRITER_LOCK:
+        if _AUDIT_WRITER is None:
+            _AUDIT_WRITER = AuditBatchWriter(
+                _flush_audit_batch, **_audit_writer_settings()
+            )
+            atexit.register(shutdown_audit_writer)
+        return _AUDIT_WRITER
+
+
+def _write_audit_entry(entry: Dict[str, Any]) -> None:
+    _get_audit_writer().submit(entry)
+
+
+def flush_audit_log(timeout: float | None = None) -> bool:
+    """Block until queued audit entries are on disk."""
+    writer = _AUDIT_WRITER
+    return True if writer is None else writer.flush(timeout)
+
+
+def shutdown_audit_writer(timeout: float | None = 5.0) -> bool:
+    """Drain and stop the audit writer; the next entry starts a fresh one."""
+    global _AUDIT_WRITER
+    with _AUDIT_WRITER_LOCK:
+        writer, _AUDIT_WRITER = _AUDIT_WRITER, None
+    if writer is None:
+        return True
+    with contextlib.suppress(ValueError):
+        atexit.unregister(shutdown_audit_writer)
+    return writer.close(timeout)
+
+
+def get_audit_writer_stats() -> dict[str, Any]:
+    """Durability mode, commit progress and queue drop/high-watermark stats."""
+    return _get_audit_writer().stats()
+
+
 def _persistable_audit_entry(
     *,
     action: str,
@@ -400,5 +494,21 @@ def audit_llm_test(actor_ip: str, ok: bool, error: Optional[str] = None) -> None
     )
 
 
-def verify_audit_chain(path: Optional[str] = None) -> AuditVerificationResult:
-    return verify_audit_chain_impl(path or AUDIT_LOG_PATH, chain_hash=_chain_hash)
+def verify_audit_chain(
+    path: Optional[str] = None, *, full: bool = False, workers: int = 1
+) -> AuditVerificationResult:
+    """Verify the audit chain, resuming from the signed verify checkpoint.
+
+    ``full=True`` re-hashes every retained entry. ``workers > 1`` verifies
+    rotated files in a process pool; keep it at 1 inside the server process.
+    """
+    base_path = path or AUDIT_LOG_PATH
+    # The bound key pickles into workers; _chain_hash would re-read the key
+    # file (or mint a new key) in each child.
+    return verify_audit_chain_impl(
+        base_path,
+        chain_hash=functools.partial(hmac_chain_hash, _get_audit_chain_key()),
+        checkpoint_path=f"{base_path}{VERIFY_CHECKPOINT_SUFFIX}",
+        full=full,
+        workers=workers,
+    )
@@ -0,0 +1,206 @@
+"""
+Background audit writer with group commit.
+
+Audited requests hand entries to a bounded queue; one writer thread drains
+it, extends the hash chain in order and writes each batch with a single
+flush and fsync. Durability modes:
+
+- ``sync``: the caller writes and fsyncs its own entry before returning.
+- ``batched``: the caller blocks until the batch holding its entry has been
+  fsynced. Callers that arrive while a batch is being written share the next
+  write and fsync.
+- ``async``: the caller returns once the entry is queued. The writer flushes
+  every ``flush_interval_sec`` or every ``batch_size`` entries, whichever
+  comes first.
+
+When the queue is full, the ``block`` policy waits for the writer. If the
+queue is still full after ``block_timeout_sec``, the caller writes its entry
+inline. The ``drop`` policy (async mode only) lets the queue discard its
+oldest entry. Drops and high-watermark are accounted in the queue's
+QueueStats.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from .metrics import metrics
+from .observability.backpressure import BoundedQueue
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.audit_writer")
+
+DURABILITY_MODES = ("sync", "batched", "async")
+QUEUE_FULL_POLICIES = ("block", "drop")
+
+DEFAULT_DURABILITY = "batched"
+DEFAULT_QUEUE_CAPACITY = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_SEC = 0.05
+DEFAULT_BLOCK_TIMEOUT_SEC = 1.0
+# Upper bound on how long a batched-mode caller waits for its commit.
+COMMIT_TIMEOUT_SEC = 10.0
+
+AuditBatchFlusher = Callable[[list[dict[str, Any]]], None]
+
+
+class AuditBatchWriter:
+    """Queue audit entries and persist them in ordered batches."""
+
+    def __init__(
+        self,
+        flush_batch: AuditBatchFlusher,
+        *,
+        mode: str = DEFAULT_DURABILITY,
+        capacity: int = DEFAULT_QUEUE_CAPACITY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        queue_full: str = "block",
+        block_timeout_sec: float = DEFAULT_BLOCK_TIMEOUT_SEC,
+    ) -> None:
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"Unknown audit durability mode: {mode}")
+        if queue_full not in QUEUE_FULL_POLICIES:
+            raise ValueError(f"Unknown audit queue-full policy: {queue_full}")
+        self.mode = mode
+        self.queue_full = queue_full
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_sec = max(0.0, float(flush_interval_sec))
+        self.block_timeout_sec = max(0.0, float(block_timeout_sec))
+        self._flush_batch = flush_batch
+        self._queue: BoundedQueue[dict[str, Any]] = BoundedQueue(capacity)
+        self._cond = threading.Condition()
+        # Sequence numbers: entries queued vs. entries handed to flush_batch.
+        self._submitted = 0
+        self._committed = 0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, entry: dict[str, Any]) -> None:
+        """Persist ``entry`` according to the configured durability mode."""
+        if self.mode == "sync":
+            self._write([entry])
+            return
+        with self._cond:
+            if self._closed or not self._reserve_slot_locked():
+                seq = None
+            else:
+                self._queue.enqueue(entry)
+                self._submitted += 1
+                seq = self._submitted
+                self._ensure_thread_locked()
+                self._cond.notify_all()
+            committed = True
+            if seq is not None and self.mode == "batched":
+                target = seq
+                committed = self._cond.wait_for(
+                    lambda: self._committed >= target or self._closed,
+                    COMMIT_TIMEOUT_SEC,
+                )
+        if not committed:
+            logger.warning("Audit entry not committed within %ss", COMMIT_TIMEOUT_SEC)
+        if seq is None:
+            # Writer closed or saturated: never lose the entry, write inline.
+            self._write([entry])
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued entry has been handed to the sink."""
+        with self._cond:
+            if self._thread is None:
+                pending = self._queue.drain()
+            else:
+                self._flush_requested = True
+                self._cond.notify_all()
+                return self._cond.wait_for(
+                    lambda: len(self._queue) == 0 and not self._writing, timeout
+                )
+        if pending:
+            self._write(pending)
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Drain the queue and stop the writer; later submits write inline."""
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return False
+        return self.flush(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "mode": self.mode,
+                "queue_full": self.queue_full,
+                "submitted": self._submitted,
+                "committed": self._committed,
+                "queue": asdict(self._queue.stats()),
+            }
+
+    def _reserve_slot_locked(self) -> bool:
+        if len(self._queue) < self._queue.capacity:
+            return True
+        if self.queue_full == "drop" and self.mode == "async":
+            # BoundedQueue drops the oldest entry and records it in its stats.
+            metrics.inc("audit_entries_dropped")
+            return True
+        metrics.inc("audit_backpressure_waits")
+        self._ensure_thread_locked()
+        return (
+            self._cond.wait_for(
+                lambda: len(self._queue) < self._queue.capacity or self._closed,
+                self.block_timeout_sec,
+            )
+            and not self._closed
+        )
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="openclaw-audit-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._queue) > 0 or self._closed)
+                if len(self._queue) == 0:
+                    return
+                if self.mode == "async":
+                    self._cond.wait_for(
+                        lambda: len(self._queue) >= self.batch_size
+                        or self._closed
+                        or self._flush_requested,
+                        self.flush_interval_sec,
+                    )
+                batch = self._queue.drain(self.batch_size)
+                if len(self._queue) == 0:
+                    self._flush_requested = False
+                self._writing = True
+            try:
+                self._write(batch)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._committed += len(batch)
+                    self._cond.notify_all()
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        if not batch:
+            return
+        try:
+            self._flush_batch(batch)
+        except Exception as exc:
+            logger.error("Audit batch write failed: %s", exc)
+            return
+        metrics.inc("audit_batches_flushed")
+        metrics.inc("audit_entries_written", len(batch))
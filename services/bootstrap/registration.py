@@ -265,14 +265,14 @@ def _do_full_registration(server) -> None:
         source="unknown",
     ):
         """Submit function for scheduler and trigger-triggered runs."""
-        # NOTE: Use IdempotencyStore API (check_and_record/update_prompt_id).
+        # NOTE: Use IdempotencyStore API (acheck_and_record/aupdate_prompt_id).
         # Avoid legacy get_store/get/set usage; wrong API here breaks route registration at runtime.
         from ..idempotency_store import IdempotencyStore
         from ..queue_submit import submit_prompt as _submit_prompt
         from ..templates import get_template_service as _get_template_service
 
         store = IdempotencyStore()
-        is_dup, existing_prompt_id = store.check_and_record(idempotency_key)
+        is_dup, existing_prompt_id = await store.acheck_and_record(idempotency_key)
         if is_dup:
             return {"prompt_id": existing_prompt_id, "deduped": True}
 
@@ -290,7 +290,7 @@ def _do_full_registration(server) -> None:
         )
 
         if result.get("prompt_id"):
-            store.update_prompt_id(idempotency_key, result["prompt_id"])
+            await store.aupdate_prompt_id(idempotency_key, result["prompt_id"])
         return result
 
     runner = get_scheduler_runner()
@@ -0,0 +1,286 @@
+"""
+Deterministic LLM response cache.
+
+Opt-in, content-addressed cache in front of LLMClient.complete(). Identical
+requests (same tenant, provider, model, endpoint, prompts, image, sampling
+params and tools) return the stored response instead of another provider
+round trip. A bounded in-memory LRU tier is always used when enabled; an
+optional on-disk tier under the state dir survives restarts.
+
+Settings (OPENCLAW_* preferred, MOLTBOT_* legacy):
+- OPENCLAW_LLM_RESPONSE_CACHE: off (default) | memory | disk
+- OPENCLAW_LLM_RESPONSE_CACHE_TTL_SEC: entry lifetime (default 3600)
+- OPENCLAW_LLM_RESPONSE_CACHE_MAX_ENTRIES: memory tier size (default 256)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from .ttl_cache import TTLCache
+
+try:
+    from ..config_layers import get_preferred_env_value
+    from ..metrics import metrics
+    from ..state_dir import get_state_dir
+except ImportError:
+    from services.config_layers import get_preferred_env_value
+    from services.metrics import metrics
+    from services.state_dir import get_state_dir
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.cache.llm_response_cache")
+
+MODE_OFF = "off"
+MODE_MEMORY = "memory"
+MODE_DISK = "disk"
+
+DEFAULT_TTL_SEC = 3600.0
+DEFAULT_MAX_ENTRIES = 256
+_MAX_TTL_SEC = 30 * 24 * 3600.0
+_MAX_ENTRIES_CAP = 10_000
+_DISK_DIRNAME = "llm_response_cache"
+# Expired disk entries are swept once per this many writes.
+_DISK_SWEEP_EVERY = 64
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def _env(name: str) -> str | None:
+    value, _legacy = get_preferred_env_value(f"OPENCLAW_{name}", f"MOLTBOT_{name}")
+    return value
+
+
+def _env_number(name: str, default: float, minimum: float, maximum: float) -> float:
+    raw = _env(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(minimum, min(float(raw), maximum))
+    except ValueError:
+        return default
+
+
+def get_cache_mode() -> str:
+    raw = str(_env("LLM_RESPONSE_CACHE") or "").strip().lower()
+    if raw in (MODE_MEMORY, MODE_DISK):
+        return raw
+    if raw in _TRUTHY:
+        return MODE_MEMORY
+    return MODE_OFF
+
+
+def build_cache_key(
+    *,
+    tenant_id: str,
+    provider: str,
+    model: str,
+    base_url: str | None,
+    system: str,
+    user_message: str,
+    image_base64: str | None,
+    image_media_type: str | None,
+    temperature: Any,
+    max_tokens: Any,
+    tools: Any,
+    tool_choice: str | None,
+) -> str:
+    """Canonical SHA-256 over every input that can change the response."""
+    image_digest = None
+    if image_base64:
+        image_digest = hashlib.sha256(image_base64.encode("utf-8")).hexdigest()
+    material = {
+        "v": 1,
+        "tenant": tenant_id,
+        "provider": provider,
+        "model": model,
+        "base_url": base_url or "",
+        "system": system,
+        "user": user_message,
+        "image": image_digest,
+        "image_media_type": image_media_type if image_digest else None,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "tools": tools,
+        "tool_choice": tool_choice,
+    }
+    canonical = json.dumps(
+        material, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + optional disk) TTL cache of completion responses."""
+
+    def __init__(
+        self,
+        *,
+        mode: str = MODE_MEMORY,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: str | None = None,
+    ):
+        self.mode = mode
+        self.ttl_sec = ttl_sec
+        self._memory = TTLCache[dict[str, Any]](max_size=max_entries, ttl_sec=ttl_sec)
+        self._disk_dir = disk_dir
+        self._disk_writes = 0
+        self._lock = threading.Lock()
+
+    def _disk_path(self, tenant_id: str, key: str) -> str | None:
+        if self.mode != MODE_DISK or not self._disk_dir:
+            return None
+        tenant_dir = hashlib.sha256(tenant_id.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._disk_dir, tenant_dir, key[:2], f"{key}.json")
+
+    def get(self, tenant_id: str, key: str) -> dict[str, Any] | None:
+        """Return a private copy of the cached response, or None."""
+        value = self._memory.get(key)
+        if value is not None:
+            metrics.increment("llm_cache_hits")
+            return copy.deepcopy(value)
+
+        value = self._read_disk(tenant_id, key)
+        if value is not None:
+            self._memory.put(key, value)
+            metrics.increment("llm_cache_hits")
+            metrics.increment("llm_cache_disk_hits")
+            return copy.deepcopy(value)
+
+        metrics.increment("llm_cache_misses")
+        return None
+
+    def put(self, tenant_id: str, key: str, response: dict[str, Any]) -> None:
+        try:
+            # Round-trip through JSON so both tiers hold the same plain data.
+            stored = json.loads(json.dumps(response, default=str))
+        except (TypeError, ValueError):
+            return
+        self._memory.put(key, stored)
+        metrics.increment("llm_cache_stores")
+        self._write_disk(tenant_id, key, stored)
+
+    def _read_disk(self, tenant_id: str, key: str) -> dict[str, Any] | None:
+        path = self._disk_path(tenant_id, key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        if float(entry.get("expires_at", 0)) <= time.time():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            return None
+        response = entry.get("response")
+        return response if isinstance(response, dict) else None
+
+    def _write_disk(self, tenant_id: str, key: str, response: dict[str, Any]) -> None:
+        path = self._disk_path(tenant_id, key)
+        if path is None:
+            return
+        now = time.time()
+        entry = {
+            "key": key,
+            "created_at": now,
+            "expires_at": now + self.ttl_sec,
+            "response": response,
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("LLM response cache disk write failed: %s", exc)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            self._disk_writes += 1
+            sweep = self._disk_writes % _DISK_SWEEP_EVERY == 0
+        if sweep:
+            self.purge_expired_disk()
+
+    def purge_expired_disk(self) -> int:
+        """Delete expired on-disk entries. Returns the number removed."""
+        if self.mode != MODE_DISK or not self._disk_dir:
+            return 0
+        removed = 0
+        now = time.time()
+        for root, _dirs, files in os.walk(self._disk_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) + self.ttl_sec <= now:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries expire on their own TTL)."""
+        self._memory = TTLCache[dict[str, Any]](
+            max_size=self._memory.max_size, ttl_sec=self.ttl_sec
+        )
+
+
+_cache_lock = threading.Lock()
+_cache: LLMResponseCache | None = None
+_cache_settings: tuple[str, float, int] | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """Return the process-wide cache, or None when the cache is off."""
+    global _cache, _cache_settings
+    mode = get_cache_mode()
+    if mode == MODE_OFF:
+        return None
+    settings = (
+        mode,
+        _env_number("LLM_RESPONSE_CACHE_TTL_SEC", DEFAULT_TTL_SEC, 1.0, _MAX_TTL_SEC),
+        int(
+            _env_number(
+                "LLM_RESPONSE_CACHE_MAX_ENTRIES",
+                DEFAULT_MAX_ENTRIES,
+                1,
+                _MAX_ENTRIES_CAP,
+            )
+        ),
+    )
+    with _cache_lock:
+        if _cache is None or settings != _cache_settings:
+            disk_dir = None
+            if mode == MODE_DISK:
+                disk_dir = os.path.join(get_state_dir(), _DISK_DIRNAME)
+            _cache = LLMResponseCache(
+                mode=mode,
+                ttl_sec=settings[1],
+                max_entries=settings[2],
+                disk_dir=disk_dir,
+            )
+            _cache_settings = settings
+        return _cache
+
+
+def reset_llm_response_cache() -> None:
+    """Forget the process-wide cache instance (tests/settings reload)."""
+    global _cache, _cache_settings
+    with _cache_lock:
+        _cache = None
+        _cache_settings = None
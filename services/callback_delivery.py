@@ -9,7 +9,13 @@ import os
 from typing import Any, Dict, Optional, Set
 
 from .async_utils import run_io_in_thread
-from .comfyui_history import extract_images, fetch_history, get_job_status
+from .comfyui_history import (
+    extract_images,
+    fetch_history,
+    fetch_recent_history,
+    get_job_status,
+)
+from .completion_watcher import CompletionWatcher, get_loop_completion_watcher
 from .job_events import JobEventType, get_job_event_store  # R71
 from .metrics import metrics
 from .reasoning_redaction import sanitize_operator_payload
@@ -31,6 +37,7 @@ CALLBACK_MAX_RETRIES = int(
 )
 POLL_INTERVAL_SEC = 2
 POLL_MAX_ATTEMPTS = 150  # 5 minutes at 2s interval
+WATCH_TIMEOUT_SEC = POLL_INTERVAL_SEC * POLL_MAX_ATTEMPTS
 
 
 def get_callback_allow_hosts() -> Set[str]:
@@ -58,6 +65,23 @@ async def start_callback_watch(
     )
 
 
+async def _sweep_recent_history(max_items: int) -> dict[str, Any] | None:
+    # IMPORTANT (R129): history reads are network/disk-bound I/O and must not
+    # compete with long LLM calls in the default lane.
+    return await run_io_in_thread(fetch_recent_history, max_items)
+
+
+async def _fetch_history_item(prompt_id: str) -> dict[str, Any] | None:
+    return await run_io_in_thread(fetch_history, prompt_id)
+
+
+def _get_completion_watcher() -> CompletionWatcher:
+    """One history sweep per event loop shared by every pending callback."""
+    return get_loop_completion_watcher(
+        "callback_delivery", _sweep_recent_history, fetch_one=_fetch_history_item
+    )
+
+
 async def _watch_and_deliver(
     prompt_id: str, callback_config: Dict[str, Any], trace_id: Optional[str] = None
 ) -> None:
@@ -78,22 +102,10 @@ async def _watch_and_deliver(
         metrics.inc("callback_blocked")
         return
 
-    # Poll for completion
-    attempts = 0
-    history_item = None
-
-    while attempts < POLL_MAX_ATTEMPTS:
-        await asyncio.sleep(POLL_INTERVAL_SEC)
-        attempts += 1
-
-        # Use thread to avoid blocking event loop
-        # IMPORTANT (R129): history polling is network/disk-bound I/O and must not
-        # compete with long LLM calls in the default lane.
-        history_item = await run_io_in_thread(fetch_history, prompt_id)
-        status = get_job_status(history_item)
-
-        if status in ("completed", "error"):
-            break
+    # Wait for completion on the shared watcher instead of polling per job.
+    history_item = await _get_completion_watcher().wait(
+        prompt_id, timeout=WATCH_TIMEOUT_SEC
+    )
 
     if history_item is None:
         logger.warning(f"[Callback] Job {prompt_id} never completed (timed out)")
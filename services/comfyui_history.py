@@ -6,6 +6,7 @@ Parses ComfyUI /history/{prompt_id} responses and extracts image output metadata
 import json
 import logging
 import os
+import sys
 import unicodedata
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
@@ -324,6 +325,49 @@ def fetch_history(prompt_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _in_process_prompt_queue() -> Any:
+    # CRITICAL: only use the already-loaded host module; never import it here.
+    server_module = sys.modules.get("server")
+    prompt_server = getattr(server_module, "PromptServer", None)
+    instance = getattr(prompt_server, "instance", None)
+    prompt_queue = getattr(instance, "prompt_queue", None)
+    if not callable(getattr(prompt_queue, "get_history", None)):
+        return None
+    return prompt_queue
+
+
+def fetch_recent_history(max_items: int) -> dict[str, Any] | None:
+    """
+    Fetch the `max_items` most recent history entries, keyed by prompt_id.
+
+    Reads the in-process PromptQueue when running inside ComfyUI and falls
+    back to one /history?max_items=N request otherwise. Returns None if
+    history is unavailable.
+    """
+    max_items = max(1, int(max_items))
+    prompt_queue = _in_process_prompt_queue()
+    if prompt_queue is not None:
+        try:
+            history = prompt_queue.get_history(max_items=max_items)
+            if isinstance(history, dict):
+                return history
+        except Exception as e:
+            logger.debug(f"In-process history read failed: {e}")
+
+    url = f"{COMFYUI_URL}/history?{urlencode({'max_items': max_items})}"
+    try:
+        req = Request(url, method="GET")
+        with urlopen(req, timeout=HISTORY_TIMEOUT) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+            return data if isinstance(data, dict) else None
+    except (URLError, HTTPError, json.JSONDecodeError, TimeoutError) as e:
+        logger.debug(f"Failed to fetch recent history: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error fetching recent history: {e}")
+        return None
+
+
 def extract_output_refs(history_item: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract previewable media outputs from a history item."""
     results = []
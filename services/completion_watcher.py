@@ -0,0 +1,308 @@
+"""
+Shared completion watcher for ComfyUI jobs.
+
+Delivery paths (webhook callbacks, connector result delivery) used to run one
+polling loop per job against /history/{prompt_id}; with hundreds of jobs in
+flight that meant hundreds of history requests per second. A CompletionWatcher
+replaces those loops with one sweep task per event loop:
+
+- waiters for the same prompt_id share one future;
+- each sweep fetches the most recent history window once (sized to the number
+  of pending jobs) and resolves every waiter whose job appears in it;
+- when the window came back full, other completions may have pushed a tracked
+  job out of it, so waiters older than one sweep interval are looked up one by
+  one (bounded per sweep, with per-job backoff);
+- an optional execution-signal stream (e.g. ComfyUI's /ws status broadcasts)
+  wakes the sweep as soon as the queue moves, and while signals are flowing the
+  periodic sweep relaxes to a slower safety-net cadence.
+
+ComfyUI only writes a history entry once execution has finished, so presence
+in the window is treated as completion; callers interpret the entry's status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from .metrics import metrics
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.completion_watcher")
+
+# fetch_recent(max_items) -> {prompt_id: history_item}, or None when unavailable.
+HistoryWindowFetcher = Callable[[int], Awaitable[dict[str, Any] | None]]
+# fetch_one(prompt_id) -> history_item, or None when absent/unavailable.
+HistoryItemFetcher = Callable[[str], Awaitable[dict[str, Any] | None]]
+# Yields a prompt_id per execution signal ("" when only the queue changed).
+ExecutionSignalSource = Callable[[], AsyncIterator[str]]
+
+SWEEP_INTERVAL_SEC = 1.0
+SWEEP_MAX_BACKOFF_SEC = 15.0
+SWEEP_MIN_GAP_SEC = 0.25
+SIGNALLED_SWEEP_INTERVAL_SEC = 10.0
+SWEEP_WINDOW_MARGIN = 32
+SWEEP_WINDOW_MAX = 1024
+SWEEP_PROBE_MAX = 16
+SIGNAL_RECONNECT_MAX_SEC = 30.0
+
+
+class CompletionWatcher:
+    """
+    Multiplexes completion waits for many prompt_ids onto one history sweep.
+
+    Bound to the event loop it is first used on. The sweep (and signal) tasks
+    only run while at least one waiter is pending.
+    """
+
+    def __init__(
+        self,
+        fetch_recent: HistoryWindowFetcher,
+        *,
+        fetch_one: HistoryItemFetcher | None = None,
+        signals: ExecutionSignalSource | None = None,
+        interval_sec: float = SWEEP_INTERVAL_SEC,
+        signalled_interval_sec: float = SIGNALLED_SWEEP_INTERVAL_SEC,
+        min_gap_sec: float = SWEEP_MIN_GAP_SEC,
+        name: str = "history",
+    ) -> None:
+        self.name = name
+        self._fetch_recent = fetch_recent
+        self._fetch_one = fetch_one
+        self._signals = signals
+        self._interval_sec = interval_sec
+        self._signalled_interval_sec = max(interval_sec, signalled_interval_sec)
+        self._min_gap_sec = min_gap_sec
+        self._futures: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._waiters: dict[str, int] = {}
+        # prompt_id -> (next per-prompt lookup time, current lookup backoff)
+        self._probe_due: dict[str, tuple[float, float]] = {}
+        self._wake = asyncio.Event()
+        self._sweeper: asyncio.Task | None = None
+        self._signal_task: asyncio.Task | None = None
+        self._signals_live = False
+        self._closed = False
+
+        # Metrics
+        self.sweeps = 0
+        self.sweep_errors = 0
+        self.resolved = 0
+        self.probes = 0
+        self.signals_seen = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._futures)
+
+    async def wait(self, prompt_id: str, timeout: float) -> dict[str, Any] | None:
+        """Wait up to timeout seconds for prompt_id's history entry."""
+        if self._closed:
+            raise RuntimeError("CompletionWatcher is closed")
+        future = self._futures.get(prompt_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[prompt_id] = future
+            self._probe_due[prompt_id] = (
+                time.monotonic() + self._interval_sec,
+                self._interval_sec,
+            )
+        self._waiters[prompt_id] = self._waiters.get(prompt_id, 0) + 1
+        self._ensure_running()
+        # Sweep promptly for new waiters; the event coalesces bursts of tracking.
+        self._wake_sweep()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._release(prompt_id)
+
+    def resolve(self, prompt_id: str, history_item: dict[str, Any]) -> bool:
+        """Complete every waiter for prompt_id. Returns False if none pending."""
+        future = self._futures.get(prompt_id)
+        if future is None or future.done():
+            return False
+        future.set_result(history_item)
+        self.resolved += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "pending": len(self._futures),
+            "sweeps": self.sweeps,
+            "sweep_errors": self.sweep_errors,
+            "resolved": self.resolved,
+            "probes": self.probes,
+            "signals_seen": self.signals_seen,
+            "signals_live": self._signals_live,
+        }
+
+    async def close(self) -> None:
+        """Stop background tasks and cancel outstanding waits."""
+        self._closed = True
+        tasks = [t for t in (self._sweeper, self._signal_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._waiters.clear()
+        self._probe_due.clear()
+
+    def _release(self, prompt_id: str) -> None:
+        remaining = self._waiters.get(prompt_id, 1) - 1
+        if remaining > 0:
+            self._waiters[prompt_id] = remaining
+            return
+        self._waiters.pop(prompt_id, None)
+        self._probe_due.pop(prompt_id, None)
+        future = self._futures.pop(prompt_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    def _wake_sweep(self) -> None:
+        self._wake.set()
+
+    def _ensure_running(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+        if self._signals is not None and (
+            self._signal_task is None or self._signal_task.done()
+        ):
+            self._signal_task = asyncio.get_running_loop().create_task(
+                self._signal_loop(self._signals)
+            )
+
+    async def _sweep_loop(self) -> None:
+        delay = self._interval_sec
+        last_sweep = 0.0
+        try:
+            while self._futures:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                gap = self._min_gap_sec - (time.monotonic() - last_sweep)
+                if gap > 0:
+                    await asyncio.sleep(gap)
+                self._wake.clear()
+                if not self._futures:
+                    break
+                last_sweep = time.monotonic()
+                window = min(len(self._futures) + SWEEP_WINDOW_MARGIN, SWEEP_WINDOW_MAX)
+                try:
+                    with metrics.timer(
+                        "history_fetch_duration_ms", {"source": self.name}
+                    ):
+                        history = await self._fetch_recent(window)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"[{self.name}] history sweep failed: {e}")
+                    history = None
+                if history is None:
+                    self.sweep_errors += 1
+                    delay = min(
+                        max(delay, self._interval_sec) * 2, SWEEP_MAX_BACKOFF_SEC
+                    )
+                    continue
+                self.sweeps += 1
+                for prompt_id, item in history.items():
+                    if isinstance(item, dict):
+                        self.resolve(prompt_id, item)
+                if len(history) >= window:
+                    await self._probe_stragglers()
+                delay = (
+                    self._signalled_interval_sec
+                    if self._signals_live
+                    else self._interval_sec
+                )
+        finally:
+            if self._signal_task is not None and not self._futures:
+                self._signal_task.cancel()
+
+    async def _probe_stragglers(self) -> None:
+        """Look up waiters that a full history window may have pushed out."""
+        if self._fetch_one is None:
+            return
+        now = time.monotonic()
+        due = sorted(
+            (next_due, prompt_id)
+            for prompt_id, (next_due, _) in self._probe_due.items()
+            if next_due <= now
+            and prompt_id in self._futures
+            and not self._futures[prompt_id].done()
+        )[:SWEEP_PROBE_MAX]
+        if not due:
+            return
+        prompt_ids = [prompt_id for _, prompt_id in due]
+        for prompt_id in prompt_ids:
+            _, backoff = self._probe_due[prompt_id]
+            # Jobs that are simply still running are re-checked less and less.
+            next_backoff = min(backoff * 2, SWEEP_MAX_BACKOFF_SEC)
+            self._probe_due[prompt_id] = (now + backoff, next_backoff)
+        self.probes += len(prompt_ids)
+        results = await asyncio.gather(
+            *(self._fetch_one(prompt_id) for prompt_id in prompt_ids),
+            return_exceptions=True,
+        )
+        for prompt_id, item in zip(prompt_ids, results, strict=True):
+            if isinstance(item, dict):
+                self.resolve(prompt_id, item)
+            elif isinstance(item, Exception):
+                logger.debug(
+                    f"[{self.name}] history lookup for {prompt_id} failed: {item}"
+                )
+
+    async def _signal_loop(self, signals: ExecutionSignalSource) -> None:
+        backoff = 1.0
+        while self._futures and not self._closed:
+            try:
+                async for prompt_id in signals():
+                    self._signals_live = True
+                    backoff = 1.0
+                    self.signals_seen += 1
+                    if not prompt_id or prompt_id in self._futures:
+                        self._wake_sweep()
+                    if not self._futures:
+                        break
+            except asyncio.CancelledError:
+                self._signals_live = False
+                raise
+            except Exception as e:
+                logger.debug(f"[{self.name}] execution signals unavailable: {e}")
+            self._signals_live = False
+            # The sweep keeps running at its normal cadence while disconnected.
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, SIGNAL_RECONNECT_MAX_SEC)
+
+
+_LOOP_WATCHERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, CompletionWatcher]
+] = weakref.WeakKeyDictionary()
+
+
+def get_loop_completion_watcher(
+    name: str,
+    fetch_recent: HistoryWindowFetcher,
+    *,
+    fetch_one: HistoryItemFetcher | None = None,
+    signals: ExecutionSignalSource | None = None,
+) -> CompletionWatcher:
+    """Return the running loop's shared watcher for name, creating it once."""
+    loop = asyncio.get_running_loop()
+    watchers = _LOOP_WATCHERS.get(loop)
+    if watchers is None:
+        watchers = _LOOP_WATCHERS[loop] = {}
+    watcher = watchers.get(name)
+    if watcher is None or watcher._closed:
+        watcher = watchers[name] = CompletionWatcher(
+            fetch_recent, fetch_one=fetch_one, signals=signals, name=name
+        )
+    return watcher
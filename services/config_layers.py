@@ -47,6 +47,8 @@ OBS_TOKEN_ENV_KEYS = ("OPENCLAW_OBSERVABILITY_TOKEN", "MOLTBOT_OBSERVABILITY_TOK
 
 _RUNTIME_OVERRIDE_LOCK = Lock()
 _RUNTIME_OVERRIDES: Dict[str, Dict[str, Any]] = {}
+# Bumped on every override write so readers can cache resolved config.
+_RUNTIME_OVERRIDE_REVISION = 0
 
 
 def get_first_present_env(
@@ -83,9 +85,17 @@ def get_runtime_overrides(section: str) -> Dict[str, Any]:
         return dict(_RUNTIME_OVERRIDES.get(section, {}))
 
 
+def get_runtime_overrides_revision() -> int:
+    """Return a counter that changes whenever any runtime override is written."""
+    with _RUNTIME_OVERRIDE_LOCK:
+        return _RUNTIME_OVERRIDE_REVISION
+
+
 def set_runtime_overrides(section: str, updates: Mapping[str, Any]) -> Dict[str, Any]:
     """Merge runtime overrides for a section. `None` value removes the key."""
+    global _RUNTIME_OVERRIDE_REVISION
     with _RUNTIME_OVERRIDE_LOCK:
+        _RUNTIME_OVERRIDE_REVISION += 1
         current = dict(_RUNTIME_OVERRIDES.get(section, {}))
         for key, value in updates.items():
             if value is None:
@@ -101,7 +111,9 @@ def set_runtime_overrides(section: str, updates: Mapping[str, Any]) -> Dict[str,
 
 def clear_runtime_overrides(section: str, keys: Optional[Iterable[str]] = None) -> None:
     """Clear runtime overrides for a section or specific keys in the section."""
+    global _RUNTIME_OVERRIDE_REVISION
     with _RUNTIME_OVERRIDE_LOCK:
+        _RUNTIME_OVERRIDE_REVISION += 1
         if keys is None:
             _RUNTIME_OVERRIDES.pop(section, None)
             return
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import threading
 import time
+import uuid
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -14,6 +14,7 @@ try:
     from .audit import emit_audit_event
     from .secret_store import SecretStore, get_secret_store
     from .state_dir import get_state_dir
+    from .state_store import STATE_DB_NAME, StateRow, open_state_store
     from .tenant_context import (
         DEFAULT_TENANT_ID,
         get_current_tenant_id,
@@ -24,6 +25,11 @@ except ImportError:
     from services.audit import emit_audit_event  # type: ignore
     from services.secret_store import SecretStore, get_secret_store  # type: ignore
     from services.state_dir import get_state_dir  # type: ignore
+    from services.state_store import (
+        STATE_DB_NAME,
+        StateRow,
+        open_state_store,
+    )
     from services.tenant_context import (  # type: ignore
         DEFAULT_TENANT_ID,
         get_current_tenant_id,
@@ -34,6 +40,8 @@ except ImportError:
 logger = logging.getLogger("ComfyUI-OpenClaw.services.connector_installation_registry")
 
 INSTALLATION_STORE_FILE = "connector_installations.json"
+INSTALLATIONS_TABLE = "connector_installations"
+INSTALLATION_AUDIT_TABLE = "connector_installation_audit"
 MAX_INSTALLATION_AUDIT = 500
 
 
@@ -124,6 +132,56 @@ class InstallationResolution:
         return payload
 
 
+def _installation_from_dict(item: dict[str, Any]) -> ConnectorInstallation:
+    return ConnectorInstallation(
+        platform=item.get("platform", ""),
+        tenant_id=item.get("tenant_id", DEFAULT_TENANT_ID),
+        workspace_id=item.get("workspace_id", ""),
+        installation_id=item.get("installation_id", ""),
+        token_refs=dict(item.get("token_refs", {}) or {}),
+        status=item.get("status", InstallationStatus.CREATED.value),
+        updated_at=float(item.get("updated_at", time.time())),
+        created_at=float(item.get("created_at", time.time())),
+        status_reason=item.get("status_reason", ""),
+        metadata=dict(item.get("metadata", {}) or {}),
+    )
+
+
+def _audit_event_from_dict(item: dict[str, Any]) -> InstallationAuditEvent:
+    return InstallationAuditEvent(
+        timestamp=float(item.get("timestamp", time.time())),
+        action=item.get("action", "unknown"),
+        installation_id=item.get("installation_id", ""),
+        platform=item.get("platform", ""),
+        tenant_id=item.get("tenant_id", DEFAULT_TENANT_ID),
+        workspace_id=item.get("workspace_id", ""),
+        status=item.get("status", ""),
+        details=dict(item.get("details", {}) or {}),
+    )
+
+
+def _installation_row(inst: ConnectorInstallation) -> StateRow:
+    return StateRow(
+        key=inst.installation_id,
+        payload=asdict(inst),
+        tenant_id=inst.tenant_id,
+        status=inst.status,
+        category=inst.platform,
+        updated_at=inst.updated_at,
+    )
+
+
+def _audit_row(event: InstallationAuditEvent) -> StateRow:
+    return StateRow(
+        key=f"{event.timestamp:.6f}:{uuid.uuid4().hex[:8]}",
+        payload=event.to_dict(),
+        tenant_id=event.tenant_id,
+        status=event.status,
+        category=event.installation_id,
+        updated_at=event.timestamp,
+    )
+
+
 class ConnectorInstallationRegistry:
     """Persistent multi-workspace installation registry with fail-closed resolution."""
 
@@ -134,8 +192,12 @@ class ConnectorInstallationRegistry:
         secret_store: Optional[SecretStore] = None,
     ):
         self._state_dir = Path(state_dir or get_state_dir())
+        # Legacy whole-file store, imported once into the state database.
         self._path = self._state_dir / INSTALLATION_STORE_FILE
         self._secret_store = secret_store or get_secret_store(str(self._state_dir))
+        self._state = open_state_store(self._state_dir / STATE_DB_NAME)
+        self._table = self._state.table(INSTALLATIONS_TABLE)
+        self._audit_table = self._state.table(INSTALLATION_AUDIT_TABLE)
         self._lock = threading.RLock()
         self._installations: Dict[str, ConnectorInstallation] = {}
         self._audit_trail: List[InstallationAuditEvent] = []
@@ -176,7 +238,7 @@ class ConnectorInstallationRegistry:
         action: str,
         installation: ConnectorInstallation,
         **details: Any,
-    ) -> None:
+    ) -> InstallationAuditEvent:
         event = InstallationAuditEvent(
             timestamp=time.time(),
             action=action,
@@ -203,58 +265,49 @@ class ConnectorInstallationRegistry:
                 **details,
             },
         )
+        return event
 
     def _load(self) -> None:
-        if not self._path.exists():
-            return
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
-            installations = data.get("installations", [])
-            audit_trail = data.get("audit_trail", [])
+            self._state.migrate_once(INSTALLATION_STORE_FILE, self._import_legacy)
             self._installations = {}
-            for item in installations:
-                inst = ConnectorInstallation(
-                    platform=item.get("platform", ""),
-                    tenant_id=item.get("tenant_id", DEFAULT_TENANT_ID),
-                    workspace_id=item.get("workspace_id", ""),
-                    installation_id=item.get("installation_id", ""),
-                    token_refs=dict(item.get("token_refs", {}) or {}),
-                    status=item.get("status", InstallationStatus.CREATED.value),
-                    updated_at=float(item.get("updated_at", time.time())),
-                    created_at=float(item.get("created_at", time.time())),
-                    status_reason=item.get("status_reason", ""),
-                    metadata=dict(item.get("metadata", {}) or {}),
-                )
-                if inst.installation_id:
-                    self._installations[inst.installation_id] = inst
+            for item in self._table.query(newest_first=False):
+                inst = _installation_from_dict(item)
+                self._installations[inst.installation_id] = inst
             self._audit_trail = [
-                InstallationAuditEvent(
-                    timestamp=float(item.get("timestamp", time.time())),
-                    action=item.get("action", "unknown"),
-                    installation_id=item.get("installation_id", ""),
-                    platform=item.get("platform", ""),
-                    tenant_id=item.get("tenant_id", DEFAULT_TENANT_ID),
-                    workspace_id=item.get("workspace_id", ""),
-                    status=item.get("status", ""),
-                    details=dict(item.get("details", {}) or {}),
-                )
-                for item in audit_trail
-                if item.get("installation_id")
+                _audit_event_from_dict(item)
+                for item in self._audit_table.query(newest_first=False)
             ]
         except Exception as exc:
             logger.error("Failed to load connector installation registry: %s", exc)
             self._installations = {}
             self._audit_trail = []
 
-    def _save(self) -> None:
-        self._state_dir.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "installations": [asdict(i) for i in self._installations.values()],
-            "audit_trail": [event.to_dict() for event in self._audit_trail],
-        }
-        temp_path = self._path.with_suffix(".tmp")
-        temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        os.replace(temp_path, self._path)
+    def _import_legacy(self) -> int:
+        """Copy connector_installations.json into the state tables."""
+        if not self._path.exists():
+            return 0
+        data = json.loads(self._path.read_text(encoding="utf-8"))
+        installations = [
+            _installation_from_dict(item) for item in data.get("installations", [])
+        ]
+        events = [
+            _audit_event_from_dict(item)
+            for item in data.get("audit_trail", [])
+            if item.get("installation_id")
+        ]
+        self._audit_table.put_many(_audit_row(event) for event in events)
+        self._audit_table.prune(MAX_INSTALLATION_AUDIT)
+        return self._table.put_many(
+            _installation_row(inst) for inst in installations if inst.installation_id
+        )
+
+    def _save(self, inst: ConnectorInstallation, event: InstallationAuditEvent) -> None:
+        """Persist one installation and its audit event in one transaction."""
+        with self._state.transaction():
+            self._table.put_many([_installation_row(inst)])
+            self._audit_table.put_many([_audit_row(event)])
+            self._audit_table.prune(MAX_INSTALLATION_AUDIT)
 
     def upsert_installation(
         self,
@@ -306,8 +359,8 @@ class ConnectorInstallationRegistry:
                 metadata=dict(metadata or (existing.metadata if existing else {})),
             )
             self._installations[normalized_installation] = inst
-            self._audit("upsert", inst, token_ref_count=len(inst.token_refs))
-            self._save()
+            event = self._audit("upsert", inst, token_ref_count=len(inst.token_refs))
+            self._save(inst, event)
             return inst
 
     def get_installation(
@@ -374,8 +427,8 @@ class ConnectorInstallationRegistry:
             inst.status_reason = reason
             inst.updated_at = time.time()
             self._installations[inst.installation_id] = inst
-            self._audit(action, inst, reason=reason, **(details or {}))
-            self._save()
+            event = self._audit(action, inst, reason=reason, **(details or {}))
+            self._save(inst, event)
             return ConnectorInstallation(**asdict(inst))
 
     def activate_installation(
@@ -416,13 +469,13 @@ class ConnectorInstallationRegistry:
             inst.status_reason = reason
             inst.updated_at = time.time()
             self._installations[inst.installation_id] = inst
-            self._audit(
+            event = self._audit(
                 "rotate",
                 inst,
                 reason=reason,
                 token_ref_count=len(inst.token_refs),
             )
-            self._save()
+            self._save(inst, event)
             return ConnectorInstallation(**asdict(inst))
 
     def revoke_installation(
@@ -464,8 +517,8 @@ class ConnectorInstallationRegistry:
             inst.status_reason = reason
             inst.updated_at = time.time()
             self._installations[inst.installation_id] = inst
-            self._audit("uninstall", inst, reason=reason)
-            self._save()
+            event = self._audit("uninstall", inst, reason=reason)
+            self._save(inst, event)
             return ConnectorInstallation(**asdict(inst))
 
     def update_installation_health(
@@ -490,13 +543,13 @@ class ConnectorInstallationRegistry:
             inst.metadata = metadata
             inst.updated_at = time.time()
             self._installations[inst.installation_id] = inst
-            self._audit(
+            event = self._audit(
                 "health_update",
                 inst,
                 health_code=metadata["health"]["state"],
                 reason=metadata["health"]["reason"],
             )
-            self._save()
+            self._save(inst, event)
             return ConnectorInstallation(**asdict(inst))
 
     def resolve_installation(
@@ -16,13 +16,18 @@ from .providers.catalog import (
     normalize_provider_base_url,
 )
 from .providers.keys import get_api_key_for_provider
-from .runtime_config import get_effective_config
+from .runtime_config import get_effective_config, get_effective_config_generation
 
 
 def get_effective_llm_config() -> tuple[dict[str, Any], dict[str, Any]]:
     return get_effective_config()
 
 
+def get_effective_llm_config_generation() -> int:
+    """Snapshot generation; changes whenever the effective config may have."""
+    return get_effective_config_generation()
+
+
 def get_effective_llm_provider() -> str:
     effective, _sources = get_effective_llm_config()
     return str(effective.get("provider") or DEFAULT_PROVIDER).lower()
@@ -174,6 +174,29 @@ class ExecutionBudgetLimiter:
             for fail-fast behavior. For truly non-blocking acquire, consider additional
             synchronization (see technical review doc).
         """
+        async with self.acquire_many(
+            1, source=source, trace_id=trace_id, tenant_id=tenant_id
+        ):
+            yield
+
+    @asynccontextmanager
+    async def acquire_many(
+        self,
+        count: int,
+        source: str = "unknown",
+        trace_id: str | None = None,
+        tenant_id: str | None = None,
+    ):
+        """
+        Acquire up to `count` concurrency slots in one pass (batch submission).
+
+        Grants as many slots as the global/source/tenant budgets currently
+        allow, capped at `count`, and yields the number granted (>= 1). Callers
+        run at most that many submissions concurrently.
+
+        Raises:
+            BudgetExceededError: If not even one slot is available
+        """
         # Normalize source
         source = source.lower() if source else "unknown"
         if source not in self._source_semaphores:
@@ -182,6 +205,72 @@ class ExecutionBudgetLimiter:
         if is_multi_tenant_enabled():
             tenant = normalize_tenant_id(tenant_id or get_current_tenant_id())
 
+        source_semaphore, tenant_semaphore = await self._check_available(
+            source, tenant, trace_id
+        )
+        semaphores = [self._global_semaphore]
+        if tenant_semaphore is not None:
+            semaphores.append(tenant_semaphore)
+        if source_semaphore is not None:
+            semaphores.append(source_semaphore)
+
+        # Acquire semaphores manually (explicit control). An unlocked asyncio
+        # semaphore acquires without yielding, so a slot is all-or-nothing.
+        granted = 0
+        try:
+            while granted < max(1, count) and not any(
+                sem.locked() for sem in semaphores
+            ):
+                for sem in semaphores:
+                    await sem.acquire()
+                granted += 1
+        except BaseException:
+            self._release_slots(semaphores, granted)
+            raise
+
+        # Update tracking
+        self._inflight_total += granted
+        self._inflight_by_source[source] = (
+            self._inflight_by_source.get(source, 0) + granted
+        )
+        self._inflight_by_tenant[tenant] = (
+            self._inflight_by_tenant.get(tenant, 0) + granted
+        )
+
+        logger.debug(
+            f"Acquired budget x{granted} for {source} (inflight: total={self._inflight_total}, "
+            f"{source}={self._inflight_by_source[source]}, trace_id={trace_id})"
+        )
+
+        try:
+            yield granted
+        finally:
+            # Release and update tracking (always runs)
+            self._inflight_total -= granted
+            self._inflight_by_source[source] -= granted
+            self._inflight_by_tenant[tenant] = max(
+                0, self._inflight_by_tenant.get(tenant, 0) - granted
+            )
+            if self._inflight_by_tenant[tenant] == 0:
+                self._inflight_by_tenant.pop(tenant, None)
+
+            self._release_slots(semaphores, granted)
+
+            logger.debug(
+                f"Released budget x{granted} for {source} (inflight: total={self._inflight_total}, "
+                f"{source}={self._inflight_by_source[source]}, trace_id={trace_id})"
+            )
+
+    @staticmethod
+    def _release_slots(semaphores: list[asyncio.Semaphore], granted: int) -> None:
+        for _ in range(granted):
+            for sem in reversed(semaphores):
+                sem.release()
+
+    async def _check_available(
+        self, source: str, tenant: str, trace_id: str | None
+    ) -> tuple[asyncio.Semaphore | None, asyncio.Semaphore | None]:
+        """Fail fast when any budget has no free slot; returns (source, tenant) semaphores."""
         # Check global budget (locked check + manual acquire)
         if self._global_semaphore.locked():
             logger.warning(
@@ -249,79 +338,7 @@ class ExecutionBudgetLimiter:
                     source=source,
                     retry_after=1,
                 )
-
-        # Acquire semaphores manually (explicit control)
-        try:
-            await self._global_semaphore.acquire()
-        except Exception:
-            # Failed to acquire global, nothing to release
-            raise
-
-        global_acquired = True
-
-        try:
-            tenant_acquired = False
-            if tenant_semaphore is not None:
-                try:
-                    await tenant_semaphore.acquire()
-                    tenant_acquired = True
-                except Exception:
-                    self._global_semaphore.release()
-                    raise
-
-            if source_semaphore:
-                try:
-                    await source_semaphore.acquire()
-                    source_acquired = True
-                except Exception:
-                    # Failed to acquire source, release global and re-raise
-                    if tenant_acquired and tenant_semaphore is not None:
-                        tenant_semaphore.release()
-                    self._global_semaphore.release()
-                    raise
-            else:
-                source_acquired = False
-
-            # Update tracking
-            self._inflight_total += 1
-            self._inflight_by_source[source] = (
-                self._inflight_by_source.get(source, 0) + 1
-            )
-            self._inflight_by_tenant[tenant] = (
-                self._inflight_by_tenant.get(tenant, 0) + 1
-            )
-
-            logger.debug(
-                f"Acquired budget for {source} (inflight: total={self._inflight_total}, "
-                f"{source}={self._inflight_by_source[source]}, trace_id={trace_id})"
-            )
-
-            try:
-                yield
-            finally:
-                # Release and update tracking (always runs)
-                self._inflight_total -= 1
-                self._inflight_by_source[source] -= 1
-                self._inflight_by_tenant[tenant] = max(
-                    0, self._inflight_by_tenant.get(tenant, 0) - 1
-                )
-                if self._inflight_by_tenant[tenant] == 0:
-                    self._inflight_by_tenant.pop(tenant, None)
-
-                if source_acquired and source_semaphore:
-                    source_semaphore.release()
-                if tenant_acquired and tenant_semaphore is not None:
-                    tenant_semaphore.release()
-                self._global_semaphore.release()
-
-                logger.debug(
-                    f"Released budget for {source} (inflight: total={self._inflight_total}, "
-                    f"{source}={self._inflight_by_source[source]}, trace_id={trace_id})"
-                )
-        except Exception:
-            # Exception during execution (after successful acquire)
-            # Finally block above already released, just re-raise
-            raise
+        return source_semaphore, tenant_semaphore
 
     def get_stats(self) -> Dict[str, int]:
         """Get current inflight statistics."""
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
 import tempfile
 import time
-from dataclasses import asdict, dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -24,6 +26,16 @@ DEDUPE_WINDOW_SEC = 2.0  # Suppress duplicate events within 2 seconds
 MIN_CANDIDATE_INTERVAL_SEC = 2.0  # Minimum interval between attempts
 DEFAULT_HEALTH_SCORE = 70  # Start neutral (range 0-100)
 
+# R14: latency-aware routing
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_WINDOW = 64  # Recent samples kept per provider/model for p95
+# Latencies below this are treated as equal, so fast local/mocked providers
+# never reorder candidates on noise.
+LATENCY_FLOOR_MS = 250.0
+LATENCY_DEAD_BAND_RATIO = 1.5  # Slower than the fastest peer by less: no penalty
+LATENCY_PENALTY_PER_DOUBLING = 10.0  # Health points per 2x slower than fastest
+MAX_LATENCY_PENALTY = 30.0
+
 
 # Error categories for failover decisions
 class ErrorCategory(Enum):
@@ -60,6 +72,23 @@ class CooldownDecision:
     bucket: str
 
 
+@dataclass
+class LatencyStats:
+    """EWMA plus a sliding window (for p95) of request latency in ms."""
+
+    ewma_ms: float
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def add(self, latency_ms: float) -> None:
+        self.ewma_ms += LATENCY_EWMA_ALPHA * (latency_ms - self.ewma_ms)
+        self.samples.append(latency_ms)
+
+    @property
+    def p95_ms(self) -> float:
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
 class FailoverState:
     """
     Manages cooldown state persistence.
@@ -92,6 +121,7 @@ class FailoverState:
         self.dedupe_map: Dict[str, float] = {}  # (provider:model:category) -> last_ts
         self.health_scores: Dict[str, int] = {}  # (provider:model) -> score [0-100]
         self.last_attempts: Dict[str, float] = {}  # (provider:model) -> last_attempt_ts
+        self.latency_stats: dict[str, LatencyStats] = {}  # (provider:model) -> stats
         self._load()
 
     def _load(self) -> None:
@@ -307,6 +337,60 @@ class FailoverState:
         self.health_scores[key] = new_score
         logger.debug(f"Health score for {key}: {current_score} -> {new_score}")
 
+    def record_latency(
+        self, provider: str, model: str | None, latency_ms: float
+    ) -> None:
+        """Add a latency sample (ms) for provider/model."""
+        key = self._get_key(provider, model)
+        stats = self.latency_stats.get(key)
+        if stats is None:
+            stats = self.latency_stats[key] = LatencyStats(ewma_ms=latency_ms)
+        stats.add(latency_ms)
+
+    def get_latency_stats(
+        self, provider: str, model: str | None
+    ) -> LatencyStats | None:
+        return self.latency_stats.get(self._get_key(provider, model))
+
+    def get_latency_p95_ms(self, provider: str, model: str | None) -> float | None:
+        stats = self.get_latency_stats(provider, model)
+        return stats.p95_ms if stats is not None else None
+
+    def fastest_latency_ms(
+        self, candidates: list[tuple[str, str | None]]
+    ) -> float | None:
+        """Lowest latency EWMA among candidates that have samples."""
+        known = [
+            stats.ewma_ms
+            for provider, model in candidates
+            if (stats := self.get_latency_stats(provider, model)) is not None
+        ]
+        return min(known) if known else None
+
+    def get_routing_score(
+        self,
+        provider: str,
+        model: str | None,
+        *,
+        fastest_ms: float | None = None,
+    ) -> float:
+        """
+        Health score minus a latency penalty relative to the fastest peer.
+
+        A provider that answers but is much slower than its alternatives
+        loses LATENCY_PENALTY_PER_DOUBLING points per doubling, so it sorts
+        behind an equally healthy faster candidate.
+        """
+        score = float(self.get_health_score(provider, model))
+        stats = self.get_latency_stats(provider, model)
+        if stats is None or fastest_ms is None:
+            return score
+        ratio = max(stats.ewma_ms, LATENCY_FLOOR_MS) / max(fastest_ms, LATENCY_FLOOR_MS)
+        if ratio < LATENCY_DEAD_BAND_RATIO:
+            return score
+        penalty = LATENCY_PENALTY_PER_DOUBLING * math.log2(ratio)
+        return score - min(MAX_LATENCY_PENALTY, penalty)
+
     def can_attempt_now(self, provider: str, model: Optional[str]) -> bool:
         """Check if enough time has passed since last attempt (throttle)."""
         key = self._get_key(provider, model)
@@ -9,15 +9,23 @@ Prevents repeated external events from flooding ComfyUI.
 - strict_mode: fail-closed when durable backend unavailable
 """
 
+import asyncio
+import contextlib
+import functools
 import hashlib
 import json
 import logging
 import os
+import queue
 import sqlite3
 import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any, Dict, Optional, Protocol, Tuple, runtime_checkable
 
+from .async_utils import run_io_in_thread, submit_io
+
 logger = logging.getLogger("ComfyUI-OpenClaw.services.idempotency")
 
 # Default TTL: 1 hour
@@ -26,6 +34,19 @@ DEFAULT_TTL_SECONDS = 3600
 # Max items to prevent memory leaks (MVP)
 MAX_ITEMS = 10000
 
+# S50: concurrent writes arriving within this window share one commit.
+DEFAULT_GROUP_COMMIT_WINDOW_MS = 2.0
+MAX_GROUP_COMMIT_OPS = 256
+
+# S50: expired durable rows are swept on this timer (IO lane), not per request.
+DURABLE_SWEEP_INTERVAL_SEC = 60.0
+
+# UPSERT ... RETURNING needs SQLite 3.35; older builds re-read the row.
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# (statement, future) queued for the durable writer thread.
+_WriteOp = tuple[Callable[[sqlite3.Connection], Any], Future[Any]]
+
 
 # ---------------------------------------------------------------------------
 # S50: Durable Backend Protocol
@@ -59,6 +80,13 @@ class SQLiteDurableBackend:
     """
     S50: SQLite-backed idempotency store.
     Persists deduplication state across restarts.
+
+    The database runs in WAL mode and is written by a single writer thread.
+    Each check-and-record is one UPSERT ... RETURNING statement; calls that
+    arrive within `group_window_ms` of each other share one transaction, so
+    concurrent webhooks pay for one fsync instead of one each. Sync methods
+    wait for their group to commit; the `a*` variants await it without
+    blocking the event loop.
     """
 
     _DDL = """
@@ -73,64 +101,257 @@ class SQLiteDurableBackend:
         CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency(expires_at);
     """
 
-    def __init__(self, db_path: str):
+    # A live row counts the hit; an expired row is reset as a fresh record.
+    _UPSERT = """
+        INSERT INTO idempotency (key, first_seen_ts, last_seen_ts, expires_at, count, prompt_id)
+        VALUES (?, ?, ?, ?, 1, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            count = CASE WHEN idempotency.expires_at > excluded.last_seen_ts
+                THEN idempotency.count + 1 ELSE 1 END,
+            first_seen_ts = CASE WHEN idempotency.expires_at > excluded.last_seen_ts
+                THEN idempotency.first_seen_ts ELSE excluded.first_seen_ts END,
+            expires_at = CASE WHEN idempotency.expires_at > excluded.last_seen_ts
+                THEN idempotency.expires_at ELSE excluded.expires_at END,
+            prompt_id = CASE WHEN idempotency.expires_at > excluded.last_seen_ts
+                THEN idempotency.prompt_id ELSE excluded.prompt_id END,
+            last_seen_ts = excluded.last_seen_ts
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        group_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        max_group_ops: int = MAX_GROUP_COMMIT_OPS,
+    ):
         self._db_path = db_path
-        self._lock = threading.Lock()
+        self._group_window_sec = max(0.0, group_window_ms) / 1000.0
+        self._max_group_ops = max(1, max_group_ops)
         os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Transactions are opened explicitly by the writer (one per group).
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        row = self._conn.execute("PRAGMA journal_mode = WAL").fetchone()
+        self._journal_mode = str(row[0]).lower() if row else "unknown"
+        # Keep per-commit durability; group commit amortizes the fsync.
+        self._conn.execute("PRAGMA synchronous = FULL")
         self._conn.executescript(self._DDL)
 
+        self._queue: queue.SimpleQueue[_WriteOp | None] = queue.SimpleQueue()
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._commits = 0
+        self._ops = 0
+        self._max_group_seen = 0
+        self._last_group_size = 0
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="openclaw-idempotency-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    # -- writer thread --
+
+    def _submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            self._queue.put((fn, future))
+        return future
+
+    def _writer_loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            group = [first]
+            stop = False
+            # Only hold the group open while writers are actually contending;
+            # an uncontended caller commits immediately.
+            window = self._group_window_sec if self._last_group_size > 1 else 0.0
+            deadline = time.monotonic() + window
+            while len(group) < self._max_group_ops:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                group.append(item)
+            self._last_group_size = len(group) + (1 if self._queue.qsize() else 0)
+            self._commit_group(group)
+            if stop:
+                return
+
+    def _commit_group(self, group: list[_WriteOp]) -> None:
+        """Run a group of writes in one transaction; resolve them after COMMIT."""
+        outcomes: list[tuple[Future[Any], Any, BaseException | None]] = []
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for fn, future in group:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    outcomes.append((future, fn(self._conn), None))
+                except Exception as e:
+                    # A failed statement is rolled back on its own; the rest commit.
+                    outcomes.append((future, None, e))
+            self._conn.execute("COMMIT")
+        except Exception as e:
+            with contextlib.suppress(Exception):
+                self._conn.execute("ROLLBACK")
+            for _fn, future in group:
+                if not future.done() and (
+                    future.running() or future.set_running_or_notify_cancel()
+                ):
+                    future.set_exception(e)
+            return
+
+        self._commits += 1
+        self._ops += len(outcomes)
+        self._max_group_seen = max(self._max_group_seen, len(outcomes))
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    # -- statements (run on the writer thread) --
+
+    def _record(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        ttl: int,
+        prompt_id: str | None,
+        now: float,
+    ) -> tuple[bool, str | None]:
+        params = (key, now, now, now + ttl, prompt_id)
+        if _SQLITE_HAS_RETURNING:
+            row = conn.execute(
+                self._UPSERT + " RETURNING count, prompt_id", params
+            ).fetchone()
+        else:
+            conn.execute(self._UPSERT, params)
+            row = conn.execute(
+                "SELECT count, prompt_id FROM idempotency WHERE key = ?", (key,)
+            ).fetchone()
+        if row[0] > 1:
+            return True, row[1]
+        return False, None
+
+    def _record_many(
+        self, conn: sqlite3.Connection, keys: list[str], ttl: int, now: float
+    ) -> list[tuple[bool, str | None]]:
+        return [self._record(conn, key, ttl, None, now) for key in keys]
+
+    @staticmethod
+    def _set_prompt_id(conn: sqlite3.Connection, key: str, prompt_id: str) -> None:
+        conn.execute(
+            "UPDATE idempotency SET prompt_id = ? WHERE key = ?", (prompt_id, key)
+        )
+
+    @staticmethod
+    def _delete_expired(conn: sqlite3.Connection, now: float) -> int:
+        return conn.execute(
+            "DELETE FROM idempotency WHERE expires_at < ?", (now,)
+        ).rowcount
+
+    @staticmethod
+    def _delete_all(conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM idempotency")
+
+    # -- DurableBackend API --
+
     def check_and_record(
-        self, key: str, ttl: int, prompt_id: Optional[str] = None
-    ) -> Tuple[bool, Optional[str]]:
+        self, key: str, ttl: int, prompt_id: str | None = None
+    ) -> tuple[bool, str | None]:
         now = time.time()
-        with self._lock:
-            row = self._conn.execute(
-                "SELECT expires_at, prompt_id, count FROM idempotency WHERE key = ?",
-                (key,),
-            ).fetchone()
-            if row:
-                expires_at, existing_pid, count = row
-                if expires_at > now:
-                    self._conn.execute(
-                        "UPDATE idempotency SET count = ?, last_seen_ts = ? WHERE key = ?",
-                        (count + 1, now, key),
-                    )
-                    self._conn.commit()
-                    return True, existing_pid
-                # Expired — delete and treat as new
-                self._conn.execute("DELETE FROM idempotency WHERE key = ?", (key,))
-
-            self._conn.execute(
-                "INSERT INTO idempotency (key, first_seen_ts, last_seen_ts, expires_at, count, prompt_id) "
-                "VALUES (?, ?, ?, ?, 1, ?)",
-                (key, now, now, now + ttl, prompt_id),
+        result: tuple[bool, str | None] = self._submit(
+            functools.partial(
+                self._record, key=key, ttl=ttl, prompt_id=prompt_id, now=now
             )
-            self._conn.commit()
-            return False, None
+        ).result()
+        return result
+
+    async def acheck_and_record(
+        self, key: str, ttl: int, prompt_id: str | None = None
+    ) -> tuple[bool, str | None]:
+        now = time.time()
+        future = self._submit(
+            functools.partial(
+                self._record, key=key, ttl=ttl, prompt_id=prompt_id, now=now
+            )
+        )
+        result: tuple[bool, str | None] = await asyncio.wrap_future(future)
+        return result
+
+    def check_and_record_many(
+        self, keys: list[str], ttl: int
+    ) -> list[tuple[bool, str | None]]:
+        """Batch check_and_record in one transaction (one commit for N keys)."""
+        now = time.time()
+        results: list[tuple[bool, str | None]] = self._submit(
+            functools.partial(self._record_many, keys=keys, ttl=ttl, now=now)
+        ).result()
+        return results
+
+    async def acheck_and_record_many(
+        self, keys: list[str], ttl: int
+    ) -> list[tuple[bool, str | None]]:
+        now = time.time()
+        future = self._submit(
+            functools.partial(self._record_many, keys=keys, ttl=ttl, now=now)
+        )
+        results: list[tuple[bool, str | None]] = await asyncio.wrap_future(future)
+        return results
 
     def update_prompt_id(self, key: str, prompt_id: str) -> None:
-        with self._lock:
-            self._conn.execute(
-                "UPDATE idempotency SET prompt_id = ? WHERE key = ?",
-                (prompt_id, key),
+        self._submit(
+            functools.partial(self._set_prompt_id, key=key, prompt_id=prompt_id)
+        ).result()
+
+    async def aupdate_prompt_id(self, key: str, prompt_id: str) -> None:
+        await asyncio.wrap_future(
+            self._submit(
+                functools.partial(self._set_prompt_id, key=key, prompt_id=prompt_id)
             )
-            self._conn.commit()
+        )
 
     def cleanup(self) -> int:
-        with self._lock:
-            cur = self._conn.execute(
-                "DELETE FROM idempotency WHERE expires_at < ?", (time.time(),)
-            )
-            self._conn.commit()
-            return cur.rowcount
+        now = time.time()
+        removed: int = self._submit(
+            functools.partial(self._delete_expired, now=now)
+        ).result()
+        return removed
 
     def clear(self) -> None:
-        with self._lock:
-            self._conn.execute("DELETE FROM idempotency")
-            self._conn.commit()
+        self._submit(self._delete_all).result()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "journal_mode": self._journal_mode,
+            "commits": self._commits,
+            "ops": self._ops,
+            "max_group_ops": self._max_group_seen,
+        }
 
     def close(self) -> None:
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._writer.join(timeout=5)
         self._conn.close()
 
 
@@ -146,6 +367,11 @@ class IdempotencyStoreError(Exception):
 class IdempotencyStore:
     _instance = None
     _lock = threading.Lock()
+    # Per-instance state, initialized in __new__ (singleton).
+    _store: dict[str, dict[str, Any]]
+    _store_lock: threading.Lock
+    _last_durable_sweep: float | None
+    _sweep_future: Future[int] | None
 
     def __new__(cls):
         if cls._instance is None:
@@ -157,6 +383,8 @@ class IdempotencyStore:
                     cls._instance._last_cleanup = time.time()
                     cls._instance._durable: Optional[DurableBackend] = None
                     cls._instance._strict_mode = False
+                    cls._instance._last_durable_sweep = None
+                    cls._instance._sweep_future = None
         return cls._instance
 
     # -- S50: durable backend wiring --
@@ -217,12 +445,44 @@ class IdempotencyStore:
 
                 self._last_cleanup = now
 
-        # Also cleanup durable backend
-        if self._durable:
-            try:
-                self._durable.cleanup()
-            except Exception:
-                pass
+        self._schedule_durable_sweep()
+
+    def _schedule_durable_sweep(self) -> None:
+        """Queue an expiry sweep of the durable backend in the IO lane when due."""
+        durable = self._durable
+        if durable is None:
+            return
+        now = time.monotonic()
+        with self._store_lock:
+            last = self._last_durable_sweep
+            if last is not None and now - last < DURABLE_SWEEP_INTERVAL_SEC:
+                return
+            if self._sweep_future is not None and not self._sweep_future.done():
+                return
+            self._last_durable_sweep = now
+            self._sweep_future = submit_io(self._sweep_durable, durable)
+
+    @staticmethod
+    def _sweep_durable(durable: DurableBackend) -> int:
+        try:
+            return durable.cleanup()
+        except Exception as e:
+            logger.warning(f"S50: Durable expiry sweep failed: {e}")
+            return 0
+
+    def _require_backend(self) -> None:
+        # S50: strict_mode fail-closed
+        if self._strict_mode and not self._durable:
+            raise IdempotencyStoreError(
+                "S50 strict_mode: durable backend unavailable — fail-closed"
+            )
+
+    def _durable_failed(self, e: Exception) -> None:
+        logger.warning(f"S50: Durable backend error, falling back to memory: {e}")
+        if self._strict_mode:
+            raise IdempotencyStoreError(
+                f"S50 strict_mode: durable backend error: {e}"
+            ) from e
 
     def generate_key(
         self, job_id: Optional[str], normalized_data: Dict[str, Any]
@@ -250,12 +510,7 @@ class IdempotencyStore:
         # R101: Ensure cleanup runs periodically to prevent storage DoS
         # This uses an internal timer (300s) to avoid excessive cleanup calls
         self._cleanup()
-
-        # S50: strict_mode fail-closed
-        if self._strict_mode and not self._durable:
-            raise IdempotencyStoreError(
-                "S50 strict_mode: durable backend unavailable — fail-closed"
-            )
+        self._require_backend()
 
         # S50: use durable backend if available
         if self._durable:
@@ -264,15 +519,42 @@ class IdempotencyStore:
             except IdempotencyStoreError:
                 raise
             except Exception as e:
-                logger.warning(
-                    f"S50: Durable backend error, falling back to memory: {e}"
+                self._durable_failed(e)
+
+        return self._memory_check_and_record(key, prompt_id, ttl)
+
+    async def acheck_and_record(
+        self, key: str, prompt_id: str | None = None, ttl: int = DEFAULT_TTL_SECONDS
+    ) -> tuple[bool, str | None]:
+        """
+        check_and_record for async handlers: the durable commit is awaited,
+        so the event loop never blocks on the database.
+        """
+        self._cleanup()
+        self._require_backend()
+
+        durable = self._durable
+        if durable is not None:
+            try:
+                acheck = getattr(durable, "acheck_and_record", None)
+                if callable(acheck):
+                    result: tuple[bool, str | None] = await acheck(
+                        key, ttl, prompt_id
+                    )
+                    return result
+                return await run_io_in_thread(
+                    durable.check_and_record, key, ttl, prompt_id
                 )
-                if self._strict_mode:
-                    raise IdempotencyStoreError(
-                        f"S50 strict_mode: durable backend error: {e}"
-                    ) from e
+            except IdempotencyStoreError:
+                raise
+            except Exception as e:
+                self._durable_failed(e)
 
-        # In-memory path
+        return self._memory_check_and_record(key, prompt_id, ttl)
+
+    def _memory_check_and_record(
+        self, key: str, prompt_id: str | None, ttl: int
+    ) -> tuple[bool, str | None]:
         now = time.time()
 
         with self._store_lock:
@@ -294,6 +576,78 @@ class IdempotencyStore:
             }
             return False, None
 
+    def check_and_record_many(
+        self, keys: list[str], ttl: int = DEFAULT_TTL_SECONDS
+    ) -> list[tuple[bool, str | None]]:
+        """
+        Bulk check_and_record for batch submissions, in key order.
+
+        A key repeated within `keys` is reported as a duplicate of its first
+        occurrence. Durable backends without a bulk method are called per key.
+        """
+        self._cleanup()
+        self._require_backend()
+
+        if self._durable:
+            bulk = getattr(self._durable, "check_and_record_many", None)
+            try:
+                if callable(bulk):
+                    results: list[tuple[bool, str | None]] = bulk(keys, ttl)
+                    return results
+                return [self._durable.check_and_record(key, ttl) for key in keys]
+            except IdempotencyStoreError:
+                raise
+            except Exception as e:
+                self._durable_failed(e)
+
+        return self._memory_check_and_record_many(keys, ttl)
+
+    async def acheck_and_record_many(
+        self, keys: list[str], ttl: int = DEFAULT_TTL_SECONDS
+    ) -> list[tuple[bool, str | None]]:
+        """Async check_and_record_many; see acheck_and_record."""
+        self._cleanup()
+        self._require_backend()
+
+        durable = self._durable
+        if durable is not None:
+            try:
+                abulk = getattr(durable, "acheck_and_record_many", None)
+                if callable(abulk):
+                    results: list[tuple[bool, str | None]] = await abulk(keys, ttl)
+                    return results
+                return await run_io_in_thread(self.check_and_record_many, keys, ttl)
+            except IdempotencyStoreError:
+                raise
+            except Exception as e:
+                self._durable_failed(e)
+
+        return self._memory_check_and_record_many(keys, ttl)
+
+    def _memory_check_and_record_many(
+        self, keys: list[str], ttl: int
+    ) -> list[tuple[bool, str | None]]:
+        # In-memory path: one lock pass for the whole batch.
+        now = time.time()
+        results: list[tuple[bool, str | None]] = []
+        with self._store_lock:
+            for key in keys:
+                item = self._store.get(key)
+                if item is not None and item["expires_at"] > now:
+                    item["count"] += 1
+                    item["last_seen_ts"] = now
+                    results.append((True, item.get("prompt_id")))
+                    continue
+                self._store[key] = {
+                    "first_seen_ts": now,
+                    "last_seen_ts": now,
+                    "expires_at": now + ttl,
+                    "count": 1,
+                    "prompt_id": None,
+                }
+                results.append((False, None))
+        return results
+
     def update_prompt_id(self, key: str, prompt_id: str):
         """Update the prompt_id for an existing key (post-enqueue)."""
         if self._durable:
@@ -307,6 +661,29 @@ class IdempotencyStore:
                         f"S50 strict_mode: update_prompt_id failed: {e}"
                     ) from e
 
+        self._memory_update_prompt_id(key, prompt_id)
+
+    async def aupdate_prompt_id(self, key: str, prompt_id: str) -> None:
+        """Async update_prompt_id; see acheck_and_record."""
+        durable = self._durable
+        if durable is not None:
+            try:
+                aupdate = getattr(durable, "aupdate_prompt_id", None)
+                if callable(aupdate):
+                    await aupdate(key, prompt_id)
+                else:
+                    await run_io_in_thread(durable.update_prompt_id, key, prompt_id)
+                return
+            except Exception as e:
+                logger.warning(f"S50: Durable update_prompt_id error: {e}")
+                if self._strict_mode:
+                    raise IdempotencyStoreError(
+                        f"S50 strict_mode: update_prompt_id failed: {e}"
+                    ) from e
+
+        self._memory_update_prompt_id(key, prompt_id)
+
+    def _memory_update_prompt_id(self, key: str, prompt_id: str) -> None:
         with self._store_lock:
             if key in self._store:
                 self._store[key]["prompt_id"] = prompt_id
@@ -11,12 +11,19 @@ callback delivery without patching ComfyUI core.
 Design:
 - Ring-buffer event store with configurable max capacity.
 - Each event has a monotonic sequence ID for SSE `id:` field.
-- Clients can resume from `Last-Event-ID` header.
+- Clients can resume from `Last-Event-ID` header. Seqs are contiguous, so a
+  cursor maps straight to a ring slot; prompt_id filters use a per-prompt seq
+  index, and TTL expiry advances the head instead of filtering every read.
 - Access control parity with existing observability endpoints.
+- Live SSE clients subscribe instead of polling: emit() pushes each event to
+  the matching subscribers' asyncio queues (indexed by prompt_id), and the
+  SSE frame is encoded once per event and shared by every subscriber.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import json
 import logging
 import os
@@ -36,6 +43,9 @@ logger = logging.getLogger("ComfyUI-OpenClaw.services.job_events")
 
 MAX_EVENT_BUFFER = int(os.environ.get("OPENCLAW_JOB_EVENT_BUFFER_SIZE", "500"))
 EVENT_TTL_SEC = int(os.environ.get("OPENCLAW_JOB_EVENT_TTL_SEC", "600"))  # 10 minutes
+# Pending live events per SSE subscriber before it is marked lagged and has to
+# catch up from the ring buffer.
+SUBSCRIBER_MAX_PENDING = 256
 
 
 # ---------------------------------------------------------------------------
@@ -70,6 +80,9 @@ class JobEvent:
     trace_id: str = ""
     timestamp: float = 0.0
     data: Dict[str, Any] = field(default_factory=dict)
+    _sse_frames: dict[bool, bytes] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.timestamp == 0.0:
@@ -95,6 +108,14 @@ class JobEvent:
         ]
         return "\n".join(lines)
 
+    def to_sse_bytes(self, *, include_reasoning: bool = False) -> bytes:
+        """Encoded SSE frame, built once per reveal mode and shared by subscribers."""
+        frame = self._sse_frames.get(include_reasoning)
+        if frame is None:
+            frame = self.to_sse(include_reasoning=include_reasoning).encode("utf-8")
+            self._sse_frames[include_reasoning] = frame
+        return frame
+
     def to_dict(self, *, include_reasoning: bool = False) -> Dict[str, Any]:
         """Serialise for JSON polling responses."""
         return {
@@ -109,6 +130,234 @@ class JobEvent:
         }
 
 
+# ---------------------------------------------------------------------------
+# Live subscriptions
+# ---------------------------------------------------------------------------
+
+
+class JobEventSubscription:
+    """
+    Push-based feed of new events for one SSE client.
+
+    Bound to the event loop that created it; emit() may run on any thread and
+    hands events over with call_soon_threadsafe. If the client falls more than
+    max_pending events behind, further events are dropped and `lagged` is set
+    so the reader can re-sync from the ring buffer with events_since().
+    """
+
+    def __init__(
+        self,
+        store: JobEventStore,
+        *,
+        prompt_id: str | None,
+        max_pending: int = SUBSCRIBER_MAX_PENDING,
+    ) -> None:
+        self.prompt_id = prompt_id
+        self.lagged = False
+        self._store = store
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[JobEvent] = asyncio.Queue()
+        self._max_pending = max(1, max_pending)
+        self._closed = False
+
+    def _deliver(self, evt: JobEvent) -> bool:
+        """Called from emit() on any thread; False once the owning loop is gone."""
+        try:
+            self._loop.call_soon_threadsafe(self._push, evt)
+        except RuntimeError:
+            return False
+        return True
+
+    def _push(self, evt: JobEvent) -> None:
+        if self._closed:
+            return
+        if self._queue.qsize() >= self._max_pending:
+            self.lagged = True
+            return
+        self._queue.put_nowait(evt)
+
+    async def next_event(self, timeout: float) -> JobEvent | None:
+        """Wait up to timeout seconds for the next live event."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def reset_lag(self) -> None:
+        """Drop queued events after the reader has re-synced from the buffer."""
+        self.lagged = False
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._store._unsubscribe(self)
+
+    def __enter__(self) -> JobEventSubscription:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Seq-indexed ring buffer
+# ---------------------------------------------------------------------------
+
+
+class _SeqIndex:
+    """Ascending seqs of one prompt_id; the head is consumed by moving start."""
+
+    __slots__ = ("seqs", "start")
+
+    def __init__(self) -> None:
+        self.seqs: list[int] = []
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.start
+
+    def pop_oldest(self) -> None:
+        self.start += 1
+        # Compact lazily so dropping the head stays amortised O(1).
+        if self.start >= 64 and self.start * 2 >= len(self.seqs):
+            del self.seqs[: self.start]
+            self.start = 0
+
+
+class JobEventRing:
+    """
+    Seq-addressable ring buffer behind JobEventStore.
+
+    Retained events always cover the contiguous range [head_seq, next_seq), so
+    seq s lives in slot s % capacity and a cursor resolves by offset. Filtered
+    reads bisect the per-prompt_id seq index. Events only leave from the head:
+    on capacity overflow (counted as drops) or once the oldest event is past
+    its TTL. Emit timestamps are non-decreasing in practice, so expiry stops
+    at the first live event.
+
+    Not thread-safe; JobEventStore serialises access under its lock.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._slots: list[JobEvent | None] = [None] * capacity
+        self._head_seq = 1
+        self._next_seq = 1
+        self._by_prompt: dict[str, _SeqIndex] = {}
+
+        # Metrics (parity with observability.backpressure.QueueStats)
+        self.high_watermark = 0
+        self.total_enqueued = 0
+        self.total_dropped = 0
+        self.total_expired = 0
+        self.last_drop_ts = 0.0
+
+    def __len__(self) -> int:
+        return self._next_seq - self._head_seq
+
+    def _at(self, seq: int) -> JobEvent:
+        evt = self._slots[seq % self.capacity]
+        if evt is None:  # pragma: no cover - guarded by the head/next range
+            raise LookupError(f"seq {seq} is not retained")
+        return evt
+
+    def append(self, evt: JobEvent) -> bool:
+        """
+        Add the next event in sequence.
+        Returns True if added without dropping, False if the oldest was dropped.
+        """
+        if len(self) == 0:
+            # Empty ring (fresh, cleared, or fully expired): restart at evt.seq.
+            self._head_seq = self._next_seq = evt.seq
+        elif evt.seq != self._next_seq:
+            raise ValueError(f"expected seq {self._next_seq}, got {evt.seq}")
+
+        dropped = False
+        if len(self) == self.capacity:
+            self._pop_head()
+            self.total_dropped += 1
+            self.last_drop_ts = time.time()
+            dropped = True
+
+        self._slots[evt.seq % self.capacity] = evt
+        self._next_seq = evt.seq + 1
+        if evt.prompt_id:
+            index = self._by_prompt.get(evt.prompt_id)
+            if index is None:
+                index = self._by_prompt[evt.prompt_id] = _SeqIndex()
+            index.seqs.append(evt.seq)
+
+        self.total_enqueued += 1
+        self.high_watermark = max(self.high_watermark, len(self))
+        return not dropped
+
+    def _pop_head(self) -> None:
+        slot = self._head_seq % self.capacity
+        evt = self._slots[slot]
+        self._slots[slot] = None
+        self._head_seq += 1
+        if evt is None or not evt.prompt_id:
+            return
+        index = self._by_prompt.get(evt.prompt_id)
+        if index is None:
+            return
+        index.pop_oldest()
+        if not index:
+            del self._by_prompt[evt.prompt_id]
+
+    def expire(self, cutoff: float) -> int:
+        """Advance the head past events older than cutoff. Returns count."""
+        expired = 0
+        while len(self) and self._at(self._head_seq).timestamp < cutoff:
+            self._pop_head()
+            expired += 1
+        self.total_expired += expired
+        return expired
+
+    def read(
+        self, last_seq: int, limit: int, prompt_id: str | None = None
+    ) -> list[JobEvent]:
+        """Up to limit events with seq > last_seq (oldest first), no full copy."""
+        if limit <= 0:
+            return []
+        if not prompt_id:
+            start = max(last_seq + 1, self._head_seq)
+            stop = min(start + limit, self._next_seq)
+            return [self._at(seq) for seq in range(start, stop)]
+        index = self._by_prompt.get(prompt_id)
+        if index is None:
+            return []
+        pos = bisect.bisect_right(index.seqs, last_seq, index.start)
+        return [self._at(seq) for seq in index.seqs[pos : pos + limit]]
+
+    def bounds(self, prompt_id: str | None = None) -> tuple[int | None, int | None]:
+        """(earliest, latest) retained seq, optionally for one prompt_id."""
+        if not prompt_id:
+            if not len(self):
+                return None, None
+            return self._head_seq, self._next_seq - 1
+        index = self._by_prompt.get(prompt_id)
+        if not index:
+            return None, None
+        return index.seqs[index.start], index.seqs[-1]
+
+    def clear(self) -> None:
+        """Drop all events and reset counters (test helper)."""
+        self._slots = [None] * self.capacity
+        self._head_seq = self._next_seq = 1
+        self._by_prompt.clear()
+        self.high_watermark = 0
+        self.total_enqueued = 0
+        self.total_dropped = 0
+        self.total_expired = 0
+        self.last_drop_ts = 0.0
+
+
 # ---------------------------------------------------------------------------
 # Bounded event store (ring buffer)
 # ---------------------------------------------------------------------------
@@ -122,20 +371,15 @@ class JobEventStore:
     - emit(): add events
     - events_since(seq): retrieve events after a given sequence ID
     - SSE client resume via Last-Event-ID
+    - subscribe(): push delivery of new events to live SSE clients
     """
 
     def __init__(self, max_size: int = MAX_EVENT_BUFFER) -> None:
-        try:
-            # IMPORTANT: keep package-relative import first to avoid custom-node
-            # import regressions when top-level "services" is unavailable.
-            from .observability.backpressure import BoundedQueue
-        except ImportError:
-            # Fallback for ad-hoc/test import paths.
-            from services.observability.backpressure import BoundedQueue
-
         self._lock = threading.Lock()
-        self._queue = BoundedQueue[JobEvent](capacity=max_size)
+        self._ring = JobEventRing(max_size)
         self._seq_counter = 0
+        # Subscribers keyed by prompt_id filter; None holds unfiltered clients.
+        self._subscribers: dict[str | None, set[JobEventSubscription]] = {}
 
     def emit(
         self,
@@ -155,10 +399,64 @@ class JobEventStore:
                 data=data or {},
             )
 
-            # enqueue returns False if dropped, but we don't need to surface that
-            # to the caller of emit(), tracking happens inside BoundedQueue checks.
-            self._queue.enqueue(evt)
-            return evt
+            # append returns False if the oldest event was dropped; that is
+            # tracked in the ring's counters rather than surfaced to emit().
+            self._ring.expire(evt.timestamp - EVENT_TTL_SEC)
+            self._ring.append(evt)
+
+            # IMPORTANT: hand off under the lock so every subscriber sees seq
+            # order; readers dedupe by seq and would drop a reordered event.
+            # _deliver only schedules a callback, it never blocks.
+            dead = [
+                subscription
+                for subscription in self._subscribers_for(prompt_id)
+                if not subscription._deliver(evt)
+            ]
+
+        for subscription in dead:
+            subscription.close()
+        return evt
+
+    def _subscribers_for(self, prompt_id: str) -> list[JobEventSubscription]:
+        targets = list(self._subscribers.get(None, ()))
+        if prompt_id:
+            targets.extend(self._subscribers.get(prompt_id, ()))
+        return targets
+
+    def subscribe(
+        self,
+        prompt_id: str | None = None,
+        *,
+        max_pending: int = SUBSCRIBER_MAX_PENDING,
+    ) -> JobEventSubscription:
+        """
+        Register a live subscriber on the running event loop.
+
+        Subscribe before replaying history so no event can fall between the
+        replay and the live feed; readers dedupe by seq.
+        """
+        subscription = JobEventSubscription(
+            self, prompt_id=prompt_id or None, max_pending=max_pending
+        )
+        with self._lock:
+            self._subscribers.setdefault(subscription.prompt_id, set()).add(
+                subscription
+            )
+        return subscription
+
+    def _unsubscribe(self, subscription: JobEventSubscription) -> None:
+        with self._lock:
+            bucket = self._subscribers.get(subscription.prompt_id)
+            if bucket is None:
+                return
+            bucket.discard(subscription)
+            if not bucket:
+                del self._subscribers[subscription.prompt_id]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(bucket) for bucket in self._subscribers.values())
 
     def events_since(
         self,
@@ -170,23 +468,9 @@ class JobEventStore:
         Return events with seq > last_seq, optionally filtered by prompt_id.
         Returns at most `limit` events (oldest first).
         """
-        now = time.time()
-        # No lock needed for get_all() as it is thread-safe, but we filter here.
-        # Ideally get_all() returns a snapshot.
-        all_events = self._queue.get_all()
-
-        results = []
-        for evt in all_events:
-            if evt.seq <= last_seq:
-                continue
-            if now - evt.timestamp > EVENT_TTL_SEC:
-                continue
-            if prompt_id and evt.prompt_id != prompt_id:
-                continue
-            results.append(evt)
-            if len(results) >= limit:
-                break
-        return results
+        with self._lock:
+            self._ring.expire(time.time() - EVENT_TTL_SEC)
+            return self._ring.read(last_seq, limit, prompt_id)
 
     def events_since_bounded(
         self,
@@ -197,60 +481,25 @@ class JobEventStore:
         scan_cap: int = 2000,
     ) -> tuple[List[JobEvent], Dict[str, Any]]:
         """
-        R95: Bounded scan variant of events_since() for management endpoints.
+        R95: Bounded variant of events_since() for management endpoints.
 
-        Prevents full-buffer traversal when many entries are skipped due to TTL,
-        prompt filter, or stale cursor ranges. Returns diagnostics so the API can
-        surface deterministic pagination behavior.
+        The cursor resolves by seq offset (or the prompt_id index), so every
+        examined event is returned and `scanned` never exceeds the page size.
+        `earliest/latest_retained_seq` describe the retained range for the
+        filter, letting the API detect stale cursors and further pages.
         """
-        now = time.time()
-        all_events = self._queue.get_all()
         if scan_cap < 1:
             scan_cap = 1
+        with self._lock:
+            self._ring.expire(time.time() - EVENT_TTL_SEC)
+            results = self._ring.read(last_seq, min(limit, scan_cap), prompt_id)
+            earliest_retained_seq, latest_retained_seq = self._ring.bounds(prompt_id)
 
-        results: List[JobEvent] = []
-        scanned = 0
-        earliest_retained_seq: Optional[int] = None
-        latest_retained_seq: Optional[int] = None
-
-        for evt in all_events:
-            if scanned >= scan_cap:
-                break
-            scanned += 1
-
-            if evt.seq <= last_seq:
-                continue
-            if now - evt.timestamp > EVENT_TTL_SEC:
-                continue
-            if prompt_id and evt.prompt_id != prompt_id:
-                continue
-
-            if earliest_retained_seq is None:
-                earliest_retained_seq = evt.seq
-            latest_retained_seq = evt.seq
-
-            results.append(evt)
-            if len(results) >= limit:
-                break
-
-        # If we didn't collect any matching events, still compute retained bounds
-        # from a second cheap pass to support stale cursor diagnostics.
-        if earliest_retained_seq is None or latest_retained_seq is None:
-            for evt in all_events:
-                if evt.seq <= 0:
-                    continue
-                if now - evt.timestamp > EVENT_TTL_SEC:
-                    continue
-                if prompt_id and evt.prompt_id != prompt_id:
-                    continue
-                if earliest_retained_seq is None:
-                    earliest_retained_seq = evt.seq
-                latest_retained_seq = evt.seq
-
+        scanned = len(results)
         return results, {
             "scanned": scanned,
             "scan_cap": scan_cap,
-            "truncated": scanned >= scan_cap and len(results) < limit,
+            "truncated": scanned >= scan_cap and scanned < limit,
             "earliest_retained_seq": earliest_retained_seq,
             "latest_retained_seq": latest_retained_seq,
         }
@@ -262,24 +511,29 @@ class JobEventStore:
 
     @property
     def size(self) -> int:
-        return self._queue.stats().current_size
+        with self._lock:
+            return len(self._ring)
 
     def stats(self) -> Dict[str, Any]:
         """Return drop/usage stats."""
-        s = self._queue.stats()
-        return {
-            "capacity": s.capacity,
-            "current_size": s.current_size,
-            "high_watermark": s.high_watermark,
-            "total_enqueued": s.total_enqueued,
-            "total_dropped": s.total_dropped,
-            "last_drop_ts": s.last_drop_ts,
-        }
+        with self._lock:
+            ring = self._ring
+            stats = {
+                "capacity": ring.capacity,
+                "current_size": len(ring),
+                "high_watermark": ring.high_watermark,
+                "total_enqueued": ring.total_enqueued,
+                "total_dropped": ring.total_dropped,
+                "total_expired": ring.total_expired,
+                "last_drop_ts": ring.last_drop_ts,
+            }
+        stats["subscribers"] = self.subscriber_count
+        return stats
 
     def clear(self) -> None:
         """Clear all events (used in tests)."""
         with self._lock:
-            self._queue.clear()
+            self._ring.clear()
             self._seq_counter = 0
 
 
@@ -3,11 +3,18 @@ Unified LLM Client with multi-provider support.
 R16: Provider-agnostic facade that routes to appropriate adapters.
 """
 
+import contextlib
+import copy
+import hashlib
 import logging
 import os
 import re
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Generator
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from ..config import setup_logger
@@ -18,21 +25,37 @@ try:
     from .effective_config import (
         get_effective_llm_base_url,
         get_effective_llm_config,
+        get_effective_llm_config_generation,
         get_effective_llm_model,
         get_effective_llm_provider,
     )
+    from .runtime_config_store import resolve_active_tenant_id
 except ImportError:
     from services.effective_config import (  # type: ignore
         get_effective_llm_base_url,
         get_effective_llm_config,
+        get_effective_llm_config_generation,
         get_effective_llm_model,
         get_effective_llm_provider,
     )
-
+    from services.runtime_config_store import resolve_active_tenant_id
+
+from .cache.llm_response_cache import build_cache_key, get_llm_response_cache
+from .llm_hedging import (
+    HEDGE,
+    PRIMARY,
+    RaceOutcome,
+    arun_hedged,
+    hedge_delay_sec,
+    hedging_enabled,
+    run_hedged,
+)
+from .metrics import metrics
 from .providers import anthropic, openai_compat
 from .providers.catalog import (
     DEFAULT_MODEL_BY_PROVIDER,
     DEFAULT_PROVIDER,
+    ProviderInfo,
     ProviderType,
     get_provider_info,
     normalize_provider_base_url,
@@ -60,6 +83,284 @@ except ImportError:
     logger.warning("Plugin system not available (import failed)")
 
 
+# R23: hard bounds applied after plugin param transforms: (min, max, default)
+_SAFE_PARAM_BOUNDS = {
+    "temperature": (0.0, 2.0, 0.7),
+    "max_tokens": (1, 128000, 4096),
+}
+
+
+FailoverCandidate = tuple[str, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class LLMClientProfile:
+    """Immutable result of LLMClient config/provider/alias resolution."""
+
+    provider: str
+    base_url: str
+    model: str
+    timeout: Any
+    max_retries: Any
+    allow_private_network: bool
+    provider_info: ProviderInfo | None
+    api_key: str | None
+    failover_candidates: tuple[FailoverCandidate, ...]
+    max_failover_candidates: Any
+
+
+# Resolved client settings are reused across per-request LLMClient instances.
+_PROFILE_CACHE_MAX = 64
+_PROFILE_LOCK = threading.Lock()
+_PROFILE_CACHE: OrderedDict[tuple[Any, ...], LLMClientProfile] = OrderedDict()
+
+
+def clear_llm_client_profiles() -> None:
+    """Drop all cached client profiles (next construction re-resolves)."""
+    with _PROFILE_LOCK:
+        _PROFILE_CACHE.clear()
+
+
+def _api_key_fingerprint(api_key: str | None) -> str:
+    # Never keep raw key material in cache keys.
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _plugin_resolve_stamp() -> tuple[Any, ...]:
+    if not PLUGINS_AVAILABLE:
+        return (False,)
+    return (True, id(plugin_manager), getattr(plugin_manager, "revision", None))
+
+
+def _get_cached_profile(key: tuple[Any, ...]) -> LLMClientProfile | None:
+    with _PROFILE_LOCK:
+        profile = _PROFILE_CACHE.get(key)
+        if profile is not None:
+            _PROFILE_CACHE.move_to_end(key)
+        return profile
+
+
+def _store_profile(key: tuple[Any, ...], profile: LLMClientProfile) -> None:
+    with _PROFILE_LOCK:
+        _PROFILE_CACHE[key] = profile
+        _PROFILE_CACHE.move_to_end(key)
+        while len(_PROFILE_CACHE) > _PROFILE_CACHE_MAX:
+            _PROFILE_CACHE.popitem(last=False)
+
+
+def _candidate_base_urls(
+    primary_provider: str,
+    primary_base_url: str | None,
+    candidates_2d: list[tuple[str, str | None]],
+) -> list[FailoverCandidate]:
+    """Convert (provider, model) candidates into (provider, model, base_url)."""
+    candidates_3d: list[FailoverCandidate] = []
+    for provider, model in candidates_2d:
+        if provider == primary_provider:
+            # Same as primary, use configured base_url
+            candidates_3d.append((provider, model, primary_base_url))
+        else:
+            # Different provider, get default base_url
+            info = get_provider_info(provider)
+            base_url = info.base_url if info else None
+            candidates_3d.append((provider, model, base_url))
+    return candidates_3d
+
+
+def _build_failover_candidates(
+    provider: str,
+    model: str | None,
+    base_url: str | None,
+    eff_config: dict[str, Any],
+) -> list[FailoverCandidate]:
+    fallback_models = eff_config.get("fallback_models", [])
+    fallback_providers = eff_config.get("fallback_providers", [])
+
+    # R14: Use failover.get_failover_candidates for ordering
+    try:
+        from ..services.failover import get_failover_candidates
+    except ImportError:
+        from services.failover import get_failover_candidates
+
+    candidates_2d = get_failover_candidates(
+        primary_provider=provider,
+        primary_model=model,
+        fallback_models=fallback_models if fallback_models else None,
+        fallback_providers=fallback_providers if fallback_providers else None,
+    )
+    return _candidate_base_urls(provider, base_url, candidates_2d)
+
+
+# Single-flight: concurrent identical completions share one provider call.
+_SINGLE_FLIGHT_DISABLED = {"0", "false", "no", "off"}
+
+
+def single_flight_enabled() -> bool:
+    raw = os.environ.get("OPENCLAW_LLM_SINGLE_FLIGHT") or os.environ.get(
+        "MOLTBOT_LLM_SINGLE_FLIGHT", ""
+    )
+    return raw.strip().lower() not in _SINGLE_FLIGHT_DISABLED
+
+
+class _Flight:
+    """One shared provider call plus the callers waiting on it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+        self.deltas: list[str] = []
+        self.subscribers: list[Callable[[str], None]] = []
+        self.waiters = 1
+        self.task: asyncio.Task[dict[str, Any]] | None = None
+
+    def subscribe(self, on_text_delta: Callable[[str], None] | None) -> None:
+        if on_text_delta is None:
+            return
+        with self.lock:
+            # Late joiners first catch up on text already streamed.
+            for delta in self.deltas:
+                self._deliver(on_text_delta, delta)
+            self.subscribers.append(on_text_delta)
+
+    def unsubscribe(self, on_text_delta: Callable[[str], None] | None) -> None:
+        with self.lock:
+            if on_text_delta in self.subscribers:
+                self.subscribers.remove(on_text_delta)
+
+    def publish(self, delta: str) -> None:
+        with self.lock:
+            self.deltas.append(delta)
+            for subscriber in list(self.subscribers):
+                if not self._deliver(subscriber, delta):
+                    self.subscribers.remove(subscriber)
+
+    @staticmethod
+    def _deliver(subscriber: Callable[[str], None], delta: str) -> bool:
+        # One subscriber failing must not break the stream for the others.
+        try:
+            subscriber(delta)
+            return True
+        except Exception as e:
+            logger.warning(f"Single-flight stream subscriber failed; detaching it: {e}")
+            return False
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls sharing a canonical key into one execution.
+
+    Sync callers: the first caller runs the call inline and later callers
+    block until it finishes. Async callers: the call runs as a task on the
+    caller's loop, and it is cancelled once every waiter has been cancelled.
+    All waiters receive the same result (each gets its own copy) or error.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Any, _Flight] = {}
+
+    def _join(self, key: Any) -> tuple[_Flight, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                metrics.increment("llm_singleflight_coalesced")
+                return flight, False
+            flight = _Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def _release(self, key: Any, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _follower_result(
+        self, flight: _Flight, on_text_delta: Callable[[str], None] | None
+    ) -> dict[str, Any]:
+        flight.unsubscribe(on_text_delta)
+        if flight.error is not None:
+            raise flight.error
+        result = copy.deepcopy(flight.result) or {}
+        # The shared call did not stream; hand the text over in one piece.
+        if on_text_delta is not None and not flight.deltas and result.get("text"):
+            _Flight._deliver(on_text_delta, str(result["text"]))
+        return result
+
+    def run(
+        self,
+        key: Any,
+        call: Callable[[Callable[[str], None]], dict[str, Any]],
+        on_text_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """Run ``call(publish)`` once per key across concurrent sync callers."""
+        flight, leader = self._join(key)
+        flight.subscribe(on_text_delta)
+        if not leader:
+            flight.done.wait()
+            return self._follower_result(flight, on_text_delta)
+        try:
+            flight.result = call(flight.publish)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._release(key, flight)
+            flight.done.set()
+
+    async def arun(
+        self,
+        key: Any,
+        call: Callable[[Callable[[str], None]], Any],
+        on_text_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """Async counterpart of run(); ``call(publish)`` returns a coroutine."""
+        loop = asyncio.get_running_loop()
+        # Tasks are bound to one loop, so flights never span loops.
+        flight_key = ("async", id(loop), key)
+        flight, leader = self._join(flight_key)
+        flight.subscribe(on_text_delta)
+        if leader:
+            flight.task = loop.create_task(call(flight.publish))
+
+            def _finished(task: asyncio.Task[dict[str, Any]]) -> None:
+                self._release(flight_key, flight)
+                if not task.cancelled():
+                    flight.error = task.exception()
+                    if flight.error is None:
+                        flight.result = task.result()
+                flight.done.set()
+
+            flight.task.add_done_callback(_finished)
+        task = flight.task
+        assert task is not None
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                # This waiter was cancelled; stop the call if nobody is left.
+                flight.unsubscribe(on_text_delta)
+                with self._lock:
+                    flight.waiters -= 1
+                    abandoned = flight.waiters <= 0
+                if abandoned:
+                    self._release(flight_key, flight)
+                    task.cancel()
+            raise
+        if leader:
+            flight.unsubscribe(on_text_delta)
+            return result
+        return self._follower_result(flight, on_text_delta)
+
+
+_single_flight = SingleFlight()
+
+
 def get_configured_provider() -> str:
     """Get configured provider from the unified effective-config facade."""
     return get_effective_llm_provider()
@@ -110,23 +411,72 @@ class LLMClient:
             timeout: Request timeout in seconds
             max_retries: Max retry attempts for transient errors
         """
+        # The generation is read before the config so a concurrent change can
+        # only make the cache key stale (a miss), never mislabel a profile.
+        generation = get_effective_llm_config_generation()
         # Load effective config through the R148 facade to keep all high-frequency
         # readers on one supported surface.
         eff_config, _ = get_effective_llm_config()
 
-        self.provider = provider or eff_config.get("provider") or DEFAULT_PROVIDER
+        resolved_provider = provider or eff_config.get("provider") or DEFAULT_PROVIDER
+        # Resolved per construction (env/secret store lookups are cheap) so the
+        # fingerprint tracks key rotation without a separate invalidation hook.
+        api_key = get_api_key_for_provider(resolved_provider)
+        cache_key = (
+            resolve_active_tenant_id(),
+            resolved_provider,
+            base_url,
+            model,
+            generation,
+            _api_key_fingerprint(api_key),
+            _plugin_resolve_stamp(),
+        )
+        profile = _get_cached_profile(cache_key)
+        if profile is None:
+            profile = self._resolve_profile(
+                eff_config, resolved_provider, base_url, model, api_key
+            )
+            _store_profile(cache_key, profile)
+        self._profile: LLMClientProfile | None = profile
+
+        self.provider = profile.provider
+        self.base_url = profile.base_url
+        self.model = profile.model
+        self.timeout = timeout if timeout is not None else profile.timeout
+        self.max_retries = (
+            max_retries if max_retries is not None else profile.max_retries
+        )
+        self.allow_private_network = profile.allow_private_network
+        self.provider_info = profile.provider_info
+        self.api_key = profile.api_key
+
+        # Validate key if required
+        if requires_api_key(self.provider) and not self.api_key:
+            # IMPORTANT: one-time warning per provider only (anti-spam guard).
+            if self.provider not in self._missing_api_key_warning_emitted:
+                logger.warning(f"No API key found for provider '{self.provider}'")
+                self._missing_api_key_warning_emitted.add(self.provider)
 
+    @staticmethod
+    def _resolve_profile(
+        eff_config: dict[str, Any],
+        provider: str,
+        base_url: str | None,
+        model: str | None,
+        api_key: str | None,
+    ) -> LLMClientProfile:
+        """Resolve base URL, model alias and failover candidates for a profile."""
         # Resolve base_url: Arg > Config > Provider Default
-        self.base_url = base_url or eff_config.get("base_url")
-        if not self.base_url:
-            info = get_provider_info(self.provider)
+        resolved_base_url = base_url or eff_config.get("base_url")
+        if not resolved_base_url:
+            info = get_provider_info(provider)
             if info:
-                self.base_url = info.base_url
+                resolved_base_url = info.base_url
         # IMPORTANT: test-connection and normal OpenAI-compatible completions must
         # share the same Ollama `/v1` normalization path as model discovery. Do not
         # bypass this with provider-specific ad hoc request URL assembly.
-        self.base_url = normalize_provider_base_url(
-            self.provider, str(self.base_url or "")
+        resolved_base_url = normalize_provider_base_url(
+            provider, str(resolved_base_url or "")
         )
 
         # R57: Strict Precedence (Arg > Config > Default)
@@ -137,22 +487,21 @@ class LLMClient:
         config_provider = eff_config.get("provider")
         config_model = eff_config.get("model")
 
+        resolved_model: str | None
         if model:
             # 1. Explicit argument override
-            self.model = model
-        elif self.provider == config_provider:
+            resolved_model = model
+        elif provider == config_provider:
             # 2. Config usage (provider matches) -> use config model
-            self.model = config_model
+            resolved_model = config_model
         else:
             # 3. Provider mismatch (arg override vs config) -> do NOT use config model
             # Fallback to default for the *new* provider
-            self.model = None
+            resolved_model = None
 
         # If we still have no model, try to get a default for the provider
-        if not self.model:
-            from .providers.catalog import DEFAULT_MODEL_BY_PROVIDER
-
-            self.model = DEFAULT_MODEL_BY_PROVIDER.get(self.provider, "default")
+        if not resolved_model:
+            resolved_model = DEFAULT_MODEL_BY_PROVIDER.get(provider, "default")
 
         # R23 (plugin wiring) + R57 (precedence compatibility):
         # CRITICAL: keep model alias resolution in __init__.
@@ -160,51 +509,64 @@ class LLMClient:
         # and tests assert that "model.resolve" runs during initialization.
         # Removing this block regresses alias behavior (e.g., gpt4 -> gpt-4) and breaks unit tests.
         # CI guard: tests/test_llm_client_plugins.py::test_model_alias_resolution_on_init.
-        if PLUGINS_AVAILABLE and self.model:
+        # This now runs once per cached profile rather than once per client.
+        if PLUGINS_AVAILABLE and resolved_model:
             try:
-                from .plugins.async_bridge import run_async_in_sync_context
+                from .plugins.async_bridge import run_hook_sync
 
                 resolve_ctx = RequestContext(
-                    provider=self.provider,
-                    model=str(self.model),
+                    provider=provider,
+                    model=str(resolved_model),
                     trace_id="init",
                 )
-                resolved_model = run_async_in_sync_context(
-                    plugin_manager.execute_first(
-                        "model.resolve", resolve_ctx, str(self.model)
-                    )
+                resolved_alias = run_hook_sync(
+                    plugin_manager,
+                    "first",
+                    "model.resolve",
+                    resolve_ctx,
+                    str(resolved_model),
                 )
-                if isinstance(resolved_model, str) and resolved_model.strip():
-                    self.model = resolved_model.strip()
+                if isinstance(resolved_alias, str) and resolved_alias.strip():
+                    resolved_model = resolved_alias.strip()
             except Exception as e:
                 logger.warning(f"Model alias resolution failed (non-fatal): {e}")
 
-        self.timeout = (
-            timeout if timeout is not None else eff_config.get("timeout_sec", 120)
-        )
-        self.max_retries = (
-            max_retries if max_retries is not None else eff_config.get("max_retries", 3)
-        )
-        self.allow_private_network = bool(
-            eff_config.get("allow_private_network", False)
-        )
-
         # Get provider info
-        self.provider_info = get_provider_info(self.provider)
-        if not self.provider_info:
+        provider_info = get_provider_info(provider)
+        if not provider_info:
             logger.warning(
-                f"Unknown provider '{self.provider}', treating as OpenAI-compatible"
+                f"Unknown provider '{provider}', treating as OpenAI-compatible"
             )
 
-        # Get API key
-        self.api_key = get_api_key_for_provider(self.provider)
+        return LLMClientProfile(
+            provider=provider,
+            base_url=resolved_base_url,
+            model=str(resolved_model),
+            timeout=eff_config.get("timeout_sec", 120),
+            max_retries=eff_config.get("max_retries", 3),
+            allow_private_network=bool(eff_config.get("allow_private_network", False)),
+            provider_info=provider_info,
+            api_key=api_key,
+            failover_candidates=tuple(
+                _build_failover_candidates(
+                    provider, resolved_model, resolved_base_url, eff_config
+                )
+            ),
+            max_failover_candidates=eff_config.get("max_failover_candidates", 3),
+        )
 
-        # Validate key if required
-        if requires_api_key(self.provider) and not self.api_key:
-            # IMPORTANT: one-time warning per provider only (anti-spam guard).
-            if self.provider not in self._missing_api_key_warning_emitted:
-                logger.warning(f"No API key found for provider '{self.provider}'")
-                self._missing_api_key_warning_emitted.add(self.provider)
+    def _matching_profile(self) -> LLMClientProfile | None:
+        """Return the profile while provider/model/base_url still match it."""
+        profile = self._profile
+        if profile is None:
+            return None
+        if (self.provider, self.model, self.base_url) != (
+            profile.provider,
+            profile.model,
+            profile.base_url,
+        ):
+            return None
+        return profile
 
     def _get_api_type(self) -> ProviderType:
         """Get the API type for the current provider."""
@@ -221,57 +583,40 @@ class LLMClient:
 
         Returns empty if no fallbacks configured (preserves existing behavior).
         """
+        profile = self._matching_profile()
+        if profile is not None:
+            return list(profile.failover_candidates)
         eff_config, _ = get_effective_llm_config()
-
-        # Get failover config
-        fallback_models = eff_config.get("fallback_models", [])
-        fallback_providers = eff_config.get("fallback_providers", [])
-
-        # R14: Use failover.get_failover_candidates for ordering
-        try:
-            from ..services.failover import get_failover_candidates
-        except ImportError:
-            from services.failover import get_failover_candidates
-
-        # Get ordered candidates (provider, model)
-        candidates_2d = get_failover_candidates(
-            primary_provider=self.provider,
-            primary_model=self.model,
-            fallback_models=fallback_models if fallback_models else None,
-            fallback_providers=fallback_providers if fallback_providers else None,
+        return _build_failover_candidates(
+            self.provider, self.model, self.base_url, eff_config
         )
 
-        return self._resolve_candidate_base_urls(candidates_2d)
-
     def _resolve_candidate_base_urls(
         self, candidates_2d: List[Tuple[str, Optional[str]]]
     ) -> List[Tuple[str, Optional[str], Optional[str]]]:
         """Convert (provider, model) candidates into (provider, model, base_url)."""
-        # Convert to (provider, model, base_url) tuples
-        candidates_3d = []
-        for provider, model in candidates_2d:
-            # Resolve base_url for each candidate
-            if provider == self.provider:
-                # Same as primary, use configured base_url
-                candidates_3d.append((provider, model, self.base_url))
-            else:
-                # Different provider, get default base_url
-                info = get_provider_info(provider)
-                base_url = info.base_url if info else None
-                candidates_3d.append((provider, model, base_url))
-
-        return candidates_3d
+        return _candidate_base_urls(self.provider, self.base_url, candidates_2d)
 
     def _sort_candidates_3d_by_health(
         self,
         candidates: List[Tuple[str, Optional[str], Optional[str]]],
         failover_state,
     ) -> List[Tuple[str, Optional[str], Optional[str]]]:
-        """R130: 3D candidate sort preserving original stable order tiebreak."""
+        """
+        R130: 3D candidate sort preserving original stable order tiebreak.
+
+        R14: ranks by health score less a latency penalty, so a healthy but
+        much slower candidate sorts behind an equally healthy faster one.
+        """
+        fastest_ms = failover_state.fastest_latency_ms(
+            [(provider, model) for provider, model, _ in candidates]
+        )
         indexed = list(enumerate(candidates))
         indexed.sort(
             key=lambda item: (
-                failover_state.get_health_score(item[1][0], item[1][1]),
+                failover_state.get_routing_score(
+                    item[1][0], item[1][1], fastest_ms=fastest_ms
+                ),
                 -item[0],
             ),
             reverse=True,
@@ -306,8 +651,12 @@ class LLMClient:
                 should_retry,
             )
 
-        eff_config, _ = get_effective_config()
-        max_failover_candidates = eff_config.get("max_failover_candidates", 3)
+        profile = self._matching_profile()
+        if profile is not None:
+            max_failover_candidates = profile.max_failover_candidates
+        else:
+            eff_config, _ = get_effective_config()
+            max_failover_candidates = eff_config.get("max_failover_candidates", 3)
         # NOTE: Keep at least 1 candidate; zero yields empty attempts and opaque errors.
         # CRITICAL: Do not remove this guard. It prevents "All 0 failover candidates exhausted".
         try:
@@ -333,6 +682,7 @@ class LLMClient:
             "should_retry": should_retry,
             "failover_state": failover_state,
             "candidates_to_try": candidates_to_try,
+            "hedging": hedging_enabled(),
         }
 
     def _get_egress_controls(
@@ -454,23 +804,77 @@ class LLMClient:
                 on_text_delta=on_text_delta,
             )
 
-    def _execute_failover_candidates(
+    async def _aexecute_request(
         self,
-        *,
-        phase: Dict[str, Any],
         system: str,
         user_message: str,
         image_base64: Optional[str],
         image_media_type: str,
         temperature: float,
         max_tokens: int,
-        tools: Optional[List[Dict[str, Any]]],
-        tool_choice: Optional[str],
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | None = None,
+        streaming: bool = False,
+        on_text_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """Async twin of _execute_request (event-loop native transport)."""
+        api_type = self._get_api_type()
+
+        if api_type == ProviderType.ANTHROPIC:
+            if tools or tool_choice:
+                logger.debug(
+                    "F25: tools/tool_choice provided but Anthropic provider does not support tool calling; ignoring."
+                )
+            return await anthropic.make_request_async(
+                **self._anthropic_request_kwargs(
+                    system,
+                    user_message,
+                    image_base64,
+                    image_media_type,
+                    temperature,
+                    max_tokens,
+                )
+            )
+
+        request_kwargs = self._openai_compat_request_kwargs(
+            system,
+            user_message,
+            image_base64,
+            image_media_type,
+            temperature,
+            max_tokens,
+        )
+        if streaming and not tools and not tool_choice:
+            try:
+                return await openai_compat.make_request_stream_async(
+                    **request_kwargs, on_text_delta=on_text_delta
+                )
+            except Exception as e:
+                logger.info(
+                    "R38: Streaming request unavailable/failed; falling back to non-streaming request: %s",
+                    e,
+                )
+        return await openai_compat.make_request_async(
+            **request_kwargs, tools=tools, tool_choice=tool_choice
+        )
+
+    def _failover_plan(
+        self,
+        *,
+        phase: dict[str, Any],
         trace_id: Optional[str],
         streaming: bool,
-        on_text_delta: Optional[Callable[[str], None]],
-    ) -> Dict[str, Any]:
-        """R130 phase 2: execute failover/retry loop against prepared candidates."""
+    ) -> Generator[tuple[str, Any], Any, dict[str, Any]]:
+        """
+        R130 phase 2: failover/retry decisions for prepared candidates.
+
+        Transport-agnostic generator shared by the sync and async drivers.
+        Yields ("sleep", seconds) for backoff and ("attempt", hedge) when the
+        current candidate (already applied to self) should be executed; the
+        driver sends back a RaceOutcome for each attempt. ``hedge`` is the
+        next eligible candidate to race against when hedging is enabled, or
+        None. Returns the first successful result or raises the last error.
+        """
         ErrorCategory = phase["ErrorCategory"]
         classify_cooldown = phase["classify_cooldown"]
         classify_error = phase["classify_error"]
@@ -581,22 +985,32 @@ class LLMClient:
                                 "trace_id": trace_id,
                             },
                         )
-                        time.sleep(sleep_time)
-
-                    try:
-                        result = self._execute_request(
-                            system,
-                            user_message,
-                            image_base64,
-                            image_media_type,
-                            temperature,
-                            max_tokens,
-                            tools=tools,
-                            tool_choice=tool_choice,
-                            streaming=streaming,
-                            on_text_delta=on_text_delta,
+                        yield ("sleep", sleep_time)
+
+                    hedge = None
+                    if phase.get("hedging") and attempt == 0:
+                        hedge = self._hedge_target(
+                            candidates_to_try[candidate_idx + 1 :],
+                            failover_state,
+                            original_model,
+                            delay_sec=hedge_delay_sec(
+                                failover_state.get_latency_p95_ms(provider, model)
+                            ),
                         )
+                    result: dict[str, Any]
+                    outcome = yield ("attempt", hedge)
+                    result, e = outcome.result, outcome.error
+                    self._record_attempt_outcome(
+                        outcome,
+                        phase=phase,
+                        candidate=(provider, model),
+                        hedge=hedge,
+                        trace_id=trace_id,
+                    )
+                    if outcome.hedge_won:
+                        return result
 
+                    if e is None:
                         # R37: Update health score on success
                         failover_state.update_health_score(
                             provider,
@@ -636,95 +1050,94 @@ class LLMClient:
 
                         return result
 
-                    except Exception as e:
-                        candidate_last_error = e
-                        status_code = self._extract_status_code(e)
-                        cooldown_decision = classify_cooldown(e, status_code)
-                        error_category, retry_after = classify_error(e, status_code)
-                        logger.error(
-                            f"Request failed for {provider}/{self.model}: {e} "
-                            f"(category: {error_category.value}, status: {status_code})"
-                        )
-                        emit_structured_log(
-                            logger,
-                            level=logging.ERROR,
-                            event="llm.request.failure",
-                            fields={
-                                "provider": provider,
-                                "model": self.model,
-                                "candidate_index": candidate_idx,
-                                "category": error_category.value,
-                                "cooldown_bucket": cooldown_decision.bucket,
-                                "reason_code": cooldown_decision.reason_code,
-                                "status_code": status_code,
-                                "error_type": type(e).__name__,
-                                "trace_id": trace_id,
-                            },
-                        )
+                    candidate_last_error = e
+                    status_code = self._extract_status_code(e)
+                    cooldown_decision = classify_cooldown(e, status_code)
+                    error_category, retry_after = classify_error(e, status_code)
+                    logger.error(
+                        f"Request failed for {provider}/{self.model}: {e} "
+                        f"(category: {error_category.value}, status: {status_code})"
+                    )
+                    emit_structured_log(
+                        logger,
+                        level=logging.ERROR,
+                        event="llm.request.failure",
+                        fields={
+                            "provider": provider,
+                            "model": self.model,
+                            "candidate_index": candidate_idx,
+                            "category": error_category.value,
+                            "cooldown_bucket": cooldown_decision.bucket,
+                            "reason_code": cooldown_decision.reason_code,
+                            "status_code": status_code,
+                            "error_type": type(e).__name__,
+                            "trace_id": trace_id,
+                        },
+                    )
 
-                        # R37: Update health score on failure (before dedupe check)
-                        failover_state.update_health_score(
-                            provider, model, error_category, is_success=False
-                        )
+                    # R37: Update health score on failure (before dedupe check)
+                    failover_state.update_health_score(
+                        provider, model, error_category, is_success=False
+                    )
 
-                        # Decide: retry same candidate or failover to next
-                        if should_retry(error_category):
-                            # Retry same candidate (continue retry loop)
-                            last_error = e
-                            continue
-
-                        elif should_failover(error_category):
-                            # R37: Check dedupe before setting cooldown/logging
-                            if failover_state.should_suppress_duplicate(
-                                provider, model, error_category
-                            ):
-                                # Duplicate within window - suppress spam
-                                logger.debug(
-                                    f"Suppressing duplicate {error_category.value} for {provider}/{model}"
-                                )
-                            else:
-                                # New failure - set cooldown and log
-                                duration = get_cooldown_duration(
-                                    error_category, retry_after_override=retry_after
-                                )
-                                failover_state.set_cooldown(
-                                    provider,
-                                    model,
-                                    cooldown_decision.reason_code,
-                                    duration,
-                                    reason_code=cooldown_decision.reason_code,
-                                    bucket=cooldown_decision.bucket,
-                                    retry_after_sec=retry_after,
-                                )
-                                logger.warning(
-                                    f"Failover triggered for {provider}/{model}: "
-                                    f"{cooldown_decision.reason_code} (cooldown: {duration}s)"
-                                )
-                                emit_structured_log(
-                                    logger,
-                                    level=logging.WARNING,
-                                    event="llm.failover.triggered",
-                                    fields={
-                                        "provider": provider,
-                                        "model": model,
-                                        "category": error_category.value,
-                                        "cooldown_bucket": cooldown_decision.bucket,
-                                        "reason_code": cooldown_decision.reason_code,
-                                        "cooldown_sec": duration,
-                                        "retry_after_sec": retry_after,
-                                        "trace_id": trace_id,
-                                    },
-                                )
-
-                            last_error = e
-                            break  # Exit retry loop, try next candidate
+                    # Decide: retry same candidate or failover to next
+                    if should_retry(error_category):
+                        # Retry same candidate (continue retry loop)
+                        last_error = e
+                        continue
 
+                    elif should_failover(error_category):
+                        # R37: Check dedupe before setting cooldown/logging
+                        if failover_state.should_suppress_duplicate(
+                            provider, model, error_category
+                        ):
+                            # Duplicate within window - suppress spam
+                            logger.debug(
+                                f"Suppressing duplicate {error_category.value} for {provider}/{model}"
+                            )
                         else:
-                            # Fatal error (e.g., auth on first attempt), don't retry or failover
-                            # But let's still try other candidates in case it's provider-specific
-                            logger.error(f"Non-retryable error: {error_category.value}")
-                            last_error = e
-                            break
+                            # New failure - set cooldown and log
+                            duration = get_cooldown_duration(
+                                error_category, retry_after_override=retry_after
+                            )
+                            failover_state.set_cooldown(
+                                provider,
+                                model,
+                                cooldown_decision.reason_code,
+                                duration,
+                                reason_code=cooldown_decision.reason_code,
+                                bucket=cooldown_decision.bucket,
+                                retry_after_sec=retry_after,
+                            )
+                            logger.warning(
+                                f"Failover triggered for {provider}/{model}: "
+                                f"{cooldown_decision.reason_code} (cooldown: {duration}s)"
+                            )
+                            emit_structured_log(
+                                logger,
+                                level=logging.WARNING,
+                                event="llm.failover.triggered",
+                                fields={
+                                    "provider": provider,
+                                    "model": model,
+                                    "category": error_category.value,
+                                    "cooldown_bucket": cooldown_decision.bucket,
+                                    "reason_code": cooldown_decision.reason_code,
+                                    "cooldown_sec": duration,
+                                    "retry_after_sec": retry_after,
+                                    "trace_id": trace_id,
+                                },
+                            )
+
+                        last_error = e
+                        break  # Exit retry loop, try next candidate
+
+                    else:
+                        # Fatal error (e.g., auth on first attempt), don't retry or failover
+                        # But let's still try other candidates in case it's provider-specific
+                        logger.error(f"Non-retryable error: {error_category.value}")
+                        last_error = e
+                        break
 
                 # If we exhausted all retries for this candidate, continue to next
                 last_error = candidate_last_error or last_error
@@ -752,6 +1165,277 @@ class LLMClient:
             f"All {candidates_tried} failover candidates exhausted"
         )
 
+    def _hedge_target(
+        self,
+        remaining: list[FailoverCandidate],
+        failover_state: Any,
+        original_model: str,
+        *,
+        delay_sec: float,
+    ) -> dict[str, Any] | None:
+        """Next eligible candidate for a speculative (hedged) request."""
+        for provider, model, base_url in remaining:
+            if failover_state.is_cooling_down(provider, model):
+                continue
+            if not self._validate_candidate_url(provider, base_url):
+                continue
+            api_key = get_api_key_for_provider(provider)
+            if requires_api_key(provider) and not api_key:
+                continue
+            return {
+                "candidate": (provider, model),
+                "provider": provider,
+                "model": model or original_model,
+                "base_url": base_url,
+                "provider_info": get_provider_info(provider),
+                "api_key": api_key,
+                "delay_sec": delay_sec,
+            }
+        return None
+
+    def _hedge_client(self, hedge: dict[str, Any]) -> "LLMClient":
+        client = copy.copy(self)
+        for attr in ("provider", "model", "base_url", "provider_info", "api_key"):
+            setattr(client, attr, hedge[attr])
+        return client
+
+    def _record_attempt_outcome(
+        self,
+        outcome: RaceOutcome,
+        *,
+        phase: dict[str, Any],
+        candidate: tuple[str, str | None],
+        hedge: dict[str, Any] | None,
+        trace_id: str | None,
+    ) -> None:
+        """Feed attempt latency and hedge side results into failover state."""
+        failover_state = phase["failover_state"]
+        keys = {PRIMARY: candidate}
+        if hedge is not None:
+            keys[HEDGE] = hedge["candidate"]
+        for name, latency_ms in outcome.latency_ms.items():
+            failover_state.record_latency(*keys[name], latency_ms)
+        for name, error in outcome.errors.items():
+            category, _ = phase["classify_error"](
+                error, self._extract_status_code(error)
+            )
+            failover_state.update_health_score(*keys[name], category, is_success=False)
+        if not outcome.hedged or hedge is None:
+            return
+        failover_state.mark_attempt(*keys[HEDGE])
+        if outcome.hedge_won:
+            failover_state.update_health_score(
+                *keys[HEDGE], phase["ErrorCategory"].UNKNOWN, is_success=True
+            )
+        emit_structured_log(
+            logger,
+            level=logging.INFO,
+            event="llm.hedge.win" if outcome.hedge_won else "llm.hedge.loss",
+            fields={
+                "provider": candidate[0],
+                "model": self.model,
+                "hedge_provider": hedge["provider"],
+                "hedge_model": hedge["model"],
+                "trace_id": trace_id,
+            },
+        )
+
+    def _racer(
+        self, call: Callable[["LLMClient", Callable[[str], None] | None], Any]
+    ) -> Callable[[Callable[[str], None] | None], dict[str, Any]]:
+        def run(publish: Callable[[str], None] | None) -> dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                result: dict[str, Any] = call(self, publish)
+            except Exception as e:
+                self._observe_attempt_latency(started, (None, e))
+                raise
+            self._observe_attempt_latency(started, (result, None))
+            return result
+
+        return run
+
+    def _aracer(
+        self, call: Callable[["LLMClient", Callable[[str], None] | None], Any]
+    ) -> Callable[[Callable[[str], None] | None], Any]:
+        async def run(publish: Callable[[str], None] | None) -> dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                result: dict[str, Any] = await call(self, publish)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._observe_attempt_latency(started, (None, e))
+                raise
+            self._observe_attempt_latency(started, (result, None))
+            return result
+
+        return run
+
+    def _run_attempt(
+        self,
+        hedge: dict[str, Any] | None,
+        call: Callable[["LLMClient", Callable[[str], None] | None], Any],
+        on_text_delta: Callable[[str], None] | None,
+    ) -> RaceOutcome:
+        if hedge is not None:
+            return run_hedged(
+                copy.copy(self)._racer(call),
+                self._hedge_client(hedge)._racer(call),
+                delay_sec=hedge["delay_sec"],
+                on_text_delta=on_text_delta,
+            )
+        started = time.perf_counter()
+        try:
+            result = self._racer(call)(on_text_delta)
+        except Exception as e:
+            return RaceOutcome(result=None, error=e)
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        return RaceOutcome(result=result, error=None, latency_ms={PRIMARY: latency_ms})
+
+    async def _arun_attempt(
+        self,
+        hedge: dict[str, Any] | None,
+        call: Callable[["LLMClient", Callable[[str], None] | None], Any],
+        on_text_delta: Callable[[str], None] | None,
+    ) -> RaceOutcome:
+        if hedge is not None:
+            return await arun_hedged(
+                copy.copy(self)._aracer(call),
+                self._hedge_client(hedge)._aracer(call),
+                delay_sec=hedge["delay_sec"],
+                on_text_delta=on_text_delta,
+            )
+        started = time.perf_counter()
+        try:
+            result = await self._aracer(call)(on_text_delta)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return RaceOutcome(result=None, error=e)
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        return RaceOutcome(result=result, error=None, latency_ms={PRIMARY: latency_ms})
+
+    def _execute_failover_candidates(
+        self,
+        *,
+        phase: dict[str, Any],
+        system: str,
+        user_message: str,
+        image_base64: str | None,
+        image_media_type: str,
+        temperature: float,
+        max_tokens: int,
+        tools: list[dict[str, Any]] | None,
+        tool_choice: str | None,
+        trace_id: str | None,
+        streaming: bool,
+        on_text_delta: Callable[[str], None] | None,
+    ) -> dict[str, Any]:
+        """Drive the failover plan with blocking sleeps and transport."""
+
+        def call(
+            client: LLMClient, publish: Callable[[str], None] | None
+        ) -> dict[str, Any]:
+            return client._execute_request(
+                system,
+                user_message,
+                image_base64,
+                image_media_type,
+                temperature,
+                max_tokens,
+                tools=tools,
+                tool_choice=tool_choice,
+                streaming=streaming,
+                on_text_delta=publish,
+            )
+
+        plan = self._failover_plan(phase=phase, trace_id=trace_id, streaming=streaming)
+        try:
+            step = next(plan)
+            while True:
+                kind, value = step
+                outcome: RaceOutcome | None = None
+                if kind == "sleep":
+                    time.sleep(value)
+                else:
+                    outcome = self._run_attempt(value, call, on_text_delta)
+                try:
+                    step = plan.send(outcome)
+                except StopIteration as done:
+                    final: dict[str, Any] = done.value
+                    return final
+        finally:
+            plan.close()
+
+    def _observe_attempt_latency(
+        self, started: float, outcome: tuple[Any, Exception | None]
+    ) -> None:
+        """Record one provider attempt in the LLM latency histogram."""
+        metrics.observe(
+            "llm_request_duration_ms",
+            (time.perf_counter() - started) * 1000.0,
+            {
+                "provider": self.provider,
+                "tenant": resolve_active_tenant_id(),
+                "outcome": "error" if outcome[1] is not None else "ok",
+            },
+        )
+
+    async def _aexecute_failover_candidates(
+        self,
+        *,
+        phase: dict[str, Any],
+        system: str,
+        user_message: str,
+        image_base64: str | None,
+        image_media_type: str,
+        temperature: float,
+        max_tokens: int,
+        tools: list[dict[str, Any]] | None,
+        tool_choice: str | None,
+        trace_id: str | None,
+        streaming: bool,
+        on_text_delta: Callable[[str], None] | None,
+    ) -> dict[str, Any]:
+        """Drive the failover plan on the running event loop."""
+
+        async def call(
+            client: LLMClient, publish: Callable[[str], None] | None
+        ) -> dict[str, Any]:
+            return await client._aexecute_request(
+                system,
+                user_message,
+                image_base64,
+                image_media_type,
+                temperature,
+                max_tokens,
+                tools=tools,
+                tool_choice=tool_choice,
+                streaming=streaming,
+                on_text_delta=publish,
+            )
+
+        plan = self._failover_plan(phase=phase, trace_id=trace_id, streaming=streaming)
+        try:
+            step = next(plan)
+            while True:
+                kind, value = step
+                outcome: RaceOutcome | None = None
+                if kind == "sleep":
+                    await asyncio.sleep(value)
+                else:
+                    outcome = await self._arun_attempt(value, call, on_text_delta)
+                try:
+                    step = plan.send(outcome)
+                except StopIteration as done:
+                    final: dict[str, Any] = done.value
+                    return final
+        finally:
+            # IMPORTANT: cancellation mid-sleep/attempt must still run the
+            # plan's finally block so candidate state is restored.
+            plan.close()
+
     def complete(
         self,
         system: str,
@@ -786,87 +1470,179 @@ class LLMClient:
             raise ValueError(f"API key not configured for provider '{self.provider}'")
 
         # R23: Param transforms + audit via plugins
-        # Default safe bounds
-        SAFE_BOUNDS = {
-            "temperature": (0.0, 2.0, 0.7),  # (min, max, default)
-            "max_tokens": (1, 128000, 4096),
-        }
-
-        # Initial params
         params = {
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        run_async_in_sync_context = None
+        run_hook_sync = None
         ctx = None
 
         if PLUGINS_AVAILABLE:
             try:
-                from .plugins.async_bridge import (
-                    run_async_in_sync_context as _run_async_in_sync_context,
-                )
+                from .plugins.async_bridge import run_hook_sync as _run_hook_sync
 
-                run_async_in_sync_context = _run_async_in_sync_context
-                ctx = RequestContext(
-                    provider=self.provider,
-                    model=self.model,
-                    trace_id=trace_id or "unknown",
-                )
+                run_hook_sync = _run_hook_sync
+                ctx = self._plugin_request_context(trace_id)
 
                 # Apply parameter transforms (params clamping, etc.)
-                transformed = run_async_in_sync_context(
-                    plugin_manager.execute_sequential("llm.params", ctx, params)
+                params = self._accept_param_transform(
+                    params,
+                    run_hook_sync(
+                        plugin_manager, "sequential", "llm.params", ctx, params
+                    ),
                 )
-
-                if transformed and isinstance(transformed, dict):
-                    params = transformed
-                else:
-                    logger.warning(
-                        f"Plugin transform returned invalid data: {transformed}, reverting to input"
-                    )
             except Exception as e:
                 logger.warning(f"Plugin param transform failed (non-fatal): {e}")
 
-        # Enforce hard safety bounds (True Fail-Closed)
-        # Regardless of whether plugin succeeded, failed, or returned garbage,
-        # we ALWAYS clamp to safe ranges before proceeding.
+        temperature, max_tokens = self._clamp_params(params, temperature, max_tokens)
+
+        response_cache = get_llm_response_cache()
+        coalesce = single_flight_enabled()
+        cache_tenant = ""
+        cache_key = ""
+        if response_cache is not None or coalesce:
+            cache_tenant = resolve_active_tenant_id()
+            cache_key = build_cache_key(
+                tenant_id=cache_tenant,
+                provider=self.provider,
+                model=self.model,
+                base_url=self.base_url,
+                system=system,
+                user_message=user_message,
+                image_base64=image_base64,
+                image_media_type=image_media_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                tool_choice=tool_choice,
+            )
+        if response_cache is not None:
+            cached = response_cache.get(cache_tenant, cache_key)
+            if cached is not None:
+                # A hit never reaches the provider, so there is no request to audit.
+                if on_text_delta is not None and cached.get("text"):
+                    on_text_delta(str(cached["text"]))
+                return cached
+
+        if PLUGINS_AVAILABLE and run_hook_sync and ctx:
+            # Audit request (fire-and-forget, never fails request)
+            with contextlib.suppress(Exception):
+                run_hook_sync(
+                    plugin_manager,
+                    "parallel",
+                    "llm.audit_request",
+                    ctx,
+                    self._audit_payload(
+                        temperature, max_tokens, image_base64 is not None
+                    ),
+                    wait=False,
+                )
 
-        # Clamp Temperature
-        t_min, t_max, t_def = SAFE_BOUNDS["temperature"]
-        t_val = params.get("temperature", temperature)
-        if not isinstance(t_val, (int, float)):
-            t_val = t_def
-        temperature = max(t_min, min(t_val, t_max))
+        def _call(publish: Callable[[str], None] | None) -> dict[str, Any]:
+            phase = self._prepare_failover_execution()
+            response = self._execute_failover_candidates(
+                phase=phase,
+                system=system,
+                user_message=user_message,
+                image_base64=image_base64,
+                image_media_type=image_media_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                tool_choice=tool_choice,
+                trace_id=trace_id,
+                streaming=streaming,
+                on_text_delta=publish if streaming else None,
+            )
+            if response_cache is not None and isinstance(response, dict):
+                response_cache.put(cache_tenant, cache_key, response)
+            return response
 
-        # Clamp Max Tokens
-        m_min, m_max, m_def = SAFE_BOUNDS["max_tokens"]
-        m_val = params.get("max_tokens", max_tokens)
-        if not isinstance(m_val, int):
-            m_val = m_def
-        max_tokens = max(m_min, min(m_val, m_max))
+        if not coalesce:
+            return _call(on_text_delta)
+        return _single_flight.run(cache_key, _call, on_text_delta)
 
-        # Re-sync params for audit
-        audit_params = {"temperature": temperature, "max_tokens": max_tokens}
-        if PLUGINS_AVAILABLE and run_async_in_sync_context and ctx:
-            # Audit request (fire-and-forget, never fails request)
+    async def acomplete(
+        self,
+        system: str,
+        user_message: str,
+        image_base64: str | None = None,
+        image_media_type: str = "image/png",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | None = None,
+        trace_id: str | None = None,
+        streaming: bool = False,
+        on_text_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Asyncio-native counterpart of complete().
+
+        Same plugin, clamping, failover and retry semantics, but provider
+        calls and backoff sleeps run on the caller's event loop instead of a
+        worker thread. on_text_delta is invoked on the event loop.
+        """
+        if requires_api_key(self.provider) and not self.api_key:
+            raise ValueError(f"API key not configured for provider '{self.provider}'")
+
+        params = {
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        ctx = None
+        if PLUGINS_AVAILABLE:
             try:
-                audit_payload = {
-                    "provider": self.provider,
-                    "model": self.model,
-                    "params": audit_params,
-                    "has_image": image_base64 is not None,
-                }
-                run_async_in_sync_context(
-                    plugin_manager.execute_parallel(
-                        "llm.audit_request", ctx, audit_payload
-                    )
+                ctx = self._plugin_request_context(trace_id)
+                params = self._accept_param_transform(
+                    params,
+                    await plugin_manager.execute_sequential("llm.params", ctx, params),
+                )
+            except Exception as e:
+                logger.warning(f"Plugin param transform failed (non-fatal): {e}")
+
+        temperature, max_tokens = self._clamp_params(params, temperature, max_tokens)
+
+        if PLUGINS_AVAILABLE and ctx:
+            # Audit request (fire-and-forget, never fails request)
+            with contextlib.suppress(Exception):
+                await plugin_manager.execute_parallel(
+                    "llm.audit_request",
+                    ctx,
+                    self._audit_payload(
+                        temperature, max_tokens, image_base64 is not None
+                    ),
                 )
-            except Exception:
-                pass  # Audit failures are non-fatal
 
-        phase = self._prepare_failover_execution()
-        return self._execute_failover_candidates(
-            phase=phase,
+        # CRITICAL: the failover plan swaps provider/model/base_url on the
+        # instance while it runs. Concurrent coroutines sharing this client
+        # would observe each other's candidates, so run on a shallow clone.
+        runner = copy.copy(self)
+
+        async def _call(publish: Callable[[str], None] | None) -> dict[str, Any]:
+            phase = runner._prepare_failover_execution()
+            return await runner._aexecute_failover_candidates(
+                phase=phase,
+                system=system,
+                user_message=user_message,
+                image_base64=image_base64,
+                image_media_type=image_media_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                tool_choice=tool_choice,
+                trace_id=trace_id,
+                streaming=streaming,
+                on_text_delta=publish if streaming else None,
+            )
+
+        if not single_flight_enabled():
+            return await _call(on_text_delta)
+        key = build_cache_key(
+            tenant_id=resolve_active_tenant_id(),
+            provider=self.provider,
+            model=self.model,
+            base_url=self.base_url,
             system=system,
             user_message=user_message,
             image_base64=image_base64,
@@ -875,21 +1651,126 @@ class LLMClient:
             max_tokens=max_tokens,
             tools=tools,
             tool_choice=tool_choice,
-            trace_id=trace_id,
-            streaming=streaming,
-            on_text_delta=on_text_delta,
         )
+        return await _single_flight.arun(key, _call, on_text_delta)
 
-    def _complete_anthropic(
+    async def astream(
         self,
         system: str,
         user_message: str,
-        image_base64: Optional[str],
+        image_base64: str | None = None,
+        image_media_type: str = "image/png",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        trace_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield text deltas as they arrive from the provider.
+
+        Providers without a streaming path (or a stream that falls back to a
+        plain request) yield the full response text as a single chunk.
+        Closing the iterator early cancels the in-flight request.
+        """
+        deltas: asyncio.Queue[str] = asyncio.Queue()
+        emitted = False
+        task = asyncio.ensure_future(
+            self.acomplete(
+                system,
+                user_message,
+                image_base64=image_base64,
+                image_media_type=image_media_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                trace_id=trace_id,
+                streaming=True,
+                on_text_delta=deltas.put_nowait,
+            )
+        )
+        try:
+            while True:
+                getter = asyncio.ensure_future(deltas.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    emitted = True
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                break
+            while not deltas.empty():
+                emitted = True
+                yield deltas.get_nowait()
+            result = task.result()
+            if not emitted and isinstance(result, dict) and result.get("text"):
+                yield result["text"]
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    def _plugin_request_context(self, trace_id: str | None) -> Any:
+        return RequestContext(
+            provider=self.provider,
+            model=self.model,
+            trace_id=trace_id or "unknown",
+        )
+
+    @staticmethod
+    def _accept_param_transform(
+        params: dict[str, Any], transformed: Any
+    ) -> dict[str, Any]:
+        if transformed and isinstance(transformed, dict):
+            return transformed
+        logger.warning(
+            f"Plugin transform returned invalid data: {transformed}, reverting to input"
+        )
+        return params
+
+    @staticmethod
+    def _clamp_params(
+        params: dict[str, Any], temperature: float, max_tokens: int
+    ) -> tuple[float, int]:
+        """
+        Enforce hard safety bounds (True Fail-Closed).
+
+        Regardless of whether plugin succeeded, failed, or returned garbage,
+        we ALWAYS clamp to safe ranges before proceeding.
+        """
+        # Clamp Temperature
+        t_min, t_max, t_def = _SAFE_PARAM_BOUNDS["temperature"]
+        t_val = params.get("temperature", temperature)
+        if not isinstance(t_val, (int, float)):
+            t_val = t_def
+        temperature = max(t_min, min(t_val, t_max))
+
+        # Clamp Max Tokens
+        m_min, m_max, m_def = _SAFE_PARAM_BOUNDS["max_tokens"]
+        m_val = params.get("max_tokens", max_tokens)
+        if not isinstance(m_val, int):
+            m_val = m_def
+        max_tokens = max(m_min, min(m_val, m_max))
+        return temperature, max_tokens
+
+    def _audit_payload(
+        self, temperature: float, max_tokens: int, has_image: bool
+    ) -> dict[str, Any]:
+        # Re-sync params for audit
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "params": {"temperature": temperature, "max_tokens": max_tokens},
+            "has_image": has_image,
+        }
+
+    def _anthropic_request_kwargs(
+        self,
+        system: str,
+        user_message: str,
+        image_base64: str | None,
         image_media_type: str,
         temperature: float,
         max_tokens: int,
-    ) -> Dict[str, Any]:
-        """Complete using Anthropic Messages API."""
+    ) -> dict[str, Any]:
         egress_controls = self._get_egress_controls(self.provider, self.base_url)
 
         if image_base64:
@@ -899,23 +1780,23 @@ class LLMClient:
         else:
             message = {"role": "user", "content": user_message}
 
-        return anthropic.make_request(
-            base_url=self.base_url,
-            api_key=self.api_key,
-            messages=[message],
-            model=self.model,
-            system=system,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            timeout=self.timeout,
-            allow_hosts=egress_controls.get("allow_hosts"),
-            allow_any_public_host=bool(egress_controls.get("allow_any_public_host")),
-            allow_loopback_hosts=egress_controls.get("allow_loopback_hosts"),
-            allow_insecure_base_url=self._allow_insecure_base_url(),
-            allow_private_network=bool(egress_controls.get("allow_private_network")),
-        )
+        return {
+            "base_url": self.base_url,
+            "api_key": self.api_key,
+            "messages": [message],
+            "model": self.model,
+            "system": system,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": self.timeout,
+            "allow_hosts": egress_controls.get("allow_hosts"),
+            "allow_any_public_host": bool(egress_controls.get("allow_any_public_host")),
+            "allow_loopback_hosts": egress_controls.get("allow_loopback_hosts"),
+            "allow_insecure_base_url": self._allow_insecure_base_url(),
+            "allow_private_network": bool(egress_controls.get("allow_private_network")),
+        }
 
-    def _complete_openai_compat(
+    def _complete_anthropic(
         self,
         system: str,
         user_message: str,
@@ -923,13 +1804,28 @@ class LLMClient:
         image_media_type: str,
         temperature: float,
         max_tokens: int,
-        *,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        tool_choice: Optional[str] = None,
-        streaming: bool = False,
-        on_text_delta: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
-        """Complete using OpenAI-compatible API."""
+        """Complete using Anthropic Messages API."""
+        return anthropic.make_request(
+            **self._anthropic_request_kwargs(
+                system,
+                user_message,
+                image_base64,
+                image_media_type,
+                temperature,
+                max_tokens,
+            )
+        )
+
+    def _openai_compat_request_kwargs(
+        self,
+        system: str,
+        user_message: str,
+        image_base64: str | None,
+        image_media_type: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any]:
         egress_controls = self._get_egress_controls(self.provider, self.base_url)
         messages = [{"role": "system", "content": system}]
 
@@ -942,28 +1838,51 @@ class LLMClient:
         else:
             messages.append({"role": "user", "content": user_message})
 
+        return {
+            "base_url": self.base_url,
+            "api_key": self.api_key,
+            "messages": messages,
+            "model": self.model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": self.timeout,
+            "allow_hosts": egress_controls.get("allow_hosts"),
+            "allow_any_public_host": bool(egress_controls.get("allow_any_public_host")),
+            "allow_loopback_hosts": egress_controls.get("allow_loopback_hosts"),
+            "allow_insecure_base_url": self._allow_insecure_base_url(),
+            "allow_private_network": bool(egress_controls.get("allow_private_network")),
+        }
+
+    def _complete_openai_compat(
+        self,
+        system: str,
+        user_message: str,
+        image_base64: Optional[str],
+        image_media_type: str,
+        temperature: float,
+        max_tokens: int,
+        *,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        streaming: bool = False,
+        on_text_delta: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Complete using OpenAI-compatible API."""
+        request_kwargs = self._openai_compat_request_kwargs(
+            system,
+            user_message,
+            image_base64,
+            image_media_type,
+            temperature,
+            max_tokens,
+        )
+
         # R38: Streaming is optional and currently only enabled for non-tool
         # OpenAI-compatible text paths. Tool-call streaming deltas are not parsed yet.
         if streaming and not tools and not tool_choice:
             try:
                 return openai_compat.make_request_stream(
-                    base_url=self.base_url,
-                    api_key=self.api_key,
-                    messages=messages,
-                    model=self.model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    timeout=self.timeout,
-                    allow_hosts=egress_controls.get("allow_hosts"),
-                    allow_any_public_host=bool(
-                        egress_controls.get("allow_any_public_host")
-                    ),
-                    allow_loopback_hosts=egress_controls.get("allow_loopback_hosts"),
-                    allow_insecure_base_url=self._allow_insecure_base_url(),
-                    allow_private_network=bool(
-                        egress_controls.get("allow_private_network")
-                    ),
-                    on_text_delta=on_text_delta,
+                    **request_kwargs, on_text_delta=on_text_delta
                 )
             except Exception as e:
                 logger.info(
@@ -972,20 +1891,7 @@ class LLMClient:
                 )
 
         return openai_compat.make_request(
-            base_url=self.base_url,
-            api_key=self.api_key,
-            messages=messages,
-            model=self.model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            timeout=self.timeout,
-            tools=tools,
-            tool_choice=tool_choice,
-            allow_hosts=egress_controls.get("allow_hosts"),
-            allow_any_public_host=bool(egress_controls.get("allow_any_public_host")),
-            allow_loopback_hosts=egress_controls.get("allow_loopback_hosts"),
-            allow_insecure_base_url=self._allow_insecure_base_url(),
-            allow_private_network=bool(egress_controls.get("allow_private_network")),
+            **request_kwargs, tools=tools, tool_choice=tool_choice
         )
 
     def get_provider_summary(self) -> Dict[str, Any]:
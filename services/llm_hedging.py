@@ -0,0 +1,257 @@
+"""
+Hedged LLM requests (opt-in).
+
+When the current failover candidate has not produced its first byte within
+an adaptive delay (the candidate's recent p95 latency), a speculative
+request is sent to the next eligible candidate. The first byte is the first
+streamed delta, or the whole response when not streaming.
+
+- Streaming: the first racer to emit a delta owns the caller's stream. The
+  other racer's deltas are suppressed and its outcome is ignored.
+- Non-streaming: the first successful response wins. If one racer fails,
+  the race keeps waiting for the other.
+
+The loser is cancelled on the async path. Sync transports block in a worker
+thread and cannot be interrupted, so a sync loser is abandoned: its output
+is discarded and the thread ends when its own request timeout fires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .metrics import metrics
+
+PRIMARY = "primary"
+HEDGE = "hedge"
+
+DEFAULT_HEDGE_DELAY_MS = 2000.0  # Used until the candidate has latency samples
+MIN_HEDGE_DELAY_MS = 250.0
+MAX_HEDGE_DELAY_MS = 15000.0
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+TextDelta = Callable[[str], None]
+Racer = Callable[[TextDelta | None], dict[str, Any]]
+AsyncRacer = Callable[[TextDelta | None], Awaitable[dict[str, Any]]]
+
+
+def hedging_enabled() -> bool:
+    raw = os.environ.get("OPENCLAW_LLM_HEDGING") or os.environ.get(
+        "MOLTBOT_LLM_HEDGING", ""
+    )
+    return raw.strip().lower() in _TRUTHY
+
+
+def hedge_delay_sec(p95_ms: float | None) -> float:
+    """Delay before hedging: the candidate's p95, clamped to sane bounds."""
+    if p95_ms is None:
+        raw = os.environ.get("OPENCLAW_LLM_HEDGE_DELAY_MS") or os.environ.get(
+            "MOLTBOT_LLM_HEDGE_DELAY_MS", ""
+        )
+        try:
+            p95_ms = float(raw) if raw.strip() else DEFAULT_HEDGE_DELAY_MS
+        except ValueError:
+            p95_ms = DEFAULT_HEDGE_DELAY_MS
+    return min(MAX_HEDGE_DELAY_MS, max(MIN_HEDGE_DELAY_MS, p95_ms)) / 1000.0
+
+
+@dataclass
+class RaceOutcome:
+    """Result of one attempt, hedged or not.
+
+    ``latency_ms`` holds completion latency per racer that succeeded, or the
+    elapsed time of a racer still running when the race was decided (a lower
+    bound). ``errors`` holds failures of racers other than the winner.
+    """
+
+    result: dict[str, Any] | None
+    error: Exception | None
+    hedged: bool = False
+    hedge_won: bool = False
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+@dataclass
+class _Finished:
+    at: float
+    result: dict[str, Any] | None
+    error: Exception | None
+
+
+class _Race:
+    def __init__(self, on_text_delta: TextDelta | None) -> None:
+        self.on_text_delta = on_text_delta
+        self.started: dict[str, float] = {}
+        self.finished: dict[str, _Finished] = {}
+        self.first_byte = False
+        self.owner: str | None = None  # Racer whose deltas reach the caller
+        self.changed: Callable[[], None] = lambda: None
+        self._lock = threading.Lock()
+
+    def publisher(self, name: str) -> TextDelta | None:
+        if self.on_text_delta is None:
+            return None
+        on_text_delta = self.on_text_delta
+
+        def publish(delta: str) -> None:
+            with self._lock:
+                if self.owner is None:
+                    self.owner = name
+                    self.first_byte = True
+                owns = self.owner == name
+            if owns:
+                on_text_delta(delta)
+            self.changed()
+
+        return publish
+
+    def finish(
+        self, name: str, result: dict[str, Any] | None, error: Exception | None
+    ) -> None:
+        with self._lock:
+            self.finished[name] = _Finished(time.perf_counter(), result, error)
+            self.first_byte = True
+        self.changed()
+
+    def winner(self) -> str | None:
+        with self._lock:
+            if self.owner is not None:
+                return self.owner if self.owner in self.finished else None
+            succeeded = [n for n, f in self.finished.items() if f.error is None]
+            if succeeded:
+                return min(succeeded, key=lambda n: self.finished[n].at)
+            if all(name in self.finished for name in self.started):
+                return PRIMARY
+            return None
+
+    def outcome(self, winner: str) -> RaceOutcome:
+        now = time.perf_counter()
+        with self._lock:
+            latency: dict[str, float] = {}
+            errors: dict[str, Exception] = {}
+            for name, started in self.started.items():
+                done = self.finished.get(name)
+                if done is None:
+                    latency[name] = (now - started) * 1000.0
+                elif done.error is None:
+                    latency[name] = (done.at - started) * 1000.0
+                elif name != winner:
+                    errors[name] = done.error
+            final = self.finished[winner]
+        hedged = HEDGE in self.started
+        if hedged:
+            metrics.inc("llm_hedge_wins" if winner == HEDGE else "llm_hedge_losses")
+        return RaceOutcome(
+            result=final.result,
+            error=final.error,
+            hedged=hedged,
+            hedge_won=winner == HEDGE,
+            latency_ms=latency,
+            errors=errors,
+        )
+
+
+def run_hedged(
+    primary: Racer,
+    hedge: Racer,
+    *,
+    delay_sec: float,
+    on_text_delta: TextDelta | None,
+) -> RaceOutcome:
+    """Race ``primary`` against a delayed ``hedge`` in worker threads."""
+    race = _Race(on_text_delta)
+    cond = threading.Condition()
+
+    def _notify() -> None:
+        with cond:
+            cond.notify_all()
+
+    race.changed = _notify
+
+    def _start(name: str, racer: Racer) -> None:
+        publish = race.publisher(name)
+
+        def _run() -> None:
+            try:
+                result, error = racer(publish), None
+            except Exception as e:
+                result, error = None, e
+            race.finish(name, result, error)
+
+        race.started[name] = time.perf_counter()
+        # Racers resolve tenant/trace from context variables.
+        ctx = contextvars.copy_context()
+        threading.Thread(
+            target=ctx.run, args=(_run,), name=f"openclaw-llm-{name}", daemon=True
+        ).start()
+
+    _start(PRIMARY, primary)
+    with cond:
+        cond.wait_for(lambda: race.first_byte, delay_sec)
+    if not race.first_byte:
+        metrics.inc("llm_hedge_launched")
+        _start(HEDGE, hedge)
+    with cond:
+        while (winner := race.winner()) is None:
+            cond.wait()
+    return race.outcome(winner)
+
+
+async def arun_hedged(
+    primary: AsyncRacer,
+    hedge: AsyncRacer,
+    *,
+    delay_sec: float,
+    on_text_delta: TextDelta | None,
+) -> RaceOutcome:
+    """Race ``primary`` against a delayed ``hedge`` on the running loop."""
+    race = _Race(on_text_delta)
+    wake = asyncio.Event()
+    race.changed = wake.set
+    tasks: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    def _done(name: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            race.finish(name, task.result(), None)
+        elif isinstance(error, Exception):
+            race.finish(name, None, error)
+
+    def _start(name: str, racer: AsyncRacer) -> None:
+        race.started[name] = time.perf_counter()
+        task = asyncio.ensure_future(racer(race.publisher(name)))
+        task.add_done_callback(lambda t: _done(name, t))
+        tasks[name] = task
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + delay_sec
+    _start(PRIMARY, primary)
+    try:
+        while (winner := race.winner()) is None:
+            timeout = None
+            if HEDGE not in tasks and not race.first_byte:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    metrics.inc("llm_hedge_launched")
+                    _start(HEDGE, hedge)
+                    continue
+            wake.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), timeout)
+        return race.outcome(winner)
+    finally:
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
@@ -1,14 +1,147 @@
 """
 In-memory metrics counters for observability.
 Thread-safe singleton pattern.
+
+Besides the fixed counter set, the singleton holds dynamically registered
+counters, gauges and fixed-bucket latency histograms, optionally split by
+labels (route, tenant, provider, source, ...), and renders everything in the
+Prometheus text exposition format.
 """
 
+import bisect
+import math
+import re
 import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from typing import Dict
 
+# Latency bucket upper bounds in milliseconds (+Inf is implicit).
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+    120000,
+)
+# Per-metric cap on distinct label sets; further sets fold into one overflow
+# series so an unbounded label (tenant ids, raw paths) cannot grow memory.
+MAX_LABEL_SETS = 256
+OVERFLOW_LABEL_VALUE = "__overflow__"
+PROMETHEUS_PREFIX = "openclaw_"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelKey = tuple[tuple[str, str], ...]
+
+_NAME_INVALID = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _sanitize_name(name: str) -> str:
+    cleaned = _NAME_INVALID.sub("_", str(name))
+    if not cleaned or cleaned[0].isdigit():
+        cleaned = f"_{cleaned}"
+    return cleaned
+
+
+def _label_key(labels: Mapping[str, object] | None) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(
+        sorted((_sanitize_name(key), str(value)) for key, value in labels.items())
+    )
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """Fixed-bucket histogram for one label set (values in milliseconds)."""
+
+    __slots__ = ("bounds", "count", "counts", "max", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        # One slot per bound plus the +Inf overflow slot.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        value = max(0.0, float(value))
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile by interpolating inside its bucket."""
+        if self.count == 0:
+            return None
+        rank = max(0.0, min(1.0, q)) * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0 or seen + bucket_count < rank:
+                seen += bucket_count
+                continue
+            lower = self.bounds[index - 1] if index > 0 else 0.0
+            # The overflow bucket is bounded by the largest observation.
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+            fraction = (rank - seen) / bucket_count
+            return min(lower + (upper - lower) * fraction, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
 
 class Metrics:
     _instance = None
+    _counters: dict[str, int]
+    _counter_lock: threading.Lock
+    _counter_series: dict[str, dict[LabelKey, int]]
+    _gauges: dict[str, dict[LabelKey, float]]
+    _histograms: dict[str, dict[LabelKey, Histogram]]
+    _histogram_bounds: dict[str, tuple[float, ...]]
+    _help: dict[str, str]
+    prometheus_content_type = PROMETHEUS_CONTENT_TYPE
     _lock = threading.Lock()
 
     def __new__(cls):
@@ -50,20 +183,223 @@ class Metrics:
                         "executor_io_completed": 0,
                         "executor_io_wait_ms_total": 0,
                         "executor_io_wait_over_250ms": 0,
+                        # Scheduler next-fire heap fires (lateness is a histogram)
+                        "scheduler_fires": 0,
+                        # safe_io pinned keep-alive pool
+                        "outbound_pool_hits": 0,
+                        "outbound_pool_misses": 0,
+                        "outbound_pool_evictions": 0,
+                        # Opt-in deterministic LLM response cache
+                        "llm_cache_hits": 0,
+                        "llm_cache_disk_hits": 0,
+                        "llm_cache_misses": 0,
+                        "llm_cache_stores": 0,
+                        # Callers that joined an identical in-flight LLM call
+                        "llm_singleflight_coalesced": 0,
+                        # Hedged LLM requests: launched, and which racer answered
+                        "llm_hedge_launched": 0,
+                        "llm_hedge_wins": 0,
+                        "llm_hedge_losses": 0,
+                        # Job event stream (SSE)
+                        "events_sse_connections": 0,
+                        "events_sse_disconnections": 0,
+                        # Audit writer batching and queue pressure
+                        "audit_entries_written": 0,
+                        "audit_batches_flushed": 0,
+                        "audit_backpressure_waits": 0,
+                        "audit_entries_dropped": 0,
+                        # Audit chain verification (hashed vs. resumed from checkpoint)
+                        "audit_verify_entries_hashed": 0,
+                        "audit_verify_entries_resumed": 0,
+                        # Preflight report memoization
+                        "preflight_cache_hits": 0,
+                        "preflight_cache_misses": 0,
+                        "preflight_nodes_rechecked": 0,
                     }
                     cls._instance._counter_lock = threading.Lock()
+                    cls._instance._counter_series = {}
+                    cls._instance._gauges = {}
+                    cls._instance._histograms = {}
+                    cls._instance._histogram_bounds = {}
+                    cls._instance._help = {}
         return cls._instance
 
-    def increment(self, name: str, count: int = 1) -> None:
-        """Increment a counter by count (default 1)."""
+    def register_counter(self, name: str, help: str = "") -> None:
+        """Register a counter at runtime so increment() records it."""
+        with self._counter_lock:
+            self._counters.setdefault(name, 0)
+            if help:
+                self._help[name] = help
+
+    def increment(
+        self, name: str, count: int = 1, labels: Mapping[str, object] | None = None
+    ) -> None:
+        """
+        Increment a counter by count (default 1).
+
+        Names that were neither pre-registered nor registered through
+        register_counter() are ignored. With labels, the per-label series is
+        tracked as well as the total returned by get_all().
+        """
         with self._counter_lock:
-            if name in self._counters:
-                self._counters[name] += count
+            if name not in self._counters:
+                return
+            self._counters[name] += count
+            if labels:
+                series = self._counter_series.setdefault(name, {})
+                key = self._bounded_key_locked(series, labels)
+                series[key] = series.get(key, 0) + count
 
     # Alias for convenience
-    def inc(self, name: str, count: int = 1) -> None:
+    def inc(
+        self, name: str, count: int = 1, labels: Mapping[str, object] | None = None
+    ) -> None:
         """Alias for increment()."""
-        self.increment(name, count)
+        self.increment(name, count, labels)
+
+    def set_gauge(
+        self, name: str, value: float, labels: Mapping[str, object] | None = None
+    ) -> None:
+        """Set a gauge (registered on first use)."""
+        with self._counter_lock:
+            series = self._gauges.setdefault(name, {})
+            series[self._bounded_key_locked(series, labels)] = float(value)
+
+    def add_gauge(
+        self, name: str, delta: float, labels: Mapping[str, object] | None = None
+    ) -> None:
+        """Move a gauge by delta, e.g. +1/-1 around an open connection."""
+        with self._counter_lock:
+            series = self._gauges.setdefault(name, {})
+            key = self._bounded_key_locked(series, labels)
+            series[key] = series.get(key, 0.0) + delta
+
+    def describe(self, name: str, help: str) -> None:
+        """Attach HELP text to a counter, gauge or histogram."""
+        with self._counter_lock:
+            self._help[name] = help
+
+    def register_histogram(
+        self,
+        name: str,
+        help: str = "",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> None:
+        """Declare custom bucket bounds before the first observation."""
+        with self._counter_lock:
+            self._histogram_bounds[name] = tuple(sorted(buckets))
+            if help:
+                self._help[name] = help
+
+    def observe(
+        self, name: str, value_ms: float, labels: Mapping[str, object] | None = None
+    ) -> None:
+        """Record one latency sample (milliseconds) in a histogram."""
+        with self._counter_lock:
+            series = self._histograms.setdefault(name, {})
+            key = self._bounded_key_locked(series, labels)
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(
+                    self._histogram_bounds.get(name, DEFAULT_LATENCY_BUCKETS_MS)
+                )
+            histogram.observe(value_ms)
+
+    @contextmanager
+    def timer(
+        self, name: str, labels: Mapping[str, object] | None = None
+    ) -> Iterator[None]:
+        """Observe the wall time of the enclosed block, even when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - started) * 1000.0, labels)
+
+    def get_histograms(self) -> dict[str, list[dict[str, object]]]:
+        """Per-series count/sum/max and estimated p50/p90/p99 for every histogram."""
+        with self._counter_lock:
+            return {
+                name: [
+                    {"labels": dict(key), **histogram.summary()}
+                    for key, histogram in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+
+    def get_gauges(self) -> dict[str, list[dict[str, object]]]:
+        with self._counter_lock:
+            return {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in series.items()
+                ]
+                for name, series in self._gauges.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._counter_lock:
+            for name, total in self._counters.items():
+                metric = PROMETHEUS_PREFIX + _sanitize_name(name)
+                if not metric.endswith("_total"):
+                    metric += "_total"
+                self._render_header_locked(lines, name, metric, "counter")
+                labeled = self._counter_series.get(name)
+                if not labeled:
+                    lines.append(f"{metric} {_format_value(total)}")
+                    continue
+                for key, value in labeled.items():
+                    lines.append(
+                        f"{metric}{_format_labels(key)} {_format_value(value)}"
+                    )
+                # Increments made without labels.
+                remainder = total - sum(labeled.values())
+                if remainder:
+                    lines.append(f"{metric} {_format_value(remainder)}")
+            for name, gauge_series in self._gauges.items():
+                metric = PROMETHEUS_PREFIX + _sanitize_name(name)
+                self._render_header_locked(lines, name, metric, "gauge")
+                for key, gauge in gauge_series.items():
+                    lines.append(
+                        f"{metric}{_format_labels(key)} {_format_value(gauge)}"
+                    )
+            for name, histogram_series in self._histograms.items():
+                metric = PROMETHEUS_PREFIX + _sanitize_name(name)
+                self._render_header_locked(lines, name, metric, "histogram")
+                for key, histogram in histogram_series.items():
+                    cumulative = 0
+                    for bound, bucket_count in zip(
+                        (*histogram.bounds, math.inf), histogram.counts, strict=True
+                    ):
+                        cumulative += bucket_count
+                        le = ("le", _format_value(bound))
+                        lines.append(
+                            f"{metric}_bucket{_format_labels(key, le)} {cumulative}"
+                        )
+                    labels = _format_labels(key)
+                    lines.append(f"{metric}_sum{labels} {_format_value(histogram.sum)}")
+                    lines.append(f"{metric}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _render_header_locked(
+        self, lines: list[str], name: str, metric: str, kind: str
+    ) -> None:
+        help_text = self._help.get(name)
+        if help_text:
+            escaped = help_text.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {metric} {escaped}")
+        lines.append(f"# TYPE {metric} {kind}")
+
+    @staticmethod
+    def _bounded_key_locked(
+        series: Mapping[LabelKey, object], labels: Mapping[str, object] | None
+    ) -> LabelKey:
+        key = _label_key(labels)
+        if key in series or len(series) < MAX_LABEL_SETS:
+            return key
+        return tuple((name, OVERFLOW_LABEL_VALUE) for name, _value in key)
 
     def get_all(self) -> Dict[str, int]:
         """Return a copy of all counters."""
@@ -84,11 +420,25 @@ class Metrics:
         }
 
     def reset(self) -> None:
-        """Reset all counters to zero."""
+        """Reset all counters to zero and drop gauges and histograms."""
         with self._counter_lock:
             for key in self._counters:
                 self._counters[key] = 0
+            self._counter_series.clear()
+            self._gauges.clear()
+            self._histograms.clear()
 
 
 # Global singleton instance
 metrics = Metrics()
+
+for _name, _help in (
+    ("http_request_duration_ms", "OpenClaw HTTP handler latency in milliseconds."),
+    ("queue_submit_duration_ms", "ComfyUI /prompt submission latency in milliseconds."),
+    ("llm_request_duration_ms", "LLM provider request latency in milliseconds."),
+    ("history_fetch_duration_ms", "ComfyUI history poll latency in milliseconds."),
+    ("disk_write_duration_ms", "Audit log disk write latency in milliseconds."),
+    ("executor_wait_ms", "Time blocking work waited for an executor slot."),
+    ("events_sse_active", "Open job event stream (SSE) connections."),
+):
+    metrics.describe(_name, _help)
@@ -0,0 +1,467 @@
+"""
+Incremental model inventory engine (R141).
+
+Replaces full ``folder_paths.get_filename_list`` rescans with a directory
+tree cache keyed by per-directory signatures ``(st_dev, st_ino,
+st_mtime_ns)``. A refresh stats every known directory but re-lists only the
+ones whose signature changed, so an unchanged 50k-file tree costs one
+``stat`` per directory instead of a full walk.
+
+Change detection:
+- polling (always): signature comparison on every refresh;
+- inotify (Linux, optional): a watcher thread marks directories dirty as
+  soon as entries are created/removed/renamed, so callers can refresh
+  before the snapshot TTL expires. Falls back to polling when inotify is
+  unavailable or the watch budget is exhausted.
+
+The tree and the last inventory are persisted to the state dir so a cold
+start can serve a warm inventory immediately and then refresh
+incrementally.
+
+Settings (OPENCLAW_* preferred, MOLTBOT_* legacy):
+- OPENCLAW_INVENTORY_WATCH: auto (default) | poll
+- OPENCLAW_INVENTORY_WATCH_MAX_DIRS: inotify watch budget (default 4096)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+try:
+    from .state_dir import get_state_dir
+except ImportError:
+    from services.state_dir import get_state_dir
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.model_inventory_engine")
+
+SNAPSHOT_FILENAME = "model_inventory_snapshot.json"
+SNAPSHOT_VERSION = 1
+# Mirrors ComfyUI folder_paths.recursive_search exclusions.
+_EXCLUDED_DIR_NAMES = {".git"}
+_DEFAULT_WATCH_MAX_DIRS = 4096
+
+# (roots, extensions) per model type, as in folder_paths.folder_names_and_paths.
+FolderSpec = tuple[Sequence[str], Iterable[str]]
+
+
+def _env(name: str) -> str:
+    return (
+        os.environ.get(f"OPENCLAW_{name}") or os.environ.get(f"MOLTBOT_{name}") or ""
+    ).strip()
+
+
+def _watch_max_dirs() -> int:
+    try:
+        return max(0, int(_env("INVENTORY_WATCH_MAX_DIRS") or _DEFAULT_WATCH_MAX_DIRS))
+    except ValueError:
+        return _DEFAULT_WATCH_MAX_DIRS
+
+
+class _DirEntry:
+    __slots__ = ("files", "signature", "subdirs", "version")
+
+    def __init__(
+        self,
+        signature: tuple[int, int, int],
+        files: list[str],
+        subdirs: list[str],
+        version: int,
+    ):
+        self.signature = signature
+        self.files = files
+        self.subdirs = subdirs
+        self.version = version
+
+
+class _InotifyWatcher:
+    """Minimal ctypes inotify reader; reports directories whose entries changed."""
+
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _MASK = (
+        0x00000100  # IN_CREATE
+        | 0x00000200  # IN_DELETE
+        | 0x00000040  # IN_MOVED_FROM
+        | 0x00000080  # IN_MOVED_TO
+        | 0x00000400  # IN_DELETE_SELF
+        | 0x00000800  # IN_MOVE_SELF
+    )
+    _IN_IGNORED = 0x00008000
+    _IN_Q_OVERFLOW = 0x00004000
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, on_change: Callable[[str | None], None], max_dirs: int):
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._on_change = on_change
+        self._max_dirs = max_dirs
+        self._lock = threading.Lock()
+        self._wd_to_path: dict[int, str] = {}
+        self._path_to_wd: dict[str, int] = {}
+        self._closed = False
+        self.exhausted = False
+        self._thread = threading.Thread(
+            target=self._run, name="openclaw-inventory-watch", daemon=True
+        )
+        self._thread.start()
+
+    def sync(self, paths: Iterable[str]) -> None:
+        """Watch exactly ``paths`` (best effort, bounded by the watch budget)."""
+        wanted = set(paths)
+        with self._lock:
+            for path in list(self._path_to_wd):
+                if path not in wanted:
+                    wd = self._path_to_wd.pop(path)
+                    self._wd_to_path.pop(wd, None)
+                    self._libc.inotify_rm_watch(self._fd, wd)
+            for path in wanted - set(self._path_to_wd):
+                if len(self._path_to_wd) >= self._max_dirs:
+                    self.exhausted = True
+                    break
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(path), self._MASK
+                )
+                if wd < 0:
+                    # ENOSPC (fs.inotify.max_user_watches) or vanished dir.
+                    self.exhausted = True
+                    continue
+                self._wd_to_path[wd] = path
+                self._path_to_wd[path] = wd
+
+    def _run(self) -> None:
+        while not self._closed:
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 1.0)
+                if not ready:
+                    continue
+                data = os.read(self._fd, 64 * 1024)
+            except OSError:
+                if self._closed:
+                    return
+                time.sleep(1.0)
+                continue
+            self._dispatch(data)
+
+    def _dispatch(self, data: bytes) -> None:
+        offset = 0
+        header = self._EVENT_HEADER
+        while offset + header.size <= len(data):
+            wd, mask, _cookie, name_len = header.unpack_from(data, offset)
+            offset += header.size + name_len
+            if mask & self._IN_Q_OVERFLOW:
+                self._on_change(None)
+                continue
+            with self._lock:
+                path = self._wd_to_path.get(wd)
+                if mask & self._IN_IGNORED and path is not None:
+                    self._wd_to_path.pop(wd, None)
+                    self._path_to_wd.pop(path, None)
+            if path is not None:
+                self._on_change(path)
+
+    def close(self) -> None:
+        self._closed = True
+        with contextlib.suppress(OSError):
+            os.close(self._fd)
+
+
+class IncrementalInventoryEngine:
+    """Signature-checked directory tree cache producing ComfyUI filename lists."""
+
+    def __init__(self, *, watch_mode: str | None = None):
+        self._lock = threading.RLock()
+        self._dirs: dict[str, _DirEntry] = {}
+        self._type_cache: dict[str, tuple[Any, tuple[int, ...], list[str]]] = {}
+        self._version = 0
+        self._dirty: set[str] = set()
+        self._pending = threading.Event()
+        self._watch_mode = (watch_mode or _env("INVENTORY_WATCH") or "auto").lower()
+        self._watcher: _InotifyWatcher | None = None
+        self._watcher_failed = False
+        self.last_stats: dict[str, Any] = {}
+
+    # -- change notification -------------------------------------------------
+
+    def _mark_dirty(self, path: str | None) -> None:
+        with self._lock:
+            if path is None:
+                # Watch queue overflowed: fall back to a full signature check.
+                self._dirty.update(self._dirs)
+            else:
+                self._dirty.add(path)
+        self._pending.set()
+
+    def has_pending_changes(self) -> bool:
+        """True when the watcher saw changes since the last refresh."""
+        return self._pending.is_set()
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and not self._watcher.exhausted
+
+    def _sync_watches_locked(self) -> None:
+        if self._watch_mode != "auto" or self._watcher_failed:
+            return
+        if not sys.platform.startswith("linux") or not self._dirs:
+            return
+        if self._watcher is None:
+            try:
+                self._watcher = _InotifyWatcher(self._mark_dirty, _watch_max_dirs())
+            except (OSError, AttributeError) as exc:
+                logger.info("R141: inotify unavailable, polling only: %s", exc)
+                self._watcher_failed = True
+                return
+        self._watcher.sync(self._dirs)
+
+    # -- tree maintenance ----------------------------------------------------
+
+    def _drop_tree_locked(self, path: str) -> None:
+        entry = self._dirs.pop(path, None)
+        self._dirty.discard(path)
+        if entry is not None:
+            for sub in entry.subdirs:
+                self._drop_tree_locked(os.path.join(path, sub))
+
+    def _sync_dir_locked(
+        self, path: str, stats: dict[str, int], seen: set[tuple[int, int]]
+    ) -> int:
+        """Refresh ``path`` and its subtree; return the newest version under it."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            if path not in self._dirs:
+                return -1
+            self._drop_tree_locked(path)
+            self._version += 1
+            return self._version
+        stats["dirs_checked"] += 1
+        identity = (st.st_dev, st.st_ino)
+        if identity in seen:
+            # Symlink loop (ComfyUI follows links); do not descend twice.
+            return -1
+        seen.add(identity)
+        signature = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        entry = self._dirs.get(path)
+        if entry is None or entry.signature != signature or path in self._dirty:
+            files: list[str] = []
+            subdirs: list[str] = []
+            try:
+                with os.scandir(path) as it:
+                    for item in it:
+                        try:
+                            is_dir = item.is_dir()
+                        except OSError:
+                            continue
+                        if is_dir:
+                            if item.name not in _EXCLUDED_DIR_NAMES:
+                                subdirs.append(item.name)
+                        else:
+                            files.append(item.name)
+            except OSError:
+                pass
+            files.sort()
+            subdirs.sort()
+            stats["dirs_rescanned"] += 1
+            self._dirty.discard(path)
+            if entry is None or files != entry.files or subdirs != entry.subdirs:
+                if entry is not None:
+                    for gone in set(entry.subdirs) - set(subdirs):
+                        self._drop_tree_locked(os.path.join(path, gone))
+                self._version += 1
+                entry = _DirEntry(signature, files, subdirs, self._version)
+                self._dirs[path] = entry
+            else:
+                entry.signature = signature
+        newest = entry.version
+        for sub in entry.subdirs:
+            newest = max(
+                newest, self._sync_dir_locked(os.path.join(path, sub), stats, seen)
+            )
+        return newest
+
+    def _collect_locked(self, root: str, extensions: set[str]) -> list[str]:
+        out: list[str] = []
+        stack = [("", root)]
+        while stack:
+            rel, path = stack.pop()
+            entry = self._dirs.get(path)
+            if entry is None:
+                continue
+            for name in entry.files:
+                if not extensions or os.path.splitext(name)[1].lower() in extensions:
+                    out.append(os.path.join(rel, name) if rel else name)
+            for sub in entry.subdirs:
+                stack.append(
+                    (os.path.join(rel, sub) if rel else sub, os.path.join(path, sub))
+                )
+        return out
+
+    # -- public API ----------------------------------------------------------
+
+    def scan(
+        self,
+        model_types: Sequence[str],
+        folder_specs: Mapping[str, FolderSpec],
+        fallback: Callable[[str], Sequence[str]],
+        checkpoint: list[str] | None = None,
+    ) -> dict[str, list[str]]:
+        """
+        Build ``{model_type: sorted filenames}`` incrementally.
+
+        Types with a folder spec are served from the directory cache; others
+        go through ``fallback`` (``folder_paths.get_filename_list``). Lists of
+        unchanged types are returned as the same objects as last time.
+        """
+        started = time.perf_counter()
+        stats = {"dirs_checked": 0, "dirs_rescanned": 0, "types_rebuilt": 0}
+        inventory: dict[str, list[str]] = {}
+        with self._lock:
+            self._pending.clear()
+            for index, model_type in enumerate(model_types):
+                if checkpoint is not None:
+                    checkpoint[:] = [str(index), model_type]
+                spec = folder_specs.get(model_type)
+                if spec is None:
+                    try:
+                        files = list(fallback(model_type) or [])
+                    except Exception:
+                        # Some folders might not exist or raise error.
+                        continue
+                else:
+                    roots = [os.path.abspath(str(root)) for root in spec[0]]
+                    extensions = {str(ext).lower() for ext in spec[1]}
+                    key = (tuple(roots), frozenset(extensions))
+                    versions = tuple(
+                        self._sync_dir_locked(root, stats, set()) for root in roots
+                    )
+                    cached = self._type_cache.get(model_type)
+                    if (
+                        cached is not None
+                        and cached[0] == key
+                        and cached[1] == versions
+                    ):
+                        files = cached[2]
+                    else:
+                        merged: set[str] = set()
+                        for root in roots:
+                            merged.update(self._collect_locked(root, extensions))
+                        files = sorted(merged)
+                        self._type_cache[model_type] = (key, versions, files)
+                        stats["types_rebuilt"] += 1
+                if files:
+                    inventory[model_type] = files
+            if checkpoint is not None:
+                checkpoint[:] = []
+            self._sync_watches_locked()
+            self.last_stats = {
+                **stats,
+                "dirs_known": len(self._dirs),
+                "watching": self.watching,
+                "duration_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            }
+        return inventory
+
+    def save(self, path: str, inventory: Mapping[str, Sequence[str]]) -> None:
+        """Persist the tree and ``inventory`` atomically (best effort)."""
+        with self._lock:
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "saved_at": time.time(),
+                "inventory": {key: list(value) for key, value in inventory.items()},
+                "dirs": {
+                    dir_path: [list(entry.signature), entry.files, entry.subdirs]
+                    for dir_path, entry in self._dirs.items()
+                },
+                "types": {
+                    model_type: [list(key[0]), sorted(key[1])]
+                    for model_type, (key, _versions, _files) in self._type_cache.items()
+                },
+            }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("R141: inventory snapshot persist failed: %s", exc)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    def load(
+        self, path: str, folder_specs: Mapping[str, FolderSpec]
+    ) -> tuple[dict[str, list[str]], float] | None:
+        """
+        Restore a persisted tree; returns ``(inventory, saved_at)`` or None.
+
+        The snapshot is rejected when the configured model folders differ
+        from the ones it was taken with.
+        """
+        try:
+            with open(path, encoding="utf-8") as fh:
+                payload = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+            return None
+        saved_types = payload.get("types") or {}
+        current_types = {
+            model_type: [
+                [os.path.abspath(str(root)) for root in spec[0]],
+                sorted({str(ext).lower() for ext in spec[1]}),
+            ]
+            for model_type, spec in folder_specs.items()
+        }
+        if not saved_types or any(
+            current_types.get(model_type) != value
+            for model_type, value in saved_types.items()
+        ):
+            return None
+        try:
+            dirs = {
+                str(dir_path): _DirEntry(
+                    (int(sig[0]), int(sig[1]), int(sig[2])),
+                    [str(name) for name in files],
+                    [str(name) for name in subdirs],
+                    0,
+                )
+                for dir_path, (sig, files, subdirs) in payload["dirs"].items()
+            }
+            inventory = {
+                str(key): [str(name) for name in value]
+                for key, value in payload["inventory"].items()
+            }
+            saved_at = float(payload["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        with self._lock:
+            self._dirs = dirs
+            self._type_cache.clear()
+            self._version = 0
+        return inventory, saved_at
+
+    def close(self) -> None:
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.close()
+
+
+def default_snapshot_path() -> str:
+    return os.path.join(get_state_dir(), SNAPSHOT_FILENAME)
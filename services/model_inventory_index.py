@@ -0,0 +1,220 @@
+"""
+Indexed model inventory for preflight lookups (R141).
+
+Wraps the per-type filename lists produced by the preflight inventory scan
+with constant-time lookups:
+- an exact filename set per model type,
+- a separator/case-normalized index (``Foo\\Bar.safetensors`` matches
+  ``foo/bar.safetensors``),
+- a character trigram index used to suggest near matches for missing models.
+
+Refreshes are applied incrementally: only model types whose filename list
+changed are touched, and only the added/removed names are re-indexed.
+"""
+
+from __future__ import annotations
+
+import difflib
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+
+_GRAM_SIZE = 3
+# Candidates sharing the most trigrams are re-ranked with difflib.
+_SUGGESTION_CANDIDATES = 25
+_SUGGESTION_MIN_RATIO = 0.6
+DEFAULT_SUGGESTION_LIMIT = 3
+
+
+def normalize_model_name(name: str) -> str:
+    """Fold path separators and case so equivalent spellings compare equal."""
+    normalized = name.strip().replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return normalized.casefold()
+
+
+def _grams(normalized: str) -> set[str]:
+    # Drop the extension: ".safetensors" would otherwise put every file of a
+    # type into the same few gram buckets.
+    stem, dot, ext = normalized.rpartition(".")
+    if dot and stem and "/" not in ext:
+        normalized = stem
+    padded = f" {normalized} "
+    if len(padded) <= _GRAM_SIZE:
+        return {padded}
+    return {padded[i : i + _GRAM_SIZE] for i in range(len(padded) - _GRAM_SIZE + 1)}
+
+
+class _TypeIndex:
+    """Lookup structures for one model type (e.g. ``loras``)."""
+
+    def __init__(self, names: Sequence[str]):
+        self.source = names
+        self.names: list[str] = list(names)
+        self.exact: set[str] = set(self.names)
+        self.normalized: dict[str, set[str]] = {}
+        for name in self.exact:
+            self.normalized.setdefault(normalize_model_name(name), set()).add(name)
+        # Built on the first suggestion request; most preflights find everything.
+        self.grams: dict[str, set[str]] | None = None
+
+    def _index_grams(self, normalized: str) -> None:
+        assert self.grams is not None
+        for gram in _grams(normalized):
+            self.grams.setdefault(gram, set()).add(normalized)
+
+    def _unindex_grams(self, normalized: str) -> None:
+        assert self.grams is not None
+        for gram in _grams(normalized):
+            bucket = self.grams.get(gram)
+            if bucket is not None:
+                bucket.discard(normalized)
+                if not bucket:
+                    del self.grams[gram]
+
+    def ensure_grams(self) -> dict[str, set[str]]:
+        if self.grams is None:
+            self.grams = {}
+            for normalized in self.normalized:
+                self._index_grams(normalized)
+        return self.grams
+
+    def apply(self, names: Sequence[str]) -> None:
+        """Re-index only the names added or removed since the last build."""
+        new_exact = set(names)
+        for name in self.exact - new_exact:
+            normalized = normalize_model_name(name)
+            bucket = self.normalized.get(normalized)
+            if bucket is None:
+                continue
+            bucket.discard(name)
+            if not bucket:
+                del self.normalized[normalized]
+                if self.grams is not None:
+                    self._unindex_grams(normalized)
+        for name in new_exact - self.exact:
+            normalized = normalize_model_name(name)
+            bucket = self.normalized.get(normalized)
+            if bucket is None:
+                self.normalized[normalized] = {name}
+                if self.grams is not None:
+                    self._index_grams(normalized)
+            else:
+                bucket.add(name)
+        self.source = names
+        self.names = list(names)
+        self.exact = new_exact
+
+
+class ModelInventoryIndex:
+    """Thread-safe indexed view over ``{model_type: [filename, ...]}``."""
+
+    def __init__(self, models: Mapping[str, Sequence[str]] | None = None):
+        self._lock = threading.RLock()
+        self._types: dict[str, _TypeIndex] = {}
+        self._source: object = None
+        self._generation = 0
+        if models:
+            self.update(models)
+
+    def update(self, models: Mapping[str, Sequence[str]]) -> int:
+        """
+        Bring the index in line with ``models``.
+
+        Returns the number of model types whose contents changed. Calling
+        again with the same mapping object is a no-op.
+        """
+        with self._lock:
+            if models is self._source:
+                return 0
+            changed = 0
+            for model_type in list(self._types):
+                if model_type not in models:
+                    del self._types[model_type]
+                    changed += 1
+            for model_type, names in models.items():
+                current = self._types.get(model_type)
+                if current is None:
+                    self._types[model_type] = _TypeIndex(names)
+                    changed += 1
+                elif current.source is names:
+                    continue
+                elif current.names != list(names):
+                    current.apply(names)
+                    changed += 1
+                else:
+                    current.source = names
+            self._source = models
+            if changed:
+                self._generation += 1
+            return changed
+
+    @property
+    def generation(self) -> int:
+        """Bumped whenever an update changes the indexed contents."""
+        with self._lock:
+            return self._generation
+
+    def model_types(self) -> list[str]:
+        with self._lock:
+            return list(self._types)
+
+    def as_lists(self) -> dict[str, list[str]]:
+        with self._lock:
+            return {key: list(index.names) for key, index in self._types.items()}
+
+    def contains(self, model_type: str, name: str) -> bool:
+        """Exact membership, matching what ComfyUI validates at execution."""
+        with self._lock:
+            index = self._types.get(model_type)
+            return index is not None and name in index.exact
+
+    def find_normalized(self, model_type: str, name: str) -> list[str]:
+        """Installed names equal to ``name`` up to separators and case."""
+        with self._lock:
+            index = self._types.get(model_type)
+            if index is None:
+                return []
+            return sorted(index.normalized.get(normalize_model_name(name), ()))
+
+    def suggest(
+        self, model_type: str, name: str, limit: int = DEFAULT_SUGGESTION_LIMIT
+    ) -> list[str]:
+        """Return up to ``limit`` installed names that look like ``name``."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            index = self._types.get(model_type)
+            if index is None or not index.exact:
+                return []
+            suggestions = self.find_normalized(model_type, name)
+            target = normalize_model_name(name)
+            grams = index.ensure_grams()
+            shared: dict[str, int] = {}
+            for gram in _grams(target):
+                for candidate in grams.get(gram, ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            ranked = sorted(shared.items(), key=lambda item: (-item[1], item[0]))
+            scored: list[tuple[float, str]] = []
+            for candidate, _count in ranked[:_SUGGESTION_CANDIDATES]:
+                if candidate == target:
+                    continue
+                ratio = difflib.SequenceMatcher(None, target, candidate).ratio()
+                if ratio >= _SUGGESTION_MIN_RATIO:
+                    scored.append((ratio, candidate))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            for _ratio, candidate in scored:
+                suggestions.extend(sorted(index.normalized.get(candidate, ())))
+                if len(suggestions) >= limit:
+                    break
+            return _dedupe(suggestions)[:limit]
+
+
+def _dedupe(names: Iterable[str]) -> list[str]:
+    seen: set[str] = set()
+    ordered: list[str] = []
+    for name in names:
+        if name not in seen:
+            seen.add(name)
+            ordered.append(name)
+    return ordered
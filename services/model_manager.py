@@ -4,6 +4,7 @@ F54/F65 model search/download/import service.
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
 import logging
@@ -18,6 +19,7 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from .job_events import JobEventType, get_job_event_store
+from .model_inventory_index import ModelInventoryIndex
 from .model_manager_catalog import (
     collect_catalog_entries as _collect_catalog_entries_impl,
 )
@@ -60,6 +62,7 @@ from .model_manager_transfer import (
 )
 from .model_manager_transfer import validate_provenance as _validate_provenance_impl
 from .model_manager_transfer import validate_url_policy as _validate_url_policy_impl
+from .preflight import get_model_inventory_index
 from .safe_io import (
     STANDARD_OUTBOUND_POLICY,
     SSRFError,
@@ -357,6 +360,21 @@ def _filename_from_url(url: str) -> str:
     return _sanitize_filename(seg)
 
 
+def _inventory_has_model(row: dict[str, Any], index: ModelInventoryIndex) -> bool:
+    """Whether a search row's file is already in the ComfyUI model inventory."""
+    subdir = MODEL_TYPE_TO_SUBDIR.get(str(row.get("model_type") or ""))
+    if not subdir:
+        return False
+    candidates = {os.path.basename(str(row.get("installation_path") or ""))}
+    with contextlib.suppress(ModelManagerError):
+        candidates.add(_filename_from_url(str(row.get("download_url") or "")))
+    return any(
+        index.contains(subdir, name) or index.find_normalized(subdir, name)
+        for name in candidates
+        if name
+    )
+
+
 def _atomic_json_write(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, temp = tempfile.mkstemp(
@@ -736,6 +754,8 @@ class ModelManager:
         offset: int = 0,
         tenant_id: Optional[str] = None,
     ) -> Dict[str, Any]:
+        # One inventory index per search, shared by every result row.
+        index = get_model_inventory_index()
         return _search_models_impl(
             manager=self,
             query=query,
@@ -748,6 +768,7 @@ class ModelManager:
             norm_source=_norm_source,
             norm_model_type=_norm_model_type,
             default_tenant_id=DEFAULT_TENANT_ID,
+            inventory_lookup=lambda row: _inventory_has_model(row, index),
         )
 
     def _validate_url_policy(self, url: str) -> None:
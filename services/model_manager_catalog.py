@@ -132,6 +132,7 @@ def search_models(
     norm_source: Callable[[str], str],
     norm_model_type: Callable[[str], str],
     default_tenant_id: str,
+    inventory_lookup: Callable[[dict[str, Any]], bool] | None = None,
 ) -> Dict[str, Any]:
     limit = max(1, min(200, int(limit)))
     offset = max(0, int(offset))
@@ -181,6 +182,10 @@ def search_models(
     )
     total = len(out)
     page = out[offset : offset + limit]
+    if inventory_lookup is not None:
+        # Catalog rows may already be present in the ComfyUI model folders.
+        for row in page:
+            row["in_inventory"] = bool(row["installed"]) or inventory_lookup(row)
     return {
         "items": page,
         "pagination": {"limit": limit, "offset": offset, "total": total},
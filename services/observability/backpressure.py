@@ -74,6 +74,22 @@ class BoundedQueue(Generic[T]):
 
         return not dropped
 
+    def drain(self, max_items: int | None = None) -> list[T]:
+        """Pop up to ``max_items`` items (all when None), oldest first."""
+        with self._lock:
+            count = len(self._deque)
+            if max_items is not None:
+                count = min(count, max(0, max_items))
+            return [self._deque.popleft() for _ in range(count)]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._deque)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
     def get_all(self) -> List[T]:
         """Return snapshot of valid items (oldest first)."""
         with self._lock:
@@ -0,0 +1,336 @@
+"""
+Pinned keep-alive connection pool for safe_io outbound requests.
+
+safe_io validates every outbound URL and dials the validated IPs directly.
+Without pooling each request pays a fresh DNS validation plus a full TCP/TLS
+handshake. This module keeps two small, bounded caches underneath the
+existing safe_io entrypoints:
+
+- OutboundValidationCache: short-TTL memo of *successful* validate_outbound_url
+  results, keyed by every input that influences the SSRF decision. Failures are
+  never cached, and every redirect hop is still looked up individually.
+- OutboundConnectionPool: idle HTTP/1.1 keep-alive connections keyed by
+  (scheme, host, port, pinned-IP set, policy). A connection is only ever
+  reused for the exact validated IP set it was dialed against.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import select
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.outbound_pool")
+
+_DEFAULT_DNS_CACHE_TTL_SEC = 30.0
+_DEFAULT_DNS_CACHE_MAX_ENTRIES = 256
+_DEFAULT_POOL_IDLE_TTL_SEC = 30.0
+_DEFAULT_POOL_MAX_IDLE_PER_KEY = 8
+_DEFAULT_POOL_MAX_KEYS = 64
+
+
+def _env_float(key: str, default: float, *, minimum: float, maximum: float) -> float:
+    raw = os.environ.get(key)
+    if raw is None or str(raw).strip() == "":
+        return default
+    try:
+        value = float(str(raw).strip())
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", key, raw, default)
+        return default
+    if value < minimum or value > maximum:
+        logger.warning(
+            "Out-of-range %s=%r (allowed %s..%s); using default %s",
+            key,
+            raw,
+            minimum,
+            maximum,
+            default,
+        )
+        return default
+    return value
+
+
+def _env_int(key: str, default: int, *, minimum: int, maximum: int) -> int:
+    return int(_env_float(key, float(default), minimum=minimum, maximum=maximum))
+
+
+def _record_metric(name: str, count: int = 1) -> None:
+    try:
+        from .metrics import metrics
+    except ImportError:  # pragma: no cover
+        try:
+            from services.metrics import metrics
+        except ImportError:
+            return
+    metrics.increment(name, count)
+
+
+class OutboundValidationCache:
+    """
+    TTL-bounded cache of successful outbound URL validations.
+
+    The cache key must include every argument that changes the validation
+    outcome (host, port, scheme, allowlists, overrides, policy). Only
+    successful validations are stored, so a denied target is re-evaluated
+    on every request.
+    """
+
+    def __init__(self, *, ttl_sec: float, max_entries: int):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, tuple[Any, ...]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> tuple[Any, ...] | None:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: tuple[Any, ...]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "ttl_sec": self.ttl_sec,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+def _connection_is_dropped(conn: Any) -> bool:
+    """Return True when an idle keep-alive socket was closed by the peer."""
+    sock = getattr(conn, "sock", None)
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError, TypeError):
+        return True
+    # An idle HTTP/1.1 connection must not have anything to read; EOF or stray
+    # bytes both mean the connection cannot carry another request safely.
+    return bool(readable)
+
+
+class OutboundConnectionPool:
+    """
+    Bounded pool of idle keep-alive connections.
+
+    Connections are checked out exclusively; a connection only returns to the
+    idle list once its response has been fully consumed and the server did
+    not request close. Idle connections expire after idle_ttl_sec.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_ttl_sec: float,
+        max_idle_per_key: int,
+        max_keys: int,
+    ):
+        self.idle_ttl_sec = idle_ttl_sec
+        self.max_idle_per_key = max_idle_per_key
+        self.max_keys = max_keys
+        self._idle: OrderedDict[Hashable, list[tuple[float, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._discards = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.idle_ttl_sec > 0 and self.max_idle_per_key > 0
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Check out an idle connection for key, or build a new one.
+
+        Returns (connection, reused).
+        """
+        stale: list[Any] = []
+        conn = None
+        if self.enabled:
+            now = time.monotonic()
+            with self._lock:
+                bucket = self._idle.get(key)
+                while bucket:
+                    idle_since, candidate = bucket.pop()
+                    if now - idle_since > self.idle_ttl_sec:
+                        stale.append(candidate)
+                        continue
+                    conn = candidate
+                    break
+                if bucket is not None and not bucket:
+                    del self._idle[key]
+        # Liveness probe runs outside the lock; it is a zero-timeout select.
+        if conn is not None and _connection_is_dropped(conn):
+            stale.append(conn)
+            conn = None
+        self._close_evicted(stale)
+        if conn is not None:
+            with self._lock:
+                self._hits += 1
+            _record_metric("outbound_pool_hits")
+            return conn, True
+        with self._lock:
+            self._misses += 1
+        _record_metric("outbound_pool_misses")
+        return factory(), False
+
+    def release(self, key: Hashable, conn: Any, reusable: bool) -> None:
+        """Return a checked-out connection, or close it if not reusable."""
+        if not reusable or not self.enabled or getattr(conn, "sock", None) is None:
+            with self._lock:
+                self._discards += 1
+            _close_quietly(conn)
+            return
+        evicted: list[Any] = []
+        with self._lock:
+            bucket = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            bucket.append((time.monotonic(), conn))
+            while len(bucket) > self.max_idle_per_key:
+                evicted.append(bucket.pop(0)[1])
+            while len(self._idle) > self.max_keys:
+                _old_key, old_bucket = self._idle.popitem(last=False)
+                evicted.extend(c for _ts, c in old_bucket)
+        self._close_evicted(evicted)
+
+    def discard(self, conn: Any) -> None:
+        """Close a checked-out connection that failed mid-request."""
+        with self._lock:
+            self._discards += 1
+        _close_quietly(conn)
+
+    def prune(self) -> int:
+        """Close idle connections past their TTL. Returns count closed."""
+        now = time.monotonic()
+        expired: list[Any] = []
+        with self._lock:
+            for key in list(self._idle.keys()):
+                bucket = self._idle[key]
+                keep = []
+                for idle_since, conn in bucket:
+                    if now - idle_since > self.idle_ttl_sec:
+                        expired.append(conn)
+                    else:
+                        keep.append((idle_since, conn))
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+        self._close_evicted(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            conns = [c for bucket in self._idle.values() for _ts, c in bucket]
+            self._idle.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._discards = 0
+        for conn in conns:
+            _close_quietly(conn)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "idle_ttl_sec": self.idle_ttl_sec,
+                "max_idle_per_key": self.max_idle_per_key,
+                "keys": len(self._idle),
+                "idle_connections": sum(len(b) for b in self._idle.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "discards": self._discards,
+            }
+
+    def _close_evicted(self, conns: list[Any]) -> None:
+        if not conns:
+            return
+        with self._lock:
+            self._evictions += len(conns)
+        _record_metric("outbound_pool_evictions", len(conns))
+        for conn in conns:
+            _close_quietly(conn)
+
+
+def _close_quietly(conn: Any) -> None:
+    with contextlib.suppress(Exception):
+        conn.close()
+
+
+def build_validation_cache() -> OutboundValidationCache:
+    return OutboundValidationCache(
+        ttl_sec=_env_float(
+            "OPENCLAW_OUTBOUND_DNS_CACHE_TTL_SEC",
+            _DEFAULT_DNS_CACHE_TTL_SEC,
+            minimum=0.0,
+            maximum=300.0,
+        ),
+        max_entries=_DEFAULT_DNS_CACHE_MAX_ENTRIES,
+    )
+
+
+def build_connection_pool() -> OutboundConnectionPool:
+    return OutboundConnectionPool(
+        idle_ttl_sec=_env_float(
+            "OPENCLAW_OUTBOUND_POOL_IDLE_TTL_SEC",
+            _DEFAULT_POOL_IDLE_TTL_SEC,
+            minimum=0.0,
+            maximum=600.0,
+        ),
+        max_idle_per_key=_env_int(
+            "OPENCLAW_OUTBOUND_POOL_MAX_IDLE_PER_KEY",
+            _DEFAULT_POOL_MAX_IDLE_PER_KEY,
+            minimum=0,
+            maximum=64,
+        ),
+        max_keys=_DEFAULT_POOL_MAX_KEYS,
+    )
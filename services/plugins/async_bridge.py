@@ -1,49 +1,300 @@
 """
 Async helper utilities for plugin integration.
 Provides safe wrappers to call async plugin hooks from sync contexts.
+
+R23: sync callers share one long-lived plugin event loop running on a
+dedicated daemon thread instead of building a fresh loop per call.
 """
 
+from __future__ import annotations
+
 import asyncio
 import concurrent.futures
-from typing import Any, Callable, TypeVar
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.plugins.async_bridge")
 
 T = TypeVar("T")
 
-# Thread pool for running async code from sync contexts
+DEFAULT_TIMEOUT_SEC = 30.0
+
+# Per-hook wall-clock budgets; hooks not listed use DEFAULT_TIMEOUT_SEC.
+HOOK_TIMEOUTS_SEC: dict[str, float] = {
+    "model.resolve": 5.0,
+    "llm.params": 5.0,
+    "llm.audit_request": 5.0,
+}
+
+# Upper bounds (ms) of the per-hook latency histogram buckets.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+# Fallback pool, only used when a sync caller is already on the plugin loop
+# thread (blocking on that loop from inside it would deadlock).
 _executor = concurrent.futures.ThreadPoolExecutor(
     max_workers=2, thread_name_prefix="plugin-async"
 )
 
 
-def run_async_in_sync_context(coro: Any) -> Any:
+class PluginLoop:
+    """A warm event loop on a daemon thread that accepts coroutine submissions."""
+
+    def __init__(self, name: str = "openclaw-plugin-loop"):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._hook_stats: dict[str, dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.close()
+
+            thread = threading.Thread(target=_run, name=self._name, daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, T],
+        *,
+        timeout: float | None = None,
+        hook_name: str | None = None,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Schedule ``coro`` on the plugin loop and return a concurrent future.
+
+        The caller's contextvars (e.g. tenant scope) are carried onto the task.
+        ``timeout`` is enforced inside the loop so an overrunning coroutine is
+        cancelled rather than left running.
+        """
+        loop = self._ensure_started()
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        caller_context = contextvars.copy_context()
+
+        async def _run() -> T:
+            started = time.perf_counter()
+            outcome = "ok"
+            try:
+                if timeout is None:
+                    return await coro
+                return await asyncio.wait_for(coro, timeout)
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                raise
+            except BaseException:
+                outcome = "error"
+                raise
+            finally:
+                if hook_name is not None:
+                    self._observe(hook_name, time.perf_counter() - started, outcome)
+
+        def _start() -> None:
+            if not future.set_running_or_notify_cancel():
+                coro.close()
+                return
+            task = caller_context.run(loop.create_task, _run())
+
+            def _done(done: asyncio.Task[T]) -> None:
+                if done.cancelled():
+                    future.set_exception(concurrent.futures.CancelledError())
+                    return
+                exc = done.exception()
+                if exc is not None:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(done.result())
+
+            task.add_done_callback(_done)
+
+        loop.call_soon_threadsafe(_start)
+        return future
+
+    def _observe(self, hook_name: str, elapsed_sec: float, outcome: str) -> None:
+        elapsed_ms = elapsed_sec * 1000.0
+        with self._stats_lock:
+            entry = self._hook_stats.get(hook_name)
+            if entry is None:
+                entry = {
+                    "count": 0,
+                    "errors": 0,
+                    "timeouts": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+                self._hook_stats[hook_name] = entry
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            if outcome == "error":
+                entry["errors"] += 1
+            elif outcome == "timeout":
+                entry["timeouts"] += 1
+            for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    entry["buckets"][index] += 1
+                    break
+            else:
+                entry["buckets"][-1] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Per-hook counts and latency histograms (bucket upper bounds in ms)."""
+        labels = [f"le_{bound:g}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        with self._stats_lock:
+            hooks = {
+                name: {
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "timeouts": entry["timeouts"],
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "histogram": dict(zip(labels, entry["buckets"], strict=True)),
+                }
+                for name, entry in self._hook_stats.items()
+            }
+        return {
+            "running": self._loop is not None and self._loop.is_running(),
+            "hooks": hooks,
+        }
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop thread; the next submission starts a fresh one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+_plugin_loop = PluginLoop()
+
+
+def get_plugin_loop() -> PluginLoop:
+    """Return the process-wide plugin loop."""
+    return _plugin_loop
+
+
+def submit_coroutine(
+    coro: Coroutine[Any, Any, T], *, timeout: float | None = None
+) -> concurrent.futures.Future[T]:
+    """Schedule a coroutine on the shared plugin loop; returns a concurrent future."""
+    return _plugin_loop.submit(coro, timeout=timeout)
+
+
+def _run_in_fresh_loop(coro: Coroutine[Any, Any, T], timeout: float | None) -> T:
+    def run_in_new_loop() -> T:
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            return new_loop.run_until_complete(coro)
+        finally:
+            new_loop.close()
+
+    return _executor.submit(run_in_new_loop).result(timeout=timeout)
+
+
+def run_async_in_sync_context(coro: Any, timeout: float | None = None) -> Any:
     """
     Execute async coroutine from synchronous context safely.
 
-    This handles the case where we're already in an event loop (e.g., aiohttp handler)
-    by running the coroutine in a separate thread with its own loop.
+    Works whether or not the caller is inside an event loop (e.g. an aiohttp
+    handler): the coroutine runs on the shared plugin loop and this call
+    blocks for its result.
 
     Args:
         coro: Coroutine to execute
+        timeout: Seconds to wait before cancelling (None waits indefinitely;
+            plugin hooks get their budgets from ``run_hook_sync``)
 
     Returns:
         Result of coroutine execution
     """
-    try:
-        # Try to get running loop - will raise if no loop running
-        loop = asyncio.get_running_loop()
-
-        # We're in an event loop - run in executor with new loop
-        def run_in_new_loop():
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(coro)
-            finally:
-                new_loop.close()
+    if _plugin_loop.in_loop_thread():
+        logger.debug("R23: nested sync bridge call on plugin loop; using fresh loop")
+        return _run_in_fresh_loop(coro, timeout)
+    return _plugin_loop.submit(coro, timeout=timeout).result()
+
+
+def _has_hooks(manager: Any, hook_name: str) -> bool:
+    has_hooks = getattr(manager, "has_hooks", None)
+    if has_hooks is None:
+        return True
+    return bool(has_hooks(hook_name))
+
+
+def run_hook_sync(
+    manager: Any,
+    strategy: str,
+    hook_name: str,
+    context: Any,
+    value: Any,
+    *,
+    timeout: float | None = None,
+    wait: bool = True,
+) -> Any:
+    """
+    Run a plugin hook from sync code on the shared loop.
+
+    ``strategy`` is ``first``, ``sequential`` or ``parallel`` (the matching
+    ``PluginManager.execute_*`` method). Hooks with no registered callbacks
+    return immediately without touching the loop: ``value`` for first and
+    sequential, ``None`` for parallel. With ``wait=False`` the hook is
+    scheduled and ``None`` is returned at once (side-effect hooks only).
+    """
+    if not _has_hooks(manager, hook_name):
+        return None if strategy == "parallel" else value
+    execute = getattr(manager, f"execute_{strategy}")
+    budget = HOOK_TIMEOUTS_SEC.get(hook_name, DEFAULT_TIMEOUT_SEC)
+    if timeout is not None:
+        budget = timeout
+    coro = execute(hook_name, context, value)
+    if _plugin_loop.in_loop_thread():
+        return _run_in_fresh_loop(coro, budget)
+    future = _plugin_loop.submit(coro, timeout=budget, hook_name=hook_name)
+    if not wait:
+        future.add_done_callback(_log_background_hook_failure(hook_name))
+        return None
+    return future.result()
+
+
+def _log_background_hook_failure(hook_name: str) -> Any:
+    def _callback(future: concurrent.futures.Future[Any]) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.warning("R23: background hook %s failed: %s", hook_name, exc)
+
+    return _callback
 
-        future = _executor.submit(run_in_new_loop)
-        return future.result(timeout=30)  # 30s timeout for plugin execution
 
-    except RuntimeError:
-        # No event loop running - safe to use asyncio.run()
-        return asyncio.run(coro)
+def get_plugin_loop_stats() -> dict[str, Any]:
+    """Diagnostics snapshot of the shared plugin loop."""
+    return _plugin_loop.stats()
@@ -27,12 +27,19 @@ class PluginManager:
             lambda: defaultdict(list)
         )
         self._plugins: Dict[str, Plugin] = {}
+        # Bumped on registration so callers can cache hook results.
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        return self._revision
 
     def register_plugin(self, plugin: Plugin):
         """Register a plugin instance."""
         if plugin.name in self._plugins:
             logger.warning(f"Plugin {plugin.name} already registered. Overwriting.")
         self._plugins[plugin.name] = plugin
+        self._revision += 1
         logger.info(f"Registered plugin: {plugin.name} v{plugin.version}")
 
     def register_hook(
@@ -54,6 +61,14 @@ class PluginManager:
             pass
 
         self._hooks[hook_name][phase].append(callback)
+        self._revision += 1
+
+    def has_hooks(self, hook_name: str) -> bool:
+        """True if any callback is registered for the hook in any phase."""
+        phases = self._hooks.get(hook_name)
+        if not phases:
+            return False
+        return any(phases.values())
 
     async def execute_first(
         self, hook_name: str, context: RequestContext, initial_value: T
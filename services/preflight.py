@@ -5,13 +5,24 @@ Provides logic to validate a workflow against the local ComfyUI environment,
 checking for missing node classes and models.
 """
 
+import copy
+import hashlib
+import json
 import logging
 import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Set, Tuple
 
+from .metrics import metrics
+from .model_inventory_engine import (
+    FolderSpec,
+    IncrementalInventoryEngine,
+    default_snapshot_path,
+)
+from .model_inventory_index import ModelInventoryIndex
 from .workflow_portability import (
-    analyze_workflow_portability,
+    analyze_diagnostic_nodes_portability,
     get_missing_node_fallback,
     iter_workflow_diagnostic_nodes,
 )
@@ -45,9 +56,19 @@ _INVENTORY_SCAN_STATE_KEY = "inventory_scan_state"
 _INVENTORY_CHECKPOINT_KEY = "inventory_scan_checkpoint"
 _INVENTORY_LAST_ATTEMPT_TS_KEY = "inventory_last_attempt_ts"
 _LEGACY_INVENTORY_CACHE_KEY = "inventory"
+_INVENTORY_INDEX_KEY = "inventory_index"
+_INVENTORY_PERSIST_LOADED_KEY = "inventory_persist_loaded"
+_INVENTORY_ENGINE = IncrementalInventoryEngine()
 _INVENTORY_LOCK = threading.RLock()
 _INVENTORY_SCAN_THREAD: threading.Thread | None = None
 _INVENTORY_ERROR_RETRY_SEC = 5
+_PREFLIGHT_CACHE_CONTEXT_KEY = "preflight_cache_context"
+_PREFLIGHT_REPORT_CACHE_KEY = "preflight_reports"
+_PREFLIGHT_NODE_CACHE_KEY = "preflight_node_results"
+_PREFLIGHT_REPORT_CACHE_MAX = 64
+_PREFLIGHT_NODE_CACHE_MAX = 4096
+_PREFLIGHT_CACHE_LOCK = threading.Lock()
+_NODE_FINGERPRINT_MEMO: tuple[Any, int, str] | None = None
 # CRITICAL: datasets are user training data and executable custom_nodes are code; neither
 # may cross the model inventory filename boundary.
 _INVENTORY_EXCLUDED_MODEL_TYPES = {"custom_nodes", "datasets"}
@@ -122,30 +143,73 @@ def _resolve_inventory_model_types() -> List[str]:
     return model_types
 
 
+def _inventory_folder_specs() -> dict[str, FolderSpec]:
+    """Model types whose folders the incremental engine can walk directly."""
+    mapping = getattr(folder_paths, "folder_names_and_paths", None)
+    if not isinstance(mapping, dict):
+        return {}
+    specs: dict[str, FolderSpec] = {}
+    for key, value in mapping.items():
+        if key in _INVENTORY_EXCLUDED_MODEL_TYPES:
+            continue
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            continue
+        roots, extensions = value
+        if not isinstance(roots, (list, tuple)) or not all(
+            isinstance(root, str) for root in roots
+        ):
+            continue
+        if not isinstance(extensions, (set, frozenset, list, tuple)):
+            continue
+        specs[key] = (list(roots), set(extensions))
+    return specs
+
+
 def _scan_model_inventory(checkpoint: List[str] | None = None) -> Dict[str, List[str]]:
     """
     Build a complete model inventory snapshot synchronously.
 
     The caller decides whether this runs on-request or in a background worker.
+    Folder-backed types are refreshed incrementally by the inventory engine
+    (only directories whose signature changed are re-listed); the rest go
+    through folder_paths.get_filename_list.
     """
-    inventory: Dict[str, List[str]] = {}
     if not folder_paths:
-        return inventory
-
-    model_types = _resolve_inventory_model_types()
-    for index, model_type in enumerate(model_types):
-        if checkpoint is not None:
-            checkpoint[:] = [str(index), model_type]
-        try:
-            files = folder_paths.get_filename_list(model_type)
-            if files:
-                inventory[model_type] = list(files)
-        except Exception:
-            # Some folders might not exist or raise error.
-            continue
-    if checkpoint is not None:
-        checkpoint[:] = []
-    return inventory
+        return {}
+
+    return _INVENTORY_ENGINE.scan(
+        _resolve_inventory_model_types(),
+        _inventory_folder_specs(),
+        folder_paths.get_filename_list,
+        checkpoint,
+    )
+
+
+def _persist_inventory_snapshot(snapshot: Dict[str, List[str]]) -> None:
+    # Only folder-backed inventories can be revalidated after a restart.
+    if not _inventory_folder_specs():
+        return
+    _INVENTORY_ENGINE.save(default_snapshot_path(), snapshot)
+
+
+def _load_persisted_inventory_locked(now: float) -> None:
+    """Serve the last persisted snapshot on a cold start (marked stale)."""
+    if _CACHE.get(_INVENTORY_PERSIST_LOADED_KEY):
+        return
+    _CACHE[_INVENTORY_PERSIST_LOADED_KEY] = True
+    if _CACHE.get(_INVENTORY_SNAPSHOT_KEY) is not None:
+        return
+    specs = _inventory_folder_specs()
+    if not specs:
+        return
+    restored = _INVENTORY_ENGINE.load(default_snapshot_path(), specs)
+    if restored is None:
+        return
+    inventory, saved_at = restored
+    _CACHE[_INVENTORY_SNAPSHOT_KEY] = inventory
+    # Backdate so the usual staleness check schedules an incremental refresh.
+    _CACHE[_INVENTORY_SNAPSHOT_TS_KEY] = min(saved_at, now - _CACHE_TTL)
+    _update_inventory_index_locked(inventory)
 
 
 def _copy_inventory_snapshot(models: Dict[str, List[str]]) -> Dict[str, List[str]]:
@@ -158,7 +222,7 @@ def _copy_inventory_snapshot(models: Dict[str, List[str]]) -> Dict[str, List[str
 
 def _inventory_snapshot_stale_locked(now: float | None = None) -> bool:
     snapshot_ts = _CACHE.get(_INVENTORY_SNAPSHOT_TS_KEY)
-    if not snapshot_ts:
+    if not snapshot_ts or _INVENTORY_ENGINE.has_pending_changes():
         return True
     current = time.time() if now is None else now
     return current - float(snapshot_ts) >= _CACHE_TTL
@@ -192,6 +256,8 @@ def _inventory_refresh_worker() -> None:
             _CACHE[_INVENTORY_LAST_ERROR_KEY] = None
             _CACHE[_INVENTORY_SCAN_STATE_KEY] = _INVENTORY_SCAN_STATE_IDLE
             _CACHE[_INVENTORY_CHECKPOINT_KEY] = None
+            _update_inventory_index_locked(snapshot)
+        _persist_inventory_snapshot(snapshot)
     except Exception as exc:  # pragma: no cover - defensive outer guard
         with _INVENTORY_LOCK:
             _CACHE[_INVENTORY_LAST_ERROR_KEY] = str(exc)
@@ -222,6 +288,13 @@ def _schedule_inventory_refresh_locked() -> None:
     worker.start()
 
 
+def _prepare_served_inventory_locked(now: float, trigger_refresh: bool) -> None:
+    if folder_paths:
+        _load_persisted_inventory_locked(now)
+    if trigger_refresh and _inventory_should_schedule_refresh_locked(now):
+        _schedule_inventory_refresh_locked()
+
+
 def get_model_inventory_snapshot(*, trigger_refresh: bool = True) -> Dict[str, Any]:
     """
     Return the latest served inventory snapshot plus scan metadata.
@@ -231,8 +304,7 @@ def get_model_inventory_snapshot(*, trigger_refresh: bool = True) -> Dict[str, A
     """
     now = time.time()
     with _INVENTORY_LOCK:
-        if trigger_refresh and _inventory_should_schedule_refresh_locked(now):
-            _schedule_inventory_refresh_locked()
+        _prepare_served_inventory_locked(now, trigger_refresh)
 
         models = _copy_inventory_snapshot(_CACHE.get(_INVENTORY_SNAPSHOT_KEY, {}))
         snapshot_ts = _CACHE.get(_INVENTORY_SNAPSHOT_TS_KEY)
@@ -252,12 +324,14 @@ def get_model_inventory_snapshot(*, trigger_refresh: bool = True) -> Dict[str, A
 
 
 def _reset_inventory_state_for_tests() -> None:
-    global _INVENTORY_SCAN_THREAD
+    global _INVENTORY_SCAN_THREAD, _INVENTORY_ENGINE
     thread = _INVENTORY_SCAN_THREAD
     if thread is not None and thread.is_alive():
         thread.join(timeout=2.0)
     with _INVENTORY_LOCK:
         _INVENTORY_SCAN_THREAD = None
+        _INVENTORY_ENGINE.close()
+        _INVENTORY_ENGINE = IncrementalInventoryEngine()
         for key in (
             _INVENTORY_SNAPSHOT_KEY,
             _INVENTORY_SNAPSHOT_TS_KEY,
@@ -266,6 +340,11 @@ def _reset_inventory_state_for_tests() -> None:
             _INVENTORY_CHECKPOINT_KEY,
             _INVENTORY_LAST_ATTEMPT_TS_KEY,
             _LEGACY_INVENTORY_CACHE_KEY,
+            _INVENTORY_INDEX_KEY,
+            _INVENTORY_PERSIST_LOADED_KEY,
+            _PREFLIGHT_CACHE_CONTEXT_KEY,
+            _PREFLIGHT_REPORT_CACHE_KEY,
+            _PREFLIGHT_NODE_CACHE_KEY,
         ):
             _CACHE.pop(key, None)
 
@@ -279,8 +358,14 @@ def _get_model_inventory() -> Dict[str, List[str]]:
     global _CACHE
     now = time.time()
 
+    with _INVENTORY_LOCK:
+        # Prefer a fresh background snapshot over another synchronous scan.
+        snapshot: dict[str, list[str]] | None = _CACHE.get(_INVENTORY_SNAPSHOT_KEY)
+        if snapshot is not None and not _inventory_snapshot_stale_locked(now):
+            return snapshot
+
     cached = _CACHE.get(_LEGACY_INVENTORY_CACHE_KEY)
-    if cached:
+    if cached and not _INVENTORY_ENGINE.has_pending_changes():
         timestamp, data = cached
         if now - timestamp < _CACHE_TTL:
             return data
@@ -289,6 +374,43 @@ def _get_model_inventory() -> Dict[str, List[str]]:
     return inventory
 
 
+def _update_inventory_index_locked(
+    models: dict[str, list[str]],
+) -> ModelInventoryIndex:
+    index = _CACHE.get(_INVENTORY_INDEX_KEY)
+    if not isinstance(index, ModelInventoryIndex):
+        index = ModelInventoryIndex()
+        _CACHE[_INVENTORY_INDEX_KEY] = index
+    # Unchanged per-type lists are skipped, so this only re-indexes what moved.
+    index.update(
+        {
+            key: value
+            for key, value in (models or {}).items()
+            if key not in _INVENTORY_EXCLUDED_MODEL_TYPES
+        }
+    )
+    return index
+
+
+def get_model_inventory_index(*, trigger_refresh: bool = True) -> ModelInventoryIndex:
+    """
+    Indexed view of the served background snapshot, without a synchronous scan.
+
+    Used by lookups (e.g. model search) that must not block on filesystem I/O.
+    """
+    with _INVENTORY_LOCK:
+        # The index reads the served snapshot in place; no per-call copy.
+        _prepare_served_inventory_locked(time.time(), trigger_refresh)
+        return _update_inventory_index_locked(_CACHE.get(_INVENTORY_SNAPSHOT_KEY) or {})
+
+
+def _get_model_inventory_index() -> ModelInventoryIndex:
+    """Indexed view of the current model inventory (exact, normalized, n-gram)."""
+    inventory = _get_model_inventory()
+    with _INVENTORY_LOCK:
+        return _update_inventory_index_locked(inventory)
+
+
 def run_preflight_check(workflow: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze a workflow (API format) and return a diagnostic report.
@@ -336,67 +458,49 @@ def run_preflight_check(workflow: Dict[str, Any]) -> Dict[str, Any]:
         report["notes"].append("Workflow must be a JSON object (API format).")
         return report
 
-    report["portability"] = analyze_workflow_portability(workflow)
+    diagnostic_nodes = list(iter_workflow_diagnostic_nodes(workflow))
 
     # 1. Check Nodes
     available_nodes = _get_node_class_mappings()
     missing_node_counts: Dict[str, int] = {}
 
     # 2. Check Models (Heuristic)
-    inventory = _get_model_inventory()
+    inventory = _get_model_inventory_index()
     missing_models_counts: Dict[str, Dict[str, Any]] = {}
 
-    for diagnostic_node in iter_workflow_diagnostic_nodes(workflow):
-        node_data = diagnostic_node.get("node_data")
-        if not isinstance(node_data, dict):
-            continue
-        node_id = str(diagnostic_node.get("node_id") or "")
-        active = bool(diagnostic_node.get("active", True))
-        inactive_reason = diagnostic_node.get("inactive_reason")
-        is_subgraph_container = bool(diagnostic_node.get("is_subgraph_container"))
-        # Check Node Class
-        class_type = diagnostic_node.get("class_type")
-        if not class_type:
-            continue
-
-        if (
-            available_nodes
-            and class_type not in available_nodes
-            and not is_subgraph_container
-        ):
-            if not active:
-                item = {
-                    "node_id": node_id,
-                    "class_type": class_type,
-                    "inactive_reason": inactive_reason or "inactive",
-                }
-                fallback = get_missing_node_fallback(class_type)
-                if fallback is not None:
-                    item["fallback"] = fallback
-                report["suppressed_missing_nodes"].append(item)
-            else:
-                missing_node_counts[class_type] = (
-                    missing_node_counts.get(class_type, 0) + 1
-                )
-
-        # Check Inputs for Models
-        inputs = diagnostic_node.get("inputs")
-        if isinstance(inputs, dict):
-            if active:
-                _check_inputs_for_models(inputs, inventory, missing_models_counts)
-            else:
-                suppressed_counts: Dict[str, Dict[str, Any]] = {}
-                _check_inputs_for_models(inputs, inventory, suppressed_counts)
-                for info in suppressed_counts.values():
-                    report["suppressed_missing_models"].append(
-                        {
-                            "node_id": node_id,
-                            "type": info["type"],
-                            "name": info["name"],
-                            "count": info["count"],
-                            "inactive_reason": inactive_reason or "inactive",
-                        }
-                    )
+    # Reports are memoized on the workflow structure plus both inventory
+    # generations; unchanged nodes of an edited workflow are not rechecked.
+    context = _preflight_cache_context(available_nodes, inventory)
+    node_digests = [_diagnostic_node_digest(node) for node in diagnostic_nodes]
+    workflow_digest = hashlib.sha256("".join(node_digests).encode()).hexdigest()
+    if context is not None:
+        cached_report = _lookup_cached_report(context, workflow_digest)
+        if cached_report is not None:
+            metrics.increment("preflight_cache_hits")
+            return cached_report
+    metrics.increment("preflight_cache_misses")
+
+    report["portability"] = analyze_diagnostic_nodes_portability(diagnostic_nodes)
+
+    for diagnostic_node, digest in zip(diagnostic_nodes, node_digests, strict=True):
+        result = _diagnose_node_cached(
+            context, digest, diagnostic_node, available_nodes, inventory
+        )
+        missing_class = result["missing_class"]
+        if missing_class is not None:
+            missing_node_counts[missing_class] = (
+                missing_node_counts.get(missing_class, 0) + 1
+            )
+        if result["suppressed_node"] is not None:
+            report["suppressed_missing_nodes"].append(
+                copy.deepcopy(result["suppressed_node"])
+            )
+        for key, info in result["models"].items():
+            if key not in missing_models_counts:
+                missing_models_counts[key] = {**copy.deepcopy(info), "count": 0}
+            missing_models_counts[key]["count"] += info["count"]
+        for item in result["suppressed_models"]:
+            report["suppressed_missing_models"].append(copy.deepcopy(item))
 
     # Format Results
     for cls in sorted(missing_node_counts):
@@ -407,9 +511,10 @@ def run_preflight_check(workflow: Dict[str, Any]) -> Dict[str, Any]:
         report["missing_nodes"].append(item)
 
     for key, info in missing_models_counts.items():
-        report["missing_models"].append(
-            {"type": info["type"], "name": info["name"], "count": info["count"]}
-        )
+        item = {"type": info["type"], "name": info["name"], "count": info["count"]}
+        if info.get("suggestions"):
+            item["suggestions"] = info["suggestions"]
+        report["missing_models"].append(item)
 
     # Summarize
     report["summary"]["missing_nodes"] = len(report["missing_nodes"])
@@ -448,43 +553,228 @@ def run_preflight_check(workflow: Dict[str, Any]) -> Dict[str, Any]:
     banners = generate_preflight_banners(report)
     report["banners"] = [b.to_dict() for b in banners]
 
+    if context is not None:
+        _store_cached_report(context, workflow_digest, report)
     return report
 
 
+def _diagnose_node(
+    diagnostic_node: dict[str, Any],
+    available_nodes: dict[str, Any],
+    inventory: ModelInventoryIndex,
+) -> dict[str, Any]:
+    """Missing class and model findings contributed by a single node."""
+    result: dict[str, Any] = {
+        "missing_class": None,
+        "suppressed_node": None,
+        "models": {},
+        "suppressed_models": [],
+    }
+    node_data = diagnostic_node.get("node_data")
+    if not isinstance(node_data, dict):
+        return result
+    node_id = str(diagnostic_node.get("node_id") or "")
+    active = bool(diagnostic_node.get("active", True))
+    inactive_reason = diagnostic_node.get("inactive_reason")
+    is_subgraph_container = bool(diagnostic_node.get("is_subgraph_container"))
+    # Check Node Class
+    class_type = diagnostic_node.get("class_type")
+    if not class_type:
+        return result
+
+    if (
+        available_nodes
+        and class_type not in available_nodes
+        and not is_subgraph_container
+    ):
+        if not active:
+            item = {
+                "node_id": node_id,
+                "class_type": class_type,
+                "inactive_reason": inactive_reason or "inactive",
+            }
+            fallback = get_missing_node_fallback(class_type)
+            if fallback is not None:
+                item["fallback"] = fallback
+            result["suppressed_node"] = item
+        else:
+            result["missing_class"] = class_type
+
+    # Check Inputs for Models
+    inputs = diagnostic_node.get("inputs")
+    if not isinstance(inputs, dict):
+        return result
+    if active:
+        _check_inputs_for_models(inputs, inventory, result["models"])
+        return result
+    suppressed_counts: dict[str, dict[str, Any]] = {}
+    _check_inputs_for_models(inputs, inventory, suppressed_counts)
+    for info in suppressed_counts.values():
+        item = {
+            "node_id": node_id,
+            "type": info["type"],
+            "name": info["name"],
+            "count": info["count"],
+            "inactive_reason": inactive_reason or "inactive",
+        }
+        if info.get("suggestions"):
+            item["suggestions"] = info["suggestions"]
+        result["suppressed_models"].append(item)
+    return result
+
+
+def _node_class_mappings_fingerprint(mappings: dict[str, Any]) -> str:
+    """Digest of the registered node class names, memoized per mapping size."""
+    global _NODE_FINGERPRINT_MEMO
+    memo = _NODE_FINGERPRINT_MEMO
+    # Custom node packs register by adding keys, so the size is enough to notice
+    # a change; the memo keeps the mapping alive so its identity stays unique.
+    if memo is not None and memo[0] is mappings and memo[1] == len(mappings):
+        return memo[2]
+    digest = hashlib.sha256("\n".join(sorted(map(str, mappings))).encode()).hexdigest()
+    _NODE_FINGERPRINT_MEMO = (mappings, len(mappings), digest)
+    return digest
+
+
+def _preflight_cache_context(
+    available_nodes: Any, inventory: ModelInventoryIndex
+) -> tuple[Any, ...] | None:
+    """Everything besides the workflow itself that a report depends on."""
+    if not isinstance(available_nodes, dict):
+        return None
+    return (
+        _node_class_mappings_fingerprint(available_nodes),
+        id(inventory),
+        inventory.generation,
+        nodes is None,
+        folder_paths is None,
+    )
+
+
+def _diagnostic_node_digest(diagnostic_node: dict[str, Any]) -> str:
+    # Only the fields the checks read; layout-only edits (position, size,
+    # widget values of frontend graphs) keep the digest stable.
+    structure = {
+        key: diagnostic_node.get(key)
+        for key in (
+            "node_id",
+            "class_type",
+            "inputs",
+            "active",
+            "inactive_reason",
+            "is_subgraph_container",
+        )
+    }
+    structure["has_data"] = isinstance(diagnostic_node.get("node_data"), dict)
+    try:
+        encoded = json.dumps(
+            structure, sort_keys=True, separators=(",", ":"), default=repr
+        )
+    except (TypeError, ValueError):
+        encoded = repr(structure)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _preflight_caches_locked(
+    context: tuple[Any, ...],
+) -> tuple["OrderedDict[str, Any]", "OrderedDict[str, Any]"]:
+    # A new node or inventory generation invalidates every memoized result.
+    if _CACHE.get(_PREFLIGHT_CACHE_CONTEXT_KEY) != context:
+        _CACHE[_PREFLIGHT_CACHE_CONTEXT_KEY] = context
+        _CACHE[_PREFLIGHT_REPORT_CACHE_KEY] = OrderedDict()
+        _CACHE[_PREFLIGHT_NODE_CACHE_KEY] = OrderedDict()
+    return _CACHE[_PREFLIGHT_REPORT_CACHE_KEY], _CACHE[_PREFLIGHT_NODE_CACHE_KEY]
+
+
+def _lookup_cached_report(
+    context: tuple[Any, ...], workflow_digest: str
+) -> dict[str, Any] | None:
+    with _PREFLIGHT_CACHE_LOCK:
+        reports, _ = _preflight_caches_locked(context)
+        cached = reports.get(workflow_digest)
+        if cached is None:
+            return None
+        reports.move_to_end(workflow_digest)
+    # Callers decorate the report they get back, so never hand out the original.
+    result: dict[str, Any] = copy.deepcopy(cached)
+    return result
+
+
+def _store_cached_report(
+    context: tuple[Any, ...], workflow_digest: str, report: dict[str, Any]
+) -> None:
+    snapshot = copy.deepcopy(report)
+    with _PREFLIGHT_CACHE_LOCK:
+        reports, _ = _preflight_caches_locked(context)
+        reports[workflow_digest] = snapshot
+        reports.move_to_end(workflow_digest)
+        while len(reports) > _PREFLIGHT_REPORT_CACHE_MAX:
+            reports.popitem(last=False)
+
+
+def _diagnose_node_cached(
+    context: tuple[Any, ...] | None,
+    digest: str,
+    diagnostic_node: dict[str, Any],
+    available_nodes: dict[str, Any],
+    inventory: ModelInventoryIndex,
+) -> dict[str, Any]:
+    if context is not None:
+        with _PREFLIGHT_CACHE_LOCK:
+            _, node_results = _preflight_caches_locked(context)
+            cached: dict[str, Any] | None = node_results.get(digest)
+            if cached is not None:
+                node_results.move_to_end(digest)
+                return cached
+    metrics.increment("preflight_nodes_rechecked")
+    result = _diagnose_node(diagnostic_node, available_nodes, inventory)
+    if context is not None:
+        with _PREFLIGHT_CACHE_LOCK:
+            _, node_results = _preflight_caches_locked(context)
+            node_results[digest] = result
+            while len(node_results) > _PREFLIGHT_NODE_CACHE_MAX:
+                node_results.popitem(last=False)
+    return result
+
+
 def _check_inputs_for_models(
     inputs: Dict[str, Any],
-    inventory: Dict[str, List[str]],
+    inventory: ModelInventoryIndex | Dict[str, List[str]],
     missing_counts: Dict[str, Dict[str, Any]],
 ):
     """
     Heuristic to detect missing models in node inputs.
     We look for keys that hint at model types (e.g. 'ckpt_name', 'lora_name').
+    Missing names carry "did you mean" suggestions from the inventory index.
     """
     # Mapping heuristic: input_key -> folder_paths type
     key_map = _INPUT_KEY_MAP
+    if isinstance(inventory, ModelInventoryIndex):
+        index = inventory
+    else:
+        index = ModelInventoryIndex(inventory)
 
     for key, value in inputs.items():
         if not isinstance(value, str):
             continue
 
         target_type = key_map.get(key)
-        if target_type:
-            # Check if exists
-            available = inventory.get(target_type, [])
-            if value not in available:
-                # Also try normalizing separators just in case (e.g. windows vs linux paths)
-                # But typically ComfyUI expects exact match or relative match.
-                # Use simple exact match for now.
-
-                unique_key = f"{target_type}:{value}"
-
-                if unique_key not in missing_counts:
-                    missing_counts[unique_key] = {
-                        "type": target_type,
-                        "name": value,
-                        "count": 0,
-                    }
-                missing_counts[unique_key]["count"] += 1
+        # ComfyUI validates the exact filename, so a separator/case variant is
+        # still missing; it is surfaced as the first suggestion instead.
+        if not target_type or index.contains(target_type, value):
+            continue
+
+        unique_key = f"{target_type}:{value}"
+        if unique_key not in missing_counts:
+            missing_counts[unique_key] = {
+                "type": target_type,
+                "name": value,
+                "count": 0,
+            }
+            suggestions = index.suggest(target_type, value)
+            if suggestions:
+                missing_counts[unique_key]["suggestions"] = suggestions
+        missing_counts[unique_key]["count"] += 1
 
 
 # F49: Banner Generation Support
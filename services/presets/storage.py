@@ -1,14 +1,25 @@
 """
 Preset Storage Service (F22).
-Local-first, JSON-based storage.
+Local-first storage in the shared state store.
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any
 
 from ..paths import get_presets_dir
+from ..state_store import (
+    STATE_DB_NAME,
+    StateRow,
+    StateTable,
+    get_state_store,
+    open_state_store,
+)
 from ..tenant_context import (
     DEFAULT_TENANT_ID,
     is_multi_tenant_enabled,
@@ -18,19 +29,60 @@ from .models import Preset
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.presets")
 
+PRESETS_TABLE = "presets"
+LEGACY_MIGRATION = "presets/*.json"
+
 
 class PresetStore:
     """
     Manages persistence of Presets.
-    """
 
-    def __init__(self, storage_dir: Optional[Path] = None):
-        self.storage_dir = storage_dir or get_presets_dir()
-
-    def _get_path(self, preset_id: str) -> Path:
-        return self.storage_dir / f"{preset_id}.json"
+    Presets are rows of the ``presets`` state table, indexed by tenant,
+    category and updated_at. The default store uses the state directory's
+    database; an explicit ``storage_dir`` gets its own ``state.db``. Legacy
+    ``{id}.json`` files in ``storage_dir`` are imported once.
+    """
 
-    def _resolve_tenant_id(self, tenant_id: Optional[str]) -> Optional[str]:
+    def __init__(self, storage_dir: Path | None = None):
+        self._db_path = (
+            None if storage_dir is None else Path(storage_dir) / STATE_DB_NAME
+        )
+        self.storage_dir = Path(storage_dir) if storage_dir else get_presets_dir()
+        self._lock = threading.Lock()
+        self._table: StateTable | None = None
+
+    def _state(self) -> StateTable:
+        with self._lock:
+            if self._table is None:
+                if self._db_path is None:
+                    store = get_state_store()
+                else:
+                    store = open_state_store(self._db_path)
+                table = store.table(PRESETS_TABLE)
+                store.migrate_once(LEGACY_MIGRATION, lambda: self._import_legacy(table))
+                self._table = table
+            return self._table
+
+    def _import_legacy(self, table: StateTable) -> int:
+        rows = []
+        for file_path in self.storage_dir.glob("*.json"):
+            preset = self._load_file(file_path)
+            if preset is None:
+                logger.warning(f"Skipping unreadable legacy preset {file_path}")
+                continue
+            rows.append(self._to_row(preset))
+        return table.put_many(rows)
+
+    def _to_row(self, preset: Preset) -> StateRow:
+        return StateRow(
+            key=preset.id,
+            payload=preset.to_dict(),
+            tenant_id=preset.tenant_id,
+            category=preset.category,
+            updated_at=preset.updated_at,
+        )
+
+    def _resolve_tenant_id(self, tenant_id: str | None) -> str | None:
         if not is_multi_tenant_enabled():
             return None
         try:
@@ -38,7 +90,7 @@ class PresetStore:
         except Exception:
             return DEFAULT_TENANT_ID
 
-    def _is_visible_to_tenant(self, preset: Preset, tenant_id: Optional[str]) -> bool:
+    def _is_visible_to_tenant(self, preset: Preset, tenant_id: str | None) -> bool:
         resolved = self._resolve_tenant_id(tenant_id)
         if resolved is None:
             return True
@@ -46,42 +98,31 @@ class PresetStore:
 
     def list_presets(
         self,
-        category: Optional[str] = None,
-        tag: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-    ) -> List[Preset]:
-        """List all presets, optionally filtered."""
-        presets = []
+        category: str | None = None,
+        tag: str | None = None,
+        tenant_id: str | None = None,
+    ) -> list[Preset]:
+        """List all presets, optionally filtered, newest first."""
         try:
-            for file_path in self.storage_dir.glob("*.json"):
-                try:
-                    p = self._load_file(file_path)
-                    if p:
-                        if not self._is_visible_to_tenant(p, tenant_id):
-                            continue
-                        if category and p.category != category:
-                            continue
-                        if tag and tag not in p.tags:
-                            continue
-                        presets.append(p)
-                except Exception as e:
-                    logger.warning(f"Failed to load preset {file_path}: {e}")
-        except OSError as e:
-            logger.error(f"Failed to list presets dir: {e}")
+            payloads = self._state().query(
+                tenant_id=self._resolve_tenant_id(tenant_id), category=category
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to list presets: {e}")
             return []
 
-        # Sort by updated_at desc
-        presets.sort(key=lambda x: x.updated_at, reverse=True)
+        presets = []
+        for payload in payloads:
+            p = self._from_payload(payload)
+            if p is None or (tag and tag not in p.tags):
+                continue
+            presets.append(p)
         return presets
 
-    def get_preset(
-        self, preset_id: str, tenant_id: Optional[str] = None
-    ) -> Optional[Preset]:
+    def get_preset(self, preset_id: str, tenant_id: str | None = None) -> Preset | None:
         """Get a specific preset."""
-        path = self._get_path(preset_id)
-        if not path.exists():
-            return None
-        preset = self._load_file(path)
+        payload = self._state().get(preset_id)
+        preset = None if payload is None else self._from_payload(payload)
         if preset is None:
             return None
         if not self._is_visible_to_tenant(preset, tenant_id):
@@ -97,40 +138,44 @@ class PresetStore:
             )
         except Exception:
             preset.tenant_id = DEFAULT_TENANT_ID
-        path = self._get_path(preset.id)
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(preset.to_dict(), f, indent=2, ensure_ascii=False)
+            self._state().put_many([self._to_row(preset)])
             logger.info(f"Saved preset {preset.id} ({preset.name})")
             return True
         except Exception as e:
             logger.error(f"Failed to save preset {preset.id}: {e}")
             return False
 
-    def delete_preset(self, preset_id: str, tenant_id: Optional[str] = None) -> bool:
+    def delete_preset(self, preset_id: str, tenant_id: str | None = None) -> bool:
         """Delete a preset."""
-        path = self._get_path(preset_id)
-        if not path.exists():
+        table = self._state()
+        payload = table.get(preset_id)
+        if payload is None:
             return False
-        preset = self._load_file(path)
+        preset = self._from_payload(payload)
         if preset is not None and not self._is_visible_to_tenant(preset, tenant_id):
             return False
         try:
-            path.unlink()
+            table.delete(preset_id)
             logger.info(f"Deleted preset {preset_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete preset {preset_id}: {e}")
             return False
 
-    def _load_file(self, path: Path) -> Optional[Preset]:
+    def _from_payload(self, data: dict[str, Any]) -> Preset | None:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
             return Preset.from_dict(data)
         except Exception:
             return None
 
+    def _load_file(self, path: Path) -> Preset | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return self._from_payload(json.load(f))
+        except Exception:
+            return None
+
 
 # Singleton
 preset_store = PresetStore()
@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, NoReturn, Optional
 
 try:
     from ..provider_errors import ProviderHTTPError
@@ -11,6 +12,7 @@ try:
         SSRFError,
         safe_request_json,
     )
+    from ..safe_io_async import async_safe_request_json
 except ImportError:
     from services.provider_errors import ProviderHTTPError
     from services.retry_after import parse_retry_after_body, parse_retry_after_header
@@ -20,6 +22,7 @@ except ImportError:
         SSRFError,
         safe_request_json,
     )
+    from services.safe_io_async import async_safe_request_json
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.providers.anthropic")
 
@@ -62,32 +65,21 @@ def build_chat_request(
     return payload
 
 
-def make_request(
+def _transport_kwargs(
+    *,
     base_url: str,
     api_key: str,
-    messages: List[Dict[str, Any]],
-    model: str,
-    system: Optional[str] = None,
-    temperature: float = 0.7,
-    max_tokens: int = 4096,
-    timeout: float = 120.0,
-    allow_hosts: Optional[set[str]] = None,
-    allow_any_public_host: bool = False,
-    allow_loopback_hosts: Optional[set[str]] = None,
-    allow_insecure_base_url: bool = False,
-    allow_private_network: bool = False,
-) -> Dict[str, Any]:
-    """
-    Make a request to Anthropic /v1/messages endpoint.
-
-    Returns: {"text": str, "raw": dict}
-    """
+    payload: dict[str, Any],
+    timeout: float,
+    allow_hosts: set[str] | None,
+    allow_any_public_host: bool,
+    allow_loopback_hosts: set[str] | None,
+    allow_insecure_base_url: bool,
+    allow_private_network: bool,
+) -> dict[str, Any]:
     # Build endpoint URL (S65: safe_io handles normalization)
     endpoint = f"{base_url.rstrip('/')}/v1/messages"
 
-    # Build request payload
-    payload = build_chat_request(messages, model, system, temperature, max_tokens)
-
     # Build headers (Anthropic uses x-api-key, not Bearer)
     headers = {
         "Content-Type": "application/json",
@@ -95,33 +87,35 @@ def make_request(
         "anthropic-version": ANTHROPIC_API_VERSION,
     }
 
-    try:
-        # S65: Enforce restricted outbound policy (HTTPS, standard ports)
-        # safe_request_json handles SSRF checks, DNS pinning, and redirects.
-        raw = safe_request_json(
-            method="POST",
-            url=endpoint,
-            json_body=payload,
-            headers=headers,
-            timeout_sec=int(timeout),
-            policy=STANDARD_OUTBOUND_POLICY,
-            allow_hosts=allow_hosts,
-            allow_any_public_host=allow_any_public_host,
-            allow_loopback_hosts=allow_loopback_hosts,
-            allow_insecure_base_url=allow_insecure_base_url,
-            allow_private_network=allow_private_network,
-        )
+    # S65: Enforce restricted outbound policy (HTTPS, standard ports)
+    # safe_request_json handles SSRF checks, DNS pinning, and redirects.
+    return {
+        "method": "POST",
+        "url": endpoint,
+        "json_body": payload,
+        "headers": headers,
+        "timeout_sec": int(timeout),
+        "policy": STANDARD_OUTBOUND_POLICY,
+        "allow_hosts": allow_hosts,
+        "allow_any_public_host": allow_any_public_host,
+        "allow_loopback_hosts": allow_loopback_hosts,
+        "allow_insecure_base_url": allow_insecure_base_url,
+        "allow_private_network": allow_private_network,
+    }
 
-        # Extract text from response
-        text = ""
-        if "content" in raw and len(raw["content"]) > 0:
-            for block in raw["content"]:
-                if block.get("type") == "text":
-                    text += block.get("text", "")
 
-        return {"text": text, "raw": raw}
+def _extract_response_text(raw: dict[str, Any]) -> str:
+    text = ""
+    if "content" in raw and len(raw["content"]) > 0:
+        for block in raw["content"]:
+            if block.get("type") == "text":
+                text += block.get("text", "")
+    return text
 
-    except SafeIOHTTPError as e:
+
+def _raise_provider_error(e: Exception, model: str) -> NoReturn:
+    """Translate safe_io transport failures into the provider error contract."""
+    if isinstance(e, SafeIOHTTPError):
         error_body = _parse_error_body_dict(e.body)
         retry_after = parse_retry_after_header(e.headers)
         if retry_after is None:
@@ -138,11 +132,9 @@ def make_request(
             body=error_body if error_body is not None else e.body,
         )
 
-    except RuntimeError as e:
+    if isinstance(e, RuntimeError):
         params = str(e)
         status_code = 500
-        import re
-
         m = re.search(r"HTTP error (\d+)", params)
         if m:
             status_code = int(m.group(1))
@@ -156,13 +148,90 @@ def make_request(
             retry_after=None,
         )
 
-    except SSRFError as e:
+    if isinstance(e, SSRFError):
         logger.error(f"Anthropic SSRF blocked: {e}")
         raise RuntimeError(f"Security policy blocked request: {e}")
 
+    logger.error(f"Anthropic unexpected error: {e}")
+    raise RuntimeError(f"API request failed: {e}")
+
+
+def make_request(
+    base_url: str,
+    api_key: str,
+    messages: List[Dict[str, Any]],
+    model: str,
+    system: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    timeout: float = 120.0,
+    allow_hosts: Optional[set[str]] = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: Optional[set[str]] = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+) -> Dict[str, Any]:
+    """
+    Make a request to Anthropic /v1/messages endpoint.
+
+    Returns: {"text": str, "raw": dict}
+    """
+    payload = build_chat_request(messages, model, system, temperature, max_tokens)
+
+    try:
+        raw = safe_request_json(
+            **_transport_kwargs(
+                base_url=base_url,
+                api_key=api_key,
+                payload=payload,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
+        )
+        return {"text": _extract_response_text(raw), "raw": raw}
+    except Exception as e:
+        _raise_provider_error(e, model)
+
+
+async def make_request_async(
+    base_url: str,
+    api_key: str,
+    messages: list[dict[str, Any]],
+    model: str,
+    system: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    timeout: float = 120.0,
+    allow_hosts: set[str] | None = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: set[str] | None = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+) -> dict[str, Any]:
+    """Event-loop native variant of make_request (same contract)."""
+    payload = build_chat_request(messages, model, system, temperature, max_tokens)
+
+    try:
+        raw = await async_safe_request_json(
+            **_transport_kwargs(
+                base_url=base_url,
+                api_key=api_key,
+                payload=payload,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
+        )
+        return {"text": _extract_response_text(raw), "raw": raw}
     except Exception as e:
-        logger.error(f"Anthropic unexpected error: {e}")
-        raise RuntimeError(f"API request failed: {e}")
+        _raise_provider_error(e, model)
 
 
 def build_vision_message(
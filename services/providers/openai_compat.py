@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, NoReturn, Optional
 
 try:
     from ..provider_errors import ProviderHTTPError
@@ -12,6 +13,7 @@ try:
         safe_request_json,
         safe_request_text_stream,
     )
+    from ..safe_io_async import async_safe_request_json, async_safe_request_text_stream
 except ImportError:
     from services.provider_errors import ProviderHTTPError
     from services.retry_after import parse_retry_after_body, parse_retry_after_header
@@ -22,6 +24,10 @@ except ImportError:
         safe_request_json,
         safe_request_text_stream,
     )
+    from services.safe_io_async import (
+        async_safe_request_json,
+        async_safe_request_text_stream,
+    )
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.providers.openai_compat")
 
@@ -87,75 +93,39 @@ def build_chat_request(
     return payload
 
 
-def make_request(
-    base_url: str,
-    api_key: Optional[str],
-    messages: List[Dict[str, Any]],
-    model: str,
-    temperature: float = 0.7,
-    max_tokens: int = 4096,
-    timeout: float = 120.0,
-    tools: Optional[List[Dict[str, Any]]] = None,  # R39: Optional tools
-    tool_choice: Optional[str] = None,  # R39: Optional tool_choice
-    allow_hosts: Optional[set[str]] = None,
-    allow_any_public_host: bool = False,
-    allow_loopback_hosts: Optional[set[str]] = None,
-    allow_insecure_base_url: bool = False,
-    allow_private_network: bool = False,
-) -> Dict[str, Any]:
-    """
-    Make a request to an OpenAI-compatible /chat/completions endpoint.
-
-    Returns: {"text": str, "raw": dict}
-    """
+def _build_endpoint_and_headers(
+    base_url: str, api_key: str | None, *, streaming: bool
+) -> tuple[str, dict[str, str]]:
     # Build endpoint URL (S65: safe_io handles normalization)
     endpoint = f"{base_url.rstrip('/')}/chat/completions"
-
-    # Build request payload
-    payload = build_chat_request(
-        messages, model, temperature, max_tokens, tools, tool_choice
-    )
-
-    # Build headers
-    headers = {
-        "Content-Type": "application/json",
-    }
+    headers = {"Content-Type": "application/json"}
+    if streaming:
+        headers["Accept"] = "text/event-stream"
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
+    return endpoint, headers
 
-    try:
-        # S65: Enforce restricted outbound policy (HTTPS, standard ports)
-        # safe_request_json handles SSRF checks, DNS pinning, and redirects.
-        raw = safe_request_json(
-            method="POST",
-            url=endpoint,
-            json_body=payload,
-            headers=headers,
-            timeout_sec=int(timeout),
-            policy=STANDARD_OUTBOUND_POLICY,
-            allow_hosts=allow_hosts,
-            allow_any_public_host=allow_any_public_host,
-            allow_loopback_hosts=allow_loopback_hosts,
-            allow_insecure_base_url=allow_insecure_base_url,
-            allow_private_network=allow_private_network,
-        )
 
-        # Extract text from response
-        text = ""
-        if "choices" in raw and len(raw["choices"]) > 0:
-            choice = raw["choices"][0]
-            if "message" in choice and "content" in choice["message"]:
-                text = choice["message"]["content"]
+def _extract_response_text(raw: dict[str, Any]) -> str:
+    text = ""
+    if "choices" in raw and len(raw["choices"]) > 0:
+        choice = raw["choices"][0]
+        if "message" in choice and "content" in choice["message"]:
+            text = choice["message"]["content"]
+    return text
 
-        return {"text": text, "raw": raw}
 
-    except SafeIOHTTPError as e:
+def _raise_provider_error(e: Exception, model: str, *, streaming: bool) -> NoReturn:
+    """Translate safe_io transport failures into the provider error contract."""
+    label = "OpenAI-compat streaming" if streaming else "OpenAI-compat"
+
+    if isinstance(e, SafeIOHTTPError):
         error_body = _parse_error_body_dict(e.body)
         retry_after = parse_retry_after_header(e.headers)
         if retry_after is None:
             retry_after = parse_retry_after_body(error_body)
 
-        logger.error(f"OpenAI-compat API error: {e}")
+        logger.error(f"{label} API error: {e}")
         raise ProviderHTTPError(
             status_code=e.status_code,
             message=str(e),
@@ -166,20 +136,15 @@ def make_request(
             body=error_body if error_body is not None else e.body,
         )
 
-    except RuntimeError as e:
+    if isinstance(e, RuntimeError):
         # S65/R14: Attempt to reconstruct ProviderHTTPError from safe_io exception
-
-        # Try to parse status code
         params = str(e)
         status_code = 500
-        import re
-
         m = re.search(r"HTTP error (\d+)", params)
         if m:
             status_code = int(m.group(1))
 
-        logger.error(f"OpenAI-compat API error: {e}")
-
+        logger.error(f"{label} API error: {e}")
         raise ProviderHTTPError(
             status_code=status_code,
             message=str(e),
@@ -188,16 +153,44 @@ def make_request(
             retry_after=None,
         )
 
-    except SSRFError as e:
-        logger.error(f"OpenAI-compat SSRF blocked: {e}")
+    if isinstance(e, SSRFError):
+        logger.error(f"{label} SSRF blocked: {e}")
         raise RuntimeError(f"Security policy blocked request: {e}")
 
-    except Exception as e:
-        logger.error(f"OpenAI-compat unexpected error: {e}")
-        raise RuntimeError(f"API request failed: {e}")
+    logger.error(f"{label} unexpected error: {e}")
+    raise RuntimeError(f"API request failed: {e}")
+
+
+def _transport_kwargs(
+    *,
+    endpoint: str,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    timeout: float,
+    allow_hosts: set[str] | None,
+    allow_any_public_host: bool,
+    allow_loopback_hosts: set[str] | None,
+    allow_insecure_base_url: bool,
+    allow_private_network: bool,
+) -> dict[str, Any]:
+    # S65: Enforce restricted outbound policy (HTTPS, standard ports)
+    # safe_request_json handles SSRF checks, DNS pinning, and redirects.
+    return {
+        "method": "POST",
+        "url": endpoint,
+        "json_body": payload,
+        "headers": headers,
+        "timeout_sec": int(timeout),
+        "policy": STANDARD_OUTBOUND_POLICY,
+        "allow_hosts": allow_hosts,
+        "allow_any_public_host": allow_any_public_host,
+        "allow_loopback_hosts": allow_loopback_hosts,
+        "allow_insecure_base_url": allow_insecure_base_url,
+        "allow_private_network": allow_private_network,
+    }
 
 
-def make_request_stream(
+def make_request(
     base_url: str,
     api_key: Optional[str],
     messages: List[Dict[str, Any]],
@@ -205,152 +198,266 @@ def make_request_stream(
     temperature: float = 0.7,
     max_tokens: int = 4096,
     timeout: float = 120.0,
-    tools: Optional[List[Dict[str, Any]]] = None,
-    tool_choice: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,  # R39: Optional tools
+    tool_choice: Optional[str] = None,  # R39: Optional tool_choice
     allow_hosts: Optional[set[str]] = None,
     allow_any_public_host: bool = False,
     allow_loopback_hosts: Optional[set[str]] = None,
     allow_insecure_base_url: bool = False,
     allow_private_network: bool = False,
-    on_text_delta: Optional[Callable[[str], None]] = None,
-    max_preview_chars: int = 16000,
 ) -> Dict[str, Any]:
     """
-    Best-effort streaming request to OpenAI-compatible /chat/completions endpoint.
+    Make a request to an OpenAI-compatible /chat/completions endpoint.
 
-    Parses SSE `data:` lines and emits incremental text deltas when present.
-    Falls back to final accumulated text result shape `{"text": str, "raw": dict}`.
+    Returns: {"text": str, "raw": dict}
     """
-    endpoint = f"{base_url.rstrip('/')}/chat/completions"
+    endpoint, headers = _build_endpoint_and_headers(base_url, api_key, streaming=False)
     payload = build_chat_request(
         messages, model, temperature, max_tokens, tools, tool_choice
     )
-    payload["stream"] = True
 
-    headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
+    try:
+        raw = safe_request_json(
+            **_transport_kwargs(
+                endpoint=endpoint,
+                payload=payload,
+                headers=headers,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
+        )
+        return {"text": _extract_response_text(raw), "raw": raw}
+    except Exception as e:
+        _raise_provider_error(e, model, streaming=False)
 
-    full_text_parts: List[str] = []
-    chunk_count = 0
-    saw_done = False
 
-    def _emit_delta(delta: str) -> None:
+async def make_request_async(
+    base_url: str,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    model: str,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    timeout: float = 120.0,
+    tools: list[dict[str, Any]] | None = None,
+    tool_choice: str | None = None,
+    allow_hosts: set[str] | None = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: set[str] | None = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+) -> dict[str, Any]:
+    """Event-loop native variant of make_request (same contract)."""
+    endpoint, headers = _build_endpoint_and_headers(base_url, api_key, streaming=False)
+    payload = build_chat_request(
+        messages, model, temperature, max_tokens, tools, tool_choice
+    )
+
+    try:
+        raw = await async_safe_request_json(
+            **_transport_kwargs(
+                endpoint=endpoint,
+                payload=payload,
+                headers=headers,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
+        )
+        return {"text": _extract_response_text(raw), "raw": raw}
+    except Exception as e:
+        _raise_provider_error(e, model, streaming=False)
+
+
+class _StreamAccumulator:
+    """Incremental parser for OpenAI-compatible SSE chat completion chunks."""
+
+    def __init__(
+        self,
+        on_text_delta: Callable[[str], None] | None,
+        max_preview_chars: int,
+    ) -> None:
+        self._on_text_delta = on_text_delta
+        self._max_preview_chars = max_preview_chars
+        self._parts: list[str] = []
+        self._chars = 0
+        self.chunk_count = 0
+        self.saw_done = False
+
+    def _emit_delta(self, delta: str) -> None:
         if not delta:
             return
-        nonlocal full_text_parts
-        current_len = sum(len(p) for p in full_text_parts)
-        if current_len >= max_preview_chars:
+        if self._chars >= self._max_preview_chars:
             return
-        clipped = delta[: max_preview_chars - current_len]
+        clipped = delta[: self._max_preview_chars - self._chars]
         if not clipped:
             return
-        full_text_parts.append(clipped)
-        if on_text_delta:
+        self._parts.append(clipped)
+        self._chars += len(clipped)
+        if self._on_text_delta:
             try:
-                on_text_delta(clipped)
+                self._on_text_delta(clipped)
             except Exception:
                 # Callback errors must not break provider parsing.
                 logger.debug("Ignoring on_text_delta callback error", exc_info=True)
 
-    try:
-        for line in safe_request_text_stream(
-            method="POST",
-            url=endpoint,
-            json_body=payload,
-            headers=headers,
-            timeout_sec=int(timeout),
-            policy=STANDARD_OUTBOUND_POLICY,
-            allow_hosts=allow_hosts,
-            allow_any_public_host=allow_any_public_host,
-            allow_loopback_hosts=allow_loopback_hosts,
-            allow_insecure_base_url=allow_insecure_base_url,
-            allow_private_network=allow_private_network,
-        ):
-            line = line.rstrip("\r\n")
-            if not line or line.startswith(":"):
-                continue
-            if not line.startswith("data:"):
-                continue
-
-            data_str = line[5:].strip()
-            if not data_str:
-                continue
-            if data_str == "[DONE]":
-                saw_done = True
-                break
-
-            try:
-                payload_obj = json.loads(data_str)
-            except json.JSONDecodeError:
-                continue
-
-            chunk_count += 1
-            choices = payload_obj.get("choices") or []
-            if not choices:
-                continue
-            delta = choices[0].get("delta") or {}
-            content = delta.get("content")
-
-            if isinstance(content, str):
-                _emit_delta(content)
-            elif isinstance(content, list):
-                for part in content:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        text = part.get("text")
-                        if isinstance(text, str):
-                            _emit_delta(text)
+    def feed(self, line: str) -> bool:
+        """Consume one SSE line. Returns True once the stream signals [DONE]."""
+        line = line.rstrip("\r\n")
+        if not line or line.startswith(":"):
+            return False
+        if not line.startswith("data:"):
+            return False
+
+        data_str = line[5:].strip()
+        if not data_str:
+            return False
+        if data_str == "[DONE]":
+            self.saw_done = True
+            return True
 
+        try:
+            payload_obj = json.loads(data_str)
+        except json.JSONDecodeError:
+            return False
+
+        self.chunk_count += 1
+        choices = payload_obj.get("choices") or []
+        if not choices:
+            return False
+        delta = choices[0].get("delta") or {}
+        content = delta.get("content")
+
+        if isinstance(content, str):
+            self._emit_delta(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "text":
+                    text = part.get("text")
+                    if isinstance(text, str):
+                        self._emit_delta(text)
+        return False
+
+    def result(self) -> dict[str, Any]:
         return {
-            "text": "".join(full_text_parts),
+            "text": "".join(self._parts),
             "raw": {
                 "stream": True,
                 "provider": "openai_compat",
-                "chunks": chunk_count,
-                "saw_done": saw_done,
+                "chunks": self.chunk_count,
+                "saw_done": self.saw_done,
             },
         }
 
-    except SafeIOHTTPError as e:
-        error_body = _parse_error_body_dict(e.body)
-        retry_after = parse_retry_after_header(e.headers)
-        if retry_after is None:
-            retry_after = parse_retry_after_body(error_body)
 
-        logger.error(f"OpenAI-compat streaming API error: {e}")
-        raise ProviderHTTPError(
-            status_code=e.status_code,
-            message=str(e),
-            provider="openai_compat",
-            model=model,
-            retry_after=retry_after,
-            headers=e.headers,
-            body=error_body if error_body is not None else e.body,
-        )
+def make_request_stream(
+    base_url: str,
+    api_key: Optional[str],
+    messages: List[Dict[str, Any]],
+    model: str,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    timeout: float = 120.0,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[str] = None,
+    allow_hosts: Optional[set[str]] = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: Optional[set[str]] = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+    on_text_delta: Optional[Callable[[str], None]] = None,
+    max_preview_chars: int = 16000,
+) -> Dict[str, Any]:
+    """
+    Best-effort streaming request to OpenAI-compatible /chat/completions endpoint.
 
-    except RuntimeError as e:
-        params = str(e)
-        status_code = 500
-        import re
+    Parses SSE `data:` lines and emits incremental text deltas when present.
+    Falls back to final accumulated text result shape `{"text": str, "raw": dict}`.
+    """
+    endpoint, headers = _build_endpoint_and_headers(base_url, api_key, streaming=True)
+    payload = build_chat_request(
+        messages, model, temperature, max_tokens, tools, tool_choice
+    )
+    payload["stream"] = True
+    accumulator = _StreamAccumulator(on_text_delta, max_preview_chars)
 
-        m = re.search(r"HTTP error (\d+)", params)
-        if m:
-            status_code = int(m.group(1))
+    try:
+        for line in safe_request_text_stream(
+            **_transport_kwargs(
+                endpoint=endpoint,
+                payload=payload,
+                headers=headers,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
+        ):
+            if accumulator.feed(line):
+                break
+        return accumulator.result()
+    except Exception as e:
+        _raise_provider_error(e, model, streaming=True)
 
-        logger.error(f"OpenAI-compat streaming API error: {e}")
-        raise ProviderHTTPError(
-            status_code=status_code,
-            message=str(e),
-            provider="openai_compat",
-            model=model,
-            retry_after=None,
+
+async def make_request_stream_async(
+    base_url: str,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    model: str,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+    timeout: float = 120.0,
+    tools: list[dict[str, Any]] | None = None,
+    tool_choice: str | None = None,
+    allow_hosts: set[str] | None = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: set[str] | None = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+    on_text_delta: Callable[[str], None] | None = None,
+    max_preview_chars: int = 16000,
+) -> dict[str, Any]:
+    """Event-loop native variant of make_request_stream (same contract)."""
+    endpoint, headers = _build_endpoint_and_headers(base_url, api_key, streaming=True)
+    payload = build_chat_request(
+        messages, model, temperature, max_tokens, tools, tool_choice
+    )
+    payload["stream"] = True
+    accumulator = _StreamAccumulator(on_text_delta, max_preview_chars)
+
+    try:
+        stream = async_safe_request_text_stream(
+            **_transport_kwargs(
+                endpoint=endpoint,
+                payload=payload,
+                headers=headers,
+                timeout=timeout,
+                allow_hosts=allow_hosts,
+                allow_any_public_host=allow_any_public_host,
+                allow_loopback_hosts=allow_loopback_hosts,
+                allow_insecure_base_url=allow_insecure_base_url,
+                allow_private_network=allow_private_network,
+            )
         )
-    except SSRFError as e:
-        logger.error(f"OpenAI-compat streaming SSRF blocked: {e}")
-        raise RuntimeError(f"Security policy blocked request: {e}")
+        try:
+            async for line in stream:
+                if accumulator.feed(line):
+                    break
+        finally:
+            await stream.aclose()
+        return accumulator.result()
     except Exception as e:
-        logger.error(f"OpenAI-compat streaming unexpected error: {e}")
-        raise RuntimeError(f"API request failed: {e}")
+        _raise_provider_error(e, model, streaming=True)
 
 
 def build_vision_message(
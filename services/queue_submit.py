@@ -2,14 +2,23 @@
 Queue Submit Service (F5 + R33).
 Submits prompt workflows to ComfyUI execution queue with execution budgets.
 
-- Uses internal HTTP call to POST /prompt
+- Inside ComfyUI, invokes the PromptServer's own POST /prompt handler
+  in-process (same validation, on-prompt hooks and queueing, no loopback HTTP)
+- Otherwise POSTs to COMFYUI_URL/prompt over a long-lived pooled session
 - Handles client_id and extra metadata
 - R33: Applies concurrency caps and render size budgets
 """
 
+import asyncio
+import copy
 import json
 import logging
+import sys
 import uuid
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 try:
@@ -47,8 +56,10 @@ configure_logger_for_structured_output(logger)
 import os
 
 try:
+    from .metrics import metrics
     from .tenant_context import get_current_tenant_id
 except ImportError:
+    from services.metrics import metrics
     from services.tenant_context import get_current_tenant_id  # type: ignore
 
 # ComfyUI internal server URL fallback
@@ -59,6 +70,8 @@ COMFYUI_URL = (
 )
 # IMPORTANT: keep this fixed and prompt-free; ComfyUI forwards it into API-node hidden inputs.
 COMFY_USAGE_SOURCE = "comfyui-openclaw"
+# "auto" submits in-process when running inside ComfyUI; "http" forces loopback.
+QUEUE_SUBMIT_MODE_ENV = "OPENCLAW_QUEUE_SUBMIT_MODE"
 
 
 def _build_queue_extra_data(
@@ -77,6 +90,162 @@ def _build_queue_extra_data(
     return payload_extra
 
 
+class _InProcessPromptRequest:
+    """Minimal request stand-in for ComfyUI's POST /prompt handler."""
+
+    method = "POST"
+    path = "/prompt"
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+        self.headers: dict[str, str] = {}
+        self.query: dict[str, str] = {}
+
+    async def json(self, **_kwargs: Any) -> dict[str, Any]:
+        # Rendered workflows share unslotted subtrees with the compiled template
+        # cache; the host owns (and may edit) what it receives, like a parsed body.
+        return copy.deepcopy(self._payload)
+
+
+# id(PromptServer) -> POST /prompt handler; None once the host proved unusable.
+_IN_PROCESS_HANDLERS: dict[int, Any] = {}
+# Loopback fallback sessions, one per event loop (sessions are loop-bound).
+_HTTP_SESSIONS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _in_process_target() -> tuple[Any, Any] | None:
+    """Return (prompt_server, post_prompt_handler) when running inside ComfyUI."""
+    if os.environ.get(QUEUE_SUBMIT_MODE_ENV, "auto").strip().lower() == "http":
+        return None
+    # CRITICAL: only use the already-loaded host module; never import it here.
+    prompt_server = getattr(sys.modules.get("server"), "PromptServer", None)
+    server = getattr(prompt_server, "instance", None)
+    if server is None or getattr(server, "prompt_queue", None) is None:
+        return None
+    key = id(server)
+    if key not in _IN_PROCESS_HANDLERS:
+        handler = None
+        for route in getattr(server, "routes", None) or ():
+            if (
+                getattr(route, "method", "") == "POST"
+                and getattr(route, "path", "") == "/prompt"
+            ):
+                handler = getattr(route, "handler", None)
+                break
+        _IN_PROCESS_HANDLERS[key] = handler if callable(handler) else None
+    handler = _IN_PROCESS_HANDLERS[key]
+    return (server, handler) if handler is not None else None
+
+
+async def _submit_in_process(
+    payload: dict[str, Any],
+) -> tuple[int, Any] | None:
+    """Run the host's /prompt handler directly. None means use HTTP instead."""
+    target = _in_process_target()
+    if target is None:
+        return None
+    server, handler = target
+    request = _InProcessPromptRequest(payload)
+    server_loop = getattr(server, "loop", None)
+    try:
+        running_loop = asyncio.get_running_loop()
+        if server_loop is None or server_loop is running_loop:
+            response = await handler(request)
+        elif server_loop.is_closed() or not server_loop.is_running():
+            return None
+        else:
+            # IMPORTANT: bridge submissions run on a worker loop; queue on the
+            # server loop so prompt numbering never races the HTTP handler.
+            response = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(handler(request), server_loop)
+            )
+        status = int(getattr(response, "status", 0))
+        text = getattr(response, "text", None) or ""
+    except (AttributeError, TypeError) as e:
+        # Host handler needs more of the request than the shim provides.
+        logger.warning(f"In-process queue submit unavailable, using HTTP: {e}")
+        _IN_PROCESS_HANDLERS[id(server)] = None
+        return None
+    if status == 200:
+        return status, json.loads(text)
+    return status, text
+
+
+def _import_aiohttp() -> Any:
+    # R62: Lazy import aiohttp to avoid hard dependency crash at startup
+    try:
+        import aiohttp
+    except ImportError:
+        msg = "aiohttp is required for queue submission but not installed."
+        logger.error(msg)
+        raise APIError(
+            message=msg,
+            code=ErrorCode.DEPENDENCY_UNAVAILABLE,
+            status=503,
+            detail={"package": "aiohttp"},
+        )
+    return aiohttp
+
+
+def _get_http_session(aiohttp: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    session = _HTTP_SESSIONS.get(loop)
+    if session is None or session.closed is not False:
+        session = aiohttp.ClientSession()
+        _HTTP_SESSIONS[loop] = session
+    return session
+
+
+async def close_queue_submit_session() -> None:
+    """Close the running loop's pooled loopback session (shutdown/tests)."""
+    session = _HTTP_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and session.closed is False:
+        await session.close()
+
+
+def close_queue_submit_sessions(timeout: float = 5.0) -> int:
+    """
+    Close every pooled loopback session from sync shutdown code.
+
+    Each session is closed on its own loop: awaited across threads when that
+    loop runs elsewhere, run to completion when it is idle. Sessions whose
+    loop is already closed are dropped. Returns the number of sessions closed.
+    """
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    closed = 0
+    for loop, session in list(_HTTP_SESSIONS.items()):
+        _HTTP_SESSIONS.pop(loop, None)
+        if session.closed is not False or loop.is_closed():
+            continue
+        try:
+            if loop is current:
+                loop.create_task(session.close())
+            elif loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                future.result(timeout)
+            else:
+                loop.run_until_complete(session.close())
+        except Exception as e:
+            logger.warning(f"Failed to close queue submit session: {e}")
+            continue
+        closed += 1
+    return closed
+
+
+async def _submit_http(payload: dict[str, Any], aiohttp: Any) -> tuple[int, Any]:
+    url = f"{COMFYUI_URL}/prompt"
+    session = _get_http_session(aiohttp)
+    async with session.post(url, json=payload) as resp:
+        if resp.status == 200:
+            return resp.status, await resp.json()
+        return resp.status, await resp.text()
+
+
 async def submit_prompt(
     prompt_workflow: Dict[str, Any],
     client_id: Optional[str] = None,
@@ -101,6 +270,122 @@ async def submit_prompt(
     Raises:
         BudgetExceededError: If concurrency or size budgets are exceeded
     """
+    payload = _prepare_payload(
+        prompt_workflow, client_id, extra_data, source, trace_id, tenant_id
+    )
+
+    try:
+        from .execution_budgets import get_limiter
+    except ImportError:
+        from services.execution_budgets import get_limiter
+
+    # R33: Acquire concurrency budget
+    limiter = get_limiter()
+    async with limiter.acquire(
+        source=source,
+        trace_id=trace_id,
+        tenant_id=tenant_id or get_current_tenant_id(),
+    ):
+        return await _send_payload(payload, source, trace_id)
+
+
+@dataclass
+class QueueSubmitItem:
+    """One job of a batch submission (see submit_prompt for field meanings)."""
+
+    prompt_workflow: dict[str, Any]
+    client_id: str | None = None
+    extra_data: dict[str, Any] | None = None
+    trace_id: str | None = None
+
+
+async def submit_prompt_batch(
+    items: Sequence[QueueSubmitItem],
+    source: str = "unknown",
+    trace_id: str | None = None,
+    tenant_id: str | None = None,
+) -> AsyncIterator[tuple[int, dict[str, Any] | Exception]]:
+    """
+    Submit many workflows under one bulk budget acquisition (R33).
+
+    Yields (index, outcome) pairs in completion order, where outcome is the
+    submit_prompt result dict or the exception submit_prompt would have
+    raised for that item (APIError / BudgetExceededError). Budget denial for
+    the whole batch is reported per item, so callers can always stream
+    per-item results.
+
+    Args:
+        items: Jobs to submit
+        source: Budget source shared by the batch
+        trace_id: Batch trace ID (budget logging); items carry their own
+        tenant_id: S49 tenant context for budget + audit metadata
+    """
+    payloads: dict[int, dict[str, Any]] = {}
+    for index, item in enumerate(items):
+        try:
+            payloads[index] = _prepare_payload(
+                item.prompt_workflow,
+                item.client_id,
+                item.extra_data,
+                source,
+                item.trace_id,
+                tenant_id,
+            )
+        except Exception as e:
+            yield index, e
+    if not payloads:
+        return
+
+    try:
+        from .execution_budgets import BudgetExceededError, get_limiter
+    except ImportError:
+        from services.execution_budgets import BudgetExceededError, get_limiter
+
+    pending = deque(payloads)
+    outcomes: asyncio.Queue = asyncio.Queue()
+
+    async def _worker() -> None:
+        while pending:
+            index = pending.popleft()
+            try:
+                result: dict[str, Any] | Exception = await _send_payload(
+                    payloads[index], source, items[index].trace_id
+                )
+            except Exception as e:
+                result = e
+            outcomes.put_nowait((index, result))
+
+    try:
+        async with get_limiter().acquire_many(
+            len(payloads),
+            source=source,
+            trace_id=trace_id,
+            tenant_id=tenant_id or get_current_tenant_id(),
+        ) as granted:
+            # R33: never run more submissions at once than slots granted.
+            workers = [asyncio.ensure_future(_worker()) for _ in range(granted)]
+            try:
+                for _ in range(len(payloads)):
+                    yield await outcomes.get()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+    except BudgetExceededError as e:
+        # Only acquire_many raises here (workers capture their own errors):
+        # nothing was sent, so every item is denied alike.
+        for index in payloads:
+            yield index, e
+
+
+def _prepare_payload(
+    prompt_workflow: dict[str, Any],
+    client_id: str | None,
+    extra_data: dict[str, Any] | None,
+    source: str,
+    trace_id: str | None,
+    tenant_id: str | None,
+) -> dict[str, Any]:
     emit_structured_log(
         logger,
         level=logging.INFO,
@@ -115,12 +400,9 @@ async def submit_prompt(
     # NOTE: Must try relative import first. In ComfyUI runtime, `services` is not a top-level module.
     # Keeping this order prevents "No module named 'services.execution_budgets'" during queue submit.
     try:
-        from .execution_budgets import check_render_size, get_limiter
+        from .execution_budgets import check_render_size
     except ImportError:
-        from services.execution_budgets import (  # type: ignore
-            check_render_size,
-            get_limiter,
-        )
+        from services.execution_budgets import check_render_size
 
     # R33: Check render size budget
     check_render_size(prompt_workflow, trace_id=trace_id)
@@ -153,107 +435,102 @@ async def submit_prompt(
                 source,
             )
 
-    # R33: Acquire concurrency budget
-    limiter = get_limiter()
-    async with limiter.acquire(
-        source=source,
-        trace_id=trace_id,
-        tenant_id=tenant_id or get_current_tenant_id(),
-    ):
-        # Use aiohttp to post to local ComfyUI instance
-        # We assume we are running INSIDE ComfyUI process, but for HTTP access we use localhost
-        # unless we can hook internal server entry point.
-        # For MVP, HTTP loopback is safest and standard.
+    return payload
 
-        # R62: Lazy import aiohttp to avoid hard dependency crash at startup
-        try:
-            import aiohttp
-        except ImportError:
-            msg = "aiohttp is required for queue submission but not installed."
-            logger.error(msg)
-            raise APIError(
-                message=msg,
-                code=ErrorCode.DEPENDENCY_UNAVAILABLE,
-                status=503,
-                detail={"package": "aiohttp"},
-            )
 
-        url = f"{COMFYUI_URL}/prompt"
+async def _send_payload(
+    payload: dict[str, Any], source: str, trace_id: str | None
+) -> dict[str, Any]:
+    # Submit latency only; time spent waiting for an execution budget is excluded.
+    with metrics.timer("queue_submit_duration_ms", {"source": source}):
+        return await _post_payload(payload, source, trace_id)
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-
-                        # R102 Hook
-                        try:
-                            q_size = data.get("number", 0)
-                            from .security_telemetry import get_security_telemetry
-
-                            get_security_telemetry().record_queue_saturation(q_size)
-                        except:
-                            pass
-
-                        logger.info(
-                            f"Queued prompt: {data.get('prompt_id')} (source={source}, trace_id={trace_id})"
-                        )
-                        emit_structured_log(
-                            logger,
-                            level=logging.INFO,
-                            event="queue.submit.success",
-                            fields={
-                                "source": source,
-                                "trace_id": trace_id,
-                                "prompt_id": data.get("prompt_id"),
-                                "queue_number": data.get("number"),
-                            },
-                        )
-                        return data
-                    else:
-                        text = await resp.text()
-                        logger.error(
-                            f"Failed to queue prompt: {resp.status} - {text} (source={source}, trace_id={trace_id})"
-                        )
-                        emit_structured_log(
-                            logger,
-                            level=logging.ERROR,
-                            event="queue.submit.upstream_error",
-                            fields={
-                                "source": source,
-                                "trace_id": trace_id,
-                                "upstream_status": resp.status,
-                            },
-                        )
-                        # R61: Use APIError for queue failure
-                        raise APIError(
-                            message=f"Queue submission failed: {resp.status}",
-                            code=ErrorCode.QUEUE_SUBMIT_FAILED,
-                            status=502,
-                            detail={
-                                "upstream_status": resp.status,
-                                "upstream_response": text[:200],
-                            },
-                        )
-        except APIError:
-            raise
-        except Exception as e:
+
+async def _post_payload(
+    payload: dict[str, Any], source: str, trace_id: str | None
+) -> dict[str, Any]:
+    try:
+        transport = "in_process"
+        outcome = await _submit_in_process(payload)
+        if outcome is None:
+            transport = "http"
+            status, body = await _submit_http(payload, _import_aiohttp())
+        else:
+            status, body = outcome
+
+        if status == 200:
+            data = body
+
+            # R102 Hook
+            try:
+                q_size = data.get("number", 0)
+                from .security_telemetry import get_security_telemetry
+
+                get_security_telemetry().record_queue_saturation(q_size)
+            except:
+                pass
+
+            logger.info(
+                f"Queued prompt: {data.get('prompt_id')} (source={source}, trace_id={trace_id})"
+            )
+            emit_structured_log(
+                logger,
+                level=logging.INFO,
+                event="queue.submit.success",
+                fields={
+                    "source": source,
+                    "trace_id": trace_id,
+                    "prompt_id": data.get("prompt_id"),
+                    "queue_number": data.get("number"),
+                    "transport": transport,
+                },
+            )
+            return data
+        else:
+            text = body if isinstance(body, str) else json.dumps(body)
             logger.error(
-                f"Error submitting to queue: {e} (source={source}, trace_id={trace_id})"
+                f"Failed to queue prompt: {status} - {text} (source={source}, trace_id={trace_id})"
             )
             emit_structured_log(
                 logger,
                 level=logging.ERROR,
-                event="queue.submit.error",
+                event="queue.submit.upstream_error",
                 fields={
                     "source": source,
                     "trace_id": trace_id,
-                    "error_type": type(e).__name__,
+                    "upstream_status": status,
+                    "transport": transport,
                 },
             )
-            # R61: Wrap generic exceptions too
+            # R61: Use APIError for queue failure
             raise APIError(
-                message=f"Queue submission error: {str(e)}",
-                code=ErrorCode.INTERNAL_ERROR,
-                status=500,
+                message=f"Queue submission failed: {status}",
+                code=ErrorCode.QUEUE_SUBMIT_FAILED,
+                status=502,
+                detail={
+                    "upstream_status": status,
+                    "upstream_response": text[:200],
+                },
             )
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Error submitting to queue: {e} (source={source}, trace_id={trace_id})"
+        )
+        emit_structured_log(
+            logger,
+            level=logging.ERROR,
+            event="queue.submit.error",
+            fields={
+                "source": source,
+                "trace_id": trace_id,
+                "error_type": type(e).__name__,
+            },
+        )
+        # R61: Wrap generic exceptions too
+        raise APIError(
+            message=f"Queue submission error: {str(e)}",
+            code=ErrorCode.INTERNAL_ERROR,
+            status=500,
+        )
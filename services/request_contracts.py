@@ -17,6 +17,8 @@ MAX_TEMPLATE_ID_LENGTH = 64
 MAX_PROFILE_ID_LENGTH = 64
 MAX_INPUT_STRING_LENGTH = 2048
 MAX_BODY_SIZE = 65536
+MAX_BATCH_JOBS = 100
+MAX_BATCH_BODY_SIZE = 1048576
 MAX_TRACE_ID_LENGTH = 64
 
 WEBHOOK_JOB_REQUEST_CONTRACT: Dict[str, Any] = {
@@ -81,6 +83,12 @@ R144_ROUTE_FIXTURES: Dict[str, Any] = {
             "legacy_path": "/moltbot/webhook/submit",
             "auth": "Webhook Secret",
         },
+        {
+            "method": "POST",
+            "path": "/webhook/submit/batch",
+            "legacy_path": "/moltbot/webhook/submit/batch",
+            "auth": "Webhook Secret",
+        },
         {
             "method": "POST",
             "path": "/webhook/validate",
@@ -12,9 +12,8 @@ from __future__ import annotations
 import copy
 import json
 import logging
-import os
 import re
-import tempfile
+import sqlite3
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -23,6 +22,13 @@ from typing import Any, Dict, List, Optional
 
 from .execution_budgets import BudgetExceededError, check_render_size
 from .state_dir import get_state_dir
+from .state_store import (
+    STATE_DB_NAME,
+    StateRow,
+    StateTable,
+    get_state_store,
+    open_state_store,
+)
 from .tenant_context import (
     DEFAULT_TENANT_ID,
     is_multi_tenant_enabled,
@@ -37,6 +43,8 @@ except Exception:  # pragma: no cover
 logger = logging.getLogger("ComfyUI-OpenClaw.services.rewrite_recipes")
 
 STATE_SUBDIR = "rewrite_recipes"
+RECIPES_TABLE = "rewrite_recipes"
+LEGACY_RECIPES_MIGRATION = "rewrite_recipes/*.json"
 MAX_NAME_LENGTH = 120
 MAX_DESCRIPTION_LENGTH = 500
 MAX_TAG_COUNT = 24
@@ -314,14 +322,52 @@ def _assert_json_serializable(value: Any) -> None:
 
 
 class RewriteRecipeStore:
+    """
+    Recipe library backed by the ``rewrite_recipes`` state table.
+
+    The default library lives in the state directory's database. Any other
+    ``storage_dir`` gets its own ``state.db``. Legacy ``{id}.json`` files in
+    ``storage_dir`` are imported once.
+    """
+
     def __init__(self, storage_dir: Optional[Path] = None):
-        if storage_dir is None:
-            storage_dir = Path(get_state_dir()) / STATE_SUBDIR
-        self.storage_dir = Path(storage_dir)
+        self._default_dir = Path(get_state_dir()) / STATE_SUBDIR
+        self.storage_dir = Path(storage_dir) if storage_dir else self._default_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._table: StateTable | None = None
+        self._table_dir: Path | None = None
+
+    def _state(self) -> StateTable:
+        # Re-resolve when storage_dir is reassigned (tests point it elsewhere).
+        if self._table is None or self._table_dir != self.storage_dir:
+            storage_dir = self.storage_dir
+            if storage_dir == self._default_dir:
+                store = get_state_store()
+            else:
+                store = open_state_store(storage_dir / STATE_DB_NAME)
+            table = store.table(RECIPES_TABLE)
+            store.migrate_once(
+                LEGACY_RECIPES_MIGRATION,
+                lambda: self._import_legacy(table, storage_dir),
+            )
+            self._table, self._table_dir = table, storage_dir
+        return self._table
 
-    def _path_for(self, recipe_id: str) -> Path:
-        return self.storage_dir / f"{recipe_id}.json"
+    def _import_legacy(self, table: StateTable, storage_dir: Path) -> int:
+        rows = []
+        for path in sorted(storage_dir.glob("*.json")):
+            recipe = self._load_file(path)
+            if recipe is not None:
+                rows.append(self._to_row(recipe))
+        return table.put_many(rows)
+
+    def _to_row(self, recipe: RewriteRecipe) -> StateRow:
+        return StateRow(
+            key=recipe.id,
+            payload=recipe.to_dict(),
+            tenant_id=recipe.tenant_id,
+            updated_at=recipe.updated_at,
+        )
 
     def _resolve_tenant_id(self, tenant_id: Optional[str]) -> Optional[str]:
         if not is_multi_tenant_enabled():
@@ -344,27 +390,21 @@ class RewriteRecipeStore:
         tenant_id: Optional[str] = None,
     ) -> List[RewriteRecipe]:
         results: List[RewriteRecipe] = []
-        if not self.storage_dir.exists():
-            return results
-        for path in sorted(self.storage_dir.glob("*.json")):
-            recipe = self._load_file(path)
+        payloads = self._state().query(tenant_id=self._resolve_tenant_id(tenant_id))
+        for payload in payloads:
+            recipe = self._from_payload(payload)
             if recipe is None:
                 continue
-            if not self._is_visible(recipe, tenant_id):
-                continue
             if tag and tag.strip().lower() not in recipe.tags:
                 continue
             results.append(recipe)
-        results.sort(key=lambda item: item.updated_at, reverse=True)
         return results
 
     def get_recipe(
         self, recipe_id: str, *, tenant_id: Optional[str] = None
     ) -> Optional[RewriteRecipe]:
-        path = self._path_for(recipe_id)
-        if not path.exists():
-            return None
-        recipe = self._load_file(path)
+        payload = self._state().get(recipe_id)
+        recipe = None if payload is None else self._from_payload(payload)
         if recipe is None:
             return None
         if not self._is_visible(recipe, tenant_id):
@@ -379,26 +419,29 @@ class RewriteRecipeStore:
             )
         except Exception:
             recipe.tenant_id = DEFAULT_TENANT_ID
-        path = self._path_for(recipe.id)
-        payload = json.dumps(recipe.to_dict(), ensure_ascii=False, indent=2).encode(
-            "utf-8"
-        )
-        _atomic_write(path, payload)
+        self._state().put_many([self._to_row(recipe)])
         return True
 
     def delete_recipe(self, recipe_id: str, *, tenant_id: Optional[str] = None) -> bool:
-        path = self._path_for(recipe_id)
-        if not path.exists():
+        table = self._state()
+        payload = table.get(recipe_id)
+        if payload is None:
             return False
-        recipe = self._load_file(path)
+        recipe = self._from_payload(payload)
         if recipe is not None and not self._is_visible(recipe, tenant_id):
             return False
         try:
-            path.unlink()
-            return True
-        except OSError:
+            return table.delete(recipe_id)
+        except sqlite3.Error:
             return False
 
+    def _from_payload(self, data: dict[str, Any]) -> RewriteRecipe | None:
+        try:
+            return RewriteRecipe.from_dict(data)
+        except Exception as exc:
+            logger.warning("Failed to load rewrite recipe %s: %s", data.get("id"), exc)
+            return None
+
     def _load_file(self, path: Path) -> Optional[RewriteRecipe]:
         try:
             text = path.read_text(encoding="utf-8")
@@ -409,24 +452,6 @@ class RewriteRecipeStore:
             return None
 
 
-def _atomic_write(path: Path, content: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(
-        prefix=f"{path.name}.tmp.", dir=str(path.parent), text=False
-    )
-    try:
-        with os.fdopen(fd, "wb") as handle:
-            handle.write(content)
-        os.replace(tmp_path, path)
-    except Exception:
-        try:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-        except OSError:
-            pass
-        raise
-
-
 def _parse_json_pointer(path: str) -> List[str]:
     if not isinstance(path, str) or not path.startswith("/") or len(path) < 2:
         raise RecipeValidationError(
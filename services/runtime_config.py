@@ -7,6 +7,11 @@ and persistence.
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.runtime_config")
@@ -14,6 +19,9 @@ logger = logging.getLogger("ComfyUI-OpenClaw.services.runtime_config")
 try:
     from .config_layers import clear_runtime_overrides as _clear_runtime_overrides
     from .config_layers import get_runtime_overrides as _get_runtime_overrides
+    from .config_layers import (
+        get_runtime_overrides_revision as _get_runtime_overrides_revision,
+    )
     from .config_layers import resolve_layered_config
     from .config_layers import set_runtime_overrides as _set_runtime_overrides
 except ImportError:
@@ -24,6 +32,9 @@ except ImportError:
         from services.config_layers import (
             get_runtime_overrides as _get_runtime_overrides,  # type: ignore
         )
+        from services.config_layers import (
+            get_runtime_overrides_revision as _get_runtime_overrides_revision,
+        )
         from services.config_layers import resolve_layered_config  # type: ignore
         from services.config_layers import (
             set_runtime_overrides as _set_runtime_overrides,  # type: ignore
@@ -34,6 +45,10 @@ except ImportError:
         def _get_runtime_overrides(section):  # type: ignore
             return dict(_RUNTIME_OVERRIDES.get(section, {}))
 
+        def _get_runtime_overrides_revision():  # type: ignore
+            # Facade writers invalidate the snapshot cache explicitly.
+            return 0
+
         def _set_runtime_overrides(section, updates):  # type: ignore
             current = dict(_RUNTIME_OVERRIDES.get(section, {}))
             for key, value in updates.items():
@@ -225,6 +240,97 @@ def _merge_config_value(base: Any, patch: Any, key: str = "") -> Any:
     return _merge_config_value_impl(base, patch, key=key)
 
 
+@dataclass(frozen=True)
+class EffectiveConfigSnapshot:
+    """Immutable resolved LLM config for one tenant at one generation."""
+
+    generation: int
+    tenant_id: str
+    values: Mapping[str, Any]
+    sources: Mapping[str, str]
+
+
+# R21: effective-config snapshot cache. Resolution is keyed on a cheap stamp
+# (config file identity + relevant env + runtime override revision) so hot
+# paths skip the file read and layer resolution until something changes.
+_SNAPSHOT_ENV_KEYS: tuple[str, ...] = tuple(
+    sorted(
+        {name for pair in ENV_MAPPINGS.values() for name in pair if name}
+        | {
+            "OPENCLAW_MULTI_TENANT_ENABLED",
+            "MOLTBOT_MULTI_TENANT_ENABLED",
+            "OPENCLAW_MULTI_TENANT_ALLOW_CONFIG_FALLBACK",
+            "MOLTBOT_MULTI_TENANT_ALLOW_CONFIG_FALLBACK",
+        }
+    )
+)
+_SNAPSHOT_LOCK = threading.RLock()
+_SNAPSHOTS: dict[str, EffectiveConfigSnapshot] = {}
+_SNAPSHOT_STAMP: tuple[Any, ...] | None = None
+_SNAPSHOT_GENERATION = 0
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _config_file_stamp(path: str) -> tuple[Any, ...]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+
+
+def _snapshot_stamp() -> tuple[Any, ...]:
+    env = os.environ
+    return (
+        _config_file_stamp(CONFIG_FILE),
+        tuple(env.get(name) for name in _SNAPSHOT_ENV_KEYS),
+        _get_runtime_overrides_revision(),
+    )
+
+
+def _sync_snapshot_stamp() -> None:
+    global _SNAPSHOT_STAMP, _SNAPSHOT_GENERATION
+    stamp = _snapshot_stamp()
+    if stamp == _SNAPSHOT_STAMP:
+        return
+    if _SNAPSHOT_STAMP is not None:
+        _SNAPSHOT_GENERATION += 1
+    _SNAPSHOT_STAMP = stamp
+    _SNAPSHOTS.clear()
+
+
+def invalidate_effective_config() -> int:
+    """Drop cached snapshots (e.g. after an env reload); returns the new generation."""
+    global _SNAPSHOT_STAMP, _SNAPSHOT_GENERATION
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT_GENERATION += 1
+        _SNAPSHOT_STAMP = None
+        _SNAPSHOTS.clear()
+        return _SNAPSHOT_GENERATION
+
+
+def get_effective_config_generation() -> int:
+    """Current snapshot generation; usable as an invalidation key by other caches."""
+    with _SNAPSHOT_LOCK:
+        _sync_snapshot_stamp()
+        return _SNAPSHOT_GENERATION
+
+
 def get_runtime_overrides(tenant_id: Optional[str] = None) -> Dict[str, Any]:
     return _get_runtime_overrides(_runtime_override_section(tenant_id))
 
@@ -236,6 +342,7 @@ def set_runtime_overrides(
     if errors:
         return False, errors
     _set_runtime_overrides(_runtime_override_section(tenant_id), sanitized)
+    invalidate_effective_config()
     return True, []
 
 
@@ -243,12 +350,12 @@ def clear_runtime_overrides(
     keys: Optional[List[str]] = None, tenant_id: Optional[str] = None
 ) -> None:
     _clear_runtime_overrides(_runtime_override_section(tenant_id), keys=keys)
+    invalidate_effective_config()
 
 
-def get_effective_config(
-    tenant_id: Optional[str] = None,
-) -> Tuple[Dict[str, Any], Dict[str, str]]:
-    active_tenant = resolve_active_tenant_id(tenant_id)
+def _resolve_effective_config(
+    active_tenant: str,
+) -> tuple[dict[str, Any], dict[str, str]]:
     file_blob = _load_file_config()
     file_config = tenant_llm_config_view(file_blob, active_tenant)
     runtime_overrides = get_runtime_overrides(active_tenant)
@@ -266,6 +373,34 @@ def get_effective_config(
     )
 
 
+def get_effective_config_snapshot(
+    tenant_id: str | None = None,
+) -> EffectiveConfigSnapshot:
+    """Return the cached, read-only effective config for the active tenant."""
+    active_tenant = resolve_active_tenant_id(tenant_id)
+    with _SNAPSHOT_LOCK:
+        _sync_snapshot_stamp()
+        snapshot = _SNAPSHOTS.get(active_tenant)
+        if snapshot is None:
+            values, sources = _resolve_effective_config(active_tenant)
+            snapshot = EffectiveConfigSnapshot(
+                generation=_SNAPSHOT_GENERATION,
+                tenant_id=active_tenant,
+                values=_freeze(values),
+                sources=MappingProxyType(dict(sources)),
+            )
+            _SNAPSHOTS[active_tenant] = snapshot
+        return snapshot
+
+
+def get_effective_config(
+    tenant_id: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    snapshot = get_effective_config_snapshot(tenant_id)
+    # Callers own the returned dicts; hand out mutable copies of the snapshot.
+    return _thaw(snapshot.values), dict(snapshot.sources)
+
+
 def get_settings_schema() -> dict:
     return get_settings_schema_map()
 
@@ -314,7 +449,9 @@ def update_config(
     for key, value in sanitized.items():
         target[key] = _merge_config_value(target.get(key), value, key=key)
 
-    if _save_file_config(file_config):
+    saved = _save_file_config(file_config)
+    invalidate_effective_config()
+    if saved:
         logger.info("Updated config: %s (tenant=%s)", list(sanitized.keys()), tenant_id)
         return True, []
     return False, ["Failed to save config file"]
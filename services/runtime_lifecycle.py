@@ -50,6 +50,12 @@ def flush_runtime_state(*, stop_scheduler_runner: bool = True) -> Dict[str, Any]
         lambda: _import_scheduler_history().get_run_history().flush(),
     )
     _step("failover.flush", lambda: _import_failover().get_failover_state().flush())
+    _step(
+        "queue_submit.sessions.close",
+        lambda: _import_queue_submit().close_queue_submit_sessions(),
+    )
+    # Last, so audit entries emitted by the steps above are persisted too.
+    _step("audit.flush", lambda: _import_audit().flush_audit_log(timeout=5.0))
 
     return report
 
@@ -153,3 +159,19 @@ def _import_failover():
     except ImportError:
         import services.failover as _failover_mod  # type: ignore
     return _failover_mod
+
+
+def _import_queue_submit():
+    try:
+        from . import queue_submit as _queue_submit
+    except ImportError:
+        from services import queue_submit as _queue_submit
+    return _queue_submit
+
+
+def _import_audit():
+    try:
+        from . import audit as _audit
+    except ImportError:
+        from services import audit as _audit
+    return _audit
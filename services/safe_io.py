@@ -2,6 +2,7 @@
 Safe IO module for filesystem and URL operations.
 Implements S4: File/path/URL safety (deny-by-default).
 S51: Outbound endpoint policy v2 (scheme+port constraints).
+Outbound requests reuse pinned keep-alive connections (see outbound_pool).
 
 Any module that touches filesystem or outbound HTTP MUST use this layer.
 """
@@ -21,6 +22,12 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+from .outbound_pool import (
+    OutboundConnectionPool,
+    build_connection_pool,
+    build_validation_cache,
+)
+
 logger = logging.getLogger("ComfyUI-OpenClaw.services.safe_io")
 
 # IMPORTANT: Keep outbound header forwarding parity across JSON and stream
@@ -262,25 +269,38 @@ def _get_pack_version() -> str:
     return str(PACK_VERSION)
 
 
-def _apply_outbound_headers(
-    request: urllib.request.Request,
+def _outbound_header_items(
     *,
-    headers: Optional[dict],
-    content_type: Optional[str],
-) -> None:
-    request.add_header("User-Agent", f"ComfyUI-OpenClaw/{_get_pack_version()}")
+    headers: dict | None,
+    content_type: str | None,
+) -> list[tuple[str, str]]:
+    """Return the allowed outbound headers in application order."""
+    items = [("User-Agent", f"ComfyUI-OpenClaw/{_get_pack_version()}")]
     if content_type:
-        request.add_header("Content-Type", content_type)
+        items.append(("Content-Type", content_type))
 
     if not headers:
-        return
+        return items
 
     for key, value in headers.items():
         key_lower = key.lower()
         if any(key_lower.startswith(p) for p in ALLOWED_OUTBOUND_HEADER_PREFIXES):
-            request.add_header(key, value)
+            items.append((key, value))
         else:
             logger.debug("Skipping disallowed outbound header.")
+    return items
+
+
+def _apply_outbound_headers(
+    request: urllib.request.Request,
+    *,
+    headers: Optional[dict],
+    content_type: Optional[str],
+) -> None:
+    for key, value in _outbound_header_items(
+        headers=headers, content_type=content_type
+    ):
+        request.add_header(key, value)
 
 
 @dataclass
@@ -384,16 +404,21 @@ def _open_outbound_response(
 
     # CRITICAL: all outbound wrappers must use this seam so every redirect hop is
     # re-validated and re-pinned before connect; bypassing it reintroduces SSRF drift.
+    controls = {
+        "allow_hosts": allow_hosts,
+        "allow_any_public_host": allow_any_public_host,
+        "allow_loopback_hosts": allow_loopback_hosts,
+        "allow_insecure_base_url": allow_insecure_base_url,
+        "allow_private_network": allow_private_network,
+        "policy": policy,
+    }
     while True:
-        _scheme, _host, _port, pinned_ips = validate_outbound_url(
-            current_url,
-            allow_hosts=allow_hosts,
-            allow_any_public_host=allow_any_public_host,
-            allow_loopback_hosts=allow_loopback_hosts,
-            allow_insecure_base_url=allow_insecure_base_url,
-            allow_private_network=allow_private_network,
-            policy=policy,
-        )
+        validated, validation_key = _lookup_validated_target(current_url, controls)
+        if validated is None:
+            validated = _validate_and_cache_target(
+                current_url, validation_key, controls
+            )
+        scheme, host, port, pinned_ips = validated
 
         request = urllib.request.Request(
             current_url, data=current_body, method=current_method
@@ -403,7 +428,11 @@ def _open_outbound_response(
             headers=headers,
             content_type=content_type,
         )
-        opener = _build_pinned_opener(pinned_ips)
+        opener = _build_pinned_opener(
+            list(pinned_ips),
+            pool=_CONNECTION_POOL,
+            pool_key=outbound_pool_key(scheme, host, port, pinned_ips, policy),
+        )
 
         try:
             response = opener.open(request, timeout=timeout_sec)
@@ -416,6 +445,8 @@ def _open_outbound_response(
             http_error_mapper(error, current_method, current_url)
             raise AssertionError("http_error_mapper must raise")  # pragma: no cover
         except urllib.error.URLError as error:
+            # Connect/transport failure: force a fresh resolution next time.
+            _invalidate_validated_target(validation_key)
             url_error_mapper(error)
             raise AssertionError("url_error_mapper must raise")  # pragma: no cover
 
@@ -679,8 +710,244 @@ def validate_outbound_url(
     return (parsed.scheme, host, port, resolved_ips)
 
 
-def _build_pinned_opener(pinned_ips: list[str]) -> urllib.request.OpenerDirector:
-    """Build a safe opener pinned to specific IPs, trying them in order."""
+# ---------------------------------------------------------------------------
+# Outbound transport reuse (validation cache + keep-alive pool)
+# ---------------------------------------------------------------------------
+
+_VALIDATION_CACHE = build_validation_cache()
+_CONNECTION_POOL = build_connection_pool()
+
+# Transport-level failures on a reused keep-alive socket mean the peer closed
+# it while idle; the request never reached the server and is safe to resend.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+
+def _policy_fingerprint(policy: OutboundPolicy | None) -> tuple | None:
+    if policy is None:
+        return None
+    return (policy.label, policy.allowed_schemes, policy.allowed_ports)
+
+
+def _validation_cache_key(
+    url: str,
+    *,
+    allow_hosts: set[str] | None,
+    allow_any_public_host: bool,
+    allow_loopback_hosts: set[str] | None,
+    allow_insecure_base_url: bool,
+    allow_private_network: bool,
+    policy: OutboundPolicy | None,
+) -> tuple | None:
+    """
+    Build the validation-cache key for one hop.
+
+    Every input that can change validate_outbound_url's decision is part of
+    the key. Returns None for URLs that should always go through the full
+    validator (malformed input, credentials, unsupported schemes).
+    """
+    try:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return None
+        if parsed.username or parsed.password or not parsed.hostname:
+            return None
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    except ValueError:
+        return None
+    return (
+        parsed.scheme,
+        _normalize_host(parsed.hostname),
+        port,
+        (
+            None
+            if allow_hosts is None
+            else frozenset(_normalize_host(h) for h in allow_hosts)
+        ),
+        bool(allow_any_public_host),
+        frozenset(_normalize_host(h) for h in (allow_loopback_hosts or set())),
+        bool(allow_insecure_base_url),
+        bool(allow_private_network),
+        _policy_fingerprint(policy),
+    )
+
+
+def _lookup_validated_target(
+    url: str, controls: dict[str, Any]
+) -> tuple[tuple | None, tuple | None]:
+    """Return (cached validation or None, cache key) without touching DNS."""
+    key = _validation_cache_key(url, **controls)
+    if key is None:
+        return None, None
+    return _VALIDATION_CACHE.get(key), key
+
+
+def _validate_and_cache_target(
+    url: str, key: tuple | None, controls: dict[str, Any]
+) -> tuple:
+    """Run the full SSRF validator and remember a successful result."""
+    validated = tuple(validate_outbound_url(url, **controls))
+    if key is not None:
+        _VALIDATION_CACHE.put(key, validated)
+    return validated
+
+
+def _invalidate_validated_target(key: tuple | None) -> None:
+    if key is not None:
+        _VALIDATION_CACHE.invalidate(key)
+
+
+def outbound_pool_key(
+    scheme: str,
+    host: str,
+    port: int,
+    pinned_ips: Any,
+    policy: OutboundPolicy | None,
+) -> tuple:
+    """Connection reuse key; connections never cross pinned-IP sets."""
+    return (
+        scheme,
+        _normalize_host(host),
+        port,
+        tuple(pinned_ips),
+        _policy_fingerprint(policy),
+    )
+
+
+def get_outbound_transport_stats() -> dict[str, Any]:
+    """Return validation-cache and keep-alive pool counters for diagnostics."""
+    return {
+        "validation_cache": _VALIDATION_CACHE.stats(),
+        "connection_pool": _CONNECTION_POOL.stats(),
+    }
+
+
+def reset_outbound_transport() -> None:
+    """Drop cached validations and close idle pooled connections."""
+    _VALIDATION_CACHE.clear()
+    _CONNECTION_POOL.clear()
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back to the pool on close."""
+
+    _pool_release: Callable[[bool], None] | None = None
+
+    def close(self) -> None:
+        # http.client drops fp (or counts length down to zero) once the body
+        # is fully consumed; an early close leaves unread bytes on the socket,
+        # so that connection cannot carry another request.
+        consumed = self.fp is None or (not self.chunked and self.length == 0)
+        reusable = consumed and not self.will_close
+        try:
+            super().close()
+        finally:
+            release, self._pool_release = self._pool_release, None
+            if release is not None:
+                release(reusable)
+
+    def __del__(self) -> None:
+        # Finalizers must never re-enter the pool lock; the orphaned
+        # connection is closed when it is collected.
+        self._pool_release = None
+        super().__del__()
+
+
+def _pooled_do_open(
+    handler: urllib.request.AbstractHTTPHandler,
+    http_class: type,
+    req: urllib.request.Request,
+    *,
+    pool: OutboundConnectionPool,
+    pool_key: tuple,
+    **http_conn_args: Any,
+) -> _PooledHTTPResponse:
+    """
+    Keep-alive variant of AbstractHTTPHandler.do_open.
+
+    Mirrors urllib's header handling but leaves the connection open and
+    routes it through the pool instead of forcing "Connection: close".
+    """
+    host = req.host
+    if not host:
+        raise urllib.error.URLError("no host given")
+
+    headers = dict(req.unredirected_hdrs)
+    headers.update({k: v for k, v in req.headers.items() if k not in headers})
+    headers["Connection"] = "keep-alive"
+    headers = {name.title(): val for name, val in headers.items()}
+
+    def _new_connection():
+        conn = http_class(host, timeout=req.timeout, **http_conn_args)
+        conn.set_debuglevel(getattr(handler, "_debuglevel", 0))
+        return conn
+
+    attempts = 0
+    while True:
+        attempts += 1
+        conn, reused = pool.acquire(pool_key, _new_connection)
+        if reused:
+            conn.timeout = req.timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(req.timeout)
+        conn.response_class = _PooledHTTPResponse
+        try:
+            try:
+                conn.request(
+                    req.get_method(),
+                    req.selector,
+                    req.data,
+                    headers,
+                    encode_chunked=req.has_header("Transfer-encoding"),
+                )
+            except OSError as err:
+                if (
+                    reused
+                    and attempts == 1
+                    and isinstance(err, _STALE_CONNECTION_ERRORS)
+                ):
+                    pool.discard(conn)
+                    continue
+                raise urllib.error.URLError(err)
+            response: _PooledHTTPResponse = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            pool.discard(conn)
+            if reused and attempts == 1:
+                continue
+            raise
+        except BaseException:
+            pool.discard(conn)
+            raise
+        break
+
+    response._pool_release = lambda reusable: pool.release(pool_key, conn, reusable)
+    response.url = req.get_full_url()
+    # urllib contract: addinfourl-style callers read the reason via .msg.
+    response.msg = response.reason  # type: ignore[assignment]
+    return response
+
+
+def _build_pinned_opener(
+    pinned_ips: list[str],
+    *,
+    pool: OutboundConnectionPool | None = None,
+    pool_key: tuple | None = None,
+) -> urllib.request.OpenerDirector:
+    """
+    Build a safe opener pinned to specific IPs, trying them in order.
+
+    When a pool is supplied, connections are drawn from and returned to it
+    under pool_key; pool_key must encode the pinned IP set.
+    """
+    pool_binding = (
+        (pool, pool_key)
+        if pool is not None and pool_key is not None and pool.enabled
+        else None
+    )
 
     class PinnedHTTPConnection(http.client.HTTPConnection):
         def connect(self):
@@ -722,6 +989,14 @@ def _build_pinned_opener(pinned_ips: list[str]) -> urllib.request.OpenerDirector
 
     class PinnedHTTPHandler(urllib.request.HTTPHandler):
         def http_open(self, req):
+            if pool_binding is not None:
+                return _pooled_do_open(
+                    self,
+                    PinnedHTTPConnection,
+                    req,
+                    pool=pool_binding[0],
+                    pool_key=pool_binding[1],
+                )
             return self.do_open(PinnedHTTPConnection, req)
 
     class PinnedHTTPSHandler(urllib.request.HTTPSHandler):
@@ -732,6 +1007,15 @@ def _build_pinned_opener(pinned_ips: list[str]) -> urllib.request.OpenerDirector
             if getattr(self, "_check_hostname", None) is not None:
                 kwargs["check_hostname"] = self._check_hostname
 
+            if pool_binding is not None:
+                return _pooled_do_open(
+                    self,
+                    PinnedHTTPSConnection,
+                    req,
+                    pool=pool_binding[0],
+                    pool_key=pool_binding[1],
+                    **kwargs,
+                )
             return self.do_open(PinnedHTTPSConnection, req, **kwargs)
 
     class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
@@ -0,0 +1,389 @@
+"""
+Asyncio twin of the safe_io outbound request helpers.
+
+Same SSRF contract as safe_io (validation, DNS pinning, per-hop redirect
+re-validation, header allowlist, structured HTTP errors), but runs natively
+on the event loop through aiohttp so in-flight provider calls do not hold a
+worker thread.
+
+Each (scheme, host, port, pinned-IP set, policy) target gets one long-lived
+ClientSession whose connector can only dial the validated IPs; sessions are
+shared by every caller on the same event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import socket
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from .safe_io import (
+    OutboundPolicy,
+    SafeIOHTTPError,
+    _invalidate_validated_target,
+    _lookup_validated_target,
+    _next_redirect_state,
+    _outbound_header_items,
+    _validate_and_cache_target,
+    outbound_pool_key,
+)
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.safe_io_async")
+
+_MAX_SESSIONS_PER_LOOP = 32
+_KEEPALIVE_TIMEOUT_SEC = 30.0
+_CONNECTIONS_PER_TARGET = 64
+_ERROR_BODY_PREVIEW_BYTES = 4096
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ModuleNotFoundError as exc:  # pragma: no cover - minimal env path
+        if exc.name != "aiohttp":
+            raise
+        raise RuntimeError("aiohttp not available")
+    return aiohttp
+
+
+class _PinnedResolver:
+    """aiohttp resolver that only ever returns the validated IP set."""
+
+    def __init__(self, host: str, port: int, pinned_ips: tuple[str, ...]):
+        self._host = host
+        self._port = port
+        self._pinned_ips = pinned_ips
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> list[dict[str, Any]]:
+        # CRITICAL: never fall back to system DNS here; a second lookup after
+        # validation would reopen DNS-rebinding risk.
+        if host != self._host:
+            raise OSError(f"Resolver pinned to {self._host}, refused {host}")
+        results = []
+        for ip in self._pinned_ips:
+            ip_family = socket.AF_INET6 if ":" in ip else socket.AF_INET
+            if family not in (socket.AF_UNSPEC, ip_family):
+                continue
+            results.append(
+                {
+                    "hostname": host,
+                    "host": ip,
+                    "port": port or self._port,
+                    "family": ip_family,
+                    "proto": 0,
+                    "flags": socket.AI_NUMERICHOST,
+                }
+            )
+        if not results:
+            raise OSError(f"No validated IPs to connect to for {host}")
+        return results
+
+    async def close(self) -> None:
+        return None
+
+
+class _LoopSessions:
+    """Per-event-loop LRU of pinned ClientSessions."""
+
+    def __init__(self) -> None:
+        self.sessions: OrderedDict[tuple, Any] = OrderedDict()
+        self.closing: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_LOOP_SESSIONS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSessions] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_pinned_session(key: tuple, host: str, port: int, pinned_ips: tuple[str, ...]):
+    aiohttp = _import_aiohttp()
+    loop = asyncio.get_running_loop()
+    state = _LOOP_SESSIONS.get(loop)
+    if state is None:
+        state = _LoopSessions()
+        _LOOP_SESSIONS[loop] = state
+
+    session = state.sessions.get(key)
+    if session is not None and not session.closed:
+        state.sessions.move_to_end(key)
+        state.hits += 1
+        return session
+
+    state.misses += 1
+    connector = aiohttp.TCPConnector(
+        resolver=_PinnedResolver(host, port, pinned_ips),
+        use_dns_cache=False,
+        limit=_CONNECTIONS_PER_TARGET,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT_SEC,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        # Parity with safe_io's ProxyHandler({}): never route via env proxies.
+        trust_env=False,
+        auto_decompress=True,
+    )
+    state.sessions[key] = session
+    while len(state.sessions) > _MAX_SESSIONS_PER_LOOP:
+        _old_key, old_session = state.sessions.popitem(last=False)
+        state.evictions += 1
+        task = loop.create_task(old_session.close())
+        state.closing.add(task)
+        task.add_done_callback(state.closing.discard)
+    return session
+
+
+async def close_async_transport() -> None:
+    """Close every pinned session owned by the running event loop."""
+    state = _LOOP_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if state is None:
+        return
+    for session in state.sessions.values():
+        with contextlib.suppress(Exception):
+            await session.close()
+
+
+def get_async_transport_stats() -> dict[str, Any]:
+    """Return session reuse counters for the running event loop."""
+    try:
+        state = _LOOP_SESSIONS.get(asyncio.get_running_loop())
+    except RuntimeError:
+        state = None
+    if state is None:
+        return {"sessions": 0, "hits": 0, "misses": 0, "evictions": 0}
+    return {
+        "sessions": len(state.sessions),
+        "hits": state.hits,
+        "misses": state.misses,
+        "evictions": state.evictions,
+    }
+
+
+async def _validated_target(url: str, controls: dict[str, Any]) -> tuple[tuple, Any]:
+    validated, key = _lookup_validated_target(url, controls)
+    if validated is None:
+        try:
+            from .async_utils import run_io_in_thread
+        except ImportError:  # pragma: no cover
+            from services.async_utils import run_io_in_thread
+
+        # getaddrinfo blocks; keep cache misses off the event loop.
+        validated = await run_io_in_thread(
+            _validate_and_cache_target, url, key, controls
+        )
+    return validated, key
+
+
+async def _open_async_outbound_response(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None,
+    headers: dict | None,
+    content_type: str | None,
+    timeout_sec: float,
+    max_redirects: int,
+    controls: dict[str, Any],
+):
+    aiohttp = _import_aiohttp()
+    current_url = url
+    current_method = method
+    current_body = body
+    redirects_followed = 0
+    request_headers = dict(
+        _outbound_header_items(headers=headers, content_type=content_type)
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=timeout_sec, sock_read=timeout_sec
+    )
+
+    # CRITICAL: mirror safe_io._open_outbound_response; every redirect hop is
+    # re-validated and dialed only through a session pinned to that hop.
+    while True:
+        validated, validation_key = await _validated_target(current_url, controls)
+        scheme, host, port, pinned_ips = validated
+        session = _get_pinned_session(
+            outbound_pool_key(scheme, host, port, pinned_ips, controls["policy"]),
+            host,
+            port,
+            tuple(pinned_ips),
+        )
+        request_kwargs: dict[str, Any] = {
+            "headers": request_headers,
+            "allow_redirects": False,
+            "timeout": timeout,
+        }
+        if current_body is not None:
+            request_kwargs["data"] = current_body
+        try:
+            response = await session.request(
+                current_method, current_url, **request_kwargs
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+            _invalidate_validated_target(validation_key)
+            raise RuntimeError(f"Request failed: {error}")
+
+        if response.status >= 400:
+            try:
+                preview = await response.content.read(_ERROR_BODY_PREVIEW_BYTES)
+            except Exception:
+                preview = b""
+            finally:
+                response.release()
+            raise SafeIOHTTPError(
+                status_code=response.status,
+                reason=str(response.reason or "HTTPError"),
+                method=current_method,
+                url=current_url,
+                headers={str(k): str(v) for k, v in response.headers.items()},
+                body=preview.decode("utf-8", errors="replace") if preview else None,
+            )
+
+        try:
+            redirect_state = _next_redirect_state(
+                response=response,
+                code=response.status,
+                current_url=current_url,
+                current_method=current_method,
+                current_body=current_body,
+                redirects_followed=redirects_followed,
+                max_redirects=max_redirects,
+                redirect_error_factory=lambda limit: RuntimeError(
+                    f"Too many redirects: {limit}"
+                ),
+            )
+        except Exception:
+            response.release()
+            raise
+        if redirect_state is None:
+            return response
+
+        response.release()
+        current_url = redirect_state.url
+        current_method = redirect_state.method
+        current_body = redirect_state.body
+        redirects_followed = redirect_state.redirects_followed
+
+
+async def async_safe_request_json(
+    method: str,
+    url: str,
+    json_body: Any = None,
+    *,
+    raw_body: bytes | None = None,
+    allow_hosts: set[str] | None = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: set[str] | None = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+    headers: dict | None = None,
+    content_type: str = "application/json",
+    timeout_sec: int = 10,
+    max_response_bytes: int = 1_000_000,
+    max_redirects: int = 0,
+    policy: OutboundPolicy | None = None,
+) -> dict:
+    """Async counterpart of safe_io.safe_request_json."""
+    if json_body is not None and raw_body is not None:
+        raise ValueError("safe_request_json accepts either json_body or raw_body")
+    current_body = raw_body
+    if json_body is not None:
+        current_body = json.dumps(json_body).encode("utf-8")
+    response = await _open_async_outbound_response(
+        method,
+        url,
+        body=current_body,
+        headers=headers,
+        content_type=content_type,
+        timeout_sec=timeout_sec,
+        max_redirects=max_redirects,
+        controls={
+            "allow_hosts": allow_hosts,
+            "allow_any_public_host": allow_any_public_host,
+            "allow_loopback_hosts": allow_loopback_hosts,
+            "allow_insecure_base_url": allow_insecure_base_url,
+            "allow_private_network": allow_private_network,
+            "policy": policy,
+        },
+    )
+    try:
+        data = await response.content.read(max_response_bytes)
+    except Exception as error:
+        response.close()
+        raise RuntimeError(f"Request failed: {error}")
+    finally:
+        response.release()
+    try:
+        parsed: dict = json.loads(data.decode("utf-8"))
+        return parsed
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {"raw_response": data.decode("utf-8", errors="replace")[:1000]}
+
+
+async def async_safe_request_text_stream(
+    method: str,
+    url: str,
+    json_body: Any = None,
+    *,
+    allow_hosts: set[str] | None = None,
+    allow_any_public_host: bool = False,
+    allow_loopback_hosts: set[str] | None = None,
+    allow_insecure_base_url: bool = False,
+    allow_private_network: bool = False,
+    headers: dict | None = None,
+    timeout_sec: int = 10,
+    max_line_bytes: int = 64 * 1024,
+    max_redirects: int = 0,
+    policy: OutboundPolicy | None = None,
+) -> AsyncGenerator[str, None]:
+    """Async counterpart of safe_io.safe_request_text_stream."""
+    current_body = json.dumps(json_body).encode("utf-8") if json_body else None
+    response = await _open_async_outbound_response(
+        method,
+        url,
+        body=current_body,
+        headers=headers,
+        content_type="application/json",
+        timeout_sec=timeout_sec,
+        max_redirects=max_redirects,
+        controls={
+            "allow_hosts": allow_hosts,
+            "allow_any_public_host": allow_any_public_host,
+            "allow_loopback_hosts": allow_loopback_hosts,
+            "allow_insecure_base_url": allow_insecure_base_url,
+            "allow_private_network": allow_private_network,
+            "policy": policy,
+        },
+    )
+    completed = False
+    try:
+        while True:
+            try:
+                line = await response.content.readline()
+            except ValueError:
+                raise RuntimeError(
+                    f"Stream line exceeds max_line_bytes ({max_line_bytes})"
+                )
+            if not line:
+                completed = True
+                break
+            if len(line) > max_line_bytes:
+                raise RuntimeError(
+                    f"Stream line exceeds max_line_bytes ({max_line_bytes})"
+                )
+            yield line.decode("utf-8", errors="replace")
+    finally:
+        # An abandoned stream leaves unread bytes; drop that connection.
+        if not completed:
+            response.close()
+        response.release()
@@ -1,24 +1,33 @@
 """
 Scheduler Run History (R9).
-Append-only run log with cursor/resume semantics.
+Append-only run log with cursor/resume semantics, journaled to JSONL.
 """
 
+import contextlib
 import json
 import logging
 import os
 import tempfile
 import threading
 import time
+from collections import deque
+from collections.abc import Iterable, Sequence
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, TextIO
 
 from ..state_dir import get_state_dir
 
 logger = logging.getLogger("ComfyUI-OpenClaw.services.scheduler")
 
-# History file name
+# History file names (runs.json is the legacy snapshot, migrated on load)
 RUNS_FILE = "runs.json"
+JOURNAL_FILE = "runs.jsonl"
+
+# Compact once the journal has this many times more lines than live runs
+COMPACT_RATIO = 4
+COMPACT_MIN_LINES = 1000
 
 # Retention limits
 MAX_RUNS = 10000
@@ -72,33 +81,53 @@ class RunRecord:
 
 
 def _get_history_path() -> str:
-    """Get the path to the history file."""
+    """Get the path to the legacy (pre-journal) history snapshot."""
     state_dir = get_state_dir()
     scheduler_dir = os.path.join(state_dir, "scheduler")
     os.makedirs(scheduler_dir, mode=0o700, exist_ok=True)
     return os.path.join(scheduler_dir, RUNS_FILE)
 
 
+def _get_journal_path() -> str:
+    """Get the path to the append-only run journal (next to the legacy file)."""
+    return os.path.join(os.path.dirname(_get_history_path()), JOURNAL_FILE)
+
+
 class RunHistory:
     """
     Append-only run history with bounded retention.
     Thread-safe through locking.
+
+    Storage is a JSONL journal: one "add" line per new run and one "update"
+    line per change, so each write is O(1). Loading replays the journal (a
+    torn trailing line from a crash is skipped). Once the journal holds
+    COMPACT_RATIO times more lines than live runs it is rewritten atomically
+    with one line per retained run.
     """
 
     def __init__(self):
         self._lock = threading.RLock()
-        self._runs: List[RunRecord] = []
+        self._runs: deque[RunRecord] = deque()  # oldest first
+        self._by_id: dict[str, RunRecord] = {}
+        self._by_schedule: dict[str, deque[RunRecord]] = {}
         self._idempotency_index: Dict[str, str] = {}  # key -> run_id
+        self._journal: TextIO | None = None
+        self._journal_lines = 0
         self._loaded = False
 
     def _ensure_loaded(self) -> None:
-        """Lazy-load history from disk."""
+        """Lazy-load history from disk (journal replay, or legacy snapshot)."""
         if self._loaded:
             return
+        self._loaded = True
+
+        journal_path = _get_journal_path()
+        if os.path.exists(journal_path):
+            self._replay(journal_path)
+            return
 
         path = _get_history_path()
         if not os.path.exists(path):
-            self._loaded = True
             return
 
         try:
@@ -108,30 +137,128 @@ class RunHistory:
             if isinstance(data, list):
                 for item in data:
                     try:
-                        run = RunRecord.from_dict(item)
-                        self._runs.append(run)
-                        self._idempotency_index[run.idempotency_key] = run.run_id
+                        self._index(RunRecord.from_dict(item))
                     except Exception as e:
                         logger.warning(f"Skipping invalid run record: {e}")
-
+            self._enforce_retention()
             logger.info(f"Loaded {len(self._runs)} run records from history")
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to load run history: {e}")
+            return
 
-        self._loaded = True
+        # One-time migration: the journal supersedes the legacy snapshot.
+        if self._save():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def _replay(self, journal_path: str) -> None:
+        skipped = 0
+        try:
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    self._journal_lines += 1
+                    try:
+                        self._apply(json.loads(line))
+                    except Exception as e:
+                        skipped += 1
+                        logger.warning(f"Skipping invalid run journal entry: {e}")
+        except OSError as e:
+            logger.error(f"Failed to load run history: {e}")
+            return
+        logger.info(
+            f"Replayed {self._journal_lines} journal entries "
+            f"({len(self._runs)} runs retained)"
+        )
+        if skipped:
+            # CRITICAL: rewrite before appending; a torn tail line would
+            # otherwise swallow the next entry written after it.
+            self._save()
+
+    def _apply(self, entry: dict[str, Any]) -> None:
+        op = entry.get("op")
+        if op == "add":
+            run = RunRecord.from_dict(entry["run"])
+            if run.idempotency_key not in self._idempotency_index:
+                self._index(run)
+                self._enforce_retention()
+        elif op == "update":
+            target = self._by_id.get(entry["run_id"])
+            if target is not None:
+                for key, value in entry.get("fields", {}).items():
+                    if hasattr(target, key):
+                        setattr(target, key, value)
+
+    def _index(self, run: RunRecord) -> None:
+        self._runs.append(run)
+        self._by_id[run.run_id] = run
+        self._by_schedule.setdefault(run.schedule_id, deque()).append(run)
+        self._idempotency_index[run.idempotency_key] = run.run_id
+
+    def _drop_oldest(self) -> None:
+        run = self._runs.popleft()
+        if self._by_id.get(run.run_id) is run:
+            del self._by_id[run.run_id]
+        if self._idempotency_index.get(run.idempotency_key) == run.run_id:
+            del self._idempotency_index[run.idempotency_key]
+        per_schedule = self._by_schedule.get(run.schedule_id)
+        if per_schedule:
+            # Insertion order is shared, so the global oldest is the schedule's oldest.
+            per_schedule.popleft()
+            if not per_schedule:
+                del self._by_schedule[run.schedule_id]
+
+    def _open_journal(self) -> TextIO:
+        if self._journal is None:
+            # Held open across appends; closed on compaction and flush.
+            self._journal = open(  # noqa: SIM115
+                _get_journal_path(), "a", encoding="utf-8"
+            )
+        return self._journal
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            with contextlib.suppress(OSError):
+                self._journal.close()
+            self._journal = None
+
+    def _append(self, entry: dict[str, Any]) -> bool:
+        """Append one journal entry, compacting when the journal is mostly dead."""
+        try:
+            line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+            journal = self._open_journal()
+            journal.write(line + "\n")
+            journal.flush()
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to append run history: {e}")
+            self._close_journal()
+            return False
+        self._journal_lines += 1
+        if self._journal_lines > COMPACT_MIN_LINES and self._journal_lines > (
+            COMPACT_RATIO * len(self._runs)
+        ):
+            self._save()
+        return True
 
     def _save(self) -> bool:
-        """Save history to disk."""
-        path = _get_history_path()
+        """Compact: atomically rewrite the journal with one line per retained run."""
+        path = _get_journal_path()
         try:
-            data = [r.to_dict() for r in self._runs]
             history_dir = os.path.dirname(path) or "."
             fd, temp_path = tempfile.mkstemp(
-                suffix=".json", dir=history_dir, prefix="runs_"
+                suffix=".jsonl", dir=history_dir, prefix="runs_"
             )
             try:
                 with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    for r in self._runs:
+                        f.write(
+                            json.dumps(
+                                {"op": "add", "run": r.to_dict()},
+                                ensure_ascii=False,
+                                separators=(",", ":"),
+                            )
+                            + "\n"
+                        )
+                self._close_journal()
                 os.replace(temp_path, path)
             except Exception:
                 try:
@@ -140,6 +267,7 @@ class RunHistory:
                 except Exception:
                     pass
                 raise
+            self._journal_lines = len(self._runs)
             return True
         except (OSError, TypeError) as e:
             logger.error(f"Failed to save run history: {e}")
@@ -153,17 +281,16 @@ class RunHistory:
             return self._save()
 
     def _enforce_retention(self) -> None:
-        """Apply retention limits."""
-        # Age-based retention
+        """Apply retention limits incrementally from the oldest end."""
+        # Age-based retention: runs are recorded in start order, so expiry
+        # only ever trims the head.
         cutoff = time.time() - (RETENTION_DAYS * 86400)
-        self._runs = [r for r in self._runs if self._parse_ts(r.started_at) > cutoff]
+        while self._runs and self._parse_ts(self._runs[0].started_at) <= cutoff:
+            self._drop_oldest()
 
         # Count-based retention (keep newest)
-        if len(self._runs) > MAX_RUNS:
-            self._runs = self._runs[-MAX_RUNS:]
-
-        # Rebuild idempotency index
-        self._idempotency_index = {r.idempotency_key: r.run_id for r in self._runs}
+        while len(self._runs) > MAX_RUNS:
+            self._drop_oldest()
 
     @staticmethod
     def _parse_ts(iso_str: str) -> float:
@@ -184,33 +311,28 @@ class RunHistory:
                 logger.debug(f"Skipping duplicate run: {run.idempotency_key}")
                 return False
 
-            self._runs.append(run)
-            self._idempotency_index[run.idempotency_key] = run.run_id
+            self._index(run)
             self._enforce_retention()
-            return self._save()
+            return self._append({"op": "add", "run": run.to_dict()})
 
     def update_run(self, run_id: str, **updates) -> bool:
         """Update an existing run record."""
         with self._lock:
             self._ensure_loaded()
 
-            for run in self._runs:
-                if run.run_id == run_id:
-                    for key, value in updates.items():
-                        if hasattr(run, key):
-                            setattr(run, key, value)
-                    return self._save()
-
-            return False
+            run = self._by_id.get(run_id)
+            if run is None:
+                return False
+            fields = {k: v for k, v in updates.items() if hasattr(run, k)}
+            for key, value in fields.items():
+                setattr(run, key, value)
+            return self._append({"op": "update", "run_id": run_id, "fields": fields})
 
     def get_run(self, run_id: str) -> Optional[RunRecord]:
         """Get a run by ID."""
         with self._lock:
             self._ensure_loaded()
-            for run in self._runs:
-                if run.run_id == run_id:
-                    return run
-            return None
+            return self._by_id.get(run_id)
 
     def get_by_idempotency_key(self, key: str) -> Optional[RunRecord]:
         """Get a run by idempotency key."""
@@ -238,25 +360,23 @@ class RunHistory:
         with self._lock:
             self._ensure_loaded()
 
-            runs = self._runs
-
-            if schedule_id:
-                runs = [r for r in runs if r.schedule_id == schedule_id]
-
-            if status:
-                runs = [r for r in runs if r.status == status]
+            runs: Sequence[RunRecord] = (
+                self._by_schedule.get(schedule_id, ()) if schedule_id else self._runs
+            )
 
             # Newest first
-            runs = list(reversed(runs))
+            newest: Iterable[RunRecord] = reversed(runs)
+            if status:
+                newest = (r for r in newest if r.status == status)
 
-            return runs[offset : offset + limit]
+            return list(islice(newest, offset, offset + limit))
 
     def count_runs(self, schedule_id: Optional[str] = None) -> int:
         """Count runs."""
         with self._lock:
             self._ensure_loaded()
             if schedule_id:
-                return sum(1 for r in self._runs if r.schedule_id == schedule_id)
+                return len(self._by_schedule.get(schedule_id, ()))
             return len(self._runs)
 
 
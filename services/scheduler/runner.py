@@ -1,18 +1,24 @@
 """
 Scheduler Runner (R4).
 Background tick loop for executing due schedules.
+
+Due checks are driven by a heap of precomputed next-fire deadlines: a schedule
+is only evaluated once its deadline passes, and deadlines are recomputed only
+when the schedule changes or fires. The loop sleeps until the earliest deadline.
 """
 
 import asyncio
 import hashlib
+import heapq
 import logging
 import os
 import random
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Awaitable, Callable, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
 
+from ..metrics import metrics
 from ..runtime_config import get_scheduler_config
 from .history import RunRecord, get_run_history
 from .models import Schedule, TriggerType
@@ -23,6 +29,9 @@ logger = logging.getLogger("ComfyUI-OpenClaw.services.scheduler")
 SCHEDULER_EXECUTION_EMBEDDED = "embedded"
 SCHEDULER_EXECUTION_DELEGATED = "delegated"
 
+# Never re-wake faster than this, even when a deadline is already past.
+MIN_WAIT_SEC = 1.0
+
 
 def resolve_scheduler_execution_mode(config: Optional[dict] = None) -> str:
     """
@@ -115,6 +124,27 @@ def is_cron_due(cron_expr: str, last_tick_ts: Optional[float], now: datetime) ->
         return _basic_cron_match(cron_expr, now)
 
 
+def next_cron_fire_ts(
+    cron_expr: str, last_tick_ts: float | None, now: datetime
+) -> float:
+    """
+    Next fire time (epoch seconds) for a cron schedule, from the same base as
+    is_cron_due. Without croniter, basic matching is per-minute, so the next
+    check is the next minute boundary.
+    """
+    try:
+        from croniter import croniter
+    except ImportError:
+        return float((int(now.timestamp() // 60) + 1) * 60)
+
+    if last_tick_ts:
+        base = datetime.fromtimestamp(last_tick_ts, tz=timezone.utc)
+    else:
+        base = now.replace(second=0, microsecond=0) - timedelta(minutes=1)
+    next_fire: datetime = croniter(cron_expr, base).get_next(datetime)
+    return next_fire.timestamp()
+
+
 def _basic_cron_match(cron_expr: str, now: datetime) -> bool:
     """Basic cron matching without croniter (limited functionality)."""
     parts = cron_expr.strip().split()
@@ -157,6 +187,17 @@ def is_interval_due(
     return elapsed >= interval_sec
 
 
+def _schedule_fingerprint(schedule: Schedule) -> tuple:
+    """Fields that determine a schedule's next fire time."""
+    return (
+        schedule.trigger_type,
+        schedule.cron_expr,
+        schedule.interval_sec,
+        schedule.last_tick_ts,
+        schedule.enabled,
+    )
+
+
 class SchedulerRunner:
     """
     Background scheduler runner.
@@ -185,6 +226,33 @@ class SchedulerRunner:
 
         self._store = get_schedule_store()
 
+        # Next-fire index: heap of (deadline_ts, seq, schedule_id). A heap entry
+        # is live only while it matches _deadlines[schedule_id] = (deadline, seq,
+        # fingerprint); superseded entries are skipped when popped.
+        self._heap: list[tuple[float, int, str]] = []
+        self._deadlines: dict[str, tuple[float, int, tuple]] = {}
+        self._schedules: dict[str, Schedule] = {}
+        self._heap_seq = 0
+        self._synced_revision: int | None = None
+        self._due_since: dict[str, float] = {}
+
+        # Metrics
+        self._fires = 0
+        self._last_lateness_sec = 0.0
+        self._max_lateness_sec = 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Next-fire heap diagnostics."""
+        next_deadline = self._peek_deadline()
+        return {
+            "pending": len(self._deadlines),
+            "heap_size": len(self._heap),
+            "next_deadline_ts": next_deadline,
+            "fires": self._fires,
+            "last_lateness_sec": round(self._last_lateness_sec, 3),
+            "max_lateness_sec": round(self._max_lateness_sec, 3),
+        }
+
     def is_execution_delegated(self, config: Optional[dict] = None) -> bool:
         """Return True when in-process scheduler execution is delegated/blocked."""
         return resolve_scheduler_execution_mode(config) == SCHEDULER_EXECUTION_DELEGATED
@@ -381,8 +449,9 @@ class SchedulerRunner:
             except Exception as e:
                 logger.error(f"Scheduler tick error: {e}", exc_info=True)
 
-            # Wait for next tick
-            self._stop_event.wait(timeout=self._tick_interval)
+            # Sleep until the earliest deadline (bounded by the tick interval so
+            # schedule edits made through the store are picked up).
+            self._stop_event.wait(timeout=self._next_wait_sec())
 
         logger.debug("Scheduler loop exited")
 
@@ -420,9 +489,119 @@ class SchedulerRunner:
                 f"Skipped {skipped_count} missed schedules due to startup policy."
             )
 
-    def _tick(self) -> None:
-        """Process one scheduler tick."""
-        now = datetime.now(timezone.utc)
+    def _push_deadline(self, schedule: Schedule, deadline: float) -> None:
+        self._heap_seq += 1
+        self._deadlines[schedule.schedule_id] = (
+            deadline,
+            self._heap_seq,
+            _schedule_fingerprint(schedule),
+        )
+        heapq.heappush(self._heap, (deadline, self._heap_seq, schedule.schedule_id))
+
+    def _peek_deadline(self) -> float | None:
+        while self._heap:
+            deadline, seq, schedule_id = self._heap[0]
+            entry = self._deadlines.get(schedule_id)
+            if entry is not None and entry[1] == seq:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def _next_wait_sec(self) -> float:
+        deadline = self._peek_deadline()
+        if deadline is None:
+            return self._tick_interval
+        return min(self._tick_interval, max(MIN_WAIT_SEC, deadline - time.time()))
+
+    def _next_fire_ts(self, schedule: Schedule, now: datetime) -> float | None:
+        if schedule.trigger_type == TriggerType.CRON:
+            if not schedule.cron_expr:
+                return None
+            return next_cron_fire_ts(schedule.cron_expr, schedule.last_tick_ts, now)
+        if schedule.trigger_type == TriggerType.INTERVAL:
+            if schedule.last_tick_ts is None or not schedule.interval_sec:
+                return None
+            return schedule.last_tick_ts + float(schedule.interval_sec)
+        return None
+
+    def _reschedule(self, schedule: Schedule, now: datetime, now_ts: float) -> None:
+        """Recompute a schedule's deadline after it was evaluated or fired."""
+        if not schedule.enabled:
+            self._deadlines.pop(schedule.schedule_id, None)
+            return
+        if schedule.compute_error_count:
+            # The due check failed: re-check on the next tick so the error
+            # threshold is reached, whatever the next fire time would be.
+            deadline = None
+        else:
+            try:
+                deadline = self._next_fire_ts(schedule, now)
+            except Exception:
+                # is_cron_due reports the same failure through compute-error tracking.
+                deadline = None
+        if deadline is None or deadline <= now_ts:
+            # Overdue or unknown: re-check on the next tick, never in a hot loop.
+            deadline = now_ts + self._tick_interval
+        self._push_deadline(schedule, deadline)
+
+    def _sync_schedules(self, now_ts: float) -> None:
+        """Index new/changed schedules; a no-op while the store is unchanged."""
+        revision = getattr(self._store, "revision", None)
+        if isinstance(revision, int) and revision == self._synced_revision:
+            return
+
+        current: dict[str, Schedule] = {}
+        for schedule in self._store.list_all():
+            schedule_id = schedule.schedule_id
+            current[schedule_id] = schedule
+            if not schedule.enabled:
+                self._deadlines.pop(schedule_id, None)
+                continue
+            entry = self._deadlines.get(schedule_id)
+            if (
+                entry is None
+                or entry[2] != _schedule_fingerprint(schedule)
+                or self._schedules.get(schedule_id) is not schedule
+            ):
+                # New or changed: evaluate on this tick, as a full scan would.
+                self._push_deadline(schedule, now_ts)
+
+        for schedule_id in list(self._deadlines):
+            if schedule_id not in current:
+                del self._deadlines[schedule_id]
+        self._schedules = current
+        self._synced_revision = revision if isinstance(revision, int) else None
+        self._publish_heap_size()
+
+    def _pop_due(self, now_ts: float) -> list[tuple[Schedule, float]]:
+        due: list[tuple[Schedule, float]] = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            deadline, seq, schedule_id = heapq.heappop(self._heap)
+            entry = self._deadlines.get(schedule_id)
+            schedule = self._schedules.get(schedule_id)
+            if entry is None or entry[1] != seq or schedule is None:
+                continue
+            due.append((schedule, deadline))
+        self._publish_heap_size()
+        return due
+
+    def _record_lateness(self, lateness_sec: float) -> None:
+        lateness_sec = max(0.0, lateness_sec)
+        self._fires += 1
+        self._last_lateness_sec = lateness_sec
+        self._max_lateness_sec = max(self._max_lateness_sec, lateness_sec)
+        metrics.increment("scheduler_fires")
+        metrics.observe("scheduler_fire_lateness_ms", lateness_sec * 1000)
+
+    def _publish_heap_size(self) -> None:
+        metrics.set_gauge("scheduler_pending_heap_size", len(self._heap))
+
+    def _tick(self, now_ts: float | None = None) -> None:
+        """Process one scheduler tick (schedules whose deadline has passed)."""
+        if now_ts is None:
+            now = datetime.now(timezone.utc)
+        else:
+            now = datetime.fromtimestamp(now_ts, tz=timezone.utc)
         now_ts = now.timestamp()
 
         # R34: Dynamic config read for runtime tuning
@@ -436,30 +615,54 @@ class SchedulerRunner:
             )
             return
 
-        schedules = self._store.list_all()
-        due_schedules = self._collect_due_schedules(
-            schedules=schedules,
-            now=now,
-            now_ts=now_ts,
-            disable_threshold=disable_threshold,
-        )
-
-        if due_schedules:
-            logger.debug(f"Found {len(due_schedules)} due schedules")
-
-            # R34: Cap max runs per tick
-            if len(due_schedules) > max_runs:
-                logger.warning(
-                    f"Throttling scheduler: {len(due_schedules)} due, "
-                    f"capping to {max_runs} (max_runs_per_tick)."
-                )
-                # Sort by last_tick_ts to prioritize oldest starved schedules
-                # If last_tick_ts is None, treat as 0 (very old)
-                due_schedules.sort(key=lambda s: s.last_tick_ts or 0)
-                due_schedules = due_schedules[:max_runs]
+        self._sync_schedules(now_ts)
+        popped = self._pop_due(now_ts)
+        if not popped:
+            return
+        for schedule, deadline in popped:
+            # Lateness is measured from the first deadline, across throttled ticks.
+            self._due_since.setdefault(schedule.schedule_id, deadline)
+        handled: set[str] = set()
 
-        for schedule in due_schedules:
-            self._execute_schedule(schedule, now_ts)
+        try:
+            due_schedules = self._collect_due_schedules(
+                schedules=[s for s, _ in popped],
+                now=now,
+                now_ts=now_ts,
+                disable_threshold=disable_threshold,
+            )
+            due_ids = {s.schedule_id for s in due_schedules}
+            for schedule, _ in popped:
+                if schedule.schedule_id not in due_ids:
+                    self._due_since.pop(schedule.schedule_id, None)
+                    self._reschedule(schedule, now, now_ts)
+                    handled.add(schedule.schedule_id)
+
+            if due_schedules:
+                logger.debug(f"Found {len(due_schedules)} due schedules")
+
+                # R34: Cap max runs per tick
+                if len(due_schedules) > max_runs:
+                    logger.warning(
+                        f"Throttling scheduler: {len(due_schedules)} due, "
+                        f"capping to {max_runs} (max_runs_per_tick)."
+                    )
+                    # Sort by last_tick_ts to prioritize oldest starved schedules
+                    # If last_tick_ts is None, treat as 0 (very old)
+                    due_schedules.sort(key=lambda s: s.last_tick_ts or 0)
+                    due_schedules = due_schedules[:max_runs]
+
+            for schedule in due_schedules:
+                schedule_id = schedule.schedule_id
+                self._record_lateness(now_ts - self._due_since.pop(schedule_id))
+                self._execute_schedule(schedule, now_ts)
+                self._reschedule(schedule, now, now_ts)
+                handled.add(schedule_id)
+        finally:
+            # Throttled (or interrupted) schedules are retried on the next tick.
+            for schedule, _ in popped:
+                if schedule.schedule_id not in handled and schedule.enabled:
+                    self._push_deadline(schedule, now_ts + self._tick_interval)
 
     def _execute_schedule(self, schedule: Schedule, tick_ts: float) -> None:
         """Execute a single due schedule."""
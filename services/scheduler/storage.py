@@ -127,6 +127,12 @@ class ScheduleStore:
         self._lock = threading.RLock()
         self._schedules: Dict[str, Schedule] = {}
         self._loaded = False
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Bumped on every add/update/delete/reload (runner change detection)."""
+        return self._revision
 
     def _ensure_loaded(self):
         """Lazy-load schedules from disk."""
@@ -160,6 +166,7 @@ class ScheduleStore:
                 return False
 
             self._schedules[schedule.schedule_id] = schedule
+            self._revision += 1
             return save_schedules(self._schedules)
 
     def update(self, schedule: Schedule) -> bool:
@@ -172,6 +179,7 @@ class ScheduleStore:
                 return False
 
             self._schedules[schedule.schedule_id] = schedule
+            self._revision += 1
             return save_schedules(self._schedules)
 
     def delete(self, schedule_id: str) -> bool:
@@ -184,6 +192,7 @@ class ScheduleStore:
                 return False
 
             del self._schedules[schedule_id]
+            self._revision += 1
             return save_schedules(self._schedules)
 
     def reload(self) -> None:
@@ -191,6 +200,7 @@ class ScheduleStore:
         with self._lock:
             self._schedules = load_schedules()
             self._loaded = True
+            self._revision += 1
 
     def flush(self) -> bool:
         """Persist loaded schedules immediately (best effort)."""
@@ -3,7 +3,7 @@ Bridge Client for OpenClaw Sidecar (F46).
 
 Handles communication with the central OpenClaw Bridge/Server.
 - Authentication (Worker Token)
-- Job Fetching (Polling)
+- Job Fetching (Long-Polling)
 - Result Delivery
 - Health Reporting
 
@@ -102,12 +102,22 @@ class BridgeClient:
             logger.error(f"Bridge health check failed: {e}")
             return False
 
-    async def fetch_jobs(self) -> list:
-        """Poll for pending jobs via contract worker_poll endpoint."""
+    async def fetch_jobs(self, batch: int = 1, wait_sec: float = 0.0) -> list:
+        """
+        Poll for pending jobs via contract worker_poll endpoint.
+
+        With wait_sec > 0 the bridge holds the request until a job arrives or
+        the wait elapses (long-poll), instead of answering 204 immediately.
+        """
         try:
             url = self._endpoint("worker_poll")
+            params = {"batch": str(max(1, int(batch)))}
+            if wait_sec > 0:
+                params["wait"] = f"{wait_sec:g}"
             async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10 + max(0.0, wait_sec)),
             ) as resp:
                 if resp.status == 200:
                     data = await resp.json()
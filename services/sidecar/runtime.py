@@ -4,21 +4,28 @@ Sidecar Runtime (F46).
 Orchestrates the Sidecar process:
 1.  Connects to Remote Bridge (BridgeClient).
 2.  Connects to Local ComfyUI (OpenClawClient).
-3.  Polls for jobs and executes them locally.
+3.  Long-polls for jobs and executes up to OPENCLAW_SIDECAR_MAX_CONCURRENCY
+    of them locally at once.
 4.  Reports results back to Bridge.
+
+Completion is detected by a shared CompletionWatcher (one history sweep for
+every in-flight job, woken by ComfyUI /ws signals), and heartbeats are
+coalesced into one status report per burst of job changes.
 """
 
 import asyncio
-import json
+import contextlib
 import logging
 import os
 import signal
 import sys
+import time
 import uuid
 
 from connector.config import ConnectorConfig
 from connector.openclaw_client import OpenClawClient
 
+from ..completion_watcher import CompletionWatcher
 from .bridge_client import BridgeClient
 
 # Configure logging
@@ -29,6 +36,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger("Sidecar")
 
+# Server-side cap on jobs handed out per poll (see /bridge/worker/poll).
+MAX_POLL_BATCH = 5
+# Minimum spacing of polls that come back empty without being held.
+IDLE_BACKOFF_SEC = 5.0
+# Job changes within this window are folded into one heartbeat.
+HEARTBEAT_MIN_GAP_SEC = 0.5
+
+
+def _env_number(name: str, default: float, minimum: float) -> float:
+    try:
+        value = float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+    return max(minimum, value)
+
 
 class SidecarRuntime:
     def __init__(self):
@@ -48,7 +71,34 @@ class SidecarRuntime:
         self.bridge = BridgeClient(self.bridge_url, self.worker_token, self.worker_id)
         self.local = OpenClawClient(self.local_config)
 
+        # Concurrency / polling
+        self.max_concurrency = int(
+            _env_number("OPENCLAW_SIDECAR_MAX_CONCURRENCY", 1, minimum=1)
+        )
+        self.poll_wait_sec = _env_number(
+            "OPENCLAW_SIDECAR_POLL_WAIT_SEC", 20.0, minimum=0.0
+        )
+        self.heartbeat_interval_sec = _env_number(
+            "OPENCLAW_SIDECAR_HEARTBEAT_SEC", 15.0, minimum=1.0
+        )
+        self.job_timeout_sec = _env_number(
+            "OPENCLAW_SIDECAR_JOB_TIMEOUT_SEC", 300.0, minimum=1.0
+        )
+        self.watcher = CompletionWatcher(
+            self._sweep_recent_history,
+            fetch_one=self._fetch_history_item,
+            signals=(
+                self.local.iter_execution_signals
+                if self.local_config.delivery_ws_signals
+                else None
+            ),
+            name="sidecar",
+        )
+
         self.running = False
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._slot_freed = asyncio.Event()
+        self._status_changed = asyncio.Event()
 
     async def start(self):
         logger.info(f"Starting Sidecar Runtime (Worker ID: {self.worker_id})")
@@ -88,29 +138,93 @@ class SidecarRuntime:
     async def stop(self):
         logger.info("Stopping Sidecar...")
         self.running = False
+        self._slot_freed.set()
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self.watcher.close()
         await self.bridge.stop()
         await self.local.stop()
 
     async def run_loop(self):
-        """Main polling loop."""
+        """Main polling loop: keep up to max_concurrency jobs in flight."""
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        try:
+            while self.running:
+                try:
+                    # 1. Wait for a free slot
+                    await self._wait_for_capacity()
+                    if not self.running:
+                        break
+
+                    # 2. Long-poll for as many jobs as there are free slots
+                    free = self.max_concurrency - len(self._in_flight)
+                    started = time.monotonic()
+                    jobs = await self.bridge.fetch_jobs(
+                        batch=min(free, MAX_POLL_BATCH), wait_sec=self.poll_wait_sec
+                    )
+                    for job in jobs:
+                        self._start_job(job)
+
+                    # 3. Backoff only when the bridge answered without holding
+                    # the poll (older bridge, long-poll disabled, or an error).
+                    if not jobs:
+                        elapsed = time.monotonic() - started
+                        await asyncio.sleep(max(0.0, IDLE_BACKOFF_SEC - elapsed))
+
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Loop error: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _wait_for_capacity(self):
+        while self.running and len(self._in_flight) >= self.max_concurrency:
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+
+    def _start_job(self, job: dict):
+        key = str(job.get("job_id") or "job")
+        if key in self._in_flight:
+            key = f"{key}-{uuid.uuid4().hex[:8]}"
+        task = asyncio.create_task(self.execute_job(job))
+        self._in_flight[key] = task
+
+        def _done(_task: asyncio.Task):
+            self._in_flight.pop(key, None)
+            self._slot_freed.set()
+            self._status_changed.set()
+
+        task.add_done_callback(_done)
+        self._status_changed.set()
+
+    def _status_snapshot(self) -> tuple:
+        job_ids = sorted(self._in_flight)
+        details = {
+            "job_ids": job_ids,
+            "in_flight": len(job_ids),
+            "capacity": self.max_concurrency,
+        }
+        return ("working" if job_ids else "idle"), details
+
+    async def _heartbeat_loop(self):
+        """Report status on an interval, or soon after jobs start/finish."""
         while self.running:
-            try:
-                # 1. Heartbeat
-                await self.bridge.report_status("idle")
-
-                # 2. Poll Jobs
-                jobs = await self.bridge.fetch_jobs()
-                for job in jobs:
-                    await self.execute_job(job)
-
-                # 3. Backoff
-                await asyncio.sleep(5 if not jobs else 1)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Loop error: {e}")
-                await asyncio.sleep(5)
+            self._status_changed.clear()
+            status, details = self._status_snapshot()
+            await self.bridge.report_status(status, details)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._status_changed.wait(), self.heartbeat_interval_sec
+                )
+            # Fold a burst of job starts/completions into the next report.
+            await asyncio.sleep(HEARTBEAT_MIN_GAP_SEC)
 
     async def execute_job(self, job: dict):
         job_id = job.get("job_id")
@@ -120,8 +234,6 @@ class SidecarRuntime:
         logger.info(f"Executing Job {job_id} (Template: {template_id})")
 
         try:
-            await self.bridge.report_status("working", {"job_id": job_id})
-
             # Submit to Local ComfyUI
             # Use submit_job (which calls /triggers/fire)
             # NOTE: submit_job in OpenClawClient adds trace_id
@@ -149,8 +261,7 @@ class SidecarRuntime:
                 )
                 return
 
-            # Poll for completion (Simple implementation for F46 MVP)
-            # Ideal: WebSocket. For now: Poll history.
+            # Wait on the shared completion watcher (event-driven sweep).
             result = await self._wait_for_completion(prompt_id)
 
             # Submit result to Bridge
@@ -162,33 +273,33 @@ class SidecarRuntime:
                 job_id, {"status": "failed", "error": str(e)}
             )
 
-    async def _wait_for_completion(self, prompt_id: str, timeout: int = 300) -> dict:
-        """Poll local history for job completion."""
-        elapsed = 0
-        while elapsed < timeout:
-            history_res = await self.local.get_history(prompt_id)
-            if history_res.get("ok"):
-                # ComfyUI history format: {prompt_id: {outputs: ..., status: ...}}
-                # Our OpenClaw client might wrapper this.
-                # Assuming OpenClaw /history/{id} wrapper returns standard shape.
-                # If wrapped: res["data"] -> {prompt_id: ...}
-                # Check implementation of /history endpoint in Connector?
-                # Actually OpenClawClient calls /history/{id}.
-                # Local ComfyUI returns {prompt_id: {outputs: ...}}
-
-                data = history_res.get("data", {})
-                if prompt_id in data:
-                    # Job done!
-                    # Extract outputs
-                    outputs = data[prompt_id].get("outputs", {})
-                    # Need to process outputs (upload images to bridge?)
-                    # For F46 MVP, sending raw output metadata or first image.
-                    return {"status": "completed", "outputs": outputs}
-
-            await asyncio.sleep(1)
-            elapsed += 1
-
-        return {"status": "timeout", "error": "Execution timed out"}
+    async def _wait_for_completion(
+        self, prompt_id: str, timeout: float | None = None
+    ) -> dict:
+        """Wait for the prompt's local history entry to appear."""
+        item = await self.watcher.wait(
+            prompt_id, self.job_timeout_sec if timeout is None else timeout
+        )
+        if item is None:
+            return {"status": "timeout", "error": "Execution timed out"}
+        # ComfyUI history format: {prompt_id: {outputs: ..., status: ...}}
+        # For F46 MVP, sending raw output metadata.
+        return {"status": "completed", "outputs": item.get("outputs", {})}
+
+    async def _sweep_recent_history(self, max_items: int) -> dict | None:
+        res = await self.local.get_recent_history(max_items)
+        if not res.get("ok"):
+            return None
+        data = res.get("data")
+        return data if isinstance(data, dict) else None
+
+    async def _fetch_history_item(self, prompt_id: str) -> dict | None:
+        res = await self.local.get_history(prompt_id)
+        if not res.get("ok"):
+            return None
+        data = res.get("data")
+        item = data.get(prompt_id) if isinstance(data, dict) else None
+        return item if isinstance(item, dict) else None
 
 
 if __name__ == "__main__":
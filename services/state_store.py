@@ -0,0 +1,385 @@
+"""
+Embedded transactional state store.
+
+One SQLite database per state directory (``state.db``, WAL mode) backs the
+stores that used to rewrite a whole JSON document, or one file per object, on
+every mutation. Every table has the same shape: a primary key, the indexed
+columns ``tenant_id``, ``status``, ``category`` and ``updated_at``, and the
+object itself as canonical JSON. Writes are single-row UPSERTs and filtered
+listings are index lookups, so neither scales with the size of the store.
+
+Each row carries the SHA-256 of its payload (R77). A row whose payload no
+longer matches its digest is logged and treated as absent (fail-closed).
+
+Legacy JSON files are imported once per database by ``migrate_once``. The
+import and its marker commit in one transaction, so an interrupted import is
+retried on the next start. Legacy files are left in place; they are no
+longer read once the marker exists.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .integrity import canonical_dumps
+from .state_dir import get_state_dir
+
+logger = logging.getLogger("ComfyUI-OpenClaw.services.state_store")
+
+STATE_DB_NAME = "state.db"
+INDEXED_COLUMNS = ("tenant_id", "status", "category", "updated_at")
+
+_TABLE_NAME_RE = re.compile(r"^[a-z][a-z0-9_]{0,62}$")
+
+_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS state_migrations (
+        name TEXT PRIMARY KEY,
+        applied_at REAL NOT NULL,
+        rows INTEGER NOT NULL
+    );
+"""
+
+
+@dataclass
+class StateRow:
+    """One object plus the columns it is indexed by."""
+
+    key: str
+    payload: dict[str, Any]
+    tenant_id: str | None = None
+    status: str | None = None
+    category: str | None = None
+    updated_at: float | None = None
+
+
+def _encode(payload: dict[str, Any]) -> tuple[str, str]:
+    data = canonical_dumps(payload)
+    return data.decode(), hashlib.sha256(data).hexdigest()
+
+
+class StateTable:
+    """Typed handle on one table of a ``StateStore``."""
+
+    def __init__(self, store: StateStore, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def _decode(self, key: str, text: str, digest: str) -> dict[str, Any] | None:
+        payload = None
+        if hashlib.sha256(text.encode()).hexdigest() == digest:
+            with contextlib.suppress(ValueError):
+                payload = json.loads(text)
+        if not isinstance(payload, dict):
+            logger.critical(
+                "R77: Integrity violation in state table %s, row %s", self.name, key
+            )
+            return None
+        return payload
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        rows = self.store.fetch(
+            f"SELECT key, payload, digest FROM {self.name} WHERE key = ?", (key,)
+        )
+        return self._decode(*rows[0]) if rows else None
+
+    def put(
+        self,
+        key: str,
+        payload: dict[str, Any],
+        *,
+        tenant_id: str | None = None,
+        status: str | None = None,
+        category: str | None = None,
+        updated_at: float | None = None,
+    ) -> None:
+        self.put_many([StateRow(key, payload, tenant_id, status, category, updated_at)])
+
+    def put_many(self, rows: Iterable[StateRow]) -> int:
+        params = []
+        for row in rows:
+            text, digest = _encode(row.payload)
+            updated_at = time.time() if row.updated_at is None else row.updated_at
+            params.append(
+                (
+                    row.key,
+                    row.tenant_id,
+                    row.status,
+                    row.category,
+                    float(updated_at),
+                    text,
+                    digest,
+                )
+            )
+        with self.store.transaction() as conn:
+            conn.executemany(
+                f"""
+                INSERT INTO {self.name}
+                    (key, tenant_id, status, category, updated_at, payload, digest)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    tenant_id = excluded.tenant_id,
+                    status = excluded.status,
+                    category = excluded.category,
+                    updated_at = excluded.updated_at,
+                    payload = excluded.payload,
+                    digest = excluded.digest
+                """,
+                params,
+            )
+        return len(params)
+
+    def replace_if_status(self, row: StateRow, expected_status: str) -> bool:
+        """Overwrite an existing row only while its status is still expected."""
+        text, digest = _encode(row.payload)
+        updated_at = time.time() if row.updated_at is None else row.updated_at
+        with self.store.transaction() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE {self.name} SET
+                    tenant_id = ?, status = ?, category = ?, updated_at = ?,
+                    payload = ?, digest = ?
+                WHERE key = ? AND status = ?
+                """,
+                (
+                    row.tenant_id,
+                    row.status,
+                    row.category,
+                    float(updated_at),
+                    text,
+                    digest,
+                    row.key,
+                    expected_status,
+                ),
+            )
+        return cursor.rowcount > 0
+
+    def delete(self, key: str) -> bool:
+        return self.delete_many([key]) > 0
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        deleted = 0
+        with self.store.transaction() as conn:
+            for key in keys:
+                deleted += conn.execute(
+                    f"DELETE FROM {self.name} WHERE key = ?", (key,)
+                ).rowcount
+        return deleted
+
+    def _where(
+        self,
+        tenant_id: str | None,
+        status: str | Sequence[str] | None,
+        category: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if tenant_id is not None:
+            clauses.append("tenant_id = ?")
+            params.append(tenant_id)
+        if isinstance(status, str):
+            clauses.append("status = ?")
+            params.append(status)
+        elif status is not None:
+            statuses = list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | Sequence[str] | None = None,
+        category: str | None = None,
+        newest_first: bool = True,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Rows matching every given filter, ordered by ``updated_at``."""
+        where, params = self._where(tenant_id, status, category)
+        order = "DESC" if newest_first else "ASC"
+        sql = (
+            f"SELECT key, payload, digest FROM {self.name}{where}"
+            f" ORDER BY updated_at {order}, key {order}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(0, int(limit)))
+        rows = self.store.fetch(sql, params)
+        decoded = (self._decode(*row) for row in rows)
+        return [payload for payload in decoded if payload is not None]
+
+    def count(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | Sequence[str] | None = None,
+        category: str | None = None,
+    ) -> int:
+        where, params = self._where(tenant_id, status, category)
+        rows = self.store.fetch(f"SELECT COUNT(*) FROM {self.name}{where}", params)
+        return int(rows[0][0])
+
+    def prune(self, keep: int) -> int:
+        """Delete all but the ``keep`` most recently updated rows."""
+        with self.store.transaction() as conn:
+            return conn.execute(
+                f"""
+                DELETE FROM {self.name} WHERE key IN (
+                    SELECT key FROM {self.name}
+                    ORDER BY updated_at DESC, key DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (max(0, int(keep)),),
+            ).rowcount
+
+
+class StateStore:
+    """
+    SQLite-backed state database shared by the persistent stores.
+
+    A single connection is shared by all threads and serialized by a
+    re-entrant lock. ``transaction()`` nests: only the outermost block opens
+    and commits the transaction.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._tables: set[str] = set()
+        # Transactions are opened explicitly by transaction().
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        row = self._conn.execute("PRAGMA journal_mode = WAL").fetchone()
+        self.journal_mode = str(row[0]).lower() if row else "unknown"
+        self._conn.execute("PRAGMA synchronous = FULL")
+        self._conn.executescript(_MIGRATIONS_DDL)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._conn
+                finally:
+                    self._depth -= 1
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._depth = 0
+
+    def fetch(self, sql: str, params: Sequence[Any] = ()) -> list[Any]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def table(self, name: str) -> StateTable:
+        """Return the named table, creating it and its indexes on first use."""
+        with self._lock:
+            if name in self._tables:
+                return StateTable(self, name)
+            if not _TABLE_NAME_RE.match(name) or name == "state_migrations":
+                raise ValueError(f"Invalid state table name: {name!r}")
+            # Plain execute(): executescript() would commit an open transaction.
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {name} (
+                    key TEXT PRIMARY KEY,
+                    tenant_id TEXT,
+                    status TEXT,
+                    category TEXT,
+                    updated_at REAL NOT NULL,
+                    payload TEXT NOT NULL,
+                    digest TEXT NOT NULL
+                )
+                """)
+            for column in INDEXED_COLUMNS:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{name}_{column}"
+                    f" ON {name}({column})"
+                )
+            self._tables.add(name)
+            return StateTable(self, name)
+
+    def migrate_once(self, name: str, migrate: Callable[[], int]) -> bool:
+        """
+        Run ``migrate`` unless migration ``name`` already ran on this database.
+
+        ``migrate`` writes its rows and returns how many it imported. Returns
+        True when the migration ran now. If it raises, nothing is recorded
+        and it runs again next time.
+        """
+        with self.transaction() as conn:
+            done = conn.execute(
+                "SELECT 1 FROM state_migrations WHERE name = ?", (name,)
+            ).fetchone()
+            if done is not None:
+                return False
+            rows = migrate()
+            conn.execute(
+                "INSERT INTO state_migrations (name, applied_at, rows) VALUES (?, ?, ?)",
+                (name, time.time(), int(rows)),
+            )
+        logger.info(
+            "Migrated %d legacy record(s) into %s (%s)", rows, self.db_path, name
+        )
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Entries drop out (and their connection closes) once no store uses them.
+_stores: weakref.WeakValueDictionary[str, StateStore] = weakref.WeakValueDictionary()
+_stores_lock = threading.Lock()
+
+
+def open_state_store(db_path: str | os.PathLike[str]) -> StateStore:
+    """Return the ``StateStore`` for ``db_path``, shared while it is in use."""
+    path = os.path.abspath(os.fspath(db_path))
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = StateStore(path)
+        return store
+
+
+def get_state_store() -> StateStore:
+    """Return the state store of the current state directory."""
+    return open_state_store(os.path.join(get_state_dir(), STATE_DB_NAME))
+
+
+def close_state_stores() -> None:
+    """Close every open state store (shutdown / tests)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        with contextlib.suppress(sqlite3.Error):
+            store.close()
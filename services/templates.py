@@ -5,11 +5,13 @@ Loads manifest and renders templates for execution.
 - Templates are runnable by ID
 - Uses safe_io to load files
 - Renders workflow JSON with safe inputs
+- Compiles each template once (parsed base + placeholder slot index); renders
+  copy only the containers on the path to a slot and share everything else
 """
 
-import copy
 import logging
 import os
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -40,6 +42,96 @@ class TemplateConfig:
     tenants: List[str] = field(default_factory=list)
 
 
+SlotPath = tuple[str | int, ...]
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    A parsed template workflow plus the paths of its exact "{{name}}" leaves.
+
+    `base` is shared by every render and must never be mutated. A rendered
+    workflow shares all unslotted subtrees with `base`; callers that hand the
+    result to code which edits it in place must copy it first.
+    """
+
+    base: Any
+    slots: tuple[tuple[SlotPath, str], ...]
+    source_key: tuple[int, int] | None = None
+    _slot_tree: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def compile(
+        cls, workflow: Any, source_key: tuple[int, int] | None = None
+    ) -> "CompiledTemplate":
+        slots: list[tuple[SlotPath, str]] = []
+        _collect_slots(workflow, (), slots)
+        return cls(
+            base=workflow,
+            slots=tuple(slots),
+            source_key=source_key,
+            _slot_tree=_build_slot_tree(slots),
+        )
+
+    def render(self, inputs: Mapping[str, Any]) -> Any:
+        """Substitute inputs into the slots; unsupplied placeholders stay as-is."""
+        if self._slot_tree is None:
+            if isinstance(self.base, dict):
+                return dict(self.base)
+            if isinstance(self.base, list):
+                return list(self.base)
+            return self.base
+        return _fill_slots(self.base, self._slot_tree, inputs)
+
+
+def _placeholder_name(value: str) -> str | None:
+    # STRICT substitution: exact match only.
+    # "Partial" replacements (e.g. "param is {{val}}") are NOT supported
+    # to prevent accidental injection or malformed JSON hacks.
+    if len(value) >= 4 and value.startswith("{{") and value.endswith("}}"):
+        return value[2:-2]
+    return None
+
+
+def _collect_slots(
+    data: Any, path: SlotPath, slots: list[tuple[SlotPath, str]]
+) -> None:
+    if isinstance(data, dict):
+        for k, v in data.items():
+            _collect_slots(v, (*path, k), slots)
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            _collect_slots(item, (*path, i), slots)
+    elif isinstance(data, str):
+        name = _placeholder_name(data)
+        if name is not None:
+            slots.append((path, name))
+
+
+def _build_slot_tree(slots: Sequence[tuple[SlotPath, str]]) -> Any:
+    """Nest slot paths into {key: subtree | placeholder_name}; None if no slots."""
+    if not slots:
+        return None
+    if slots[0][0] == ():
+        return slots[0][1]
+    tree: dict[str | int, Any] = {}
+    for path, name in slots:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = name
+    return tree
+
+
+def _fill_slots(node: Any, tree: Any, inputs: Mapping[str, Any]) -> Any:
+    if isinstance(tree, str):
+        return inputs.get(tree, node)
+    out = dict(node) if isinstance(node, dict) else list(node)
+    for key, subtree in tree.items():
+        out[key] = _fill_slots(node[key], subtree, inputs)
+    return out
+
+
 class TemplateService:
     _instance = None
 
@@ -49,6 +141,8 @@ class TemplateService:
         self._manifest_abspath = os.path.join(self.templates_root, MANIFEST_PATH)
         self._manifest_mtime: Optional[float] = None
         self._last_load_error: Optional[str] = None
+        # rel_path -> (abs_path, compiled); cleared whenever the manifest reloads.
+        self._compiled: dict[str, tuple[str, CompiledTemplate]] = {}
         self._load_manifest()
 
     def _maybe_reload_manifest(self) -> None:
@@ -111,6 +205,7 @@ class TemplateService:
                 return
 
             self.manifest.clear()
+            self._compiled.clear()
             for t_id, t_cfg in data.get("templates", {}).items():
                 tenants = t_cfg.get("tenants", [])
                 if not isinstance(tenants, list):
@@ -215,6 +310,42 @@ class TemplateService:
         Raises:
             ValueError: if template not found or inputs invalid
         """
+        config, workflow = self._load_template(template_id)
+        return self._render_loaded(config, workflow, inputs)
+
+    def render_templates(
+        self, requests: Sequence[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any] | ValueError]:
+        """
+        Render many (template_id, inputs) pairs in one pass (batch submit).
+
+        Each distinct template is resolved once for the whole batch.
+
+        Args:
+            requests: (template_id, inputs) pairs
+
+        Returns:
+            One entry per request, in order: the rendered workflow, or the
+            ValueError render_template would have raised
+        """
+        loaded: dict[str, tuple[TemplateConfig, CompiledTemplate] | ValueError] = {}
+        results: list[dict[str, Any] | ValueError] = []
+        for template_id, inputs in requests:
+            if template_id not in loaded:
+                try:
+                    loaded[template_id] = self._load_template(template_id)
+                except ValueError as e:
+                    loaded[template_id] = e
+            entry = loaded[template_id]
+            if isinstance(entry, ValueError):
+                results.append(entry)
+                continue
+            results.append(self._render_loaded(entry[0], entry[1], inputs))
+        return results
+
+    def _load_template(
+        self, template_id: str
+    ) -> tuple[TemplateConfig, CompiledTemplate]:
         config = self.get_template_config(template_id)
         if not config:
             raise ValueError(f"Unknown template: {template_id}")
@@ -236,12 +367,37 @@ class TemplateService:
         if rel_path.startswith("data/templates/"):
             rel_path = rel_path.replace("data/templates/", "")
 
+        return config, self._get_compiled(rel_path)
+
+    def _get_compiled(self, rel_path: str) -> CompiledTemplate:
+        """Return the compiled template, recompiling when the file changed."""
+        cached = self._compiled.get(rel_path)
+        if cached is not None:
+            abs_path, compiled = cached
+            try:
+                st = os.stat(abs_path)
+                if (st.st_mtime_ns, st.st_size) == compiled.source_key:
+                    return compiled
+            except OSError:
+                pass
+
         try:
+            abs_path = resolve_under_root(self.templates_root, rel_path)
+            st = os.stat(abs_path)
             workflow = safe_read_json(self.templates_root, rel_path)
         except Exception as e:
             logger.error(f"Failed to load template file {rel_path}: {e}")
             raise ValueError("Template loading failed")
 
+        compiled = CompiledTemplate.compile(
+            workflow, source_key=(st.st_mtime_ns, st.st_size)
+        )
+        self._compiled[rel_path] = (abs_path, compiled)
+        return compiled
+
+    def _render_loaded(
+        self, config: TemplateConfig, compiled: CompiledTemplate, inputs: dict[str, Any]
+    ) -> dict[str, Any]:
         # Merge defaults and inputs
         final_inputs = config.defaults.copy()
         final_inputs.update(inputs)
@@ -269,27 +425,8 @@ class TemplateService:
         # in the widgets_values of the workflow. This is robust enough for an MVP.
         # We traverse the dict recursively.
 
-        rendered = self._recursive_substitute(workflow, final_inputs)
-        return rendered
-
-    def _recursive_substitute(self, data: Any, replacements: Dict[str, Any]) -> Any:
-        if isinstance(data, dict):
-            return {
-                k: self._recursive_substitute(v, replacements) for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._recursive_substitute(item, replacements) for item in data]
-        elif isinstance(data, str):
-            # STRICT substitution: exact match only.
-            # "Partial" replacements (e.g. "param is {{val}}") are NOT supported
-            # to prevent accidental injection or malformed JSON hacks.
-            for k, v in replacements.items():
-                placeholder = f"{{{{{k}}}}}"
-                if data == placeholder:
-                    return v
-            return data
-        else:
-            return data
+        # Placeholder slots were indexed at compile time; only their paths are copied.
+        return compiled.render(final_inputs)
 
 
 # Singleton accessor
@@ -140,39 +140,44 @@ def verify_bearer(request: RequestLike) -> Tuple[bool, str]:
     return True, ""
 
 
-def verify_hmac(request: RequestLike, raw_body: bytes) -> Tuple[bool, str]:
-    """
-    Verify HMAC signature authentication.
+# Nonces are remembered past the 5 minute drift window.
+NONCE_TTL_SEC = 600
 
-    Signature header: X-OpenClaw-Signature: sha256=<hex> (legacy: X-Moltbot-Signature)
 
-    Returns: (is_valid, error_message)
+def _check_hmac_request(
+    request: RequestLike, raw_body: bytes
+) -> tuple[bool, str, str | None]:
+    """
+    Signature and timestamp checks shared by verify_hmac and averify_hmac.
+
+    Returns: (is_valid, error_message, nonce_key). ``nonce_key`` is set when
+    the request still has to pass the nonce uniqueness check.
     """
     secret = get_hmac_secret()
     if not secret:
-        return False, "hmac_not_configured"
+        return False, "hmac_not_configured", None
 
     sig_header, _used_legacy_sig = get_header_alias_value(
         request.headers, WEBHOOK_SIGNATURE_HEADERS, logger=logger
     )
 
     if not sig_header:
-        return False, "missing_signature_header"
+        return False, "missing_signature_header", None
 
     # Parse signature (sha256=<hex>)
     if not sig_header.startswith("sha256="):
-        return False, "invalid_signature_format"
+        return False, "invalid_signature_format", None
 
     provided_sig = sig_header[7:]  # Remove "sha256=" prefix
 
     if not provided_sig:
-        return False, "empty_signature"
+        return False, "empty_signature", None
 
     # Compute expected signature
     expected_sig = hmac.new(secret, raw_body, hashlib.sha256).hexdigest()
 
     if not hmac.compare_digest(provided_sig.lower(), expected_sig.lower()):
-        return False, "invalid_signature"
+        return False, "invalid_signature", None
 
     # Replay Protection (S2.1)
     timestamp, _used_legacy_ts = get_header_alias_value(
@@ -185,64 +190,108 @@ def verify_hmac(request: RequestLike, raw_body: bytes) -> Tuple[bool, str]:
     # Enforced if headers present OR if strictly required configuration
     should_enforce = timestamp or nonce or should_require_replay_protection()
 
-    if should_enforce:
-        if not timestamp:
-            return False, "missing_timestamp"
-        if not nonce:
-            return False, "missing_nonce"
+    if not should_enforce:
+        return True, "", None
+
+    if not timestamp:
+        return False, "missing_timestamp", None
+    if not nonce:
+        return False, "missing_nonce", None
 
+    try:
+        ts = int(timestamp)
+    except ValueError:
+        return False, "invalid_timestamp", None
+
+    # Check drift (5 minutes)
+    import time
+
+    now = int(time.time())
+    if abs(now - ts) > 300:
+        # R102 Hook
         try:
-            ts = int(timestamp)
-        except ValueError:
-            return False, "invalid_timestamp"
-
-        # Check drift (5 minutes)
-        import time
-
-        now = int(time.time())
-        if abs(now - ts) > 300:
-            # R102 Hook
-            try:
-                from .security_telemetry import get_security_telemetry
-
-                get_security_telemetry().record_replay_rejection(
-                    "timestamp_out_of_range"
-                )
-            except ImportError:
-                pass
-            return False, "timestamp_out_of_range"
-
-        # Check nonce uniqueness
-        IdempotencyStore = None
+            from .security_telemetry import get_security_telemetry
+
+            get_security_telemetry().record_replay_rejection("timestamp_out_of_range")
+        except ImportError:
+            pass
+        return False, "timestamp_out_of_range", None
+
+    return True, "", f"nonce:{nonce}"
+
+
+def _get_nonce_store_class():
+    try:
+        from .idempotency_store import IdempotencyStore
+    except ImportError:
         try:
-            from .idempotency_store import IdempotencyStore
+            from services.idempotency_store import IdempotencyStore
         except ImportError:
-            try:
-                from services.idempotency_store import IdempotencyStore
-            except ImportError:
-                pass
-
-        if IdempotencyStore:
-            try:
-                store = IdempotencyStore()
-                # Nonce key
-                nonce_key = f"nonce:{nonce}"
-                # TTL should allow for the drift window (buffer)
-                is_dup, _ = store.check_and_record(nonce_key, ttl=600)
-                if is_dup:
-                    return False, "nonce_used"
-            except Exception as e:
-                logger.error(f"Idempotency store check failed: {e}")
-                if should_require_replay_protection():
-                    return False, "internal_error"
-                # Else proceed (allow open in legacy/relaxed mode - risk acceptance)
-                pass
-        else:
-            logger.warning("IdempotencyStore not available for nonce check")
-            # Fail closed if configured to require protection, otherwise warn
-            if should_require_replay_protection():
-                return False, "internal_error"
+            return None
+    return IdempotencyStore
+
 
+def _nonce_store_unavailable() -> tuple[bool, str]:
+    logger.warning("IdempotencyStore not available for nonce check")
+    # Fail closed if configured to require protection, otherwise warn
+    if should_require_replay_protection():
+        return False, "internal_error"
+    return True, ""
+
+
+def _nonce_store_failed(exc: Exception) -> tuple[bool, str]:
+    logger.error(f"Idempotency store check failed: {exc}")
+    if should_require_replay_protection():
+        return False, "internal_error"
+    # Else proceed (allow open in legacy/relaxed mode - risk acceptance)
+    return True, ""
+
+
+def verify_hmac(request: RequestLike, raw_body: bytes) -> Tuple[bool, str]:
+    """
+    Verify HMAC signature authentication.
+
+    Signature header: X-OpenClaw-Signature: sha256=<hex> (legacy: X-Moltbot-Signature)
+
+    Returns: (is_valid, error_message)
+    """
+    valid, error, nonce_key = _check_hmac_request(request, raw_body)
+    if not valid or nonce_key is None:
+        return valid, error
+
+    # Check nonce uniqueness
+    store_cls = _get_nonce_store_class()
+    if store_cls is None:
+        return _nonce_store_unavailable()
+    try:
+        is_dup, _ = store_cls().check_and_record(nonce_key, ttl=NONCE_TTL_SEC)
+    except Exception as e:
+        return _nonce_store_failed(e)
+    if is_dup:
+        return False, "nonce_used"
+    return True, ""
+
+
+async def averify_hmac(request: RequestLike, raw_body: bytes) -> tuple[bool, str]:
+    """
+    verify_hmac for async handlers.
+
+    The nonce is recorded through ``acheck_and_record``, so the durable
+    commit is awaited instead of blocking the event loop.
+    """
+    valid, error, nonce_key = _check_hmac_request(request, raw_body)
+    if not valid or nonce_key is None:
+        return valid, error
+
+    store_cls = _get_nonce_store_class()
+    if store_cls is None:
+        return _nonce_store_unavailable()
+    try:
+        is_dup, _ = await store_cls().acheck_and_record(nonce_key, ttl=NONCE_TTL_SEC)
+    except Exception as e:
+        return _nonce_store_failed(e)
+    if is_dup:
+        return False, "nonce_used"
     return True, ""
 
 
@@ -279,6 +328,38 @@ def require_auth(request: RequestLike, raw_body: bytes) -> Tuple[bool, str]:
     return False, "unknown_auth_mode"
 
 
+async def arequire_auth(request: RequestLike, raw_body: bytes) -> tuple[bool, str]:
+    """
+    require_auth for async handlers (HMAC nonce checks are awaited).
+
+    Returns: (is_valid, error_message)
+    """
+    if not is_auth_configured():
+        logger.warning("Webhook auth not configured, denying request")
+        return False, "auth_not_configured"
+
+    mode = get_auth_mode()
+
+    if mode == AUTH_MODE_BEARER:
+        return verify_bearer(request)
+
+    elif mode == AUTH_MODE_HMAC:
+        return await averify_hmac(request, raw_body)
+
+    elif mode == AUTH_MODE_BEARER_OR_HMAC:
+        valid, _ = verify_bearer(request)
+        if valid:
+            return True, ""
+
+        valid, _ = await averify_hmac(request, raw_body)
+        if valid:
+            return True, ""
+
+        return False, "invalid_credentials"
+
+    return False, "unknown_auth_mode"
+
+
 def get_auth_summary() -> dict:
     """Get auth configuration summary (no secrets)."""
     mode = get_auth_mode()
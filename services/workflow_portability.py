@@ -46,13 +46,22 @@ def get_missing_node_fallback(class_type: str) -> Dict[str, Any] | None:
 
 
 def analyze_workflow_portability(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    return analyze_diagnostic_nodes_portability(
+        iter_workflow_diagnostic_nodes(workflow)
+    )
+
+
+def analyze_diagnostic_nodes_portability(
+    diagnostic_nodes: Iterable[dict[str, Any]],
+) -> dict[str, Any]:
+    """Portability report over nodes already walked by the caller."""
     contract = get_workflow_portability_contract()
     entries = []
     suppressed_entries = []
     detected_class_types = set()
     recommended_actions = []
 
-    for node in iter_workflow_diagnostic_nodes(workflow):
+    for node in diagnostic_nodes:
         class_type = node.get("class_type")
         if not isinstance(class_type, str):
             continue
@@ -101,7 +110,7 @@ def analyze_workflow_portability(workflow: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def iter_workflow_diagnostic_nodes(
-    workflow: Dict[str, Any]
+    workflow: Dict[str, Any],
 ) -> Iterable[Dict[str, Any]]:
     if not isinstance(workflow, dict):
         return []
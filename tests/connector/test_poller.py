@@ -1,6 +1,6 @@
 import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from connector.config import ConnectorConfig
 from connector.contract import Platform
@@ -26,9 +26,11 @@ class TestResultsPoller(unittest.TestCase):
     def setUp(self):
         self.config = ConnectorConfig()
         self.config.delivery_timeout_sec = 5  # short timeout for tests
+        self.config.delivery_ws_signals = False
 
         self.client = MagicMock()
         self.client.get_history = AsyncMock()
+        self.client.get_recent_history = AsyncMock()
         self.client.get_view = AsyncMock()
 
         self.mock_platform = MockPlatform()
@@ -44,31 +46,21 @@ class TestResultsPoller(unittest.TestCase):
         item = self.poller.queue.get_nowait()
         self.assertEqual(item, ("p-1", "test_plat", "c-1", "u-1", {}))
 
-    @patch("connector.results_poller.time")
-    @patch("connector.results_poller.asyncio.sleep", new_callable=AsyncMock)
-    def test_poll_job_success(self, mock_sleep, mock_time):
-        mock_time.time.side_effect = [0, 1, 2, 3]
-
-        self.client.get_history.side_effect = [
-            {"ok": True, "data": {}},
-            {
-                "ok": True,
-                "data": {
-                    "p-1": {
-                        "outputs": {
-                            "node-1": {
-                                "images": [{"filename": "f.png", "type": "output"}]
-                            }
-                        }
+    def test_watch_job_success(self):
+        self.client.get_recent_history.return_value = {
+            "ok": True,
+            "data": {
+                "p-1": {
+                    "outputs": {
+                        "node-1": {"images": [{"filename": "f.png", "type": "output"}]}
                     }
-                },
+                }
             },
-        ]
-
+        }
         self.client.get_view.return_value = b"image_bytes"
 
         asyncio.run(
-            self.poller._poll_job(
+            self.poller._watch_job(
                 "p-1",
                 "test_plat",
                 "c-1",
@@ -77,7 +69,7 @@ class TestResultsPoller(unittest.TestCase):
             )
         )
 
-        self.assertEqual(self.client.get_history.call_count, 2)
+        self.client.get_history.assert_not_called()
         self.client.get_view.assert_called_with("f.png", "", "output")
         self.mock_platform.send_image.assert_called_with(
             "c-1",
@@ -86,39 +78,50 @@ class TestResultsPoller(unittest.TestCase):
             delivery_context={"workspace_id": "T1", "thread_id": "123.456"},
         )
 
-    @patch("connector.results_poller.time")
-    @patch("connector.results_poller.asyncio.sleep", new_callable=AsyncMock)
-    def test_poll_job_no_outputs(self, mock_sleep, mock_time):
+    def test_watch_job_no_outputs(self):
         # Scenario: Job finished, but "outputs" is empty or has no images.
-        mock_time.time.side_effect = [0, 1, 2]
-
-        self.client.get_history.side_effect = [
-            {
-                "ok": True,
-                "data": {"p-empty": {"outputs": {}}},
-            }  # Completed, empty outputs
-        ]
+        self.client.get_recent_history.return_value = {
+            "ok": True,
+            "data": {"p-empty": {"outputs": {}}},
+        }
 
-        asyncio.run(self.poller._poll_job("p-empty", "test_plat", "c-1", "u-1"))
+        asyncio.run(self.poller._watch_job("p-empty", "test_plat", "c-1", "u-1"))
 
         self.mock_platform.send_image.assert_not_called()
         self.mock_platform.send_message.assert_called_once()
         args = self.mock_platform.send_message.call_args
         self.assertIn("No output images", args[0][1])
 
-    @patch("connector.results_poller.time")
-    @patch("connector.results_poller.asyncio.sleep", new_callable=AsyncMock)
-    def test_poll_job_timeout(self, mock_sleep, mock_time):
-        self.config.delivery_timeout_sec = 2
-        mock_time.time.side_effect = [0, 1, 3]
-
-        self.client.get_history.return_value = {"ok": True, "data": {}}
+    def test_watch_job_timeout(self):
+        self.config.delivery_timeout_sec = 0.05
+        self.client.get_recent_history.return_value = {"ok": True, "data": {}}
 
-        asyncio.run(self.poller._poll_job("p-timeout", "test_plat", "c-1", "u-1"))
+        asyncio.run(self.poller._watch_job("p-timeout", "test_plat", "c-1", "u-1"))
 
         self.mock_platform.send_image.assert_not_called()
         self.mock_platform.send_message.assert_called_once()
         self.assertIn("timed out", self.mock_platform.send_message.call_args[0][1])
+        self.assertEqual(self.poller.watcher.pending, 0)
+
+    def test_concurrent_jobs_share_one_history_sweep(self):
+        self.client.get_recent_history.return_value = {
+            "ok": True,
+            "data": {f"p-{i}": {"outputs": {}} for i in range(20)},
+        }
+
+        async def _run():
+            await asyncio.gather(
+                *(
+                    self.poller._watch_job(f"p-{i}", "test_plat", "c-1", "u-1")
+                    for i in range(20)
+                )
+            )
+            await self.poller.watcher.close()
+
+        asyncio.run(_run())
+
+        self.assertEqual(self.client.get_recent_history.await_count, 1)
+        self.assertEqual(self.mock_platform.send_message.call_count, 20)
 
     def test_deliver_results_limits(self):
         self.config.delivery_max_images = 1
@@ -61,6 +61,21 @@ class TestBridgeClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(jobs), 1)
         self.assertEqual(jobs[0]["id"], "1")
 
+    async def test_fetch_jobs_long_poll_params(self):
+        """Long-poll passes batch/wait and extends the request timeout."""
+        mock_resp = AsyncMock()
+        mock_resp.status = 204
+
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_resp
+
+        self.client.session = mock_session
+
+        await self.client.fetch_jobs(batch=3, wait_sec=20)
+        _, kwargs = mock_session.get.call_args
+        self.assertEqual(kwargs["params"], {"batch": "3", "wait": "20"})
+        self.assertEqual(kwargs["timeout"].total, 30)
+
     async def test_submit_result(self):
         """Test result submission."""
         mock_resp = AsyncMock()
@@ -0,0 +1,101 @@
+"""
+Tests for Sidecar Runtime concurrency and heartbeats (F46).
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from services.sidecar.runtime import SidecarRuntime
+
+
+class TestSidecarRuntime(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        env = {
+            "OPENCLAW_WORKER_TOKEN": "token",
+            "OPENCLAW_SIDECAR_MAX_CONCURRENCY": "2",
+            "OPENCLAW_SIDECAR_POLL_WAIT_SEC": "0.1",
+        }
+        with patch.dict(os.environ, env):
+            self.runtime = SidecarRuntime()
+        self.runtime.bridge = MagicMock()
+        self.runtime.bridge.report_status = AsyncMock()
+        self.runtime.bridge.submit_result = AsyncMock(return_value=True)
+        self.runtime.local = MagicMock()
+        self.release = asyncio.Event()
+        self.active = 0
+        self.peak = 0
+
+    async def _execute(self, job):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await self.release.wait()
+        self.active -= 1
+
+    async def test_jobs_run_concurrently_up_to_limit(self):
+        queue = [{"job_id": f"j{i}"} for i in range(3)]
+        batches = []
+
+        async def fetch_jobs(batch=1, wait_sec=0.0):
+            batches.append(batch)
+            jobs, queue[:batch] = queue[:batch], []
+            if not jobs:
+                await asyncio.sleep(wait_sec)
+            return jobs
+
+        self.runtime.bridge.fetch_jobs = fetch_jobs
+        self.runtime.execute_job = self._execute
+        self.runtime.running = True
+        loop = asyncio.ensure_future(self.runtime.run_loop())
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(len(queue), 1)
+        self.release.set()
+        await asyncio.sleep(0.05)
+        self.runtime.running = False
+        self.runtime._slot_freed.set()
+        await asyncio.wait_for(loop, 2)
+
+        self.assertEqual(queue, [])
+        self.assertEqual(batches[0], 2)
+
+    async def test_heartbeat_batches_job_changes(self):
+        self.runtime.heartbeat_interval_sec = 60
+        self.runtime.running = True
+        self.runtime.execute_job = self._execute
+        heartbeat = asyncio.ensure_future(self.runtime._heartbeat_loop())
+        await asyncio.sleep(0)
+        for i in range(3):
+            self.runtime._start_job({"job_id": f"j{i}"})
+        await asyncio.sleep(0.7)
+        self.runtime.running = False
+        heartbeat.cancel()
+
+        calls = self.runtime.bridge.report_status.await_args_list
+        self.assertEqual(len(calls), 2)
+        status, details = calls[-1].args
+        self.assertEqual(status, "working")
+        self.assertEqual(details["job_ids"], ["j0", "j1", "j2"])
+        self.release.set()
+
+    async def test_completion_uses_shared_watcher(self):
+        self.runtime.local.get_recent_history = AsyncMock(
+            return_value={"ok": True, "data": {"p1": {"outputs": {"9": {}}}}}
+        )
+
+        result = await self.runtime._wait_for_completion("p1", timeout=2)
+
+        self.assertEqual(result, {"status": "completed", "outputs": {"9": {}}})
+        await self.runtime.watcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
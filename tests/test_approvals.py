@@ -207,6 +207,62 @@ class TestApprovalStorage(unittest.TestCase):
         retrieved = store.get("apr_update001")
         self.assertIsNotNone(retrieved.approved_at)
 
+    def test_expire_between_get_and_update_is_a_conflict(self):
+        """An expiry landing between get() and update() keeps its result."""
+        from services.approvals.models import ApprovalRequest, ApprovalStatus
+        from services.approvals.storage import ApprovalConflictError, ApprovalStore
+
+        store = ApprovalStore()
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        store.add(
+            ApprovalRequest(
+                approval_id="apr_race001",
+                template_id="template_test",
+                expires_at=past,
+            )
+        )
+
+        request = store.get("apr_race001")
+        self.assertEqual(store.expire_due(), 1)
+        request.approve(actor="tester")
+
+        with self.assertRaises(ApprovalConflictError):
+            store.update(request, expected_status=ApprovalStatus.PENDING)
+        self.assertEqual(store.get("apr_race001").status, ApprovalStatus.EXPIRED)
+        self.assertFalse(
+            store.update(
+                ApprovalRequest(approval_id="apr_race404", template_id="t"),
+                expected_status=ApprovalStatus.PENDING,
+            )
+        )
+
+    def test_expire_due_skips_rows_decided_after_the_scan(self):
+        """expire_due() must not overwrite a decision made after its query."""
+        from services.approvals.models import ApprovalRequest, ApprovalStatus
+        from services.approvals.storage import ApprovalStore
+
+        store = ApprovalStore()
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        request = ApprovalRequest(
+            approval_id="apr_race002",
+            template_id="template_test",
+            expires_at=past,
+        )
+        store.add(request)
+        decided = ApprovalRequest.from_dict(request.to_dict())
+        decided.reject(actor="tester")
+
+        query = store._state().query
+
+        def query_then_decide(*args, **kwargs):
+            rows = query(*args, **kwargs)
+            store.update(decided, expected_status=ApprovalStatus.PENDING)
+            return rows
+
+        with patch.object(store._state(), "query", side_effect=query_then_decide):
+            self.assertEqual(store.expire_due(), 0)
+        self.assertEqual(store.get("apr_race002").status, ApprovalStatus.REJECTED)
+
     def test_list_by_status(self):
         """Test listing by status."""
         from services.approvals.models import ApprovalRequest, ApprovalStatus
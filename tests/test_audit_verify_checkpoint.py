@@ -0,0 +1,151 @@
+"""
+Tests for checkpointed, incremental and parallel audit chain verification.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import unittest
+
+from services.audit_pipeline import (
+    VERIFY_CHECKPOINT_SUFFIX,
+    BatchFileAuditSink,
+    hmac_chain_hash,
+    load_verify_checkpoint,
+    verify_audit_chain,
+)
+from services.metrics import metrics
+
+_CHAIN_HASH = functools.partial(hmac_chain_hash, b"test-chain-key")
+
+
+class TestAuditVerifyCheckpoint(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "audit.log")
+        self.checkpoint = f"{self.path}{VERIFY_CHECKPOINT_SUFFIX}"
+        self.tail = None
+
+    def _append(self, count, max_bytes=0):
+        sink = BatchFileAuditSink(
+            path=self.path, max_bytes=max_bytes, backups=5, chain_hash=_CHAIN_HASH
+        )
+        entries = [{"seq": seq} for seq in range(count)]
+        self.tail = sink.append_batch(entries, last_hash=self.tail, fsync=False)
+        sink.close()
+
+    def _verify(self, **kwargs):
+        kwargs.setdefault("checkpoint_path", self.checkpoint)
+        hashed = metrics.get_all()["audit_verify_entries_hashed"]
+        result = verify_audit_chain(self.path, chain_hash=_CHAIN_HASH, **kwargs)
+        return result, metrics.get_all()["audit_verify_entries_hashed"] - hashed
+
+    def _rewrite_line(self, path, index, **changes):
+        with open(path, "r", encoding="utf-8") as handle:
+            lines = [json.loads(line) for line in handle]
+        lines[index].update(changes)
+        with open(path, "w", encoding="utf-8") as handle:
+            for line in lines:
+                handle.write(json.dumps(line, sort_keys=True, ensure_ascii=True) + "\n")
+
+    def test_resume_hashes_only_appended_entries(self):
+        self._append(5)
+        first, hashed = self._verify()
+        self.assertTrue(first.ok)
+        self.assertEqual(hashed, 5)
+
+        self._append(3)
+        second, hashed = self._verify()
+
+        self.assertTrue(second.ok, second.to_dict())
+        self.assertEqual(hashed, 3)
+        self.assertEqual(second.entries_checked, 8)
+        self.assertEqual(second.terminal_hash, self.tail)
+
+    def test_full_mode_ignores_checkpoint(self):
+        self._append(4)
+        self._verify()
+
+        result, hashed = self._verify(full=True)
+
+        self.assertTrue(result.ok)
+        self.assertEqual(hashed, 4)
+
+    def test_forged_checkpoint_is_not_trusted(self):
+        self._append(4)
+        self._verify()
+        with open(self.checkpoint, "r", encoding="utf-8") as handle:
+            body = json.load(handle)
+        body["segments"][0]["entries"] = 999
+        with open(self.checkpoint, "w", encoding="utf-8") as handle:
+            json.dump(body, handle)
+
+        self.assertEqual(
+            load_verify_checkpoint(self.checkpoint, chain_hash=_CHAIN_HASH), []
+        )
+        result, hashed = self._verify()
+        self.assertEqual((result.entries_checked, hashed), (4, 4))
+
+    def test_rewritten_tail_of_verified_prefix_forces_rescan(self):
+        self._append(3)
+        self._verify()
+        self._rewrite_line(self.path, 2, seq="tampered")
+
+        result, _ = self._verify()
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.issues[0].code, "entry_hash_mismatch")
+        self.assertEqual(result.issues[0].line_number, 3)
+
+    def test_rotated_segment_keeps_its_checkpoint(self):
+        self._append(3)
+        self._verify()
+        # Rotate the verified file to audit.log.1 and start a new active file.
+        self._append(1, max_bytes=1)
+
+        result, hashed = self._verify()
+
+        self.assertTrue(result.ok, result.to_dict())
+        self.assertEqual(len(result.files_checked), 2)
+        self.assertEqual(hashed, 1)
+
+    def test_parallel_segments_match_serial_result(self):
+        self._append(6, max_bytes=1)
+
+        serial, _ = self._verify(checkpoint_path=None)
+        parallel, hashed = self._verify(checkpoint_path=None, workers=3)
+
+        self.assertTrue(parallel.ok, parallel.to_dict())
+        self.assertEqual(parallel.to_dict(), serial.to_dict())
+        self.assertEqual(hashed, 6)
+
+    def test_parallel_detects_gap_between_segments(self):
+        self._append(4, max_bytes=1)
+        os.remove(f"{self.path}.2")
+
+        result, _ = self._verify(workers=2)
+
+        self.assertFalse(result.ok)
+        issue = result.issues[0]
+        self.assertEqual(issue.code, "prev_hash_mismatch")
+        self.assertEqual((issue.file_path, issue.line_number), (f"{self.path}.1", 1))
+        self.assertEqual(result.entries_checked, 1)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_unpicklable_chain_hash_falls_back_to_serial(self):
+        self._append(3, max_bytes=1)
+
+        def local_hash(prev_hash, entry):
+            return _CHAIN_HASH(prev_hash, entry)
+
+        with self.assertLogs("ComfyUI-OpenClaw.services.audit_pipeline", "WARNING"):
+            result = verify_audit_chain(self.path, chain_hash=local_hash, workers=2)
+
+        self.assertTrue(result.ok, result.to_dict())
+        self.assertEqual(result.entries_checked, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+Tests for the batched audit writer and the batch file sink.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import services.audit as audit_module
+from services.audit_pipeline import BatchFileAuditSink
+from services.audit_writer import AuditBatchWriter
+from services.metrics import metrics
+
+
+def _chain_hash(prev_hash, entry):
+    return f"{prev_hash[:8]}:{entry['seq']}"
+
+
+class _RecordingFlusher:
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, batch):
+        self.gate.wait(5)
+        self.batches.append([entry["seq"] for entry in batch])
+
+
+class TestAuditBatchWriter(unittest.TestCase):
+    def _writer(self, flusher, **kwargs):
+        writer = AuditBatchWriter(flusher, **kwargs)
+        self.addCleanup(writer.close, 5)
+        return writer
+
+    def test_sync_mode_writes_inline(self):
+        flusher = _RecordingFlusher()
+        writer = self._writer(flusher, mode="sync")
+
+        writer.submit({"seq": 1})
+
+        self.assertEqual(flusher.batches, [[1]])
+        self.assertIsNone(writer._thread)
+
+    def test_batched_mode_groups_concurrent_callers(self):
+        flusher = _RecordingFlusher()
+        writer = self._writer(flusher, mode="batched")
+        flusher.gate.clear()
+        threads = [
+            threading.Thread(target=writer.submit, args=({"seq": seq},))
+            for seq in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        flusher.gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        written = [seq for batch in flusher.batches for seq in batch]
+        self.assertEqual(sorted(written), list(range(8)))
+        self.assertLess(len(flusher.batches), 8)
+        self.assertEqual(writer.stats()["committed"], 8)
+
+    def test_async_mode_returns_before_write_and_flushes(self):
+        flusher = _RecordingFlusher()
+        writer = self._writer(flusher, mode="async", flush_interval_sec=5)
+
+        writer.submit({"seq": 1})
+        writer.submit({"seq": 2})
+        self.assertEqual(flusher.batches, [])
+
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(flusher.batches, [[1, 2]])
+
+    def test_async_batch_size_triggers_early_flush(self):
+        flusher = _RecordingFlusher()
+        writer = self._writer(flusher, mode="async", batch_size=2, flush_interval_sec=5)
+
+        writer.submit({"seq": 1})
+        writer.submit({"seq": 2})
+
+        deadline = time.monotonic() + 2
+        while not flusher.batches and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(flusher.batches, [[1, 2]])
+
+    def test_drop_policy_accounts_in_queue_stats(self):
+        flusher = _RecordingFlusher()
+        flusher.gate.clear()
+        writer = self._writer(
+            flusher, mode="async", capacity=2, batch_size=1, queue_full="drop"
+        )
+        writer.submit({"seq": 0})
+        # Wait for the writer to pick up seq 0 and block inside the flusher.
+        while len(writer._queue) or not writer._writing:
+            time.sleep(0.005)
+        for seq in range(1, 5):
+            writer.submit({"seq": seq})
+
+        stats = writer.stats()["queue"]
+        self.assertEqual(stats["total_dropped"], 2)
+        self.assertEqual(stats["high_watermark"], 2)
+        flusher.gate.set()
+        writer.flush(5)
+        written = [seq for batch in flusher.batches for seq in batch]
+        self.assertEqual(written, [0, 3, 4])
+
+    def test_block_policy_falls_back_to_inline_write(self):
+        flusher = _RecordingFlusher()
+        flusher.gate.clear()
+        writer = self._writer(
+            flusher, mode="async", capacity=1, batch_size=1, block_timeout_sec=0.05
+        )
+        writer.submit({"seq": 0})
+        while len(writer._queue) or not writer._writing:
+            time.sleep(0.005)
+        writer.submit({"seq": 1})
+        waits = metrics.get_all()["audit_backpressure_waits"]
+        threading.Timer(0.2, flusher.gate.set).start()
+
+        writer.submit({"seq": 2})  # queue full, writer stuck: written inline
+
+        self.assertEqual(metrics.get_all()["audit_backpressure_waits"], waits + 1)
+        self.assertEqual(writer.stats()["submitted"], 2)
+        writer.flush(5)
+        written = [seq for batch in flusher.batches for seq in batch]
+        self.assertEqual(sorted(written), [0, 1, 2])
+        self.assertEqual(writer.stats()["queue"]["total_dropped"], 0)
+
+    def test_submit_after_close_writes_inline(self):
+        flusher = _RecordingFlusher()
+        writer = self._writer(flusher, mode="async")
+        writer.close(5)
+
+        writer.submit({"seq": 9})
+
+        self.assertEqual(flusher.batches, [[9]])
+
+
+class TestBatchFileAuditSink(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "audit.log")
+
+    def _sink(self, max_bytes=0, backups=3):
+        sink = BatchFileAuditSink(
+            path=self.path, max_bytes=max_bytes, backups=backups, chain_hash=_chain_hash
+        )
+        self.addCleanup(sink.close)
+        return sink
+
+    def _lines(self, path=None):
+        with open(path or self.path, "r", encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle]
+
+    def test_batch_is_chained_in_order(self):
+        tail = self._sink().append_batch([{"seq": 1}, {"seq": 2}], last_hash=None)
+
+        lines = self._lines()
+        self.assertEqual(lines[0]["prev_hash"], "GENESIS")
+        self.assertEqual(lines[1]["prev_hash"], lines[0]["entry_hash"])
+        self.assertEqual(tail, lines[1]["entry_hash"])
+
+    def test_reopens_when_file_is_removed(self):
+        sink = self._sink()
+        sink.append_batch([{"seq": 1}], last_hash=None)
+        os.remove(self.path)
+
+        sink.append_batch([{"seq": 2}], last_hash="restart")
+
+        self.assertEqual([line["seq"] for line in self._lines()], [2])
+
+    def test_rotates_inside_a_batch(self):
+        sink = self._sink(max_bytes=1)
+
+        sink.append_batch([{"seq": 1}, {"seq": 2}, {"seq": 3}], last_hash=None)
+
+        self.assertEqual(self._lines()[0]["seq"], 3)
+        self.assertEqual(self._lines(f"{self.path}.1")[0]["seq"], 2)
+        self.assertEqual(self._lines(f"{self.path}.2")[0]["seq"], 1)
+
+
+class TestAuditServiceWriter(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.audit_log = os.path.join(temp_dir.name, "audit.log")
+        for patcher in (
+            patch("services.audit.AUDIT_LOG_PATH", self.audit_log),
+            patch("services.audit._LAST_HASH", None),
+            patch("services.audit._AUDIT_CHAIN_KEY", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        audit_module.shutdown_audit_writer()
+        self.addCleanup(audit_module.shutdown_audit_writer)
+
+    def _emit(self, seq):
+        audit_module.emit_audit_event(
+            action="config.update",
+            target="settings.json",
+            outcome="allow",
+            status_code=200,
+            details={"seq": seq},
+        )
+
+    def test_concurrent_emits_keep_a_valid_chain(self):
+        threads = [threading.Thread(target=self._emit, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        result = audit_module.verify_audit_chain()
+        self.assertTrue(result.ok, result.to_dict())
+        self.assertEqual(result.entries_checked, 20)
+
+    def test_async_mode_persists_on_flush(self):
+        with patch.dict(os.environ, {"OPENCLAW_AUDIT_DURABILITY": "async"}):
+            self._emit(1)
+        self.assertEqual(audit_module.get_audit_writer_stats()["mode"], "async")
+
+        self.assertTrue(audit_module.flush_audit_log(5))
+
+        self.assertEqual(audit_module.verify_audit_chain().entries_checked, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
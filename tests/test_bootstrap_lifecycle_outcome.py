@@ -686,6 +686,7 @@ class TestPublicHealthLifecycleProjection(unittest.TestCase):
                     "trace_handler",
                     "webhook_handler",
                     "webhook_submit_handler",
+                    "webhook_submit_batch_handler",
                     "webhook_validate_handler",
                     "capabilities_handler",
                     "config_get_handler",
@@ -719,6 +720,7 @@ class TestPublicHealthLifecycleProjection(unittest.TestCase):
                     "secrets_put_handler",
                     "events_stream_handler",
                     "events_poll_handler",
+                    "metrics_handler",
                     "secrets_delete_handler",
                     "security_doctor_handler",
                     "tools_list_handler",
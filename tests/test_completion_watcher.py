@@ -0,0 +1,128 @@
+"""
+Tests for the shared completion watcher (one history sweep for all waiters).
+"""
+
+import asyncio
+import sys
+import types
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services import comfyui_history
+from services.completion_watcher import CompletionWatcher, get_loop_completion_watcher
+
+
+class TestCompletionWatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_waiters_share_future_and_sweep(self):
+        fetch = AsyncMock(return_value={"p1": {"status": {"status_str": "success"}}})
+        watcher = CompletionWatcher(fetch)
+
+        first, second = await asyncio.gather(
+            watcher.wait("p1", timeout=1), watcher.wait("p1", timeout=1)
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(fetch.await_count, 1)
+        self.assertEqual(fetch.await_args.args[0], 1 + 32)
+        self.assertEqual(watcher.pending, 0)
+        await watcher.close()
+
+    async def test_timeout_releases_waiter(self):
+        watcher = CompletionWatcher(AsyncMock(return_value={}), interval_sec=0.01)
+
+        self.assertIsNone(await watcher.wait("missing", timeout=0.05))
+        self.assertEqual(watcher.pending, 0)
+        await watcher.close()
+
+    async def test_failed_sweep_backs_off_then_recovers(self):
+        fetch = AsyncMock(side_effect=[RuntimeError("down"), None, {"p1": {}}])
+        watcher = CompletionWatcher(fetch, interval_sec=0.01, min_gap_sec=0)
+
+        self.assertEqual(await watcher.wait("p1", timeout=1), {})
+        self.assertEqual(watcher.stats()["sweep_errors"], 2)
+        self.assertEqual(watcher.stats()["sweeps"], 1)
+        await watcher.close()
+
+    async def test_signal_wakes_sweep_before_interval(self):
+        fetch = AsyncMock(side_effect=[{}, {"p1": {"outputs": {}}}])
+
+        async def _signals():
+            await asyncio.sleep(0.05)
+            yield ""
+            await asyncio.Event().wait()
+
+        watcher = CompletionWatcher(
+            fetch, signals=_signals, interval_sec=30, min_gap_sec=0
+        )
+
+        self.assertEqual(await watcher.wait("p1", timeout=2), {"outputs": {}})
+        self.assertEqual(fetch.await_count, 2)
+        self.assertEqual(watcher.stats()["signals_seen"], 1)
+        await watcher.close()
+
+    async def test_job_pushed_out_of_window_is_looked_up(self):
+        # The watched prompt finished first, then 40 unrelated prompts did.
+        history = {"watched": {"outputs": {"9": {}}}}
+        history.update({f"other-{i}": {"outputs": {}} for i in range(40)})
+        newest_first = list(reversed(history))
+
+        async def fetch_recent(max_items):
+            return {pid: history[pid] for pid in newest_first[:max_items]}
+
+        async def fetch_one(prompt_id):
+            return history.get(prompt_id)
+
+        fetch_one_mock = AsyncMock(side_effect=fetch_one)
+        watcher = CompletionWatcher(
+            fetch_recent, fetch_one=fetch_one_mock, interval_sec=0.01, min_gap_sec=0
+        )
+
+        item = await watcher.wait("watched", timeout=2)
+
+        self.assertEqual(item, {"outputs": {"9": {}}})
+        fetch_one_mock.assert_awaited_with("watched")
+        self.assertGreaterEqual(watcher.stats()["probes"], 1)
+        await watcher.close()
+
+    async def test_partial_window_skips_per_prompt_lookups(self):
+        fetch_one = AsyncMock(return_value=None)
+        watcher = CompletionWatcher(
+            AsyncMock(return_value={"other": {}}),
+            fetch_one=fetch_one,
+            interval_sec=0.01,
+            min_gap_sec=0,
+        )
+
+        self.assertIsNone(await watcher.wait("running", timeout=0.1))
+        fetch_one.assert_not_awaited()
+        await watcher.close()
+
+    async def test_loop_watcher_is_shared_per_name(self):
+        fetch = AsyncMock(return_value={})
+        first = get_loop_completion_watcher("t", fetch)
+        self.assertIs(get_loop_completion_watcher("t", fetch), first)
+        self.assertIsNot(get_loop_completion_watcher("other", fetch), first)
+
+
+class TestFetchRecentHistory(unittest.TestCase):
+    def test_prefers_in_process_prompt_queue(self):
+        prompt_queue = MagicMock()
+        prompt_queue.get_history.return_value = {"p1": {"outputs": {}}}
+        server = types.SimpleNamespace(
+            PromptServer=types.SimpleNamespace(
+                instance=types.SimpleNamespace(prompt_queue=prompt_queue)
+            )
+        )
+        with (
+            patch.dict(sys.modules, {"server": server}),
+            patch.object(comfyui_history, "urlopen") as mock_urlopen,
+        ):
+            history = comfyui_history.fetch_recent_history(40)
+
+        self.assertEqual(history, {"p1": {"outputs": {}}})
+        prompt_queue.get_history.assert_called_once_with(max_items=40)
+        mock_urlopen.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
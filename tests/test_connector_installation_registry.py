@@ -1,6 +1,7 @@
 import os
 import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from services.connector_installation_registry import (
@@ -8,6 +9,7 @@ from services.connector_installation_registry import (
     InstallationStatus,
 )
 from services.secret_store import SecretStore
+from services.state_store import STATE_DB_NAME
 
 
 class TestConnectorInstallationRegistry(unittest.TestCase):
@@ -153,12 +155,12 @@ class TestConnectorInstallationRegistry(unittest.TestCase):
         self.assertEqual(len(listed), 1)
         self.assertEqual(listed[0].installation_id, "inst-persist")
 
-        with open(
-            os.path.join(self.state_dir, "connector_installations.json"),
-            "r",
-            encoding="utf-8",
-        ) as fh:
-            raw = fh.read()
+        # Rows live in the state database (plus its WAL until checkpoint).
+        raw = "".join(
+            path.read_bytes().decode("latin-1")
+            for path in Path(self.state_dir).glob(f"{STATE_DB_NAME}*")
+        )
+        self.assertIn("inst-persist", raw)
         self.assertNotIn("xoxb-secret", raw)
 
     def test_multi_tenant_resolve_mismatch_fail_closed(self):
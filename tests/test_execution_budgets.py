@@ -243,6 +243,31 @@ class TestExecutionBudgetLimiter(unittest.IsolatedAsyncioTestCase):
                     stats = limiter.get_stats()
                     self.assertEqual(stats["total"], 2)
 
+    async def test_acquire_many_grants_available_slots(self):
+        """Bulk acquisition grants up to the tightest free budget in one pass."""
+        from services.execution_budgets import BudgetConfig
+
+        config = BudgetConfig(
+            max_inflight_total=4,
+            max_inflight_webhook=3,
+            max_inflight_trigger=1,
+            max_inflight_scheduler=1,
+            max_inflight_bridge=1,
+        )
+        limiter = ExecutionBudgetLimiter(config)
+
+        async with limiter.acquire("trigger"):
+            async with limiter.acquire_many(10, "webhook") as granted:
+                self.assertEqual(granted, 3)
+                self.assertEqual(limiter.get_stats()["total"], 4)
+                with self.assertRaises(BudgetExceededError):
+                    async with limiter.acquire_many(2, "webhook"):
+                        pass
+
+        self.assertEqual(limiter.get_stats()["total"], 0)
+        async with limiter.acquire_many(2, "webhook") as granted:
+            self.assertEqual(granted, 2)
+
 
 class TestGlobalLimiterSingleton(unittest.TestCase):
     """Test global limiter singleton."""
@@ -202,6 +202,42 @@ class TestF46WorkerPoll(unittest.TestCase):
         resp = asyncio.run(handlers.worker_poll_handler(req))
         self.assertEqual(resp.status, 400)
 
+    def test_poll_wait_returns_job_enqueued_during_hold(self):
+        """Long-poll hold releases as soon as a job is enqueued."""
+        from api.bridge import BridgeHandlers
+
+        handlers = BridgeHandlers()
+        req = _make_auth_request(query={"wait": "5"})
+
+        async def scenario():
+            poll = asyncio.ensure_future(handlers.worker_poll_handler(req))
+            await asyncio.sleep(0.05)
+            handlers.enqueue_worker_job({"job_id": "late"})
+            return await asyncio.wait_for(poll, 1)
+
+        resp = asyncio.run(scenario())
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(json.loads(resp.body)["jobs"][0]["job_id"], "late")
+        self.assertEqual(handlers._worker_poll_waiters, [])
+
+    def test_poll_wait_expires_with_204(self):
+        """Long-poll hold ends with 204 when no job arrives."""
+        from api.bridge import BridgeHandlers
+
+        handlers = BridgeHandlers()
+        req = _make_auth_request(query={"wait": "0.1"})
+        resp = asyncio.run(handlers.worker_poll_handler(req))
+        self.assertEqual(resp.status, 204)
+
+    def test_poll_wait_invalid_returns_400(self):
+        """Non-numeric wait parameter returns 400."""
+        from api.bridge import BridgeHandlers
+
+        handlers = BridgeHandlers()
+        req = _make_auth_request(query={"wait": "soon"})
+        resp = asyncio.run(handlers.worker_poll_handler(req))
+        self.assertEqual(resp.status, 400)
+
     def test_poll_no_auth_returns_401(self):
         """Unauthenticated poll returns 401."""
         from api.bridge import BridgeHandlers
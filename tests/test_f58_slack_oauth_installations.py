@@ -2,6 +2,7 @@ import os
 import sys
 import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -12,6 +13,7 @@ from connector.platforms.slack_installation_manager import SlackInstallationMana
 from connector.platforms.slack_webhook import SlackWebhookServer
 from services.connector_installation_registry import ConnectorInstallationRegistry
 from services.secret_store import SecretStore
+from services.state_store import STATE_DB_NAME
 
 
 class TestF58SlackOAuthInstallations(unittest.IsolatedAsyncioTestCase):
@@ -69,12 +71,11 @@ class TestF58SlackOAuthInstallations(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(resolution.ok)
         self.assertEqual(tokens["bot_token"], "xoxb-rotated")
 
-        with open(
-            os.path.join(self.state_dir, "connector_installations.json"),
-            "r",
-            encoding="utf-8",
-        ) as fh:
-            raw = fh.read()
+        # Rows live in the state database (plus its WAL until checkpoint).
+        raw = "".join(
+            path.read_bytes().decode("latin-1")
+            for path in Path(self.state_dir).glob(f"{STATE_DB_NAME}*")
+        )
         self.assertNotIn("xoxb-rotated", raw)
 
     async def test_workspace_bound_reply_uses_installation_token(self):
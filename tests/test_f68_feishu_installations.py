@@ -3,6 +3,7 @@ import os
 import sys
 import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -13,6 +14,7 @@ from connector.platforms.feishu_installation_manager import FeishuInstallationMa
 from connector.platforms.feishu_webhook import FeishuWebhookServer
 from services.connector_installation_registry import ConnectorInstallationRegistry
 from services.secret_store import SecretStore
+from services.state_store import STATE_DB_NAME
 from services.tenant_context import tenant_scope
 
 
@@ -99,9 +101,11 @@ class TestF68FeishuInstallations(unittest.IsolatedAsyncioTestCase):
             2,
         )
 
-        store_path = os.path.join(self.state_dir, "connector_installations.json")
-        with open(store_path, "r", encoding="utf-8") as fh:
-            raw = fh.read()
+        # Rows live in the state database (plus its WAL until checkpoint).
+        raw = "".join(
+            path.read_bytes().decode("latin-1")
+            for path in Path(self.state_dir).glob(f"{STATE_DB_NAME}*")
+        )
         self.assertNotIn("sec_alpha", raw)
         self.assertNotIn("sec_beta", raw)
 
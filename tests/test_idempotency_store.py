@@ -50,6 +50,16 @@ class TestIdempotencyStore(unittest.TestCase):
         is_dup, prompts = self.store.check_and_record(key, ttl=60)
         self.assertTrue(is_dup)
 
+    def test_check_and_record_many(self):
+        """Bulk check records fresh keys once and flags repeats in order."""
+        self.store.check_and_record("seen", ttl=60)
+        self.store.update_prompt_id("seen", "p-seen")
+
+        results = self.store.check_and_record_many(["seen", "new", "new"], ttl=60)
+
+        self.assertEqual(results, [(True, "p-seen"), (False, None), (True, None)])
+        self.assertTrue(self.store.check_and_record("new", ttl=60)[0])
+
     def test_ttl_expiration(self):
         """Test that expired items are removed."""
         key = "short_lived"
@@ -0,0 +1,279 @@
+"""
+Tests for the asyncio-native LLM path (safe_io_async + LLMClient.acomplete/astream).
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import types
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.getcwd())
+
+from services.failover import reset_failover_state
+from services.provider_errors import ProviderHTTPError
+from services.safe_io import SafeIOHTTPError, SSRFError, reset_outbound_transport
+from services.safe_io_async import (
+    async_safe_request_json,
+    async_safe_request_text_stream,
+    close_async_transport,
+    get_async_transport_stats,
+)
+
+_LOOPBACK = {"allow_hosts": {"127.0.0.1"}, "allow_loopback_hosts": {"127.0.0.1"}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        return None
+
+    def _send(self, status, body, content_type="application/json", extra=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address[1])
+        if self.path == "/redirect":
+            self._send(302, b"", extra={"Location": "/final"})
+            return
+        if self.path == "/limited":
+            self._send(429, b'{"error": "slow down"}', extra={"Retry-After": "7"})
+            return
+        if self.path == "/stream":
+            self._send(200, b"data: one\n\ndata: two\n\n", "text/event-stream")
+            return
+        self._send(200, json.dumps({"path": self.path}).encode("utf-8"))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.peers.append(self.client_address[1])
+        self._send(200, json.dumps({"echo": payload}).encode("utf-8"))
+
+
+class TestAsyncSafeRequest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Some connector tests install a MagicMock aiohttp module at import
+        # time; these tests need the real client stack.
+        cls._modules = patch.dict(sys.modules)
+        cls._modules.start()
+        if not isinstance(sys.modules.get("aiohttp"), types.ModuleType):
+            sys.modules.pop("aiohttp", None)
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.server.peers = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls._modules.stop()
+
+    def setUp(self):
+        reset_outbound_transport()
+        self.server.peers.clear()
+
+    def _run(self, coro_fn):
+        async def _wrapped():
+            try:
+                return await coro_fn()
+            finally:
+                await close_async_transport()
+
+        return asyncio.run(_wrapped())
+
+    def test_requests_share_pinned_session(self):
+        async def _go():
+            first = await async_safe_request_json("GET", f"{self.base}/a", **_LOOPBACK)
+            second = await async_safe_request_json(
+                "POST", f"{self.base}/b", {"x": 1}, **_LOOPBACK
+            )
+            return first, second, get_async_transport_stats()
+
+        first, second, stats = self._run(_go)
+        self.assertEqual(first, {"path": "/a"})
+        self.assertEqual(second, {"echo": {"x": 1}})
+        self.assertEqual(stats["sessions"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(len(set(self.server.peers)), 1)
+
+    def test_http_error_is_structured(self):
+        async def _go():
+            await async_safe_request_json("GET", f"{self.base}/limited", **_LOOPBACK)
+
+        with self.assertRaises(SafeIOHTTPError) as ctx:
+            self._run(_go)
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertEqual(ctx.exception.headers.get("Retry-After"), "7")
+        self.assertIn("slow down", ctx.exception.body)
+
+    def test_redirects_blocked_by_default(self):
+        async def _go():
+            await async_safe_request_json("GET", f"{self.base}/redirect", **_LOOPBACK)
+
+        with self.assertRaises(RuntimeError):
+            self._run(_go)
+
+    def test_redirect_followed_when_allowed(self):
+        async def _go():
+            return await async_safe_request_json(
+                "GET", f"{self.base}/redirect", max_redirects=1, **_LOOPBACK
+            )
+
+        self.assertEqual(self._run(_go), {"path": "/final"})
+
+    def test_ssrf_policy_enforced(self):
+        async def _go():
+            await async_safe_request_json(
+                "GET", f"{self.base}/a", allow_hosts={"example.com"}
+            )
+
+        with self.assertRaises(SSRFError):
+            self._run(_go)
+
+    def test_text_stream_yields_lines(self):
+        async def _go():
+            return [
+                line
+                async for line in async_safe_request_text_stream(
+                    "GET", f"{self.base}/stream", **_LOOPBACK
+                )
+            ]
+
+        lines = self._run(_go)
+        self.assertEqual(lines[0], "data: one\n")
+        self.assertIn("data: two\n", lines)
+
+
+class TestLLMClientAsync(unittest.TestCase):
+    def setUp(self):
+        reset_failover_state()
+        patches = [
+            patch(
+                "services.runtime_config.get_effective_config",
+                return_value=(
+                    {
+                        "provider": "openai",
+                        "model": "gpt-async-test",
+                        "base_url": "https://api.openai.com/v1",
+                        "timeout_sec": 30,
+                        "max_retries": 2,
+                    },
+                    None,
+                ),
+            ),
+            patch(
+                "services.llm_client.get_api_key_for_provider", return_value="sk-test"
+            ),
+            patch("services.llm_client.PLUGINS_AVAILABLE", False),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        reset_failover_state()
+
+    def _client(self):
+        from services.llm_client import LLMClient
+
+        return LLMClient()
+
+    def test_acomplete_retries_rate_limit_without_blocking(self):
+        client = self._client()
+        rate_limited = ProviderHTTPError(
+            status_code=429,
+            message="HTTP error 429",
+            provider="openai_compat",
+            model=client.model,
+        )
+        with (
+            patch(
+                "services.llm_client.openai_compat.make_request_async",
+                new=AsyncMock(side_effect=[rate_limited, {"text": "ok", "raw": {}}]),
+            ) as mock_request,
+            patch("services.llm_client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+            patch("services.llm_client.openai_compat.make_request") as mock_sync,
+        ):
+            result = asyncio.run(client.acomplete(system="s", user_message="u"))
+
+        self.assertEqual(result["text"], "ok")
+        self.assertEqual(mock_request.await_count, 2)
+        mock_sleep.assert_awaited_once()
+        mock_sync.assert_not_called()
+
+    def test_concurrent_acomplete_keeps_client_state(self):
+        client = self._client()
+        provider, model = client.provider, client.model
+
+        async def _slow(**kwargs):
+            await asyncio.sleep(0)
+            return {"text": kwargs["model"], "raw": {}}
+
+        async def _go():
+            return await asyncio.gather(
+                client.acomplete(system="s", user_message="a"),
+                client.acomplete(system="s", user_message="b"),
+            )
+
+        with patch("services.llm_client.openai_compat.make_request_async", new=_slow):
+            results = asyncio.run(_go())
+
+        self.assertEqual([r["text"] for r in results], [model, model])
+        self.assertEqual((client.provider, client.model), (provider, model))
+
+    def test_astream_yields_deltas(self):
+        client = self._client()
+
+        async def _stream(**kwargs):
+            kwargs["on_text_delta"]("Hel")
+            await asyncio.sleep(0)
+            kwargs["on_text_delta"]("lo")
+            return {"text": "Hello", "raw": {"stream": True}}
+
+        async def _go():
+            return [chunk async for chunk in client.astream("s", "u")]
+
+        with patch(
+            "services.llm_client.openai_compat.make_request_stream_async", new=_stream
+        ):
+            chunks = asyncio.run(_go())
+        self.assertEqual(chunks, ["Hel", "lo"])
+
+    def test_astream_falls_back_to_full_text(self):
+        client = self._client()
+
+        async def _go():
+            return [chunk async for chunk in client.astream("s", "u")]
+
+        with (
+            patch(
+                "services.llm_client.openai_compat.make_request_stream_async",
+                new=AsyncMock(side_effect=RuntimeError("no stream")),
+            ),
+            patch(
+                "services.llm_client.openai_compat.make_request_async",
+                new=AsyncMock(return_value={"text": "whole", "raw": {}}),
+            ),
+        ):
+            chunks = asyncio.run(_go())
+        self.assertEqual(chunks, ["whole"])
+
+
+if __name__ == "__main__":
+    unittest.main()
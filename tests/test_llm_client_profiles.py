@@ -0,0 +1,109 @@
+"""
+Tests for cached LLMClient profiles.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services import runtime_config
+from services.llm_client import LLMClient, clear_llm_client_profiles
+
+
+class TestLLMClientProfiles(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory(prefix="openclaw_profiles_")
+        self.addCleanup(tmpdir.cleanup)
+        patches = [
+            patch(
+                "services.runtime_config.CONFIG_FILE",
+                os.path.join(tmpdir.name, "config.json"),
+            ),
+            patch.dict(os.environ),
+            patch("services.llm_client.PLUGINS_AVAILABLE", True),
+            patch(
+                "services.llm_client.get_api_key_for_provider", return_value="sk-one"
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        for key in ("OPENCLAW_LLM_PROVIDER", "OPENCLAW_LLM_MODEL"):
+            os.environ.pop(key, None)
+
+        self.plugin_manager = MagicMock()
+        self.plugin_manager.revision = 1
+        self.plugin_manager.execute_first = AsyncMock(return_value="gpt-4o-resolved")
+        pm_patch = patch("services.llm_client.plugin_manager", self.plugin_manager)
+        pm_patch.start()
+        self.addCleanup(pm_patch.stop)
+
+        runtime_config.clear_runtime_overrides()
+        runtime_config.set_runtime_overrides(
+            {"provider": "openai", "model": "gpt4o", "fallback_models": ["gpt-4o-mini"]}
+        )
+        self.addCleanup(runtime_config.clear_runtime_overrides)
+        clear_llm_client_profiles()
+        self.addCleanup(clear_llm_client_profiles)
+
+    def test_repeat_construction_reuses_resolved_profile(self):
+        first = LLMClient()
+        second = LLMClient()
+
+        self.assertEqual(self.plugin_manager.execute_first.await_count, 1)
+        self.assertIs(first._profile, second._profile)
+        self.assertEqual(second.model, "gpt-4o-resolved")
+        self.assertEqual(second.api_key, "sk-one")
+        self.assertEqual(
+            second._get_failover_candidates(),
+            list(first._profile.failover_candidates),
+        )
+
+    def test_config_change_re_resolves(self):
+        LLMClient()
+        runtime_config.set_runtime_overrides({"model": "gpt4o-mini"})
+        client = LLMClient()
+
+        self.assertEqual(self.plugin_manager.execute_first.await_count, 2)
+        self.assertEqual(
+            self.plugin_manager.execute_first.await_args.args[2], "gpt4o-mini"
+        )
+        self.assertEqual(client.model, "gpt-4o-resolved")
+
+    def test_secret_change_re_resolves(self):
+        first = LLMClient()
+        with patch(
+            "services.llm_client.get_api_key_for_provider", return_value="sk-two"
+        ):
+            second = LLMClient()
+
+        self.assertIsNot(first._profile, second._profile)
+        self.assertEqual(second.api_key, "sk-two")
+
+    def test_plugin_registration_re_resolves(self):
+        LLMClient()
+        self.plugin_manager.revision = 2
+        LLMClient()
+        self.assertEqual(self.plugin_manager.execute_first.await_count, 2)
+
+    def test_explicit_args_do_not_leak_into_default_profile(self):
+        custom = LLMClient(provider="anthropic", timeout=5)
+        default = LLMClient()
+
+        self.assertEqual(custom.provider, "anthropic")
+        self.assertEqual(custom.timeout, 5)
+        self.assertEqual(default.provider, "openai")
+        self.assertNotEqual(default.timeout, 5)
+
+    def test_mutated_client_falls_back_to_live_failover_candidates(self):
+        client = LLMClient()
+        client.model = "gpt-other"
+
+        candidates = client._get_failover_candidates()
+
+        self.assertEqual(candidates[0][:2], ("openai", "gpt-other"))
+
+
+if __name__ == "__main__":
+    unittest.main()
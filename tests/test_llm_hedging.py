@@ -0,0 +1,273 @@
+"""
+Tests for latency-aware failover ordering (R14) and hedged LLM requests.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from services.failover import (
+    FailoverState,
+    get_failover_state,
+    reset_failover_state,
+)
+from services.llm_hedging import (
+    HEDGE,
+    PRIMARY,
+    arun_hedged,
+    hedge_delay_sec,
+    run_hedged,
+)
+from services.metrics import metrics
+
+
+class TestLatencyAwareRouting(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.state = FailoverState(os.path.join(temp_dir.name, "failover.json"))
+
+    def test_tracks_ewma_and_p95(self):
+        for latency in range(1, 21):
+            self.state.record_latency("openai", "gpt", float(latency))
+
+        stats = self.state.get_latency_stats("openai", "gpt")
+        self.assertEqual(stats.p95_ms, 19.0)
+        self.assertGreater(stats.ewma_ms, 10)
+        self.assertIsNone(self.state.get_latency_p95_ms("openai", "other"))
+
+    def test_slow_candidate_is_penalised_relative_to_fastest(self):
+        self.state.record_latency("slow", None, 4000)
+        self.state.record_latency("fast", None, 1000)
+        self.state.record_latency("close", None, 1200)
+        fastest = self.state.fastest_latency_ms([("slow", None), ("fast", None)])
+
+        self.assertEqual(
+            self.state.get_routing_score("slow", None, fastest_ms=fastest), 50
+        )
+        self.assertEqual(
+            self.state.get_routing_score("close", None, fastest_ms=fastest), 70
+        )
+        self.assertEqual(
+            self.state.get_routing_score("fast", None, fastest_ms=fastest), 70
+        )
+
+    def test_latencies_under_floor_never_reorder(self):
+        self.state.record_latency("a", None, 1)
+        self.state.record_latency("b", None, 200)
+
+        self.assertEqual(self.state.get_routing_score("b", None, fastest_ms=1), 70)
+
+    def test_client_sort_puts_slow_primary_behind_faster_fallback(self):
+        from services.llm_client import LLMClient
+
+        self.state.record_latency("openai", "gpt", 8000)
+        self.state.record_latency("anthropic", "claude", 900)
+        candidates = [("openai", "gpt", None), ("anthropic", "claude", None)]
+
+        ordered = LLMClient._sort_candidates_3d_by_health(None, candidates, self.state)
+
+        self.assertEqual(ordered[0][0], "anthropic")
+
+    def test_hedge_delay_follows_p95_within_bounds(self):
+        self.assertEqual(hedge_delay_sec(1200), 1.2)
+        self.assertEqual(hedge_delay_sec(1), 0.25)
+        with patch.dict(os.environ, {"OPENCLAW_LLM_HEDGE_DELAY_MS": "500"}):
+            self.assertEqual(hedge_delay_sec(None), 0.5)
+
+
+def _sleeper(delay, text, error=None, deltas=()):
+    def racer(publish):
+        for delta in deltas:
+            if publish is not None:
+                publish(delta)
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return {"text": text}
+
+    return racer
+
+
+class TestRunHedged(unittest.TestCase):
+    def _counter(self, name):
+        return metrics.get_all()[name]
+
+    def test_fast_primary_never_launches_hedge(self):
+        launched = self._counter("llm_hedge_launched")
+        hedge_calls = []
+
+        outcome = run_hedged(
+            _sleeper(0, "primary"),
+            lambda publish: hedge_calls.append(1),
+            delay_sec=1,
+            on_text_delta=None,
+        )
+
+        self.assertEqual(outcome.result, {"text": "primary"})
+        self.assertFalse(outcome.hedged)
+        self.assertEqual(hedge_calls, [])
+        self.assertEqual(self._counter("llm_hedge_launched"), launched)
+        self.assertIn(PRIMARY, outcome.latency_ms)
+
+    def test_slow_primary_loses_to_hedge(self):
+        wins = self._counter("llm_hedge_wins")
+
+        outcome = run_hedged(
+            _sleeper(1, "primary"),
+            _sleeper(0, "hedge"),
+            delay_sec=0.01,
+            on_text_delta=None,
+        )
+
+        self.assertTrue(outcome.hedge_won)
+        self.assertEqual(outcome.result, {"text": "hedge"})
+        self.assertEqual(self._counter("llm_hedge_wins"), wins + 1)
+        # The abandoned primary contributes a lower-bound latency sample.
+        self.assertEqual(set(outcome.latency_ms), {PRIMARY, HEDGE})
+
+    def test_primary_wins_when_hedge_fails(self):
+        losses = self._counter("llm_hedge_losses")
+
+        outcome = run_hedged(
+            _sleeper(0.05, "primary"),
+            _sleeper(0, "hedge", error=RuntimeError("hedge down")),
+            delay_sec=0.01,
+            on_text_delta=None,
+        )
+
+        self.assertFalse(outcome.hedge_won)
+        self.assertEqual(outcome.result, {"text": "primary"})
+        self.assertIsInstance(outcome.errors[HEDGE], RuntimeError)
+        self.assertEqual(self._counter("llm_hedge_losses"), losses + 1)
+
+    def test_primary_error_before_delay_is_returned_without_hedging(self):
+        outcome = run_hedged(
+            _sleeper(0, "primary", error=ValueError("bad request")),
+            _sleeper(0, "hedge"),
+            delay_sec=1,
+            on_text_delta=None,
+        )
+
+        self.assertFalse(outcome.hedged)
+        self.assertIsInstance(outcome.error, ValueError)
+
+    def test_first_streamed_delta_owns_the_caller_stream(self):
+        deltas = []
+        released = threading.Event()
+
+        def slow_primary(publish):
+            released.wait(1)
+            publish("late")
+            return {"text": "primary"}
+
+        outcome = run_hedged(
+            slow_primary,
+            _sleeper(0, "hedge", deltas=("he", "dge")),
+            delay_sec=0.01,
+            on_text_delta=deltas.append,
+        )
+        released.set()
+
+        self.assertTrue(outcome.hedge_won)
+        self.assertEqual(deltas, ["he", "dge"])
+
+
+class TestArunHedged(unittest.TestCase):
+    def test_loser_task_is_cancelled(self):
+        cancelled = []
+
+        async def slow_primary(publish):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return {"text": "primary"}
+
+        async def hedge(publish):
+            return {"text": "hedge"}
+
+        async def _go():
+            outcome = await arun_hedged(
+                slow_primary, hedge, delay_sec=0.01, on_text_delta=None
+            )
+            await asyncio.sleep(0)
+            return outcome
+
+        outcome = asyncio.run(_go())
+
+        self.assertTrue(outcome.hedge_won)
+        self.assertEqual(cancelled, [True])
+
+
+class TestLLMClientHedging(unittest.TestCase):
+    def setUp(self):
+        reset_failover_state()
+        self.addCleanup(reset_failover_state)
+        patches = [
+            patch(
+                "services.runtime_config.get_effective_config",
+                return_value=(
+                    {
+                        "provider": "openai",
+                        "model": "gpt-hedge-test",
+                        "base_url": "https://api.openai.com/v1",
+                        "timeout_sec": 30,
+                        "max_retries": 0,
+                    },
+                    None,
+                ),
+            ),
+            patch(
+                "services.llm_client.get_api_key_for_provider", return_value="sk-test"
+            ),
+            patch("services.llm_client.PLUGINS_AVAILABLE", False),
+            patch.dict(
+                os.environ,
+                {
+                    "OPENCLAW_LLM_HEDGING": "1",
+                    "OPENCLAW_LLM_HEDGE_DELAY_MS": "250",
+                    "OPENCLAW_LLM_SINGLE_FLIGHT": "0",
+                },
+            ),
+            patch(
+                "services.llm_client.LLMClient._get_failover_candidates",
+                return_value=[
+                    ("openai", "gpt-hedge-test", None),
+                    ("openai", "gpt-hedge-fallback", None),
+                ],
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_hedged_fallback_answers_for_a_stalled_primary(self):
+        from services.llm_client import LLMClient
+
+        def fake_request(client, *args, **kwargs):
+            if client.model == "gpt-hedge-test":
+                time.sleep(1)
+            return {"text": client.model, "raw": {}}
+
+        client = LLMClient()
+        model = client.model
+        with patch.object(LLMClient, "_execute_request", fake_request):
+            result = client.complete(system="s", user_message="u")
+
+        self.assertEqual(result["text"], "gpt-hedge-fallback")
+        self.assertEqual(client.model, model)
+        state = get_failover_state()
+        self.assertEqual(state.get_health_score("openai", "gpt-hedge-fallback"), 71)
+        self.assertGreaterEqual(
+            state.get_latency_stats("openai", "gpt-hedge-test").ewma_ms, 250
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Tests for the deterministic LLM response cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from services.cache import llm_response_cache
+from services.cache.llm_response_cache import (
+    LLMResponseCache,
+    build_cache_key,
+    get_llm_response_cache,
+    reset_llm_response_cache,
+)
+from services.metrics import metrics
+
+_KEY_ARGS = {
+    "tenant_id": "default",
+    "provider": "openai",
+    "model": "gpt-4o",
+    "base_url": "https://api.openai.com/v1",
+    "system": "You are a planner.",
+    "user_message": "a cat",
+    "image_base64": None,
+    "image_media_type": "image/png",
+    "temperature": 0.7,
+    "max_tokens": 512,
+    "tools": None,
+    "tool_choice": None,
+}
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_key_is_deterministic(self):
+        self.assertEqual(build_cache_key(**_KEY_ARGS), build_cache_key(**_KEY_ARGS))
+
+    def test_every_input_changes_key(self):
+        base = build_cache_key(**_KEY_ARGS)
+        changes = {
+            "tenant_id": "tenant-b",
+            "provider": "anthropic",
+            "model": "gpt-4o-mini",
+            "base_url": "http://localhost:11434/v1",
+            "system": "You are a refiner.",
+            "user_message": "a dog",
+            "image_base64": "aGVsbG8=",
+            "temperature": 0.2,
+            "max_tokens": 1024,
+            "tools": [{"type": "function", "function": {"name": "f"}}],
+            "tool_choice": "auto",
+        }
+        for field, value in changes.items():
+            with self.subTest(field=field):
+                self.assertNotEqual(
+                    build_cache_key(**{**_KEY_ARGS, field: value}), base
+                )
+
+    def test_media_type_ignored_without_image(self):
+        self.assertEqual(
+            build_cache_key(**{**_KEY_ARGS, "image_media_type": "image/jpeg"}),
+            build_cache_key(**_KEY_ARGS),
+        )
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory(prefix="openclaw_llm_cache_")
+        self.addCleanup(tmpdir.cleanup)
+        self.disk_dir = tmpdir.name
+        self.key = build_cache_key(**_KEY_ARGS)
+
+    def test_memory_hit_returns_private_copy(self):
+        cache = LLMResponseCache()
+        before = metrics.get_all()
+        self.assertIsNone(cache.get("default", self.key))
+        cache.put("default", self.key, {"text": "hello", "raw": {"id": 1}})
+
+        hit = cache.get("default", self.key)
+        hit["text"] = "mutated"
+
+        self.assertEqual(cache.get("default", self.key)["text"], "hello")
+        after = metrics.get_all()
+        self.assertEqual(after["llm_cache_misses"], before["llm_cache_misses"] + 1)
+        self.assertEqual(after["llm_cache_hits"], before["llm_cache_hits"] + 2)
+        self.assertEqual(after["llm_cache_stores"], before["llm_cache_stores"] + 1)
+
+    def test_entries_expire(self):
+        cache = LLMResponseCache(ttl_sec=0.05)
+        cache.put("default", self.key, {"text": "hello"})
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("default", self.key))
+
+    def test_disk_tier_survives_new_instance(self):
+        LLMResponseCache(mode="disk", disk_dir=self.disk_dir).put(
+            "default", self.key, {"text": "persisted"}
+        )
+        fresh = LLMResponseCache(mode="disk", disk_dir=self.disk_dir)
+        before = metrics.get_all()["llm_cache_disk_hits"]
+
+        self.assertEqual(fresh.get("default", self.key)["text"], "persisted")
+        self.assertEqual(metrics.get_all()["llm_cache_disk_hits"], before + 1)
+
+    def test_disk_tier_is_partitioned_by_tenant(self):
+        cache = LLMResponseCache(mode="disk", disk_dir=self.disk_dir)
+        cache.put("tenant-a", self.key, {"text": "a"})
+        cache.clear()
+        self.assertIsNone(cache.get("tenant-b", self.key))
+        self.assertEqual(cache.get("tenant-a", self.key)["text"], "a")
+
+    def test_purge_removes_expired_disk_entries(self):
+        cache = LLMResponseCache(mode="disk", ttl_sec=0.05, disk_dir=self.disk_dir)
+        cache.put("default", self.key, {"text": "old"})
+        time.sleep(0.1)
+        self.assertEqual(cache.purge_expired_disk(), 1)
+
+
+class TestGlobalCacheSettings(unittest.TestCase):
+    def setUp(self):
+        env_patch = patch.dict(os.environ)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        for name in ("OPENCLAW_LLM_RESPONSE_CACHE", "MOLTBOT_LLM_RESPONSE_CACHE"):
+            os.environ.pop(name, None)
+        reset_llm_response_cache()
+        self.addCleanup(reset_llm_response_cache)
+
+    def test_off_by_default(self):
+        self.assertIsNone(get_llm_response_cache())
+
+    def test_enabled_instance_is_reused_until_settings_change(self):
+        os.environ["OPENCLAW_LLM_RESPONSE_CACHE"] = "memory"
+        first = get_llm_response_cache()
+        self.assertIs(first, get_llm_response_cache())
+
+        os.environ["OPENCLAW_LLM_RESPONSE_CACHE_TTL_SEC"] = "60"
+        second = get_llm_response_cache()
+        self.assertIsNot(first, second)
+        self.assertEqual(second.ttl_sec, 60.0)
+
+    def test_disk_mode_uses_state_dir(self):
+        with (
+            tempfile.TemporaryDirectory() as state_dir,
+            patch.object(llm_response_cache, "get_state_dir", return_value=state_dir),
+        ):
+            os.environ["OPENCLAW_LLM_RESPONSE_CACHE"] = "disk"
+            cache = get_llm_response_cache()
+            self.assertEqual(
+                cache._disk_dir, os.path.join(state_dir, "llm_response_cache")
+            )
+
+
+class TestLLMClientIntegration(unittest.TestCase):
+    def setUp(self):
+        env_patch = patch.dict(os.environ, {"OPENCLAW_LLM_RESPONSE_CACHE": "memory"})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        reset_llm_response_cache()
+        self.addCleanup(reset_llm_response_cache)
+        for p in (
+            patch("services.llm_client.PLUGINS_AVAILABLE", False),
+            patch("services.llm_client.get_api_key_for_provider", return_value="sk"),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_repeat_completion_skips_provider(self):
+        from services.llm_client import LLMClient
+
+        client = LLMClient(provider="openai", model="gpt-4o")
+        with patch(
+            "services.llm_client.openai_compat.make_request",
+            return_value={"text": "planned", "raw": {}},
+        ) as make_request:
+            first = client.complete("system", "a cat", temperature=0.1)
+            deltas = []
+            second = client.complete(
+                "system",
+                "a cat",
+                temperature=0.1,
+                streaming=True,
+                on_text_delta=deltas.append,
+            )
+            third = client.complete("system", "a dog", temperature=0.1)
+
+        self.assertEqual(make_request.call_count, 2)
+        self.assertEqual(first["text"], "planned")
+        self.assertEqual(second["text"], "planned")
+        self.assertEqual(third["text"], "planned")
+        self.assertEqual(deltas, ["planned"])
+
+
+if __name__ == "__main__":
+    unittest.main()
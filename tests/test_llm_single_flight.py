@@ -0,0 +1,217 @@
+"""
+Tests for single-flight coalescing of identical LLM calls.
+"""
+
+import asyncio
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from services.llm_client import LLMClient, SingleFlight
+from services.metrics import metrics
+
+
+def _run_in_thread(target, *args):
+    box = {}
+
+    def _target():
+        try:
+            box["result"] = target(*args)
+        except Exception as e:
+            box["error"] = e
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    return thread, box
+
+
+class TestSingleFlightSync(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _blocking_call(self, publish):
+        self.calls += 1
+        self.started.set()
+        self.assertTrue(self.release.wait(5))
+        return {"text": "shared"}
+
+    def _wait_for_waiters(self, count):
+        flight = next(iter(self.flight._flights.values()))
+        for _ in range(500):
+            if flight.waiters >= count:
+                return
+            threading.Event().wait(0.01)
+        self.fail("follower never joined")
+
+    def test_concurrent_callers_share_one_call(self):
+        before = metrics.get_all()["llm_singleflight_coalesced"]
+        leader, leader_box = _run_in_thread(self.flight.run, "k", self._blocking_call)
+        self.assertTrue(self.started.wait(5))
+        follower, follower_box = _run_in_thread(
+            self.flight.run, "k", self._blocking_call
+        )
+        self._wait_for_waiters(2)
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(leader_box["result"], {"text": "shared"})
+        self.assertEqual(follower_box["result"], {"text": "shared"})
+        self.assertIsNot(leader_box["result"], follower_box["result"])
+        self.assertEqual(metrics.get_all()["llm_singleflight_coalesced"], before + 1)
+        self.assertEqual(self.flight._flights, {})
+
+    def test_error_reaches_every_waiter(self):
+        def failing(publish):
+            self.started.set()
+            self.release.wait(5)
+            raise RuntimeError("provider down")
+
+        leader, leader_box = _run_in_thread(self.flight.run, "k", failing)
+        self.assertTrue(self.started.wait(5))
+        follower, follower_box = _run_in_thread(self.flight.run, "k", failing)
+        self._wait_for_waiters(2)
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertIsInstance(leader_box["error"], RuntimeError)
+        self.assertIs(follower_box["error"], leader_box["error"])
+
+    def test_late_subscriber_replays_streamed_text(self):
+        streamed = threading.Event()
+
+        def streaming_call(publish):
+            publish("Hel")
+            streamed.set()
+            self.assertTrue(self.release.wait(5))
+            publish("lo")
+            return {"text": "Hello"}
+
+        leader_deltas, follower_deltas = [], []
+        leader, _ = _run_in_thread(
+            self.flight.run, "k", streaming_call, leader_deltas.append
+        )
+        self.assertTrue(streamed.wait(5))
+        follower, _ = _run_in_thread(
+            self.flight.run, "k", streaming_call, follower_deltas.append
+        )
+        self._wait_for_waiters(2)
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(leader_deltas, ["Hel", "lo"])
+        self.assertEqual(follower_deltas, ["Hel", "lo"])
+
+    def test_failing_subscriber_is_detached(self):
+        def bad(delta):
+            raise ValueError("closed socket")
+
+        def streaming_call(publish):
+            publish("a")
+            publish("b")
+            return {"text": "ab"}
+
+        self.assertEqual(self.flight.run("k", streaming_call, bad)["text"], "ab")
+
+
+class TestSingleFlightAsync(unittest.TestCase):
+    def test_call_survives_one_cancelled_waiter(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def call(publish):
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"text": "done"}
+
+        async def scenario():
+            first = asyncio.ensure_future(flight.arun("k", call))
+            second = asyncio.ensure_future(flight.arun("k", call))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first
+
+        result, first = asyncio.run(scenario())
+        self.assertEqual(result, {"text": "done"})
+        self.assertTrue(first.cancelled())
+        self.assertEqual(len(calls), 1)
+
+    def test_last_waiter_leaving_cancels_shared_call(self):
+        flight = SingleFlight()
+        cancelled = []
+
+        async def call(publish):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return {}
+
+        async def scenario():
+            waiters = [asyncio.ensure_future(flight.arun("k", call)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(scenario())
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(flight._flights, {})
+
+
+class TestLLMClientCoalescing(unittest.TestCase):
+    def setUp(self):
+        for p in (
+            patch.dict(os.environ),
+            patch("services.llm_client.PLUGINS_AVAILABLE", False),
+            patch("services.llm_client.get_api_key_for_provider", return_value="sk"),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        os.environ.pop("OPENCLAW_LLM_RESPONSE_CACHE", None)
+        os.environ.pop("OPENCLAW_LLM_SINGLE_FLIGHT", None)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _make_request(self, **kwargs):
+        self.started.set()
+        self.release.wait(5)
+        return {"text": "planned", "raw": {}}
+
+    def _complete_concurrently(self):
+        with patch(
+            "services.llm_client.openai_compat.make_request",
+            side_effect=self._make_request,
+        ) as make_request:
+            client = LLMClient(provider="openai", model="gpt-4o")
+            leader, leader_box = _run_in_thread(client.complete, "system", "a cat")
+            self.assertTrue(self.started.wait(5))
+            other = LLMClient(provider="openai", model="gpt-4o")
+            follower, follower_box = _run_in_thread(other.complete, "system", "a cat")
+            threading.Event().wait(0.1)
+            self.release.set()
+            leader.join(5)
+            follower.join(5)
+        self.assertEqual(leader_box["result"]["text"], "planned")
+        self.assertEqual(follower_box["result"]["text"], "planned")
+        return make_request.call_count
+
+    def test_identical_concurrent_completions_coalesce(self):
+        self.assertEqual(self._complete_concurrently(), 1)
+
+    def test_coalescing_can_be_disabled(self):
+        os.environ["OPENCLAW_LLM_SINGLE_FLIGHT"] = "0"
+        self.assertEqual(self._complete_concurrently(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+Tests for labelled metrics, latency histograms and Prometheus exposition.
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import services.metrics as metrics_module
+from api.route_handlers import metrics_response
+from api.route_timing import (
+    HTTP_LATENCY_METRIC,
+    install_route_timing,
+    route_timing_middleware,
+)
+from services.metrics import Histogram, metrics
+
+
+class TestHistogram(unittest.TestCase):
+    def test_quantiles_interpolate_within_buckets(self):
+        histogram = Histogram((10, 20, 40))
+        for value in (5, 15, 15, 30):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [1, 2, 1, 0])
+        self.assertEqual(histogram.quantile(0.5), 15.0)
+        self.assertEqual(histogram.quantile(1.0), 30)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_overflow_bucket_is_bounded_by_max(self):
+        histogram = Histogram((10,))
+        histogram.observe(500)
+
+        self.assertEqual(histogram.counts, [0, 1])
+        self.assertEqual(histogram.quantile(0.5), 255)
+        self.assertEqual(histogram.quantile(1.0), 500)
+
+
+class TestLabelledMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_observe_keeps_one_series_per_label_set(self):
+        metrics.observe("llm_request_duration_ms", 12, {"provider": "openai"})
+        metrics.observe("llm_request_duration_ms", 80, {"provider": "anthropic"})
+        metrics.observe("llm_request_duration_ms", 14, {"provider": "openai"})
+
+        series = {
+            entry["labels"]["provider"]: entry
+            for entry in metrics.get_histograms()["llm_request_duration_ms"]
+        }
+        self.assertEqual(series["openai"]["count"], 2)
+        self.assertEqual(series["anthropic"]["count"], 1)
+
+    def test_label_sets_beyond_cap_fold_into_overflow(self):
+        with patch.object(metrics_module, "MAX_LABEL_SETS", 2):
+            for tenant in ("a", "b", "c", "d"):
+                metrics.observe("queue_submit_duration_ms", 1, {"tenant": tenant})
+
+        tenants = sorted(
+            entry["labels"]["tenant"]
+            for entry in metrics.get_histograms()["queue_submit_duration_ms"]
+        )
+        self.assertEqual(tenants, ["__overflow__", "a", "b"])
+
+    def test_timer_records_even_when_block_raises(self):
+        with self.assertRaises(ValueError), metrics.timer("disk_write_duration_ms"):
+            raise ValueError("boom")
+
+        (entry,) = metrics.get_histograms()["disk_write_duration_ms"]
+        self.assertEqual(entry["count"], 1)
+
+    def test_registered_counter_accepts_labels(self):
+        metrics.increment("histogram_test_unregistered")
+        self.assertNotIn("histogram_test_unregistered", metrics.get_all())
+
+        metrics.register_counter("histogram_test_requests", "Test requests.")
+        metrics.increment("histogram_test_requests", labels={"route": "/x"})
+        metrics.increment("histogram_test_requests")
+
+        self.assertEqual(metrics.get_all()["histogram_test_requests"], 2)
+        text = metrics.render_prometheus()
+        self.assertIn("# HELP openclaw_histogram_test_requests_total Test", text)
+        self.assertIn('openclaw_histogram_test_requests_total{route="/x"} 1', text)
+        self.assertIn("openclaw_histogram_test_requests_total 1\n", text)
+
+    def test_counter_already_ending_in_total_is_not_suffixed_twice(self):
+        metrics.register_counter("histogram_test_bytes_total")
+        metrics.increment("histogram_test_bytes_total", 7)
+
+        text = metrics.render_prometheus()
+
+        self.assertIn("# TYPE openclaw_histogram_test_bytes_total counter", text)
+        self.assertIn("openclaw_histogram_test_bytes_total 7\n", text)
+        self.assertIn("openclaw_budget_denied_total ", text)
+        self.assertNotIn("_total_total", text)
+
+    def test_prometheus_histogram_buckets_are_cumulative(self):
+        metrics.register_histogram("render_test_ms", buckets=(10, 100))
+        metrics.observe("render_test_ms", 5, {"route": 'say "hi"'})
+        metrics.observe("render_test_ms", 50, {"route": 'say "hi"'})
+        metrics.add_gauge("events_sse_active", 1)
+
+        text = metrics.render_prometheus()
+
+        self.assertIn("# TYPE openclaw_render_test_ms histogram", text)
+        self.assertIn('render_test_ms_bucket{route="say \\"hi\\"",le="10"} 1', text)
+        self.assertIn('render_test_ms_bucket{route="say \\"hi\\"",le="100"} 2', text)
+        self.assertIn('render_test_ms_bucket{route="say \\"hi\\"",le="+Inf"} 2', text)
+        self.assertIn('openclaw_render_test_ms_sum{route="say \\"hi\\""} 55', text)
+        self.assertIn("openclaw_events_sse_active 1\n", text)
+        self.assertIn("openclaw_events_sse_connections_total 0\n", text)
+
+
+def _request(path, canonical="/openclaw/trace/{prompt_id}"):
+    route = SimpleNamespace(resource=SimpleNamespace(canonical=canonical))
+    return SimpleNamespace(
+        path=path, method="GET", match_info=SimpleNamespace(route=route)
+    )
+
+
+class TestRouteTimingMiddleware(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def _run(self, request, handler):
+        return asyncio.run(route_timing_middleware(request, handler))
+
+    def test_owned_route_is_timed_by_template(self):
+        async def handler(_request):
+            return SimpleNamespace(status=404)
+
+        self._run(_request("/openclaw/trace/abc123"), handler)
+
+        (entry,) = metrics.get_histograms()[HTTP_LATENCY_METRIC]
+        self.assertEqual(
+            entry["labels"],
+            {"method": "GET", "route": "/openclaw/trace/{prompt_id}", "status": "4xx"},
+        )
+
+    def test_handler_error_is_timed_and_reraised(self):
+        async def handler(_request):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self._run(_request("/api/openclaw/health", "/api/openclaw/health"), handler)
+
+        (entry,) = metrics.get_histograms()[HTTP_LATENCY_METRIC]
+        self.assertEqual(entry["labels"]["status"], "5xx")
+
+    def test_foreign_paths_are_not_timed(self):
+        async def handler(_request):
+            return SimpleNamespace(status=200)
+
+        self._run(_request("/prompt", "/prompt"), handler)
+
+        self.assertNotIn(HTTP_LATENCY_METRIC, metrics.get_histograms())
+
+    def test_install_is_idempotent(self):
+        server = SimpleNamespace(app=SimpleNamespace(middlewares=[]))
+
+        self.assertTrue(install_route_timing(server))
+        self.assertTrue(install_route_timing(server))
+
+        self.assertEqual(server.app.middlewares, [route_timing_middleware])
+        self.assertFalse(install_route_timing(SimpleNamespace()))
+
+
+class _FakeWeb:
+    @staticmethod
+    def json_response(payload, status=200):
+        return SimpleNamespace(payload=payload, status=status)
+
+    @staticmethod
+    def Response(body, headers):
+        return SimpleNamespace(body=body, headers=headers, status=200)
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.allowed = (True, None)
+        self.deps = SimpleNamespace(
+            web=_FakeWeb,
+            metrics=metrics,
+            ensure_observability_deps_ready=lambda: (True, None),
+            check_rate_limit=lambda _request, _bucket: True,
+            require_observability_access=lambda _request: self.allowed,
+        )
+
+    def _get(self, **query):
+        request = SimpleNamespace(query=query)
+        return asyncio.run(metrics_response(request, self.deps))
+
+    def test_default_is_prometheus_text(self):
+        metrics.observe("queue_submit_duration_ms", 3, {"source": "webhook"})
+
+        response = self._get()
+
+        self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            b'openclaw_queue_submit_duration_ms_count{source="webhook"} 1',
+            response.body,
+        )
+
+    def test_json_format_reports_percentiles(self):
+        metrics.observe("queue_submit_duration_ms", 3, {"source": "webhook"})
+
+        payload = self._get(format="json").payload
+
+        (entry,) = payload["histograms"]["queue_submit_duration_ms"]
+        self.assertEqual(entry["count"], 1)
+        self.assertIn("p99", entry)
+
+    def test_requires_observability_access(self):
+        self.allowed = (False, "denied")
+
+        self.assertEqual(self._get().status, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests for the incremental, watch-driven model inventory engine (R141).
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import services.preflight
+from services.model_inventory_engine import IncrementalInventoryEngine
+
+_EXT = {".safetensors"}
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("x")
+
+
+class TestIncrementalInventoryEngine(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="openclaw_inventory_")
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        _touch(os.path.join(self.root, "a.safetensors"))
+        _touch(os.path.join(self.root, "notes.txt"))
+        _touch(os.path.join(self.root, "style", "b.safetensors"))
+        _touch(os.path.join(self.root, ".git", "c.safetensors"))
+        self.engine = IncrementalInventoryEngine(watch_mode="poll")
+        self.addCleanup(self.engine.close)
+        self.specs = {"loras": ([self.root], _EXT)}
+        self.fallback = MagicMock(return_value=["legacy.ckpt"])
+
+    def _scan(self, types=("loras",)):
+        return self.engine.scan(list(types), self.specs, self.fallback)
+
+    def test_matches_comfyui_filename_listing(self):
+        inventory = self._scan(("loras", "checkpoints"))
+
+        self.assertEqual(
+            inventory["loras"],
+            ["a.safetensors", os.path.join("style", "b.safetensors")],
+        )
+        self.assertEqual(inventory["checkpoints"], ["legacy.ckpt"])
+        self.fallback.assert_called_once_with("checkpoints")
+
+    def test_unchanged_tree_is_not_relisted(self):
+        first = self._scan()["loras"]
+        second = self._scan()["loras"]
+
+        self.assertIs(first, second)
+        self.assertEqual(self.engine.last_stats["dirs_rescanned"], 0)
+        self.assertEqual(self.engine.last_stats["types_rebuilt"], 0)
+        self.assertEqual(self.engine.last_stats["dirs_checked"], 2)
+
+    def test_only_changed_directory_is_relisted(self):
+        self._scan()
+        _touch(os.path.join(self.root, "style", "d.safetensors"))
+
+        inventory = self._scan()
+
+        self.assertEqual(self.engine.last_stats["dirs_rescanned"], 1)
+        self.assertIn(os.path.join("style", "d.safetensors"), inventory["loras"])
+
+    def test_removed_subdirectory_drops_its_files(self):
+        self._scan()
+        shutil.rmtree(os.path.join(self.root, "style"))
+
+        self.assertEqual(self._scan()["loras"], ["a.safetensors"])
+
+    def test_types_sharing_a_root_both_see_changes(self):
+        self.specs["text_encoders"] = ([self.root], _EXT)
+        self._scan(("loras", "text_encoders"))
+        _touch(os.path.join(self.root, "e.safetensors"))
+
+        inventory = self._scan(("loras", "text_encoders"))
+
+        self.assertIn("e.safetensors", inventory["loras"])
+        self.assertIn("e.safetensors", inventory["text_encoders"])
+
+    def _state_path(self):
+        state_dir = tempfile.mkdtemp(prefix="openclaw_inventory_state_")
+        self.addCleanup(shutil.rmtree, state_dir, ignore_errors=True)
+        return os.path.join(state_dir, "inventory.json")
+
+    def test_persisted_tree_restores_and_revalidates(self):
+        inventory = self._scan()
+        path = self._state_path()
+        self.engine.save(path, inventory)
+
+        restored_engine = IncrementalInventoryEngine(watch_mode="poll")
+        self.addCleanup(restored_engine.close)
+        restored, saved_at = restored_engine.load(path, self.specs)
+        self.assertEqual(restored, inventory)
+        self.assertLessEqual(saved_at, time.time())
+
+        restored_engine.scan(["loras"], self.specs, self.fallback)
+        self.assertEqual(restored_engine.last_stats["dirs_rescanned"], 0)
+
+    def test_persisted_tree_rejected_when_folders_change(self):
+        path = self._state_path()
+        self.engine.save(path, self._scan())
+
+        other = {"loras": ([os.path.join(self.root, "style")], _EXT)}
+        self.assertIsNone(IncrementalInventoryEngine().load(path, other))
+
+
+@unittest.skipUnless(os.name == "posix", "inotify is Linux-only")
+class TestInventoryWatcher(unittest.TestCase):
+    def test_new_file_marks_changes_pending(self):
+        root = tempfile.mkdtemp(prefix="openclaw_inventory_watch_")
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        engine = IncrementalInventoryEngine(watch_mode="auto")
+        self.addCleanup(engine.close)
+        engine.scan(["loras"], {"loras": ([root], _EXT)}, list)
+        if not engine.watching:
+            self.skipTest("inotify unavailable")
+
+        _touch(os.path.join(root, "new.safetensors"))
+        deadline = time.time() + 5
+        while not engine.has_pending_changes() and time.time() < deadline:
+            time.sleep(0.02)
+
+        self.assertTrue(engine.has_pending_changes())
+
+
+class TestPreflightWarmStart(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="openclaw_inventory_warm_")
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        _touch(os.path.join(self.root, "loras", "warm.safetensors"))
+        folder_paths = MagicMock()
+        folder_paths.folder_names_and_paths = {
+            "loras": ([os.path.join(self.root, "loras")], _EXT)
+        }
+        folder_paths.get_filename_list.return_value = []
+        snapshot_path = os.path.join(self.root, "state", "snapshot.json")
+        for p in (
+            patch.object(services.preflight, "folder_paths", folder_paths),
+            patch.object(
+                services.preflight, "default_snapshot_path", return_value=snapshot_path
+            ),
+            patch.dict(os.environ, {"OPENCLAW_INVENTORY_WATCH": "poll"}),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        services.preflight._reset_inventory_state_for_tests()
+        self.addCleanup(services.preflight._reset_inventory_state_for_tests)
+
+    def test_cold_start_serves_persisted_snapshot(self):
+        services.preflight._inventory_refresh_worker()
+        services.preflight._reset_inventory_state_for_tests()
+
+        snapshot = services.preflight.get_model_inventory_snapshot(
+            trigger_refresh=False
+        )
+
+        self.assertEqual(snapshot["models"], {"loras": ["warm.safetensors"]})
+        self.assertTrue(snapshot["stale"])
+        index = services.preflight.get_model_inventory_index(trigger_refresh=False)
+        self.assertTrue(index.contains("loras", "warm.safetensors"))
+
+
+if __name__ == "__main__":
+    unittest.main()
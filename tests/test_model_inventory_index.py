@@ -0,0 +1,144 @@
+"""
+Tests for the indexed preflight model inventory (R141).
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import services.preflight
+from services.model_inventory_index import ModelInventoryIndex, normalize_model_name
+
+
+class TestModelInventoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ModelInventoryIndex(
+            {
+                "loras": [
+                    "Styles/AnimeLineart_v2.safetensors",
+                    "detail_tweaker_xl.safetensors",
+                    "film_grain.safetensors",
+                ],
+                "checkpoints": ["sd_xl_base_1.0.safetensors"],
+            }
+        )
+
+    def test_exact_lookup_is_per_type(self):
+        self.assertTrue(self.index.contains("loras", "film_grain.safetensors"))
+        self.assertFalse(self.index.contains("checkpoints", "film_grain.safetensors"))
+        self.assertFalse(self.index.contains("vae", "film_grain.safetensors"))
+
+    def test_normalized_lookup_folds_separators_and_case(self):
+        self.assertEqual(
+            normalize_model_name(".\\Styles\\X.safetensors"), "styles/x.safetensors"
+        )
+        self.assertEqual(
+            self.index.find_normalized("loras", "styles\\animelineart_V2.safetensors"),
+            ["Styles/AnimeLineart_v2.safetensors"],
+        )
+
+    def test_suggestions_rank_near_matches(self):
+        self.assertEqual(
+            self.index.suggest("loras", "detail_tweaker_xI.safetensors"),
+            ["detail_tweaker_xl.safetensors"],
+        )
+        self.assertEqual(
+            self.index.suggest("loras", "STYLES\\AnimeLineart_v2.safetensors")[0],
+            "Styles/AnimeLineart_v2.safetensors",
+        )
+        self.assertEqual(self.index.suggest("loras", "zzzz.safetensors"), [])
+        self.assertEqual(self.index.suggest("vae", "film_grain.safetensors"), [])
+
+    def test_incremental_update_touches_only_changed_types(self):
+        self.index.suggest("loras", "film_grain")  # build the gram index
+        checkpoints = self.index.as_lists()["checkpoints"]
+        loras = self.index.as_lists()["loras"]
+        loras.remove("film_grain.safetensors")
+        loras.append("film_grain_v2.safetensors")
+
+        changed = self.index.update({"loras": loras, "checkpoints": checkpoints})
+
+        self.assertEqual(changed, 1)
+        self.assertFalse(self.index.contains("loras", "film_grain.safetensors"))
+        self.assertTrue(self.index.contains("loras", "film_grain_v2.safetensors"))
+        self.assertEqual(
+            self.index.suggest("loras", "film_grain.safetensors"),
+            ["film_grain_v2.safetensors"],
+        )
+
+    def test_removed_type_is_dropped(self):
+        self.index.update({"loras": self.index.as_lists()["loras"]})
+        self.assertEqual(self.index.model_types(), ["loras"])
+
+    def test_same_mapping_is_a_no_op(self):
+        models = {"vae": ["a.safetensors"]}
+        self.assertEqual(self.index.update(models), 3)
+        self.assertEqual(self.index.update(models), 0)
+
+
+class TestPreflightUsesIndex(unittest.TestCase):
+    def setUp(self):
+        services.preflight._reset_inventory_state_for_tests()
+        self.addCleanup(services.preflight._reset_inventory_state_for_tests)
+        self.folder_paths = MagicMock()
+        self.folder_paths.folder_names_and_paths = {}
+        self.folder_paths.get_filename_list.side_effect = lambda ftype: (
+            ["detail_tweaker_xl.safetensors"] if ftype == "loras" else []
+        )
+        patcher = patch.object(services.preflight, "folder_paths", self.folder_paths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_missing_model_reports_suggestions(self):
+        workflow = {
+            "1": {
+                "class_type": "LoraLoader",
+                "inputs": {"lora_name": "Detail_Tweaker_XL.safetensors"},
+            }
+        }
+        report = services.preflight.run_preflight_check(workflow)
+
+        self.assertFalse(report["ok"])
+        self.assertEqual(
+            report["missing_models"],
+            [
+                {
+                    "type": "loras",
+                    "name": "Detail_Tweaker_XL.safetensors",
+                    "count": 1,
+                    "suggestions": ["detail_tweaker_xl.safetensors"],
+                }
+            ],
+        )
+
+    def test_fresh_background_snapshot_avoids_sync_scan(self):
+        with services.preflight._INVENTORY_LOCK:
+            services.preflight._CACHE[services.preflight._INVENTORY_SNAPSHOT_KEY] = {
+                "loras": ["indexed.safetensors"]
+            }
+            services.preflight._CACHE[services.preflight._INVENTORY_SNAPSHOT_TS_KEY] = (
+                time.time()
+            )
+
+        index = services.preflight._get_model_inventory_index()
+
+        self.assertTrue(index.contains("loras", "indexed.safetensors"))
+        self.folder_paths.get_filename_list.assert_not_called()
+
+    def test_background_refresh_updates_shared_index(self):
+        first = services.preflight._get_model_inventory_index()
+        with patch.object(
+            services.preflight,
+            "_scan_model_inventory",
+            return_value={"loras": ["fresh.safetensors"]},
+        ):
+            services.preflight._inventory_refresh_worker()
+
+        second = services.preflight._get_model_inventory_index()
+        self.assertIs(first, second)
+        self.assertTrue(second.contains("loras", "fresh.safetensors"))
+        self.assertFalse(second.contains("loras", "detail_tweaker_xl.safetensors"))
+
+
+if __name__ == "__main__":
+    unittest.main()
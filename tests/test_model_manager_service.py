@@ -19,6 +19,7 @@ from services.model_manager import (
     _model_type_exclusion_reason,
     _norm_model_type,
 )
+from services.model_inventory_index import ModelInventoryIndex
 from services.model_manager_transfer import (
     _absolute_bounded_install_path,
     _resolve_bounded_relative_install_path,
@@ -135,6 +136,36 @@ class TestModelManagerService(unittest.TestCase):
         self.assertEqual(lora_only["pagination"]["total"], 1)
         self.assertEqual(lora_only["items"][0]["id"], "installed-b")
 
+    def test_search_resolves_inventory_index_once(self):
+        catalog_dir = self.state_root / "catalog"
+        catalog_dir.mkdir(parents=True, exist_ok=True)
+        items = [
+            {
+                "id": f"catalog-{suffix}",
+                "name": f"Catalog {suffix.upper()}",
+                "model_type": "checkpoint",
+                "download_url": f"https://example.com/catalog-{suffix}.safetensors",
+                "sha256": suffix * 64,
+            }
+            for suffix in ("a", "b", "c")
+        ]
+        (catalog_dir / "test.json").write_text(
+            json.dumps({"source": "catalog", "items": items}), encoding="utf-8"
+        )
+        index = ModelInventoryIndex()
+        index.update({"checkpoints": ["catalog-b.safetensors"]})
+
+        with patch(
+            "services.model_manager.get_model_inventory_index", return_value=index
+        ) as get_index:
+            result = self.manager.search_models(limit=10, offset=0)
+
+        get_index.assert_called_once()
+        flags = {item["id"]: item["in_inventory"] for item in result["items"]}
+        self.assertEqual(
+            flags, {"catalog-a": False, "catalog-b": True, "catalog-c": False}
+        )
+
     def test_norm_model_type_tracks_current_comfyui_folder_keys(self):
         self.assertEqual(_norm_model_type("diffusion_models"), "diffusion_models")
         self.assertEqual(_norm_model_type("text_encoders"), "text_encoders")
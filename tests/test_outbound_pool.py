@@ -0,0 +1,216 @@
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+from services import safe_io
+from services.outbound_pool import OutboundConnectionPool, OutboundValidationCache
+from services.safe_io import (
+    SSRFError,
+    get_outbound_transport_stats,
+    reset_outbound_transport,
+    safe_request_json,
+    safe_request_text_stream,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        return None
+
+    def _send_json(self, payload, *, close=False):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address[1])
+        if self.path == "/close":
+            self._send_json({"ok": True}, close=True)
+            self.close_connection = True
+            return
+        if self.path == "/stream":
+            body = b"data: one\n\ndata: two\n\n"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self._send_json({"ok": True, "path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.peers.append(self.client_address[1])
+        self._send_json({"echo": payload})
+
+
+class TestOutboundKeepAlivePool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        cls.server.daemon_threads = True
+        cls.server.peers = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        reset_outbound_transport()
+        self.server.peers.clear()
+
+    def tearDown(self):
+        reset_outbound_transport()
+
+    def _get(self, path):
+        return safe_request_json(
+            "GET",
+            f"{self.base}{path}",
+            allow_hosts={"127.0.0.1"},
+            allow_loopback_hosts={"127.0.0.1"},
+        )
+
+    def test_sequential_requests_reuse_one_connection(self):
+        self.assertEqual(self._get("/a")["path"], "/a")
+        self.assertEqual(self._get("/b")["path"], "/b")
+        out = safe_request_json(
+            "POST",
+            f"{self.base}/c",
+            {"x": 1},
+            allow_hosts={"127.0.0.1"},
+            allow_loopback_hosts={"127.0.0.1"},
+        )
+        self.assertEqual(out, {"echo": {"x": 1}})
+
+        self.assertEqual(len(set(self.server.peers)), 1)
+        pool = get_outbound_transport_stats()["connection_pool"]
+        self.assertEqual(pool["misses"], 1)
+        self.assertEqual(pool["hits"], 2)
+        self.assertEqual(pool["idle_connections"], 1)
+
+    def test_server_close_is_not_pooled(self):
+        self._get("/close")
+        self._get("/a")
+        self.assertEqual(len(set(self.server.peers)), 2)
+        pool = get_outbound_transport_stats()["connection_pool"]
+        self.assertEqual(pool["hits"], 0)
+        self.assertEqual(pool["discards"], 1)
+
+    def test_stream_fully_consumed_returns_connection(self):
+        lines = list(
+            safe_request_text_stream(
+                "GET",
+                f"{self.base}/stream",
+                allow_hosts={"127.0.0.1"},
+                allow_loopback_hosts={"127.0.0.1"},
+            )
+        )
+        self.assertEqual(lines[0], "data: one\n")
+        self._get("/a")
+        self.assertEqual(len(set(self.server.peers)), 1)
+
+    def test_stale_idle_connection_is_replaced(self):
+        self._get("/a")
+        pool = safe_io._CONNECTION_POOL
+        with pool._lock:
+            idle = [c for bucket in pool._idle.values() for _ts, c in bucket]
+        # Simulate the peer dropping an idle keep-alive socket.
+        idle[0].sock.close()
+        idle[0].sock = None
+        self.assertEqual(self._get("/b")["path"], "/b")
+        stats = get_outbound_transport_stats()["connection_pool"]
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_validation_cache_skips_repeat_resolution(self):
+        with patch(
+            "services.safe_io.validate_outbound_url",
+            wraps=safe_io.validate_outbound_url,
+        ) as mock_validate:
+            self._get("/a")
+            self._get("/b")
+        self.assertEqual(mock_validate.call_count, 1)
+        cache = get_outbound_transport_stats()["validation_cache"]
+        self.assertEqual(cache["hits"], 1)
+
+    def test_validation_cache_is_scoped_to_allowlist(self):
+        self._get("/a")
+        with self.assertRaises(SSRFError):
+            safe_request_json(
+                "GET",
+                f"{self.base}/a",
+                allow_hosts={"example.com"},
+                allow_loopback_hosts={"127.0.0.1"},
+            )
+
+
+class TestOutboundPoolPrimitives(unittest.TestCase):
+    def test_validation_cache_expires(self):
+        cache = OutboundValidationCache(ttl_sec=5, max_entries=2)
+        with patch("services.outbound_pool.time.monotonic", return_value=100.0):
+            cache.put("k", ("https", "h", 443, ["1.1.1.1"]))
+            self.assertIsNotNone(cache.get("k"))
+        with patch("services.outbound_pool.time.monotonic", return_value=106.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_validation_cache_disabled_with_zero_ttl(self):
+        cache = OutboundValidationCache(ttl_sec=0, max_entries=2)
+        cache.put("k", ("https", "h", 443, ["1.1.1.1"]))
+        self.assertIsNone(cache.get("k"))
+
+    def test_pool_bounds_idle_connections_per_key(self):
+        class _Conn:
+            def __init__(self):
+                self.sock = object()
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        pool = OutboundConnectionPool(idle_ttl_sec=30, max_idle_per_key=1, max_keys=4)
+        first, second = _Conn(), _Conn()
+        pool.release("k", first, True)
+        pool.release("k", second, True)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+        self.assertEqual(pool.stats()["evictions"], 1)
+
+    def test_pool_expires_idle_connections(self):
+        class _Conn:
+            sock = object()
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        pool = OutboundConnectionPool(idle_ttl_sec=5, max_idle_per_key=2, max_keys=4)
+        conn = _Conn()
+        with patch("services.outbound_pool.time.monotonic", return_value=10.0):
+            pool.release("k", conn, True)
+        with patch("services.outbound_pool.time.monotonic", return_value=20.0):
+            fresh, reused = pool.acquire("k", _Conn)
+        self.assertFalse(reused)
+        self.assertIsNot(fresh, conn)
+        self.assertTrue(conn.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for the shared plugin event loop (R23 async bridge).
+"""
+
+import asyncio
+import contextvars
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.plugins.async_bridge import (
+    PluginLoop,
+    get_plugin_loop,
+    run_async_in_sync_context,
+    run_hook_sync,
+)
+from services.plugins.contract import RequestContext
+from services.plugins.manager import PluginManager
+
+_marker: contextvars.ContextVar[str] = contextvars.ContextVar("marker", default="")
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestPluginLoop(unittest.TestCase):
+    def test_calls_reuse_one_warm_loop(self):
+        first = run_async_in_sync_context(_current_loop())
+        second = run_async_in_sync_context(_current_loop())
+        self.assertIs(first, second)
+        self.assertTrue(first.is_running())
+
+    def test_works_from_inside_running_loop(self):
+        async def handler():
+            return run_async_in_sync_context(_current_loop())
+
+        inner = asyncio.run(handler())
+        self.assertIs(inner, run_async_in_sync_context(_current_loop()))
+
+    def test_caller_contextvars_are_propagated(self):
+        async def read_marker():
+            return _marker.get()
+
+        token = _marker.set("tenant-a")
+        try:
+            self.assertEqual(run_async_in_sync_context(read_marker()), "tenant-a")
+        finally:
+            _marker.reset(token)
+
+    def test_nested_sync_call_on_loop_thread_does_not_deadlock(self):
+        async def outer():
+            return run_async_in_sync_context(_current_loop(), timeout=5)
+
+        nested_loop = run_async_in_sync_context(outer(), timeout=5)
+        self.assertIsNot(nested_loop, run_async_in_sync_context(_current_loop()))
+
+    def test_generic_calls_are_not_bound_by_hook_budget(self):
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        with patch("services.plugins.async_bridge.DEFAULT_TIMEOUT_SEC", 0.01):
+            self.assertEqual(run_async_in_sync_context(slow()), "done")
+
+    def test_timeout_cancels_and_is_counted(self):
+        loop = PluginLoop(name="test-plugin-loop")
+        self.addCleanup(loop.stop)
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        future = loop.submit(slow(), timeout=0.05, hook_name="slow.hook")
+        with self.assertRaises(TimeoutError):
+            future.result(timeout=5)
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(loop.stats()["hooks"]["slow.hook"]["timeouts"], 1)
+
+    def test_stop_then_submit_restarts(self):
+        loop = PluginLoop(name="test-plugin-loop")
+        self.addCleanup(loop.stop)
+        before = loop.submit(_current_loop()).result(timeout=5)
+        loop.stop()
+        after = loop.submit(_current_loop()).result(timeout=5)
+        self.assertIsNot(before, after)
+
+
+class TestRunHookSync(unittest.TestCase):
+    def setUp(self):
+        self.ctx = RequestContext(provider="openai", model="gpt-4", trace_id="t")
+
+    def test_fast_path_skips_unregistered_hooks(self):
+        manager = PluginManager()
+        manager.execute_sequential = AsyncMock()
+        manager.execute_parallel = AsyncMock()
+
+        value = {"temperature": 0.7}
+        self.assertIs(
+            run_hook_sync(manager, "sequential", "llm.params", self.ctx, value), value
+        )
+        self.assertIsNone(
+            run_hook_sync(manager, "parallel", "llm.audit_request", self.ctx, value)
+        )
+        manager.execute_sequential.assert_not_called()
+        manager.execute_parallel.assert_not_called()
+
+    def test_registered_hook_runs_and_records_latency(self):
+        manager = PluginManager()
+
+        async def resolve(_ctx, model):
+            return "resolved-" + model
+
+        manager.register_hook("test.bridge.resolve", resolve)
+        before = (
+            get_plugin_loop()
+            .stats()["hooks"]
+            .get("test.bridge.resolve", {})
+            .get("count", 0)
+        )
+
+        result = run_hook_sync(manager, "first", "test.bridge.resolve", self.ctx, "m")
+
+        self.assertEqual(result, "resolved-m")
+        entry = get_plugin_loop().stats()["hooks"]["test.bridge.resolve"]
+        self.assertEqual(entry["count"], before + 1)
+        self.assertEqual(sum(entry["histogram"].values()), entry["count"])
+
+    def test_background_hook_does_not_block(self):
+        manager = MagicMock()
+        manager.has_hooks.return_value = True
+        manager.execute_parallel = AsyncMock()
+
+        result = run_hook_sync(
+            manager, "parallel", "llm.audit_request", self.ctx, {}, wait=False
+        )
+
+        self.assertIsNone(result)
+        manager.execute_parallel.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for preflight report memoization keyed by workflow structure (R42).
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import services.preflight
+from services.metrics import metrics
+
+
+def _workflow(lora="missing.safetensors"):
+    return {
+        "1": {"class_type": "KSampler", "inputs": {"seed": 1}},
+        "2": {"class_type": "LoraLoader", "inputs": {"lora_name": lora}},
+        "3": {"class_type": "UnknownNode", "inputs": {}},
+    }
+
+
+class TestPreflightReportCache(unittest.TestCase):
+    def setUp(self):
+        services.preflight._reset_inventory_state_for_tests()
+        self.addCleanup(services.preflight._reset_inventory_state_for_tests)
+        self.node_mappings = {"KSampler": object, "LoraLoader": object}
+        mock_nodes = MagicMock()
+        mock_nodes.NODE_CLASS_MAPPINGS = self.node_mappings
+        self.folder_paths = MagicMock()
+        self.folder_paths.folder_names_and_paths = {}
+        self.folder_paths.get_filename_list.side_effect = lambda ftype: (
+            ["installed.safetensors"] if ftype == "loras" else []
+        )
+        for p in (
+            patch.object(services.preflight, "nodes", mock_nodes),
+            patch.object(services.preflight, "folder_paths", self.folder_paths),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _counter(self, name):
+        return metrics.get_all()[name]
+
+    def test_repeated_workflow_is_served_from_cache(self):
+        first = services.preflight.run_preflight_check(_workflow())
+        hits = self._counter("preflight_cache_hits")
+        rechecked = self._counter("preflight_nodes_rechecked")
+
+        second = services.preflight.run_preflight_check(_workflow())
+
+        self.assertEqual(first, second)
+        self.assertEqual(self._counter("preflight_cache_hits"), hits + 1)
+        self.assertEqual(self._counter("preflight_nodes_rechecked"), rechecked)
+
+    def test_returned_report_is_a_private_copy(self):
+        services.preflight.run_preflight_check(_workflow())["missing_nodes"].clear()
+
+        report = services.preflight.run_preflight_check(_workflow())
+
+        self.assertEqual(report["missing_nodes"][0]["class_type"], "UnknownNode")
+
+    def test_edited_workflow_rechecks_only_changed_nodes(self):
+        services.preflight.run_preflight_check(_workflow())
+        rechecked = self._counter("preflight_nodes_rechecked")
+
+        report = services.preflight.run_preflight_check(
+            _workflow(lora="installed.safetensors")
+        )
+
+        self.assertEqual(self._counter("preflight_nodes_rechecked"), rechecked + 1)
+        self.assertEqual(report["missing_models"], [])
+        self.assertEqual(report["missing_nodes"][0]["class_type"], "UnknownNode")
+
+    def test_node_registration_invalidates_cached_report(self):
+        self.assertFalse(services.preflight.run_preflight_check(_workflow())["ok"])
+        self.node_mappings["UnknownNode"] = object
+
+        report = services.preflight.run_preflight_check(_workflow())
+
+        self.assertEqual(report["missing_nodes"], [])
+
+    def test_inventory_change_invalidates_cached_report(self):
+        before = services.preflight.run_preflight_check(_workflow())
+        self.assertEqual(before["summary"]["missing_models"], 1)
+        with patch.object(
+            services.preflight,
+            "_scan_model_inventory",
+            return_value={"loras": ["missing.safetensors"]},
+        ):
+            services.preflight._inventory_refresh_worker()
+
+        report = services.preflight.run_preflight_check(_workflow())
+
+        self.assertEqual(report["missing_models"], [])
+
+    def test_layout_only_edit_reuses_report(self):
+        workflow = {
+            "nodes": [
+                {"id": 1, "type": "KSampler", "pos": [0, 0], "inputs": []},
+            ]
+        }
+        services.preflight.run_preflight_check(workflow)
+        hits = self._counter("preflight_cache_hits")
+        workflow["nodes"][0]["pos"] = [120, 40]
+
+        services.preflight.run_preflight_check(workflow)
+
+        self.assertEqual(self._counter("preflight_cache_hits"), hits + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
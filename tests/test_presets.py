@@ -2,6 +2,7 @@
 Tests for Preset Storage (F22).
 """
 
+import json
 import os
 import shutil
 import tempfile
@@ -11,6 +12,7 @@ from unittest.mock import patch
 
 from services.presets.models import Preset
 from services.presets.storage import PresetStore
+from services.state_store import STATE_DB_NAME
 
 
 class TestPresetStorage(unittest.TestCase):
@@ -65,19 +67,46 @@ class TestPresetStorage(unittest.TestCase):
         self.assertEqual(cat1[0].id, p1.id)
 
     def test_persistence(self):
-        """Test file persistence."""
+        """Test state store persistence."""
         p = Preset.new("Persistent", {})
         self.store.save_preset(p)
 
-        # Verify file exists
-        path = self.tmp_dir / f"{p.id}.json"
-        self.assertTrue(path.exists())
+        # Stored as a row, not a file per preset
+        self.assertTrue((self.tmp_dir / STATE_DB_NAME).exists())
+        self.assertFalse((self.tmp_dir / f"{p.id}.json").exists())
 
         # New store instance should verify
         store2 = PresetStore(storage_dir=self.tmp_dir)
         loaded = store2.get_preset(p.id)
         self.assertEqual(loaded.name, "Persistent")
 
+    def test_legacy_json_files_are_migrated_once(self):
+        """Existing {id}.json presets are imported on first use."""
+        legacy_dir = self.tmp_dir / "legacy"
+        legacy_dir.mkdir()
+        old = Preset.new("Old", {"text": "kept"}, category="prompt")
+        (legacy_dir / f"{old.id}.json").write_text(
+            json.dumps(old.to_dict()), encoding="utf-8"
+        )
+
+        store = PresetStore(storage_dir=legacy_dir)
+        self.assertEqual(store.get_preset(old.id).content, {"text": "kept"})
+        self.assertTrue(store.delete_preset(old.id))
+
+        # The file is not re-imported once the migration is recorded.
+        self.assertIsNone(PresetStore(storage_dir=legacy_dir).get_preset(old.id))
+
+    def test_list_is_newest_first(self):
+        older = Preset.new("Older", {})
+        older.updated_at = 100.0
+        newer = Preset.new("Newer", {})
+        newer.updated_at = 200.0
+        self.store.save_preset(older)
+        self.store.save_preset(newer)
+
+        names = [p.name for p in self.store.list_presets()]
+        self.assertEqual(names, ["Newer", "Older"])
+
     def test_multi_tenant_visibility_filter(self):
         """S49: preset visibility must be tenant-isolated in multi-tenant mode."""
         p1 = Preset.new("A", {})
@@ -106,6 +106,9 @@ class TestR122RealBackendLane(AioHTTPTestCase):
         self._patchers.append(queue_url_patch)
 
     async def asyncTearDown(self):
+        from services.queue_submit import close_queue_submit_session
+
+        await close_queue_submit_session()
         if self._upstream_server is not None:
             await self._upstream_server.close()
             self._upstream_server = None
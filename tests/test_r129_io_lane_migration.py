@@ -16,7 +16,9 @@ class TestR129IOLaneMigration(unittest.IsolatedAsyncioTestCase):
         mock_store = MagicMock()
         mock_store.emit = MagicMock()
 
-        run_io = AsyncMock(side_effect=[{"dummy": "history"}, {"ok": True}])
+        run_io = AsyncMock(
+            side_effect=[{"prompt-1": {"dummy": "history"}}, {"ok": True}]
+        )
         with (
             patch.object(callback_delivery, "run_io_in_thread", run_io),
             patch.object(
@@ -42,7 +44,7 @@ class TestR129IOLaneMigration(unittest.IsolatedAsyncioTestCase):
 
         self.assertGreaterEqual(run_io.await_count, 2)
         self.assertIs(
-            run_io.await_args_list[0].args[0], callback_delivery.fetch_history
+            run_io.await_args_list[0].args[0], callback_delivery.fetch_recent_history
         )
         self.assertIs(
             run_io.await_args_list[1].args[0], callback_delivery.safe_request_json
@@ -35,6 +35,7 @@ class TestR151RouteRegistrars(unittest.TestCase):
             "trace_handler": sentinel.trace_handler,
             "webhook_handler": sentinel.webhook_handler,
             "webhook_submit_handler": sentinel.webhook_submit_handler,
+            "webhook_submit_batch_handler": sentinel.webhook_submit_batch_handler,
             "webhook_validate_handler": sentinel.webhook_validate_handler,
             "capabilities_handler": sentinel.capabilities_handler,
             "config_get_handler": sentinel.config_get_handler,
@@ -68,6 +69,7 @@ class TestR151RouteRegistrars(unittest.TestCase):
             "secrets_put_handler": sentinel.secrets_put_handler,
             "events_stream_handler": sentinel.events_stream_handler,
             "events_poll_handler": sentinel.events_poll_handler,
+            "metrics_handler": sentinel.metrics_handler,
             "secrets_delete_handler": sentinel.secrets_delete_handler,
             "security_doctor_handler": sentinel.security_doctor_handler,
             "tools_list_handler": sentinel.tools_list_handler,
@@ -88,7 +90,7 @@ class TestR151RouteRegistrars(unittest.TestCase):
         self.assertIn(("GET", "/openclaw/llm/models"), keys)
         self.assertIn(("POST", "/openclaw/pnginfo"), keys)
         self.assertIn(("POST", "/openclaw/lab/experiments/{exp_id}/winner"), keys)
-        self.assertEqual(50, len(specs))
+        self.assertEqual(52, len(specs))
 
     def test_build_assist_route_specs_preserves_expected_paths(self):
         specs = build_assist_route_specs("/moltbot", _AssistStub())
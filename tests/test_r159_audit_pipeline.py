@@ -116,7 +116,7 @@ class TestR159AuditPipeline(unittest.TestCase):
 
     def test_emit_surfaces_sink_failure_but_does_not_raise(self):
         with patch(
-            "services.audit.LocalFileAuditSink.append_entry",
+            "services.audit.BatchFileAuditSink.append_batch",
             side_effect=OSError("disk full"),
         ):
             with self.assertLogs(
@@ -56,8 +56,8 @@ class TestR167AssetApiContract(unittest.IsolatedAsyncioTestCase):
         }
 
         async def fake_run_io(func, *args, **kwargs):
-            if func is callback_delivery.fetch_history:
-                return history_item
+            if func is callback_delivery.fetch_recent_history:
+                return {"p-r167": history_item}
             if func is callback_delivery.safe_request_json:
                 sent_payloads.append(args[2])
                 return {"ok": True}
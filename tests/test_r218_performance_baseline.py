@@ -17,11 +17,14 @@ from connector.config import ConnectorConfig
 from connector.contract import CommandRequest
 from connector.router import CommandRouter
 from services import jobs_read_model
+from services.job_events import JobEventStore, JobEventType
 from services.jobs_security import normalize_jobs_query
 
 ROOT = Path(__file__).resolve().parents[1]
 POLICY_PATH = ROOT / "tests" / "performance_baseline_policy.json"
 EXPECTED_WORKLOAD_IDS = {
+    "backend_job_events_resume_10k",
+    "backend_job_events_resume_100k",
     "backend_jobs_history",
     "connector_jobs_dispatch",
     "frontend_history_outputs",
@@ -69,11 +72,27 @@ def validate_performance_policy(policy: object) -> list[str]:
         errors.append("workload ids must be unique and complete")
 
     expected_inputs = {
+        "backend_job_events_resume_10k": ({"retained_events", "job_ids"}, 10_000),
+        "backend_job_events_resume_100k": ({"retained_events", "job_ids"}, 100_000),
         "backend_jobs_history": ({"history_records"}, 10_001),
         "connector_jobs_dispatch": ({"returned_jobs"}, 200),
         "frontend_history_outputs": ({"nodes", "refs_per_node"}, 512),
     }
+    job_events_outputs = (
+        {
+            "retained",
+            "dropped",
+            "earliest_retained_seq",
+            "resume_returned",
+            "resume_scanned",
+            "filtered_returned",
+            "filtered_scanned",
+        },
+        "max_examined_events",
+    )
     expected_outputs = {
+        "backend_job_events_resume_10k": job_events_outputs,
+        "backend_job_events_resume_100k": job_events_outputs,
         "backend_jobs_history": (
             {
                 "source_records",
@@ -263,6 +282,52 @@ def _run_backend_probe(workload: dict) -> tuple[dict, float]:
     return deterministic, elapsed
 
 
+def _run_job_events_probe(workload: dict) -> tuple[dict, float]:
+    size = workload["input"]["retained_events"]
+    job_ids = [f"job-{index:03d}" for index in range(workload["input"]["job_ids"])]
+    rng = random.Random(workload["seed"])
+    event_types = tuple(JobEventType)
+    store = JobEventStore(max_size=size)
+    with patch("services.job_events.time.time", new=lambda: 1_000.0):
+        # One extra event rotates the ring so resume starts past a dropped head.
+        for _ in range(size + 1):
+            store.emit(
+                event_types[rng.randrange(len(event_types))],
+                job_ids[rng.randrange(len(job_ids))],
+            )
+        filtered_job = job_ids[0]
+        started = time.perf_counter()
+        resumed, resume_scan = store.events_since_bounded(
+            last_seq=store.latest_seq() - 50, limit=50, scan_cap=500
+        )
+        filtered, filtered_scan = store.events_since_bounded(
+            last_seq=size // 2, limit=50, prompt_id=filtered_job, scan_cap=500
+        )
+        elapsed = time.perf_counter() - started
+
+    stats = store.stats()
+    pages = {
+        "resume": [(e.seq, e.event_type, e.prompt_id) for e in resumed],
+        "filtered": [(e.seq, e.event_type) for e in filtered],
+        "filtered_bounds": [
+            filtered_scan["earliest_retained_seq"],
+            filtered_scan["latest_retained_seq"],
+        ],
+    }
+    deterministic = {
+        "retained": stats["current_size"],
+        "dropped": stats["total_dropped"],
+        "earliest_retained_seq": resume_scan["earliest_retained_seq"],
+        "resume_returned": len(resumed),
+        "resume_scanned": resume_scan["scanned"],
+        "filtered_returned": len(filtered),
+        "filtered_scanned": filtered_scan["scanned"],
+        "examined_events": resume_scan["scanned"] + filtered_scan["scanned"],
+        "digest": _canonical_digest(pages),
+    }
+    return deterministic, elapsed
+
+
 def _connector_request() -> CommandRequest:
     return CommandRequest(
         platform="test",
@@ -412,8 +477,27 @@ class TestR218PerformanceBaseline(unittest.TestCase):
         self.assertEqual(result["digest"], expected["digest_sha256"])
         self.assertGreaterEqual(elapsed, 0.0)
 
+    def test_job_events_cursor_resume_is_independent_of_retained_size(self):
+        for workload_id in (
+            "backend_job_events_resume_10k",
+            "backend_job_events_resume_100k",
+        ):
+            with self.subTest(workload=workload_id):
+                workload = _workload(self.policy, workload_id)
+                result, elapsed = _run_job_events_probe(workload)
+                expected = workload["expected"]
+                self.assertEqual(
+                    {key: result[key] for key in expected["exact"]}, expected["exact"]
+                )
+                self.assertLessEqual(
+                    result["examined_events"], expected["max_examined_events"]
+                )
+                self.assertEqual(result["digest"], expected["digest_sha256"])
+                self.assertGreaterEqual(elapsed, 0.0)
+
     def test_repeated_runs_compare_deterministic_results_not_timing(self):
         for workload_id, probe in (
+            ("backend_job_events_resume_10k", _run_job_events_probe),
             ("backend_jobs_history", _run_backend_probe),
             ("connector_jobs_dispatch", _run_connector_probe),
         ):
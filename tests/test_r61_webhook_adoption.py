@@ -55,7 +55,7 @@ class TestR61WebhookAdoption(unittest.IsolatedAsyncioTestCase):
         """Test auth failure."""
         with patch("api.webhook.check_rate_limit", return_value=True):
             with patch(
-                "api.webhook.require_auth", return_value=(False, "auth_failed_test")
+                "api.webhook.arequire_auth", return_value=(False, "auth_failed_test")
             ):
                 request = MagicMock()
                 request.headers.get.return_value = "application/json"
@@ -2,8 +2,11 @@
 Tests for R62 Queue Submit Degrade and R61 Error Contract.
 """
 
+import asyncio
 import os
 import sys
+import threading
+import types
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +17,7 @@ from api.errors import APIError, ErrorCode
 
 # We import submit_prompt inside tests to ensure mocks applied before import if needed,
 # although the lazy import inside the function makes it easier.
+from services import queue_submit
 from services.queue_submit import (
     COMFY_USAGE_SOURCE,
     _build_queue_extra_data,
@@ -45,8 +49,8 @@ class TestR62QueueDegrade(unittest.IsolatedAsyncioTestCase):
         mock_session_inst = MagicMock()
         mock_session_inst.post.return_value.__aenter__.return_value = mock_response
 
-        mock_session_cls = MagicMock()
-        mock_session_cls.return_value.__aenter__.return_value = mock_session_inst
+        mock_session_inst.closed = False
+        mock_session_cls = MagicMock(return_value=mock_session_inst)
 
         # Mock aiohttp module
         mock_aiohttp = MagicMock()
@@ -63,6 +67,54 @@ class TestR62QueueDegrade(unittest.IsolatedAsyncioTestCase):
             )
             self.assertIn("tenant_id", sent_payload["extra_data"]["openclaw"])
 
+    async def test_http_fallback_reuses_pooled_session(self):
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"prompt_id": "123", "number": 1})
+        mock_session_inst = MagicMock()
+        mock_session_inst.closed = False
+        mock_session_inst.close = AsyncMock()
+        mock_session_inst.post.return_value.__aenter__.return_value = mock_response
+        mock_aiohttp = MagicMock()
+        mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_inst)
+
+        with patch.dict(sys.modules, {"aiohttp": mock_aiohttp}):
+            await submit_prompt({"test": "workflow"})
+            await submit_prompt({"test": "workflow"})
+            await queue_submit.close_queue_submit_session()
+
+        mock_aiohttp.ClientSession.assert_called_once()
+        self.assertEqual(mock_session_inst.post.call_count, 2)
+        mock_session_inst.close.assert_awaited_once()
+
+    def test_sync_shutdown_closes_sessions_on_their_loops(self):
+        idle_loop = asyncio.new_event_loop()
+        self.addCleanup(idle_loop.close)
+        busy_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=busy_loop.run_forever, daemon=True)
+        thread.start()
+
+        def _stop_busy_loop():
+            busy_loop.call_soon_threadsafe(busy_loop.stop)
+            thread.join(5)
+            busy_loop.close()
+
+        self.addCleanup(_stop_busy_loop)
+
+        sessions = {}
+        for loop in (idle_loop, busy_loop):
+            session = MagicMock()
+            session.closed = False
+            session.close = AsyncMock()
+            queue_submit._HTTP_SESSIONS[loop] = session
+            sessions[loop] = session
+
+        self.assertEqual(queue_submit.close_queue_submit_sessions(timeout=5), 2)
+        for session in sessions.values():
+            session.close.assert_awaited_once()
+        self.assertNotIn(idle_loop, queue_submit._HTTP_SESSIONS)
+        self.assertNotIn(busy_loop, queue_submit._HTTP_SESSIONS)
+
     def test_queue_extra_data_sets_stable_usage_source_without_prompt_leak(self):
         prompt_text = "private prompt body should not become attribution"
 
@@ -89,8 +141,8 @@ class TestR62QueueDegrade(unittest.IsolatedAsyncioTestCase):
         mock_session_inst = MagicMock()
         mock_session_inst.post.return_value.__aenter__.return_value = mock_response
 
-        mock_session_cls = MagicMock()
-        mock_session_cls.return_value.__aenter__.return_value = mock_session_inst
+        mock_session_inst.closed = False
+        mock_session_cls = MagicMock(return_value=mock_session_inst)
 
         mock_aiohttp = MagicMock()
         mock_aiohttp.ClientSession = mock_session_cls
@@ -134,8 +186,8 @@ class TestR62QueueDegrade(unittest.IsolatedAsyncioTestCase):
         mock_session_inst = MagicMock()
         mock_session_inst.post.return_value.__aenter__.return_value = mock_response
 
-        mock_session_cls = MagicMock()
-        mock_session_cls.return_value.__aenter__.return_value = mock_session_inst
+        mock_session_inst.closed = False
+        mock_session_cls = MagicMock(return_value=mock_session_inst)
 
         mock_aiohttp = MagicMock()
         mock_aiohttp.ClientSession = mock_session_cls
@@ -150,5 +202,118 @@ class TestR62QueueDegrade(unittest.IsolatedAsyncioTestCase):
             self.assertIn("Queue submission failed: 500", err.message)
 
 
+class _FakeRoute:
+    def __init__(self, method, path, handler):
+        self.method = method
+        self.path = path
+        self.handler = handler
+
+
+class TestInProcessQueueSubmit(unittest.IsolatedAsyncioTestCase):
+    def _fake_server_module(self, handler, loop=None):
+        instance = types.SimpleNamespace(
+            prompt_queue=object(),
+            loop=loop,
+            routes=[
+                _FakeRoute("GET", "/prompt", AsyncMock()),
+                _FakeRoute("POST", "/prompt", handler),
+            ],
+        )
+        return types.SimpleNamespace(
+            PromptServer=types.SimpleNamespace(instance=instance)
+        )
+
+    def setUp(self):
+        queue_submit._IN_PROCESS_HANDLERS.clear()
+
+    async def test_uses_host_prompt_handler_without_http(self):
+        seen = []
+
+        async def _post_prompt(request):
+            seen.append(await request.json())
+            return types.SimpleNamespace(
+                status=200, text='{"prompt_id": "p-1", "number": 4}'
+            )
+
+        server = self._fake_server_module(_post_prompt)
+        with patch.dict(sys.modules, {"server": server, "aiohttp": None}):
+            result = await submit_prompt({"1": {}}, client_id="c-1")
+
+        self.assertEqual(result, {"prompt_id": "p-1", "number": 4})
+        self.assertEqual(seen[0]["client_id"], "c-1")
+        self.assertEqual(
+            seen[0]["extra_data"]["comfy_usage_source"], COMFY_USAGE_SOURCE
+        )
+
+    async def test_host_validation_error_maps_to_queue_submit_failed(self):
+        async def _post_prompt(request):
+            return types.SimpleNamespace(status=400, text='{"error": "bad node"}')
+
+        server = self._fake_server_module(_post_prompt)
+        with patch.dict(sys.modules, {"server": server}):
+            with self.assertRaises(APIError) as cm:
+                await submit_prompt({"1": {}})
+
+        self.assertEqual(cm.exception.code, ErrorCode.QUEUE_SUBMIT_FAILED)
+        self.assertEqual(cm.exception.detail["upstream_status"], 400)
+        self.assertIn("bad node", cm.exception.detail["upstream_response"])
+
+    async def test_runs_on_server_loop_from_bridge_thread(self):
+        server_loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+        loop_thread.start()
+        handler_loops = []
+
+        async def _post_prompt(request):
+            handler_loops.append(asyncio.get_running_loop())
+            return types.SimpleNamespace(status=200, text='{"prompt_id": "p-2"}')
+
+        server = self._fake_server_module(_post_prompt, loop=server_loop)
+        try:
+            with patch.dict(sys.modules, {"server": server}):
+                result = await submit_prompt({"1": {}})
+        finally:
+            server_loop.call_soon_threadsafe(server_loop.stop)
+            loop_thread.join(timeout=5)
+            server_loop.close()
+
+        self.assertEqual(result["prompt_id"], "p-2")
+        self.assertEqual(handler_loops, [server_loop])
+
+    async def test_incompatible_host_falls_back_to_http(self):
+        async def _post_prompt(request):
+            return await request.post()
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"prompt_id": "http-1"})
+        mock_session_inst = MagicMock()
+        mock_session_inst.closed = False
+        mock_session_inst.post.return_value.__aenter__.return_value = mock_response
+        mock_aiohttp = MagicMock()
+        mock_aiohttp.ClientSession = MagicMock(return_value=mock_session_inst)
+
+        server = self._fake_server_module(_post_prompt)
+        with patch.dict(sys.modules, {"server": server, "aiohttp": mock_aiohttp}):
+            result = await submit_prompt({"1": {}})
+
+        self.assertEqual(result["prompt_id"], "http-1")
+        mock_session_inst.post.assert_called_once()
+        self.assertEqual(list(queue_submit._IN_PROCESS_HANDLERS.values()), [None])
+
+    async def test_http_mode_env_skips_in_process(self):
+        handler = AsyncMock()
+        server = self._fake_server_module(handler)
+        with (
+            patch.dict(sys.modules, {"server": server, "aiohttp": None}),
+            patch.dict(os.environ, {queue_submit.QUEUE_SUBMIT_MODE_ENV: "http"}),
+        ):
+            with self.assertRaises(APIError) as cm:
+                await submit_prompt({"1": {}})
+
+        self.assertEqual(cm.exception.code, ErrorCode.DEPENDENCY_UNAVAILABLE)
+        handler.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
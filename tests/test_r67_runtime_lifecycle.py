@@ -99,6 +99,37 @@ class TestR67RuntimeLifecycle(unittest.TestCase):
             ],
         )
 
+    def test_flush_closes_queue_submit_sessions(self):
+        from services import runtime_lifecycle as rl
+
+        calls = []
+        flushable = SimpleNamespace(flush=lambda: True)
+        fake_storage = SimpleNamespace(get_schedule_store=lambda: flushable)
+        fake_history = SimpleNamespace(get_run_history=lambda: flushable)
+        fake_failover = SimpleNamespace(get_failover_state=lambda: flushable)
+        fake_queue_submit = SimpleNamespace(
+            close_queue_submit_sessions=lambda: calls.append("sessions.close") or 1
+        )
+        fake_audit = SimpleNamespace(
+            flush_audit_log=lambda timeout: calls.append("audit.flush") or True
+        )
+        with (
+            patch.object(rl, "_import_schedule_storage", return_value=fake_storage),
+            patch.object(rl, "_import_scheduler_history", return_value=fake_history),
+            patch.object(rl, "_import_failover", return_value=fake_failover),
+            patch.object(rl, "_import_queue_submit", return_value=fake_queue_submit),
+            patch.object(rl, "_import_audit", return_value=fake_audit),
+        ):
+            report = rl.flush_runtime_state(stop_scheduler_runner=False)
+
+        self.assertTrue(report["ok"])
+        # Audit stays last so entries from the close step are persisted.
+        self.assertEqual(calls, ["sessions.close", "audit.flush"])
+        step = next(
+            s for s in report["steps"] if s["name"] == "queue_submit.sessions.close"
+        )
+        self.assertTrue(step["ok"])
+
     def test_register_shutdown_hooks_idempotent(self):
         from services import runtime_lifecycle as rl
 
@@ -2,7 +2,10 @@
 Tests for R71 Job Event Stream (SSE).
 """
 
+import asyncio
+import threading
 import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from services.job_events import (
     JobEvent,
@@ -63,6 +66,56 @@ class TestJobEventStore(unittest.TestCase):
         self.assertEqual(p1_events[0].prompt_id, "p1")
         self.assertEqual(p1_events[1].prompt_id, "p1")
 
+    def test_cursor_resume_after_rotation(self):
+        store = self.store
+        for i in range(12):
+            store.emit(JobEventType.QUEUED, "p1" if i % 3 == 0 else "p2")
+
+        # Retained seqs are 8..12; a cursor before the head resumes at the head.
+        self.assertEqual([e.seq for e in store.events_since(0)], [8, 9, 10, 11, 12])
+        self.assertEqual([e.seq for e in store.events_since(10, limit=1)], [11])
+        self.assertEqual([e.seq for e in store.events_since(0, prompt_id="p1")], [10])
+        self.assertEqual(
+            [e.seq for e in store.events_since(8, prompt_id="p2")], [9, 11, 12]
+        )
+        self.assertEqual(store.events_since(12), [])
+        self.assertEqual(store.events_since(0, prompt_id="missing"), [])
+
+    def test_ttl_expiry_advances_head(self):
+        store = self.store
+        with patch("services.job_events.time.time", return_value=1000.0):
+            store.emit(JobEventType.QUEUED, "p1")
+            store.emit(JobEventType.RUNNING, "p1")
+        with patch("services.job_events.time.time", return_value=1500.0):
+            store.emit(JobEventType.COMPLETED, "p2")
+        with (
+            patch("services.job_events.EVENT_TTL_SEC", 600),
+            patch("services.job_events.time.time", return_value=1700.0),
+        ):
+            events = store.events_since(0)
+            self.assertEqual(store.events_since(0, prompt_id="p1"), [])
+
+        self.assertEqual([e.seq for e in events], [3])
+        self.assertEqual(store.size, 1)
+        self.assertEqual(store.stats()["total_expired"], 2)
+        self.assertEqual(store.stats()["total_dropped"], 0)
+
+    def test_bounded_reports_retained_range_without_scanning(self):
+        store = self.store
+        for i in range(5):
+            store.emit(JobEventType.QUEUED, f"p{i % 2}")
+
+        events, scan = store.events_since_bounded(last_seq=1, limit=2, prompt_id="p0")
+        self.assertEqual([e.seq for e in events], [3, 5])
+        self.assertEqual(scan["scanned"], 2)
+        self.assertFalse(scan["truncated"])
+        self.assertEqual(scan["earliest_retained_seq"], 1)
+        self.assertEqual(scan["latest_retained_seq"], 5)
+
+        events, scan = store.events_since_bounded(last_seq=0, limit=4, scan_cap=2)
+        self.assertEqual([e.seq for e in events], [1, 2])
+        self.assertTrue(scan["truncated"])
+
     def test_sse_format(self):
         evt = JobEvent(
             seq=123,
@@ -82,6 +135,111 @@ class TestJobEventStore(unittest.TestCase):
         ]
         self.assertEqual(sse, "\n".join(expected_lines))
 
+    def test_sse_bytes_encoded_once(self):
+        evt = JobEvent(seq=1, event_type="queued", prompt_id="p1", timestamp=1.0)
+        frame = evt.to_sse_bytes()
+        self.assertEqual(frame, evt.to_sse().encode("utf-8"))
+        self.assertIs(evt.to_sse_bytes(), frame)
+        self.assertIsNot(evt.to_sse_bytes(include_reasoning=True), frame)
+
+
+class TestJobEventSubscriptions(unittest.IsolatedAsyncioTestCase):
+    async def test_emit_pushes_to_subscriber(self):
+        store = JobEventStore(max_size=10)
+        with store.subscribe() as sub:
+            store.emit(JobEventType.QUEUED, "p1")
+            evt = await sub.next_event(timeout=1)
+        self.assertEqual(evt.seq, 1)
+        self.assertEqual(store.subscriber_count, 0)
+
+    async def test_prompt_filter_is_indexed(self):
+        store = JobEventStore(max_size=10)
+        with store.subscribe(prompt_id="p2") as sub:
+            store.emit(JobEventType.QUEUED, "p1")
+            store.emit(JobEventType.RUNNING, "p2")
+            evt = await sub.next_event(timeout=1)
+            self.assertEqual((evt.prompt_id, evt.seq), ("p2", 2))
+            self.assertIsNone(await sub.next_event(timeout=0.01))
+
+    async def test_emit_from_worker_thread_preserves_order(self):
+        store = JobEventStore(max_size=100)
+        with store.subscribe() as sub:
+
+            def _emit_many():
+                for _ in range(20):
+                    store.emit(JobEventType.QUEUED, "p1")
+
+            workers = [threading.Thread(target=_emit_many) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            seqs = [(await sub.next_event(timeout=1)).seq for _ in range(60)]
+        self.assertEqual(seqs, list(range(1, 61)))
+
+    async def test_overflow_marks_subscriber_lagged(self):
+        store = JobEventStore(max_size=10)
+        with store.subscribe(max_pending=2) as sub:
+            for _ in range(4):
+                store.emit(JobEventType.QUEUED, "p1")
+            await asyncio.sleep(0)
+            self.assertTrue(sub.lagged)
+            sub.reset_lag()
+            self.assertFalse(sub.lagged)
+            self.assertIsNone(await sub.next_event(timeout=0.01))
+
+
+class TestEventsStreamPush(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_replays_then_pushes_live_events(self):
+        import api.events as events_api
+
+        store = JobEventStore(max_size=10)
+        store.emit(JobEventType.QUEUED, "p1")
+        response = MagicMock()
+        response.prepare = AsyncMock()
+        written = []
+        live_written = asyncio.Event()
+
+        async def _write(chunk):
+            written.append(chunk)
+            if len(written) == 2:
+                live_written.set()
+
+        response.write = _write
+        request = MagicMock()
+        request.headers = {}
+        request.query = {}
+        fake_web = MagicMock()
+        fake_web.StreamResponse.return_value = response
+
+        with (
+            patch.object(events_api, "web", fake_web),
+            patch.object(events_api, "get_job_event_store", return_value=store),
+            patch.object(events_api, "check_rate_limit", return_value=True),
+            patch.object(
+                events_api, "require_observability_access", return_value=(True, None)
+            ),
+            patch.object(events_api, "require_admin_token", return_value=(False, None)),
+            patch.object(
+                events_api, "resolve_reasoning_reveal", return_value={"allowed": False}
+            ),
+            patch.object(events_api, "audit_reasoning_reveal"),
+            patch.object(events_api, "SSE_MAX_DURATION_SEC", 5),
+        ):
+            handler = asyncio.ensure_future(events_api.events_stream_handler(request))
+            while store.subscriber_count == 0:
+                await asyncio.sleep(0)
+            threading.Thread(
+                target=store.emit, args=(JobEventType.COMPLETED, "p1")
+            ).start()
+            await asyncio.wait_for(live_written.wait(), timeout=1)
+            handler.cancel()
+            await handler
+
+        self.assertTrue(written[0].startswith(b"id: 1\n"))
+        self.assertTrue(written[1].startswith(b"id: 2\nevent: completed"))
+        self.assertEqual(store.subscriber_count, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
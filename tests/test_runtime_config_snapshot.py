@@ -0,0 +1,119 @@
+"""
+Tests for the effective-config snapshot cache (R21).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from services import runtime_config
+
+
+class TestEffectiveConfigSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="openclaw_snapshot_test_")
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.cfg_path = os.path.join(self.temp_dir, "config.json")
+        patcher = patch("services.runtime_config.CONFIG_FILE", self.cfg_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env_patch = patch.dict(os.environ)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        for key in ("OPENCLAW_LLM_PROVIDER", "MOLTBOT_LLM_PROVIDER"):
+            os.environ.pop(key, None)
+        runtime_config.clear_runtime_overrides()
+
+    def _write_config(self, llm):
+        with open(self.cfg_path, "w", encoding="utf-8") as fh:
+            json.dump({"llm": llm}, fh)
+
+    def test_repeat_reads_hit_cache(self):
+        self._write_config({"model": "cached-model"})
+        with patch(
+            "services.runtime_config._load_file_config",
+            wraps=runtime_config._load_file_config,
+        ) as load:
+            first = runtime_config.get_effective_config_snapshot()
+            second = runtime_config.get_effective_config_snapshot()
+            effective, _ = runtime_config.get_effective_config()
+
+        self.assertIs(first, second)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(effective["model"], "cached-model")
+
+    def test_snapshot_is_read_only_and_copies_are_mutable(self):
+        self._write_config({"fallback_models": ["a", "b"]})
+        snapshot = runtime_config.get_effective_config_snapshot()
+
+        with self.assertRaises(TypeError):
+            snapshot.values["model"] = "x"  # type: ignore[index]
+        self.assertEqual(snapshot.values["fallback_models"], ("a", "b"))
+
+        effective, sources = runtime_config.get_effective_config()
+        effective["fallback_models"].append("c")
+        sources["model"] = "mutated"
+        again, again_sources = runtime_config.get_effective_config()
+        self.assertEqual(again["fallback_models"], ["a", "b"])
+        self.assertNotEqual(again_sources["model"], "mutated")
+
+    def test_file_change_invalidates(self):
+        self._write_config({"model": "before"})
+        generation = runtime_config.get_effective_config_generation()
+        self.assertEqual(runtime_config.get_effective_config()[0]["model"], "before")
+
+        self._write_config({"model": "after-change"})
+        self.assertEqual(
+            runtime_config.get_effective_config()[0]["model"], "after-change"
+        )
+        self.assertGreater(runtime_config.get_effective_config_generation(), generation)
+
+    def test_update_config_and_runtime_overrides_invalidate(self):
+        generation = runtime_config.get_effective_config_generation()
+        ok, errors = runtime_config.update_config({"model": "persisted"})
+        self.assertTrue(ok, errors)
+        self.assertEqual(runtime_config.get_effective_config()[0]["model"], "persisted")
+
+        ok, errors = runtime_config.set_runtime_overrides({"model": "override"})
+        self.assertTrue(ok, errors)
+        effective, sources = runtime_config.get_effective_config()
+        self.assertEqual(effective["model"], "override")
+        self.assertEqual(sources["model"], "runtime_override")
+
+        runtime_config.clear_runtime_overrides()
+        self.assertEqual(runtime_config.get_effective_config()[0]["model"], "persisted")
+        self.assertGreaterEqual(
+            runtime_config.get_effective_config_generation(), generation + 3
+        )
+
+    def test_env_change_invalidates(self):
+        runtime_config.get_effective_config()
+        with patch.dict(os.environ, {"OPENCLAW_LLM_PROVIDER": "anthropic"}):
+            effective, sources = runtime_config.get_effective_config()
+        self.assertEqual(effective["provider"], "anthropic")
+        self.assertEqual(sources["provider"], "env")
+        self.assertNotEqual(runtime_config.get_effective_config()[1]["provider"], "env")
+
+    def test_stable_generation_without_changes(self):
+        self._write_config({"model": "steady"})
+        generation = runtime_config.get_effective_config_generation()
+        runtime_config.get_effective_config()
+        self.assertEqual(runtime_config.get_effective_config_generation(), generation)
+        self.assertEqual(
+            runtime_config.get_effective_config_snapshot().generation, generation
+        )
+
+    def test_explicit_invalidate_bumps_generation(self):
+        before = runtime_config.get_effective_config_snapshot()
+        generation = runtime_config.invalidate_effective_config()
+        after = runtime_config.get_effective_config_snapshot()
+        self.assertGreater(generation, before.generation)
+        self.assertEqual(after.generation, generation)
+        self.assertIsNot(before, after)
+
+
+if __name__ == "__main__":
+    unittest.main()
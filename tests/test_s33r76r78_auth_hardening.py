@@ -41,6 +41,7 @@ AUTH_CLASS_BY_ROUTE = {
     ("GET", "/trace/{prompt_id}"): "admin",
     ("POST", "/webhook"): "webhook-auth",
     ("POST", "/webhook/submit"): "webhook-auth",
+    ("POST", "/webhook/submit/batch"): "webhook-auth",
     ("POST", "/webhook/validate"): "webhook-auth",
     ("GET", "/capabilities"): "public-safe",
     ("GET", "/config"): "observability",
@@ -74,6 +75,7 @@ AUTH_CLASS_BY_ROUTE = {
     ("DELETE", "/secrets/{provider}"): "admin",
     ("GET", "/events/stream"): "observability",
     ("GET", "/events"): "observability",
+    ("GET", "/metrics"): "observability",
     ("GET", "/security/doctor"): "admin",
     ("GET", "/tools"): "admin",
     ("POST", "/tools/{name}/run"): "admin",
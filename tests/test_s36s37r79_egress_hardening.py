@@ -272,6 +272,7 @@ class TestR79EgressCompliance(unittest.TestCase):
         # Sourced from scan_r79.py output
         ALLOWED_FILES = {
             "services/safe_io.py",
+            "services/safe_io_async.py",
             "services/llm_client.py",
             "services/webhook_auth.py",
             "connector/base.py",
@@ -1,9 +1,12 @@
+import asyncio
 import os
 import shutil
 import sqlite3
 import tempfile
+import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 from services.idempotency_store import (
@@ -59,6 +62,18 @@ class TestSQLiteDurableBackend(unittest.TestCase):
             if "backend2" in locals():
                 backend2.close()
 
+    def test_check_and_record_many_single_transaction(self):
+        self.backend.check_and_record("k1", 3600)
+        self.backend.update_prompt_id("k1", "p1")
+
+        results = self.backend.check_and_record_many(["k1", "k2", "k2"], 3600)
+
+        self.assertEqual(results, [(True, "p1"), (False, None), (True, None)])
+        count = self.backend._conn.execute(
+            "SELECT count FROM idempotency WHERE key = 'k2'"
+        ).fetchone()[0]
+        self.assertEqual(count, 2)
+
     def test_ttl_expiry(self):
         """Test TTL expiry."""
         # IMPORTANT: drive the backend clock explicitly so this regression stays
@@ -78,6 +93,52 @@ class TestSQLiteDurableBackend(unittest.TestCase):
             is_dup, pid = self.backend.check_and_record("key_ttl", 3600)
         self.assertFalse(is_dup)
 
+    def test_wal_mode_enabled(self):
+        self.assertEqual(self.backend.stats()["journal_mode"], "wal")
+
+    def test_expired_key_is_recorded_fresh(self):
+        with patch(
+            "services.idempotency_store.time.time", side_effect=[100.0, 200.0, 201.0]
+        ):
+            self.backend.check_and_record("k", 10, "p_old")
+            first = self.backend.check_and_record("k", 10, "p_new")
+            second = self.backend.check_and_record("k", 10)
+        self.assertEqual(first, (False, None))
+        self.assertEqual(second, (True, "p_new"))
+
+    def test_concurrent_writers_share_commits(self):
+        self.backend.close()
+        self.backend = SQLiteDurableBackend(self.db_path, group_window_ms=20)
+        start = threading.Barrier(16)
+
+        def _writer(index):
+            start.wait()
+            return self.backend.check_and_record(f"key{index % 8}", 3600)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(_writer, range(16)))
+
+        self.assertEqual(sum(1 for is_dup, _ in results if not is_dup), 8)
+        stats = self.backend.stats()
+        self.assertEqual(stats["ops"], 16)
+        self.assertLess(stats["commits"], 16)
+
+    def test_async_check_and_record(self):
+        async def _run():
+            first = await self.backend.acheck_and_record("ak", 3600)
+            await self.backend.aupdate_prompt_id("ak", "p1")
+            again = await self.backend.acheck_and_record_many(["ak", "bk"], 3600)
+            return first, again
+
+        first, again = asyncio.run(_run())
+        self.assertEqual(first, (False, None))
+        self.assertEqual(again, [(True, "p1"), (False, None)])
+
+    def test_closed_backend_rejects_writes(self):
+        self.backend.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.backend.check_and_record("k", 60)
+
 
 class TestIdempotencyStoreS50(unittest.TestCase):
     def setUp(self):
@@ -126,6 +187,33 @@ class TestIdempotencyStoreS50(unittest.TestCase):
         except IdempotencyStoreError:
             self.fail("Should not raise IdempotencyStoreError in lenient mode")
 
+    def test_async_path_uses_durable_backend(self):
+        store = IdempotencyStore()
+        store.configure_durable(db_path=self.db_path, strict_mode=True)
+        try:
+
+            async def _run():
+                first = await store.acheck_and_record("job:1")
+                await store.aupdate_prompt_id("job:1", "pid")
+                return first, await store.acheck_and_record("job:1")
+
+            first, second = asyncio.run(_run())
+            self.assertEqual(first, (False, None))
+            self.assertEqual(second, (True, "pid"))
+            self.assertEqual(store.get_stats()["items"], 0)
+        finally:
+            IdempotencyStore.reset_singleton()
+
+    def test_async_strict_mode_fail_closed(self):
+        mock_backend = MagicMock(spec=DurableBackend)
+        mock_backend.check_and_record.side_effect = Exception("Disk failure")
+
+        store = IdempotencyStore()
+        store.configure_durable(backend=mock_backend, strict_mode=True)
+
+        with self.assertRaises(IdempotencyStoreError):
+            asyncio.run(store.acheck_and_record("test_key", ttl=60))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -263,8 +263,8 @@ class TestS72CallbackDelivery(unittest.IsolatedAsyncioTestCase):
         sent_payloads = []
 
         async def fake_run_io(func, *args, **kwargs):
-            if func is callback_delivery.fetch_history:
-                return {"prompt_id": "p1"}
+            if func is callback_delivery.fetch_recent_history:
+                return {"p1": {"prompt_id": "p1"}}
             if func is callback_delivery.safe_request_json:
                 sent_payloads.append(args[2])
                 return {"ok": True}
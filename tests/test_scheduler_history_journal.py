@@ -0,0 +1,130 @@
+"""
+Tests for the journaled scheduler run history (R9).
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from services.scheduler import history as history_mod
+from services.scheduler.history import RunHistory, RunRecord
+
+
+def _run(i, schedule_id="s1"):
+    return RunRecord(
+        run_id=f"r{i}",
+        schedule_id=schedule_id,
+        trace_id=f"t{i}",
+        idempotency_key=f"k{i}",
+    )
+
+
+class TestRunHistoryJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.legacy_path = os.path.join(self.tmp.name, "runs.json")
+        self.journal_path = os.path.join(self.tmp.name, "runs.jsonl")
+        patcher = patch.object(
+            history_mod, "_get_history_path", return_value=self.legacy_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def _journal_lines(self):
+        with open(self.journal_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_writes_append_without_rewriting(self):
+        hist = RunHistory()
+        with patch.object(history_mod.os, "replace") as mock_replace:
+            for i in range(3):
+                self.assertTrue(hist.add_run(_run(i)))
+            self.assertTrue(hist.update_run("r1", status="error", bogus=1))
+        mock_replace.assert_not_called()
+
+        self.assertEqual(
+            [e["op"] for e in self._journal_lines()], ["add", "add", "add", "update"]
+        )
+        self.assertEqual(self._journal_lines()[-1]["fields"], {"status": "error"})
+        self.assertFalse(hist.add_run(_run(1)))
+        self.assertFalse(hist.update_run("missing", status="error"))
+
+    def test_replay_recovers_state_and_skips_torn_tail(self):
+        hist = RunHistory()
+        hist.add_run(_run(1))
+        hist.add_run(_run(2, schedule_id="s2"))
+        hist.update_run("r1", status="completed", prompt_id="p1")
+        hist._close_journal()
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op":"add","run":{"run_id"')
+
+        recovered = RunHistory()
+        self.assertEqual(recovered.get_run("r1").prompt_id, "p1")
+        self.assertTrue(recovered.is_processed("k2"))
+        self.assertEqual(recovered.count_runs(), 2)
+        # The torn line was compacted away before any new append.
+        self.assertEqual(len(self._journal_lines()), 2)
+        recovered.add_run(_run(3))
+        self.assertEqual(len(self._journal_lines()), 3)
+
+    def test_indexes_and_listing(self):
+        hist = RunHistory()
+        for i in range(6):
+            hist.add_run(_run(i, schedule_id="even" if i % 2 == 0 else "odd"))
+        hist.update_run("r4", status="error")
+
+        self.assertEqual(hist.count_runs("even"), 3)
+        self.assertEqual(
+            [r.run_id for r in hist.list_runs(schedule_id="even")], ["r4", "r2", "r0"]
+        )
+        self.assertEqual(
+            [r.run_id for r in hist.list_runs(limit=2, offset=1)], ["r4", "r3"]
+        )
+        self.assertEqual([r.run_id for r in hist.list_runs(status="error")], ["r4"])
+        self.assertEqual(hist.get_by_idempotency_key("k3").run_id, "r3")
+
+    def test_retention_trims_oldest_incrementally(self):
+        hist = RunHistory()
+        expired = _run(0)
+        expired.started_at = "2000-01-01T00:00:00+00:00"
+        hist.add_run(expired)
+        with patch.object(history_mod, "MAX_RUNS", 3):
+            for i in range(1, 6):
+                hist.add_run(_run(i, schedule_id="s1" if i < 3 else "s2"))
+
+        self.assertEqual([r.run_id for r in hist.list_runs()], ["r5", "r4", "r3"])
+        self.assertIsNone(hist.get_run("r0"))
+        self.assertFalse(hist.is_processed("k1"))
+        self.assertEqual(hist.count_runs("s1"), 0)
+        self.assertEqual(hist.count_runs("s2"), 3)
+
+    def test_compaction_bounds_journal(self):
+        hist = RunHistory()
+        with (
+            patch.object(history_mod, "COMPACT_MIN_LINES", 4),
+            patch.object(history_mod, "COMPACT_RATIO", 2),
+        ):
+            hist.add_run(_run(1))
+            for _ in range(4):
+                hist.update_run("r1", status="completed")
+
+        self.assertEqual(len(self._journal_lines()), 1)
+        self.assertEqual(self._journal_lines()[0]["run"]["status"], "completed")
+
+    def test_legacy_snapshot_is_migrated(self):
+        with open(self.legacy_path, "w", encoding="utf-8") as f:
+            json.dump([_run(1).to_dict(), _run(2).to_dict()], f)
+
+        hist = RunHistory()
+        self.assertEqual(hist.count_runs(), 2)
+        self.assertFalse(os.path.exists(self.legacy_path))
+        self.assertEqual(
+            [e["run"]["run_id"] for e in self._journal_lines()], ["r1", "r2"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
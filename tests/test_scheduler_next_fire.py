@@ -0,0 +1,149 @@
+"""
+Tests for the scheduler's next-fire deadline heap (R4/R34).
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from services.metrics import metrics
+from services.scheduler.models import Schedule, TriggerType
+from services.scheduler.runner import SchedulerRunner
+from services.scheduler.storage import ScheduleStore
+
+
+def _interval(schedule_id, last_tick_ts, interval_sec=300):
+    return Schedule(
+        schedule_id=schedule_id,
+        name=schedule_id,
+        template_id="tmpl",
+        trigger_type=TriggerType.INTERVAL,
+        interval_sec=interval_sec,
+        last_tick_ts=last_tick_ts,
+    )
+
+
+def _lateness_summary():
+    series = metrics.get_histograms().get("scheduler_fire_lateness_ms", [])
+    return series[0] if series else {"count": 0, "sum": 0.0}
+
+
+class TestSchedulerNextFireHeap(unittest.TestCase):
+    def setUp(self):
+        self.store = ScheduleStore()
+        self.store._loaded = True
+        patchers = [
+            patch("services.scheduler.storage.save_schedules", return_value=True),
+            patch(
+                "services.scheduler.runner.get_schedule_store", return_value=self.store
+            ),
+            patch(
+                "services.scheduler.runner.get_scheduler_config",
+                return_value={"execution_mode": "embedded", "max_runs_per_tick": 5},
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.now = time.time()
+        self.runner = SchedulerRunner(submit_fn=None, tick_interval=30.0)
+        self.fired = []
+
+        def _execute(schedule, tick_ts):
+            self.fired.append(schedule.schedule_id)
+            schedule.update_cursor(tick_ts, "run")
+            self.store.update(schedule)
+
+        self.runner._execute_schedule = MagicMock(side_effect=_execute)
+
+    def test_only_evaluates_schedules_past_their_deadline(self):
+        self.store.add(_interval("soon", self.now - 250))
+        self.store.add(_interval("later", self.now - 10))
+        self.runner._tick(now_ts=self.now)  # first sight: evaluate everything
+        self.assertEqual(self.fired, [])
+
+        with patch(
+            "services.scheduler.runner.is_interval_due", wraps=lambda *a: True
+        ) as mock_due:
+            self.runner._tick(now_ts=self.now + 10)
+            mock_due.assert_not_called()
+            self.assertAlmostEqual(
+                self.runner.get_stats()["next_deadline_ts"], self.now + 50, places=3
+            )
+
+            self.runner._tick(now_ts=self.now + 60)
+            self.assertEqual(mock_due.call_count, 1)
+        self.assertEqual(self.fired, ["soon"])
+        self.assertAlmostEqual(
+            self.runner.get_stats()["last_lateness_sec"], 10.0, places=2
+        )
+        self.assertEqual(self.runner.get_stats()["pending"], 2)
+
+    def test_list_all_only_on_store_change(self):
+        self.store.add(_interval("a", self.now - 10))
+        with patch.object(
+            self.store, "list_all", wraps=self.store.list_all
+        ) as mock_list:
+            self.runner._tick(now_ts=self.now)
+            self.runner._tick(now_ts=self.now + 1)
+            self.assertEqual(mock_list.call_count, 1)
+
+            edited = _interval("a", self.now - 400)
+            self.store.update(edited)
+            self.runner._tick(now_ts=self.now + 2)
+            self.assertEqual(mock_list.call_count, 2)
+        self.assertEqual(self.fired, ["a"])
+
+    def test_disabled_and_deleted_schedules_leave_the_heap(self):
+        self.store.add(_interval("a", self.now - 10))
+        self.store.add(_interval("b", self.now - 10))
+        self.runner._tick(now_ts=self.now)
+        self.assertEqual(self.runner.get_stats()["pending"], 2)
+
+        self.store.delete("a")
+        disabled = _interval("b", self.now - 10)
+        disabled.enabled = False
+        self.store.update(disabled)
+        self.runner._tick(now_ts=self.now + 1)
+        self.assertEqual(self.runner.get_stats()["pending"], 0)
+        self.assertIsNone(self.runner.get_stats()["next_deadline_ts"])
+
+    def test_wait_targets_earliest_deadline(self):
+        self.store.add(_interval("a", time.time() - 290))
+        self.runner._tick()
+        self.assertLessEqual(self.runner._next_wait_sec(), 10.5)
+        self.assertGreaterEqual(self.runner._next_wait_sec(), 9.0)
+
+        self.runner._deadlines.clear()
+        self.assertEqual(self.runner._next_wait_sec(), 30.0)
+
+    def test_lateness_metrics_recorded(self):
+        before = metrics.get_all()
+        before_lateness = _lateness_summary()
+        self.store.add(_interval("late", self.now - 250))
+        self.runner._tick(now_ts=self.now)
+        self.runner._tick(now_ts=self.now + 52)
+        after = metrics.get_all()
+        after_lateness = _lateness_summary()
+
+        self.assertEqual(self.fired, ["late"])
+        self.assertEqual(after["scheduler_fires"] - before["scheduler_fires"], 1)
+        self.assertEqual(after_lateness["count"] - before_lateness["count"], 1)
+        self.assertGreaterEqual(after_lateness["sum"] - before_lateness["sum"], 1900)
+        self.assertNotIn("scheduler_lateness_ms_total", after)
+
+    def test_heap_size_gauge_published(self):
+        self.store.add(_interval("a", self.now - 10))
+        self.store.add(_interval("b", self.now - 10))
+        self.runner._tick(now_ts=self.now)
+
+        gauge = metrics.get_gauges()["scheduler_pending_heap_size"]
+        self.assertEqual(gauge, [{"labels": {}, "value": 0.0}])
+        self.runner._tick(now_ts=self.now + 1)
+        gauge = metrics.get_gauges()["scheduler_pending_heap_size"]
+        self.assertEqual(gauge[0]["value"], len(self.runner._heap))
+        self.assertEqual(gauge[0]["value"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,6 +70,7 @@ class TestSchedulerR34(unittest.TestCase):
         schedules = []
         for i in range(5):
             s = MagicMock(spec=Schedule)
+            s.schedule_id = f"sched_{i}"
             s.enabled = True
             s.trigger_type = TriggerType.INTERVAL
             s.interval_sec = 1
@@ -102,6 +103,9 @@ class TestSchedulerR34(unittest.TestCase):
             self.assertEqual(executed_schedules[0].last_tick_ts, 100)
             self.assertEqual(executed_schedules[1].last_tick_ts, 101)
 
+            # Throttled schedules stay indexed for the next tick.
+            self.assertEqual(self.runner.get_stats()["pending"], 5)
+
     def test_skip_missed_intervals_on_startup(self):
         """Test skip logic."""
         # Logic is in _skip_missed_ticks
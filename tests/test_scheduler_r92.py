@@ -100,11 +100,16 @@ class TestSchedulerR92(unittest.TestCase):
         ):
             runner = SchedulerRunner(submit_fn=None, tick_interval=30.0)
             runner._execute_schedule = MagicMock()
-            runner._tick()
+            now_ts = 1_700_000_000.0
+            runner._tick(now_ts=now_ts)
             self.assertTrue(schedule.enabled)
             self.assertEqual(schedule.compute_error_count, 1)
 
-            runner._tick()
+            # Errored schedules are re-checked on the next tick, not immediately
+            # and not at the next cron fire.
+            runner._tick(now_ts=now_ts + 1)
+            self.assertEqual(schedule.compute_error_count, 1)
+            runner._tick(now_ts=now_ts + 30)
             self.assertFalse(schedule.enabled)
             self.assertEqual(schedule.compute_error_count, 2)
             self.assertIn("boom", schedule.last_compute_error)
@@ -0,0 +1,168 @@
+"""
+Tests for the embedded transactional state store.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from services.integrity import save_verified
+from services.state_store import (
+    STATE_DB_NAME,
+    StateRow,
+    close_state_stores,
+    open_state_store,
+)
+
+
+class TestStateStore(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(close_state_stores)
+        self.dir = temp_dir.name
+        self.store = open_state_store(os.path.join(self.dir, STATE_DB_NAME))
+        self.table = self.store.table("things")
+
+    def _seed(self):
+        self.table.put_many(
+            [
+                StateRow("a", {"n": 1}, tenant_id="t1", status="open", updated_at=1),
+                StateRow("b", {"n": 2}, tenant_id="t1", status="done", updated_at=2),
+                StateRow("c", {"n": 3}, tenant_id="t2", status="open", updated_at=3),
+            ]
+        )
+
+    def test_filtered_listing_uses_indexes(self):
+        self._seed()
+
+        self.assertEqual(self.store.journal_mode, "wal")
+        self.assertEqual(self.table.query(tenant_id="t1"), [{"n": 2}, {"n": 1}])
+        self.assertEqual(self.table.count(status=("open", "done")), 3)
+        self.assertEqual(
+            self.table.query(status="open", newest_first=False)[0], {"n": 1}
+        )
+        plan = self.store.fetch(
+            "EXPLAIN QUERY PLAN SELECT key FROM things WHERE status = ?", ("open",)
+        )
+        self.assertIn("idx_things_status", str(plan))
+
+    def test_put_replaces_row_and_delete_removes_it(self):
+        self.table.put("a", {"v": 1}, status="open")
+        self.table.put("a", {"v": 2}, status="done")
+
+        self.assertEqual(self.table.get("a"), {"v": 2})
+        self.assertEqual(self.table.count(status="open"), 0)
+        self.assertTrue(self.table.delete("a"))
+        self.assertFalse(self.table.delete("a"))
+        self.assertIsNone(self.table.get("a"))
+
+    def test_replace_if_status_is_compare_and_set(self):
+        self._seed()
+
+        done = StateRow("a", {"n": 10}, tenant_id="t1", status="done")
+        self.assertTrue(self.table.replace_if_status(done, "open"))
+        self.assertFalse(self.table.replace_if_status(done, "open"))
+        self.assertFalse(self.table.replace_if_status(StateRow("z", {}), "open"))
+        self.assertEqual(self.table.get("a"), {"n": 10})
+        self.assertIsNone(self.table.get("z"))
+
+    def test_transaction_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.table.put("a", {"v": 1})
+                raise RuntimeError("boom")
+
+        self.assertIsNone(self.table.get("a"))
+
+    def test_tampered_row_is_dropped(self):
+        self._seed()
+        self.store.fetch("UPDATE things SET payload = '{\"n\":9}' WHERE key = 'a'")
+
+        with self.assertLogs("ComfyUI-OpenClaw.services.state_store", "CRITICAL"):
+            self.assertIsNone(self.table.get("a"))
+        self.assertEqual(len(self.table.query(tenant_id="t1")), 1)
+
+    def test_prune_keeps_most_recent_rows(self):
+        self._seed()
+
+        self.assertEqual(self.table.prune(2), 1)
+        self.assertIsNone(self.table.get("a"))
+
+    def test_migration_runs_once_and_retries_after_failure(self):
+        def broken():
+            self.table.put("x", {"v": 1})
+            raise ValueError("bad legacy file")
+
+        with self.assertRaises(ValueError):
+            self.store.migrate_once("legacy", broken)
+        self.assertIsNone(self.table.get("x"))
+
+        self.assertTrue(
+            self.store.migrate_once("legacy", lambda: self.table.put_many([]))
+        )
+        self.assertFalse(self.store.migrate_once("legacy", broken))
+
+    def test_rejects_unsafe_table_names(self):
+        for name in ("drop table", "state_migrations", "Things"):
+            with self.assertRaises(ValueError):
+                self.store.table(name)
+
+    def test_same_path_shares_one_store(self):
+        again = open_state_store(os.path.join(self.dir, ".", STATE_DB_NAME))
+
+        self.assertIs(again, self.store)
+
+
+class TestLegacyApprovalMigration(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(close_state_stores)
+        self.dir = temp_dir.name
+        patcher = patch.dict(os.environ, {"OPENCLAW_STATE_DIR": self.dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_verified_file_is_imported(self):
+        from services.approvals.models import ApprovalRequest, ApprovalStatus
+        from services.approvals.storage import ApprovalStore
+
+        legacy = ApprovalRequest(approval_id="apr_legacy1", template_id="t")
+        os.makedirs(os.path.join(self.dir, "approvals"))
+        save_verified(
+            os.path.join(self.dir, "approvals", "approvals.json"),
+            {"version": 1, "approvals": [legacy.to_dict()]},
+        )
+
+        store = ApprovalStore()
+
+        self.assertEqual(store.get("apr_legacy1").template_id, "t")
+        self.assertEqual(store.count_pending(), 1)
+        self.assertEqual(
+            [a.approval_id for a in store.list_by_status(ApprovalStatus.PENDING)],
+            ["apr_legacy1"],
+        )
+
+    def test_tampered_file_is_not_imported(self):
+        from services.approvals.models import ApprovalRequest
+        from services.approvals.storage import ApprovalStore
+
+        path = os.path.join(self.dir, "approvals", "approvals.json")
+        os.makedirs(os.path.dirname(path))
+        legacy = ApprovalRequest(approval_id="apr_legacy2", template_id="t")
+        save_verified(path, {"version": 1, "approvals": [legacy.to_dict()]})
+        with open(path, "r", encoding="utf-8") as handle:
+            body = json.load(handle)
+        body["data"]["approvals"][0]["template_id"] = "forged"
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(body, handle)
+
+        with self.assertLogs("ComfyUI-OpenClaw.services.approvals", "CRITICAL"):
+            self.assertIsNone(ApprovalStore().get("apr_legacy2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
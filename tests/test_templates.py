@@ -12,7 +12,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.append(os.getcwd())
 
-from services.templates import TemplateService
+from services.templates import CompiledTemplate, TemplateService
 from services.tenant_context import tenant_scope
 
 
@@ -68,6 +68,68 @@ class TestTemplateService(unittest.TestCase):
         rendered = self.service.render_template("t1", {"input1": "hello"})
         self.assertEqual(rendered["node1"]["inputs"]["text"], "hello")
 
+    def test_render_templates_loads_each_template_once(self):
+        """Batch rendering reads each distinct template once and keeps order."""
+        with patch(
+            "services.templates.safe_read_json", return_value=self.template_data
+        ) as mock_read:
+            rendered = self.service.render_templates(
+                [("t1", {"input1": "a"}), ("missing", {}), ("t1", {"input1": "b"})]
+            )
+
+        self.assertEqual(mock_read.call_count, 1)
+        self.assertEqual(rendered[0]["node1"]["inputs"]["text"], "a")
+        self.assertIsInstance(rendered[1], ValueError)
+        self.assertEqual(rendered[2]["node1"]["inputs"]["text"], "b")
+        self.assertEqual(self.template_data["node1"]["inputs"]["text"], "{{input1}}")
+
+    def test_compiled_once_and_render_shares_unslotted_nodes(self):
+        """Renders reuse the compiled base and copy only slotted paths."""
+        with open(os.path.join(self.test_dir, "t1.json"), "w") as f:
+            json.dump(
+                {
+                    "node1": {"inputs": {"text": "{{input1}}", "steps": 20}},
+                    "node2": {"inputs": {"list": [1, "{{input1}}", "{{other}}"]}},
+                    "node3": {"inputs": {"ckpt": "model.safetensors"}},
+                },
+                f,
+            )
+
+        first = self.service.render_template("t1", {"input1": "a"})
+        with patch("services.templates.safe_read_json") as mock_read:
+            second = self.service.render_template("t1", {"input1": "b"})
+        mock_read.assert_not_called()
+
+        _, compiled = self.service._compiled["t1.json"]
+        self.assertEqual(
+            compiled.slots,
+            (
+                (("node1", "inputs", "text"), "input1"),
+                (("node2", "inputs", "list", 1), "input1"),
+                (("node2", "inputs", "list", 2), "other"),
+            ),
+        )
+        self.assertEqual(first["node2"]["inputs"]["list"], [1, "a", "{{other}}"])
+        self.assertEqual(second["node1"]["inputs"]["text"], "b")
+        self.assertIs(second["node3"], compiled.base["node3"])
+        self.assertIsNot(second["node1"], compiled.base["node1"])
+        self.assertEqual(compiled.base["node1"]["inputs"]["text"], "{{input1}}")
+
+    def test_template_file_change_recompiles(self):
+        """Editing the template file on disk is picked up on the next render."""
+        self.service.render_template("t1", {"input1": "a"})
+        with open(os.path.join(self.test_dir, "t1.json"), "w") as f:
+            json.dump({"node1": {"inputs": {"seed": "{{input1}}", "n": 1}}}, f)
+
+        rendered = self.service.render_template("t1", {"input1": 7})
+        self.assertEqual(rendered["node1"]["inputs"], {"seed": 7, "n": 1})
+
+    def test_compiled_template_root_placeholder(self):
+        """A bare placeholder workflow renders to the input value itself."""
+        compiled = CompiledTemplate.compile("{{wf}}")
+        self.assertEqual(compiled.render({"wf": {"a": 1}}), {"a": 1})
+        self.assertEqual(compiled.render({}), "{{wf}}")
+
     def test_strict_substitution_only(self):
         """Test that partial substitution is NOT performed."""
         # Update template to have partial placeholder
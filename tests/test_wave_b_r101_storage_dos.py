@@ -20,9 +20,16 @@ class TestR101StorageDoS(unittest.TestCase):
         store.configure_durable(backend=backend, strict_mode=False)
         store.check_and_record("wave_b_key", ttl=60)
 
+        # S50: the expiry sweep runs in the IO lane, off the request path.
+        store._sweep_future.result(timeout=5)
         backend.cleanup.assert_called()
         backend.check_and_record.assert_called_once()
 
+        # Swept on a timer, not on every request.
+        store.check_and_record("wave_b_key_2", ttl=60)
+        store._sweep_future.result(timeout=5)
+        backend.cleanup.assert_called_once()
+
     def test_connector_and_trigger_quotas_exist(self):
         limiter = RateLimiter()
         self.assertIn("connector", limiter.defaults)
@@ -3,18 +3,20 @@ Tests for Webhook Auth Module.
 S2: ChatOps/webhook auth verification tests.
 """
 
+import asyncio
 import hashlib
 import hmac
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 sys.path.append(os.getcwd())
 
 # Import to insure module is loaded for patching
 import services.idempotency_store
 from services.webhook_auth import (
+    arequire_auth,
     constant_time_compare,
     get_auth_summary,
     is_auth_configured,
@@ -330,6 +332,41 @@ class TestAuthSummary(unittest.TestCase):
                     err, "missing_timestamp"
                 )  # Fails on first missing header
 
+    @patch("services.idempotency_store.IdempotencyStore")
+    @patch("time.time")
+    def test_async_auth_awaits_nonce_check(self, mock_time, mock_store_cls):
+        """arequire_auth records the nonce through the async store API."""
+        with patch.dict(
+            os.environ,
+            {
+                "OPENCLAW_WEBHOOK_AUTH_MODE": "hmac",
+                "OPENCLAW_WEBHOOK_HMAC_SECRET": "secret",
+            },
+        ):
+            mock_time.return_value = 1000.0
+
+            mock_store = MagicMock()
+            mock_store.acheck_and_record = AsyncMock(return_value=(True, "existing"))
+            mock_store_cls.return_value = mock_store
+
+            request = MagicMock()
+            request.headers = {
+                "X-OpenClaw-Signature": "sha256=VALID_SIG",
+                "X-OpenClaw-Timestamp": "1000",
+                "X-OpenClaw-Nonce": "nonce123",
+            }
+
+            with patch("hmac.new") as mock_hmac:
+                mock_hmac.return_value.hexdigest.return_value = "VALID_SIG"
+
+                valid, err = asyncio.run(arequire_auth(request, b"body"))
+                self.assertFalse(valid)
+                self.assertEqual(err, "nonce_used")
+                mock_store.acheck_and_record.assert_awaited_once_with(
+                    "nonce:nonce123", ttl=600
+                )
+                mock_store.check_and_record.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,231 @@
+"""
+Tests for batched webhook submission (POST /openclaw/webhook/submit/batch).
+
+One signed payload carries many jobs; outcomes stream back as NDJSON lines.
+The upstream queue boundary (`_send_payload`) is mocked; auth, normalization,
+idempotency, template rendering and budgets are real.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import AioHTTPTestCase
+
+    _AIOHTTP_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    web = None  # type: ignore
+    AioHTTPTestCase = unittest.TestCase  # type: ignore
+    _AIOHTTP_AVAILABLE = False
+
+import services.templates
+from api.webhook_submit import webhook_submit_batch_handler
+from services.execution_budgets import BudgetConfig, ExecutionBudgetLimiter
+from services.idempotency_store import IdempotencyStore
+
+SECRET = b"batch-secret"
+
+
+def _job(seed, **extra):
+    job = {
+        "template_id": "batch-test",
+        "profile_id": "default",
+        "version": 1,
+        "inputs": {"seed": seed},
+    }
+    job.update(extra)
+    return job
+
+
+@unittest.skipUnless(_AIOHTTP_AVAILABLE, "aiohttp not installed")
+class TestWebhookSubmitBatch(AioHTTPTestCase):
+    async def get_application(self):
+        app = web.Application()
+        app.router.add_post(
+            "/openclaw/webhook/submit/batch", webhook_submit_batch_handler
+        )
+        return app
+
+    def setUp(self):
+        super().setUp()
+        self.templates_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.templates_dir, "batch-test.json"), "w") as f:
+            json.dump({"3": {"inputs": {"seed": "{{seed}}"}}}, f)
+        with open(os.path.join(self.templates_dir, "manifest.json"), "w") as f:
+            json.dump({"version": 1, "templates": {}}, f)
+
+        self.patchers = [
+            patch.dict(
+                os.environ,
+                {
+                    "OPENCLAW_WEBHOOK_AUTH_MODE": "hmac",
+                    "OPENCLAW_WEBHOOK_HMAC_SECRET": SECRET.decode(),
+                    "OPENCLAW_WEBHOOK_REQUIRE_REPLAY_PROTECTION": "0",
+                },
+            ),
+            patch.object(
+                services.templates.TemplateService,
+                "_instance",
+                services.templates.TemplateService(templates_root=self.templates_dir),
+            ),
+            patch(
+                "services.execution_budgets._limiter",
+                ExecutionBudgetLimiter(
+                    BudgetConfig(
+                        max_inflight_total=4,
+                        max_inflight_webhook=2,
+                        max_inflight_trigger=1,
+                        max_inflight_scheduler=1,
+                        max_inflight_bridge=1,
+                    )
+                ),
+            ),
+            patch("api.webhook_submit.check_rate_limit", return_value=True),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.mock_callback = self._start(
+            patch("api.webhook_submit.start_callback_watch", new_callable=AsyncMock)
+        )
+        self.sent = []
+
+        async def _send(payload, source, trace_id):
+            self.sent.append(payload)
+            return {"prompt_id": f"pid-{len(self.sent)}", "number": len(self.sent)}
+
+        self.mock_send = self._start(
+            patch("services.queue_submit._send_payload", side_effect=_send)
+        )
+        IdempotencyStore.reset_singleton()
+
+    def _start(self, patcher):
+        self.patchers.append(patcher)
+        return patcher.start()
+
+    def tearDown(self):
+        super().tearDown()
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        IdempotencyStore.reset_singleton()
+        shutil.rmtree(self.templates_dir)
+
+    async def _post(self, jobs):
+        body = json.dumps({"jobs": jobs}).encode("utf-8")
+        signature = hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+        resp = await self.client.post(
+            "/openclaw/webhook/submit/batch",
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "X-OpenClaw-Signature": f"sha256={signature}",
+            },
+        )
+        if resp.headers.get("Content-Type", "").startswith("application/x-ndjson"):
+            lines = [json.loads(line) for line in (await resp.text()).splitlines()]
+            return resp, {line["index"]: line for line in lines[:-1]}, lines[-1]
+        return resp, await resp.json(), None
+
+    async def test_streams_per_item_outcomes(self):
+        resp, items, summary = await self._post(
+            [
+                _job(1, job_id="job-a", callback={"url": "http://sink.example/r"}),
+                _job(2, trace_id="trace-b"),
+                {"template_id": "batch-test"},
+                _job(3, template_id="missing-template"),
+                _job(1, job_id="job-a"),
+            ]
+        )
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(
+            summary,
+            {
+                "done": True,
+                "batch_trace_id": summary["batch_trace_id"],
+                "total": 5,
+                "submitted": 2,
+                "deduped": 1,
+                "failed": 2,
+            },
+        )
+        self.assertEqual(
+            {items[0]["prompt_id"], items[1]["prompt_id"]}, {"pid-1", "pid-2"}
+        )
+        self.assertEqual(items[1]["trace_id"], "trace-b")
+        self.assertNotEqual(items[0]["trace_id"], items[1]["trace_id"])
+        self.assertTrue(items[0]["callback_scheduled"])
+        self.assertEqual(
+            (items[2]["status"], items[2]["error"]), (400, "validation_error")
+        )
+        self.assertEqual(items[3]["error"], "template_error")
+        self.assertTrue(items[4]["deduped"])
+
+        self.assertEqual(len(self.sent), 2)
+        sent_seeds = sorted(p["prompt"]["3"]["inputs"]["seed"] for p in self.sent)
+        self.assertEqual(sent_seeds, [1, 2])
+        for payload in self.sent:
+            self.assertEqual(
+                payload["extra_data"]["moltbot"]["batch_trace_id"],
+                summary["batch_trace_id"],
+            )
+        self.mock_callback.assert_awaited_once()
+        self.assertEqual(
+            self.mock_callback.call_args.kwargs["trace_id"], items[0]["trace_id"]
+        )
+
+    async def test_replayed_batch_is_deduped_in_bulk(self):
+        jobs = [_job(1, job_id="job-1"), _job(2, job_id="job-2")]
+        await self._post(jobs)
+
+        resp, items, summary = await self._post(jobs)
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(summary["deduped"], 2)
+        self.assertEqual(
+            {items[0]["prompt_id"], items[1]["prompt_id"]}, {"pid-1", "pid-2"}
+        )
+        self.assertEqual(len(self.sent), 2)
+
+    async def test_budget_denial_is_reported_per_item(self):
+        limiter = ExecutionBudgetLimiter(
+            BudgetConfig(
+                max_inflight_total=1,
+                max_inflight_webhook=1,
+                max_inflight_trigger=1,
+                max_inflight_scheduler=1,
+                max_inflight_bridge=1,
+            )
+        )
+        with patch("services.execution_budgets._limiter", limiter):
+            async with limiter.acquire("webhook"):
+                resp, items, summary = await self._post([_job(1), _job(2)])
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(summary["failed"], 2)
+        self.assertEqual({line["status"] for line in items.values()}, {429})
+        self.assertEqual(self.sent, [])
+
+    async def test_rejects_oversized_batch_and_bad_signature(self):
+        with patch("api.webhook_submit.MAX_BATCH_JOBS", 2):
+            resp, body, _ = await self._post([_job(1), _job(2), _job(3)])
+        self.assertEqual(resp.status, 413)
+        self.assertEqual(body["error"], "batch_too_large")
+
+        resp = await self.client.post(
+            "/openclaw/webhook/submit/batch",
+            data=json.dumps({"jobs": [_job(1)]}),
+            headers={"Content-Type": "application/json"},
+        )
+        self.assertEqual(resp.status, 401)
+        self.assertEqual(self.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
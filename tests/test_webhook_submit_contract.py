@@ -42,7 +42,7 @@ class TestWebhookSubmitContract(AioHTTPTestCase):
     @patch("api.webhook_submit.get_template_service")
     @patch("api.webhook_submit.submit_prompt", new_callable=AsyncMock)
     @patch("api.webhook_submit.IdempotencyStore")
-    @patch("api.webhook_submit.require_auth")
+    @patch("api.webhook_submit.arequire_auth")
     async def test_valid_submit(
         self, mock_auth, mock_store_cls, mock_submit, mock_get_template
     ):
@@ -58,7 +58,8 @@ class TestWebhookSubmitContract(AioHTTPTestCase):
         # Mock idempotency store
         mock_store = MagicMock()
         mock_store.generate_key.return_value = "key1"
-        mock_store.check_and_record.return_value = (False, None)
+        mock_store.acheck_and_record = AsyncMock(return_value=(False, None))
+        mock_store.aupdate_prompt_id = AsyncMock()
         mock_store_cls.return_value = mock_store
 
         # Mock submit
@@ -89,12 +90,13 @@ class TestWebhookSubmitContract(AioHTTPTestCase):
         self.assertEqual(body["prompt_id"], "pid123")
 
         # Verify calls
-        mock_store.check_and_record.assert_called_with("key1")
+        mock_store.acheck_and_record.assert_awaited_with("key1")
+        mock_store.aupdate_prompt_id.assert_awaited_with("key1", "pid123")
         mock_template_svc.render_template.assert_called_with("t1", {"seed": 123})
         mock_submit.assert_called()
 
     @patch("api.webhook_submit.IdempotencyStore")
-    @patch("api.webhook_submit.require_auth")
+    @patch("api.webhook_submit.arequire_auth")
     async def test_duplicate_suppression(self, mock_auth, mock_store_cls):
         """Test duplicate request supression."""
         # Mock auth
@@ -103,7 +105,7 @@ class TestWebhookSubmitContract(AioHTTPTestCase):
         mock_store = MagicMock()
         mock_store.generate_key.return_value = "key_dup"
         # Simulate duplicate found
-        mock_store.check_and_record.return_value = (True, "pid_old")
+        mock_store.acheck_and_record = AsyncMock(return_value=(True, "pid_old"))
         mock_store_cls.return_value = mock_store
 
         payload = {"version": 1, "template_id": "t1", "profile_id": "p1"}
@@ -127,7 +129,7 @@ class TestWebhookSubmitContract(AioHTTPTestCase):
     @patch("api.webhook_submit.get_template_service")
     @patch("api.webhook_submit.IdempotencyStore")
     @patch("api.webhook_submit.validate_canonical_schema")
-    @patch("api.webhook_submit.require_auth")
+    @patch("api.webhook_submit.arequire_auth")
     async def test_post_map_canonical_schema_gate_blocks_enqueue(
         self, mock_auth, mock_validate_schema, mock_store_cls, mock_get_template
     ):
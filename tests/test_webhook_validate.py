@@ -71,7 +71,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_success_200(self):
         """Should return 200 OK for valid request."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     with patch("api.webhook_validate.check_render_size"):
@@ -106,7 +106,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     async def test_auth_failure_401(self):
         """Should return 401 for auth failures."""
         with patch(
-            "api.webhook_validate.require_auth", return_value=(False, "invalid_token")
+            "api.webhook_validate.arequire_auth", return_value=(False, "invalid_token")
         ):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 resp = await self.client.post(
@@ -122,7 +122,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     async def test_auth_not_configured_403(self):
         """Should return 403 when auth not configured."""
         with patch(
-            "api.webhook_validate.require_auth",
+            "api.webhook_validate.arequire_auth",
             return_value=(False, "auth_not_configured"),
         ):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
@@ -138,7 +138,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_rate_limit_exceeded_429(self):
         """Should return 429 when rate limited."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=False):
                 resp = await self.client.post(
                     "/validate",
@@ -158,7 +158,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_unsupported_media_type_415(self):
         """Should return 415 for non-JSON content type."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 resp = await self.client.post(
                     "/validate",
@@ -178,7 +178,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     async def test_payload_too_large_413_body(self):
         """Should return 413 for large body."""
         case = R144_IO_BOUNDARY_MATRIX["webhook_validate"][0]
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 large_payload = {"data": "x" * (2 * MAX_BODY_SIZE)}
                 resp = await self.client.post(
@@ -199,7 +199,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     async def test_r144_boundary_equal_body_is_not_rejected_by_size_gate(self):
         """R144: payload exactly at the byte cap should pass the size gate."""
         case = R144_IO_BOUNDARY_MATRIX["webhook_validate"][1]
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 payload = _json_payload_with_exact_size(case["limit_bytes"])
                 resp = await self.client.post(
@@ -218,7 +218,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_payload_too_large_413_render(self):
         """Should return 413 for large rendered workflow (budget exceeded)."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     with patch("api.webhook_validate.check_render_size") as mock_size:
@@ -261,7 +261,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     async def test_invalid_json_400(self):
         """Should return 400 for malformed JSON."""
         case = R144_IO_BOUNDARY_MATRIX["webhook_validate"][2]
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 resp = await self.client.post(
                     "/validate",
@@ -280,7 +280,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_validation_error_400(self):
         """Should return 400 for schema validation errors."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 resp = await self.client.post(
                     "/validate",
@@ -304,7 +304,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_template_error_400(self):
         """Should return 400 for template not found."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     mock_service = MagicMock()
@@ -335,7 +335,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_placeholder_warnings(self):
         """Should detect and warn about unresolved placeholders."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     with patch("api.webhook_validate.check_render_size"):
@@ -373,7 +373,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_never_submits_to_queue(self):
         """CRITICAL: Must never call submit_prompt (dry-run guarantee)."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     with patch("api.webhook_validate.check_render_size"):
@@ -407,7 +407,7 @@ class TestWebhookValidateContract(AioHTTPTestCase):
     @unittest_run_loop
     async def test_redaction_applied(self):
         """Should redact sensitive fields in normalized output."""
-        with patch("api.webhook_validate.require_auth", return_value=(True, None)):
+        with patch("api.webhook_validate.arequire_auth", return_value=(True, None)):
             with patch("api.webhook_validate.check_rate_limit", return_value=True):
                 with patch("api.webhook_validate.get_template_service") as mock_tmpl:
                     with patch("api.webhook_validate.check_render_size"):
@@ -382,6 +382,11 @@ export const ExplorerTab = {
                 const ul = makeEl("ul");
                 report.missing_models.forEach(m => {
                     const li = makeEl("li", "", `${m.type}: ${m.name} (x${m.count})`);
+                    if (Array.isArray(m.suggestions) && m.suggestions.length) {
+                        const hint = makeEl("span", "", ` (Did you mean: ${m.suggestions.join(", ")}?)`);
+                        hint.style.opacity = "0.75";
+                        li.appendChild(hint);
+                    }
                     ul.appendChild(li);
                 });
                 section.appendChild(ul);